@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+
+"""
+pycimc benchmark suite.
+
+Micro-benchmarks time the CPU-bound pieces of a request (command building, parsing realistic
+responses, adaptor tree assembly, inventory serialization). Macro-benchmarks run full inventory
+sweeps (threaded getters, threaded get_full_inventory() and asyncio getters) against a local
+cimc_simulator fleet with a configurable BMC latency.
+
+Results are written as JSON so runs can be compared between releases:
+
+    python benchmarks/bench.py --output before.json
+    python benchmarks/bench.py --output after.json --compare before.json
+
+--compare exits with status 1 if any benchmark got slower than --threshold (default 10%).
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import platform
+import statistics
+import subprocess
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# pycimc imports the example config module
+sys.path[:0] = [ROOT, os.path.join(ROOT, 'examples')]
+
+import xml.etree.ElementTree as ET
+import pycimc
+import cimc_metrics
+from pycimc import InventoryDict, build_adaptor_tree, resolve_class_command, resolve_children_command
+import cimc_xml
+from cimc_parser import iter_mos, collect_mos, CHUNK_SIZE, BACKENDS
+from cimc_snapshot import SnapshotWriter, SnapshotReader
+from cimc_simulator import CimcSimulator, SimulatedHost, MoTree, raise_fd_limit
+from cimc_transport import CimcTransport
+from collections import defaultdict
+
+SAMPLE_INVENTORY = os.path.join(ROOT, 'sample_inventory.json')
+MACRO_HOSTS = (1, 100, 5000)
+MACRO_LATENCY = 0.02
+SWEEP_GETTERS = ('get_chassis_info', 'get_interface_inventory', 'get_drive_inventory', 'get_pci_inventory',
+                 'get_psu_inventory', 'get_fw_versions', 'get_bios_settings', 'getBootOrder')
+COOKIE = '1394044707/539306f8-f3e0-13e0-8005-1af7ea354e4c'
+
+def time_micro(name, function, repeat=5, min_time=0.2):
+    """
+    Time function() like timeit: pick a loop count that runs for at least min_time, repeat, report per call
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    times = [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return {'name': name, 'kind': 'micro', 'unit': 's/call', 'number': number, 'repeat': repeat,
+            'min': min(times), 'median': statistics.median(times), 'mean': statistics.mean(times),
+            'stdev': statistics.stdev(times) if len(times) > 1 else 0.0}
+
+def response_body(tree, command_string):
+    """
+    The simulator's answer to command_string, as the CIMC would send it
+    """
+    request = ET.fromstring(command_string)
+    host = SimulatedHost(CimcSimulator(tree, tls=False), 0, tree)
+    return ET.tostring(getattr(host, 'do_' + request.tag)(request))
+
+def scaled_interfaces(inventory, count):
+    """
+    Flat adaptorUnit/adaptorExtEthIf/adaptorHostEthIf dicts for a server with count adaptors cloned
+    from the sample's, as get_interface_inventory sees them before build_adaptor_tree
+    """
+    adaptors, ports, vnics = [], [], []
+    for index in range(count):
+        template = inventory['adaptor'][index % len(inventory['adaptor'])]
+        old_dn, new_dn = template['dn'], f'sys/rack-unit-1/adaptor-{index + 1}'
+        adaptors.append(dict({key: value for key, value in template.items() if key != 'port'}, dn=new_dn))
+        for port in template['port']:
+            ports.append(dict({key: value for key, value in port.items() if key != 'vnic'},
+                              dn=port['dn'].replace(old_dn, new_dn)))
+            vnics.extend(dict(vnic, dn=vnic['dn'].replace(old_dn, new_dn)) for vnic in port['vnic'])
+    return adaptors, ports, vnics
+
+def scaled_body(body, copies):
+    """
+    A response with the objects of body repeated copies times, for payloads the size of a big server's
+    """
+    root = ET.fromstring(body)
+    out_configs = root.find('outConfigs')
+    objects = list(out_configs)
+    for _ in range(copies - 1):
+        out_configs.extend(objects)
+    return ET.tostring(root)
+
+def chunked(body):
+    return [body[i:i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)]
+
+def micro_benchmarks(repeat=5, min_time=0.2):
+    with open(SAMPLE_INVENTORY) as inventory_file:
+        inventory = json.load(inventory_file)
+    tree = MoTree.from_fixture(inventory)
+    disks_body = response_body(tree, resolve_class_command(COOKIE, 'storageLocalDisk'))
+    sweep_body = response_body(tree, resolve_children_command(COOKIE, 'sys', 'computeRackUnit', True))
+    chunks = chunked(sweep_body)
+    # what get_bios_settings and get_fw_versions stream, scaled up to many tokens and firmware components
+    payloads = {
+        'biosSettings': chunked(scaled_body(response_body(tree, resolve_class_command(COOKIE, 'biosSettings', True)), 20)),
+        'firmwareRunning': chunked(scaled_body(response_body(tree, resolve_class_command(COOKIE, 'firmwareRunning')), 200)),
+    }
+    inventory_dict = InventoryDict(None, inventory)
+    results = []
+
+    def run(name, function):
+        results.append(time_micro(name, function, repeat, min_time))
+
+    run('command.resolve_class', lambda: resolve_class_command(COOKIE, 'storageLocalDisk'))
+    run('command.resolve_children', lambda: resolve_children_command(COOKIE, 'sys/rack-unit-1', 'adaptorUnit', True))
+    run('command.login', lambda: cimc_xml.login('admin', 'password'))
+    run(f'parse.fromstring.storageLocalDisk[{len(disks_body)}B]', lambda: ET.fromstring(disks_body))
+    run(f'parse.fromstring.sweep[{len(sweep_body)}B]', lambda: ET.fromstring(sweep_body))
+    run(f'parse.stream.sweep[{len(sweep_body)}B]', lambda: collect_mos(iter_mos(chunks), ('storageLocalDisk',),
+                                                                         defaultdict(list)))
+    for payload, payload_chunks in payloads.items():
+        size = sum(map(len, payload_chunks))
+        for backend in sorted(BACKENDS):
+            run(f'parse.{backend}.{payload}[{size}B]',
+                lambda payload_chunks=payload_chunks, backend=backend: list(iter_mos(payload_chunks, backend=backend)))
+    for count in (2, 256):
+        flat = scaled_interfaces(inventory, count)
+        run(f'adaptor_tree.adaptors[{count}]',
+            lambda flat=flat: build_adaptor_tree([dict(a) for a in flat[0]], [dict(p) for p in flat[1]], flat[2]))
+    run('inventory.json_dumps', lambda: json.dumps(inventory_dict))
+    # a fleet of the sample server: one pretty-printed JSON file per host against one snapshot
+    fleet_hosts = 1000
+    snapshot = io.BytesIO()
+    writer = SnapshotWriter(snapshot)
+    for index in range(fleet_hosts):
+        writer.write(f'10.0.0.{index}', inventory)
+    json_files = [json.dumps(inventory, indent=4)] * fleet_hosts
+    run(f'inventory.json_loads.hosts[{fleet_hosts}]', lambda: [json.loads(body) for body in json_files])
+    run(f'inventory.snapshot_load.hosts[{fleet_hosts}]',
+        lambda: list(SnapshotReader(io.BytesIO(snapshot.getvalue()))))
+    return results
+
+def sync_sweep(addresses, scheme, workers, full=False):
+    """
+    Full inventory of every host with UcsServer, workers hosts at a time, through the getters or with
+    get_full_inventory(). Returns per-host elapsed times.
+    """
+    def inventory(host):
+        start = time.perf_counter()
+        with pycimc.UcsServer(host, 'admin', 'password', transport=CimcTransport(host, scheme=scheme)) as server:
+            if full:
+                server.get_full_inventory()
+            else:
+                for getter in SWEEP_GETTERS:
+                    getattr(server, getter)()
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(inventory, addresses))
+
+def async_sweep(addresses, scheme, concurrency):
+    from cimc_async import Fleet, inventory_task
+    fleet = Fleet(addresses, 'admin', 'password', concurrency=concurrency, scheme=scheme)
+    results = fleet.collect(inventory_task(*SWEEP_GETTERS))
+    errors = [result for result in results if result.error]
+    if errors:
+        raise RuntimeError(f'{len(errors)} hosts failed, e.g. {errors[0].host}: {errors[0].error!r}')
+    return [result.elapsed for result in results]
+
+def macro_benchmarks(hosts=MACRO_HOSTS, latency=MACRO_LATENCY, tls=False, workers=64, concurrency=500, modes=None):
+    results = []
+    modes = modes or ['sync', 'full', 'async']
+    try:
+        import aiohttp
+    except ImportError:
+        modes = [mode for mode in modes if mode != 'async']
+    # a listening socket per simulated host, plus both ends of every connection
+    raise_fd_limit(max(hosts) * 3 + 1024)
+    for count in hosts:
+        with CimcSimulator(SAMPLE_INVENTORY, count=count, latency=latency, tls=tls) as simulator:
+            for mode in modes:
+                cimc_metrics.REGISTRY.reset()
+                requests_before = sum(sum(host.stats.values()) for host in simulator.hosts)
+                start = time.perf_counter()
+                if mode in ('sync', 'full'):
+                    elapsed = sync_sweep(simulator.addresses, simulator.scheme, min(workers, count), mode == 'full')
+                else:
+                    elapsed = async_sweep(simulator.addresses, simulator.scheme, min(concurrency, count))
+                wall = time.perf_counter() - start
+                requests = sum(sum(host.stats.values()) for host in simulator.hosts) - requests_before
+                elapsed.sort()
+                results.append({
+                    'name': f'sweep.{mode}.hosts[{count}]', 'kind': 'macro', 'unit': 's', 'hosts': count,
+                    'latency': latency, 'tls': tls, 'wall': wall, 'median': wall, 'hosts_per_s': count / wall,
+                    'requests': requests, 'requests_per_host': requests / count,
+                    'host_p50': elapsed[len(elapsed) // 2], 'host_p95': elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.95))],
+                })
+    return results
+
+def metadata():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {'pycimc': '.'.join(map(str, pycimc.UcsServer.version)), 'commit': commit,
+            'python': platform.python_version(), 'platform': platform.platform(), 'host': socket.gethostname(),
+            'cpus': os.cpu_count(), 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z')}
+
+def compare(results, baseline, threshold):
+    """
+    Return [(name, baseline, current, change)] for benchmarks that got more than threshold slower
+    """
+    previous = {result['name']: result['median'] for result in baseline['results']}
+    regressions = []
+    for result in results['results']:
+        before = previous.get(result['name'])
+        if before:
+            change = result['median'] / before - 1
+            print(f'{result["name"]:55} {before:12.6g} -> {result["median"]:12.6g}  {change:+7.1%}')
+            if change > threshold:
+                regressions.append((result['name'], before, result['median'], change))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark pycimc')
+    parser.add_argument('--suite', choices=('micro', 'macro', 'all'), default='all')
+    parser.add_argument('--hosts', type=int, nargs='+', default=list(MACRO_HOSTS), help='fleet sizes for the sweeps')
+    parser.add_argument('--latency', type=float, default=MACRO_LATENCY, help='simulated BMC latency per request, seconds')
+    parser.add_argument('--tls', action='store_true', help='sweep over HTTPS instead of HTTP')
+    parser.add_argument('--modes', nargs='+', choices=('sync', 'full', 'async'), default=['sync', 'full', 'async'],
+                        help='getters from threads, get_full_inventory() from threads, getters from asyncio')
+    parser.add_argument('--workers', type=int, default=64, help='threads for the sync sweep')
+    parser.add_argument('--concurrency', type=int, default=500, help='hosts in flight for the async sweep')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--compare', help='baseline JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    results = {'meta': metadata(), 'results': []}
+    if args.suite in ('micro', 'all'):
+        results['results'] += micro_benchmarks(repeat=args.repeat)
+    if args.suite in ('macro', 'all'):
+        results['results'] += macro_benchmarks(args.hosts, args.latency, args.tls, args.workers, args.concurrency,
+                                               args.modes)
+    for result in results['results']:
+        print(f'{result["name"]:55} {result["median"]:12.6g} {result["unit"]}')
+    if args.output:
+        with open(args.output, 'w') as out_file:
+            json.dump(results, out_file, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.threshold)
+        if regressions:
+            print(f'{len(regressions)} benchmarks regressed by more than {args.threshold:.0%}')
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
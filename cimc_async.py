@@ -0,0 +1,425 @@
+#!/usr/bin/env python
+
+"""
+asyncio client for querying many CIMCs concurrently from a single thread.
+
+AsyncUcsServer mirrors the UcsServer login/logout and inventory getters and fills in the same
+inventory dict shape. Fleet runs a coroutine against a list of hosts with a global and a per-host
+concurrency limit and yields the results as they finish.
+
+    async def chassis(server):
+        await server.get_chassis_info()
+        return server.inventory['chassis']
+
+    async for result in Fleet(hosts, 'admin', 'password').run(chassis):
+        print(result.host, result.error or result.value['serial'])
+
+Requires aiohttp.
+"""
+
+import asyncio
+import time
+from collections import namedtuple, defaultdict
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from pycimc import (InventoryDict, Version, LOGIN_TIMEOUT, REQUEST_TIMEOUT, RACK_UNIT_DN, parse_response, record_request,
+                    resolve_class_command, resolve_children_command, plan_class_queries,
+                    build_adaptor_tree, fw_versions, bios_settings, boot_order, FULL_INVENTORY_SUBSYSTEMS,
+                    SUBSYSTEM_GETTERS, resolve_dn_command, full_inventory_root, getter_round_trips, fan_out_inventory)
+from cimc_parser import CHUNK_SIZE, mo_parser, collect_mos
+from cimc_mo import make as make_mo
+import cimc_xml
+from cveLogger import mylogger
+from cimc_metrics import count_retry, count_round_trips_saved
+from exception_mapper import *
+from cimc_transport import HEADERS
+from cimc_session import is_session_error
+
+FLEET_CONCURRENCY = 200
+HOST_CONCURRENCY = 1
+WILDCARD_HOST = '0.0.0.0'
+
+FleetResult = namedtuple('FleetResult', ['host', 'value', 'error', 'elapsed'])
+
+def client_session(concurrency=FLEET_CONCURRENCY, per_host=HOST_CONCURRENCY, verify=False):
+    """
+    Return an aiohttp.ClientSession whose keep-alive connection pool is capped at concurrency
+    connections in total and per_host connections to any one CIMC
+    """
+    if aiohttp is None:
+        raise ImportError('cimc_async requires aiohttp. Install it with "pip install aiohttp"')
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=per_host, ssl=None if verify else False)
+    return aiohttp.ClientSession(connector=connector, headers=HEADERS)
+
+class AsyncUcsServer():
+
+    version = Version(0,6,0)
+
+    def __init__(self, ipaddress, username, password, session=None, scheme='https', timeout=REQUEST_TIMEOUT,
+                 session_cache=None, models=False):
+        """
+        session is an optional aiohttp.ClientSession (see client_session()) shared between servers.
+        Without one, the server opens its own and closes it in __aexit__/close()
+
+        session_cache is an optional cimc_session.SessionCache to reuse cached cookies, and models=True
+        stores cimc_models objects instead of attribute dicts, as for UcsServer
+        """
+        self.session_cookie = None
+        self.session_refresh_period = None
+        self.ipaddress = ipaddress
+        self.username = username
+        self.password = password
+        self.serial_no = 'not queried'
+        self.model = 'not queried'
+        self.total_memory = 0
+        self.inventory = InventoryDict()
+        self.url = f'{scheme}://{ipaddress}/nuova'
+        self.timeout = timeout
+        self.session = session
+        self._owns_session = session is None
+        self.session_cache = session_cache
+        self._make = make_mo if models else None
+        self.round_trips_saved = 0
+
+    async def __aenter__(self):
+        await self.login()
+        return self
+
+    async def __aexit__(self, exc_type, exc_inst, exc_tb):
+        try:
+            if self.session_cookie is not None:
+                await self.logout()
+        finally:
+            await self.close()
+
+    async def close(self):
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _post(self, command_string, timeout=None):
+        """
+        POST an XML API command to the CIMC and return the parsed response element.
+        If the CIMC rejects the session cookie, log in again once and resend.
+        """
+        try:
+            return await self._send(command_string, timeout)
+        except ResponseError as err:
+            return await self._send(await self._renew_session(err, command_string), timeout)
+
+    async def _stream(self, command_string, timeout=None):
+        """
+        Like _post(), but parse the response incrementally as it arrives and return its managed objects
+        as a list of cimc_parser.Mo's
+        """
+        try:
+            return await self._send(command_string, timeout, stream=True)
+        except ResponseError as err:
+            return await self._send(await self._renew_session(err, command_string), timeout, stream=True)
+
+    async def _renew_session(self, err, command_string):
+        old_cookie = self.session_cookie
+        if not is_session_error(err) or not old_cookie or old_cookie not in command_string \
+                or command_string.startswith('<aaaLog'):
+            raise err
+        mylogger('Session for %s is no longer valid (%s), logging in again', self.ipaddress, err)
+        count_retry(self.ipaddress, 'session')
+        if self.session_cache is not None:
+            self.session_cache.discard(self.ipaddress, self.username, old_cookie)
+        await self.login(force=True)
+        return command_string.replace(old_cookie, self.session_cookie)
+
+    async def fetch(self, command_string, timeout=None):
+        """
+        POST an XML API command and return the raw response body, unparsed, e.g. to parse it in another
+        process. An errorCode in the response is only found once it is parsed.
+        """
+        return await self._send(command_string, timeout, raw=True)
+
+    async def _send(self, command_string, timeout=None, stream=False, raw=False):
+        if self.session is None:
+            self.session = client_session()
+        client_timeout = aiohttp.ClientTimeout(total=timeout if timeout is not None else self.timeout)
+        start = time.perf_counter()
+        status = None
+        nbytes = 0
+        response_text = None
+        try:
+            async with self.session.post(self.url, data=cimc_xml.encode(command_string), timeout=client_timeout) as myResp:
+                status = myResp.status
+                if raw:
+                    body = await myResp.read()
+                    record_request(self.ipaddress, command_string, status, len(body), time.perf_counter() - start)
+                    return body
+                if not stream:
+                    nbytes = len(await myResp.read())
+                    response_text = await myResp.text()
+                else:
+                    parser = mo_parser(command_string)
+                    mos = []
+                    async for chunk in myResp.content.iter_chunked(CHUNK_SIZE):
+                        nbytes += len(chunk)
+                        mos.extend(parser.feed(chunk))
+                    mos.extend(parser.close())
+                    record_request(self.ipaddress, command_string, status, nbytes, time.perf_counter() - start)
+                    return mos
+        except asyncio.TimeoutError as err:
+            record_request(self.ipaddress, command_string, status, nbytes, time.perf_counter() - start, error=err)
+            raise TimeoutError(f'Timed out communicating with {self.ipaddress}') from err
+        except (aiohttp.ClientError, ResponseError) as err:
+            record_request(self.ipaddress, command_string, status, nbytes, time.perf_counter() - start, error=err)
+            if isinstance(err, ResponseError):
+                raise
+            raise ConnectionError(f'Could not connect to {self.ipaddress}: {err}') from err
+        try:
+            response_element = parse_response(response_text, command_string)
+        except ResponseError as err:
+            record_request(self.ipaddress, command_string, status, nbytes, time.perf_counter() - start, response_text, err)
+            raise
+        record_request(self.ipaddress, command_string, status, nbytes, time.perf_counter() - start, response_text)
+        return response_element
+
+    async def login(self, force=False):
+        """
+        Log in to the CIMC using the instance's ipaddress, username, and password configured during init()
+        With a session_cache, a still-valid cached cookie is reused instead unless force is True.
+        """
+        if self.session_cache is not None and not force:
+            cached = self.session_cache.get(self.ipaddress, self.username)
+            if cached:
+                self.session_cookie = cached['cookie']
+                self.session_refresh_period = str(cached['refresh_period'])
+                if cached.get('version'):
+                    self.version = cached['version']
+                return self
+        command_string = cimc_xml.login(self.username, self.password)
+        response = await self._post(command_string, timeout=LOGIN_TIMEOUT)
+        if 'outCookie' in response.attrib:
+            self.session_cookie = response.attrib['outCookie']
+        if 'outRefreshPeriod' in response.attrib:
+            self.session_refresh_period = response.attrib['outRefreshPeriod']
+        if 'outVersion' in response.attrib:
+            self.version = response.attrib['outVersion']
+        if self.session_cache is not None:
+            self.session_cache.put(self.ipaddress, self.username, self.session_cookie,
+                                   self.session_refresh_period, self.version)
+        return self
+
+    async def logout(self, force=False):
+        """
+        Log out of the server instance. Invalidates the current session cookie in self.session_cookie
+        With a session_cache the session is kept open for reuse, unless force is True.
+        """
+        if self.session_cache is not None:
+            if not force:
+                return
+            self.session_cache.discard(self.ipaddress, self.username, self.session_cookie)
+        command_string = cimc_xml.logout(self.session_cookie)
+        await self._post(command_string)
+        self.session_cookie = None
+
+    async def resolve_classes(self, class_ids):
+        """
+        Async version of UcsServer.resolve_classes(): subtree and single-class queries are all sent concurrently
+        """
+        class_ids = list(dict.fromkeys(class_ids))
+        found = {class_id: [] for class_id in class_ids}
+        subtree_queries, single_classes = plan_class_queries(class_ids)
+
+        async def resolve_subtree(parent_dn, root_class, wanted):
+            try:
+                mos = await self._stream(resolve_children_command(self.session_cookie, parent_dn, root_class, True))
+            except ResponseError as err:
+                mylogger('Hierarchical query on %s failed, falling back to class queries: %s', parent_dn, err)
+                wanted = [class_id for class_id in class_ids if class_id in wanted]
+                await asyncio.gather(*(resolve_class(class_id) for class_id in wanted))
+                return
+            collect_mos(mos, wanted, found, self._make)
+
+        async def resolve_class(class_id):
+            collect_mos(await self._stream(resolve_class_command(self.session_cookie, class_id)), (class_id,), found,
+                        self._make)
+
+        await asyncio.gather(*(resolve_subtree(*query) for query in subtree_queries),
+                             *(resolve_class(class_id) for class_id in single_classes))
+        return found
+
+    async def get_chassis_info(self):
+        self.inventory['chassis'] = (await self.resolve_classes(['computeRackUnit']))['computeRackUnit'][0].copy()
+        self.serial_no = self.inventory['chassis']['serial']
+        self.model = self.inventory['chassis']['model']
+        self.total_memory = self.inventory['chassis']['totalMemory']
+        self.name = self.inventory['chassis']['name']
+        self.operPower = self.inventory['chassis']['operPower']
+        return self
+
+    async def get_cimc_info(self):
+        mos = await self._stream(resolve_children_command(self.session_cookie, f'{RACK_UNIT_DN}/mgmt', hierarchical=True))
+        self.inventory['cimc'] = [self._make(mo.class_id, mo.attrib) if self._make else mo.attrib
+                                  for mo in mos if mo.class_id == 'mgmtIf' and mo.depth == 0][0]
+
+    async def getBootOrder(self):
+        mos = await self._stream(resolve_children_command(self.session_cookie, f'{RACK_UNIT_DN}/boot-policy'))
+        self.inventory['boot_order'] = boot_order(mos)
+        return self
+
+    async def get_drive_inventory(self):
+        self.inventory['drives'] = await self.resolve_classes(['storageLocalDisk', 'storageVirtualDrive'])
+        return self
+
+    async def get_local_drive_usage(self):
+        self.inventory['drive_usage'] = (await self.resolve_classes(['storageLocalDiskUsage']))['storageLocalDiskUsage']
+        return self
+
+    async def get_interface_inventory(self):
+        interfaces = await self.resolve_classes(['adaptorUnit', 'adaptorExtEthIf', 'adaptorHostEthIf'])
+        self.inventory['adaptor'] = build_adaptor_tree(interfaces['adaptorUnit'], interfaces['adaptorExtEthIf'],
+                                                       interfaces['adaptorHostEthIf'])
+        return True
+
+    async def get_pci_inventory(self):
+        self.inventory['pci'] = (await self.resolve_classes(['pciEquipSlot']))['pciEquipSlot']
+
+    async def getStorageControllerInventory(self):
+        self.inventory['storageControllers'] = (await self.resolve_classes(['storageController']))['storageController']
+        return True
+
+    async def get_psu_inventory(self):
+        self.inventory['psu'] = (await self.resolve_classes(['equipmentPsu']))['equipmentPsu']
+
+    async def get_bios_settings(self):
+        mos = await self._stream(resolve_class_command(self.session_cookie, 'biosSettings', True))
+        self.inventory['bios'] = bios_settings(mos)
+
+    async def get_users(self):
+        users = (await self.resolve_classes(['aaaUser']))['aaaUser']
+        self.inventory['users'] = [user for user in users if user['name']]
+        return True
+
+    async def getMgmtIf(self):
+        mgmtIfs = (await self.resolve_classes(['mgmtIf']))['mgmtIf']
+        if mgmtIfs:
+            self.inventory['mgmtIf'] = mgmtIfs[0]
+            return True
+
+    async def get_fw_versions(self):
+        self.inventory['fw'] = fw_versions((await self.resolve_classes(['firmwareRunning']))['firmwareRunning'])
+        return self
+
+    async def get_full_inventory(self, subsystems=FULL_INVENTORY_SUBSYSTEMS):
+        """
+        Async version of UcsServer.get_full_inventory(), without the inventory cache
+        """
+        subsystems = list(dict.fromkeys(subsystems))
+        root = full_inventory_root(subsystems)
+        try:
+            mos = await self._stream(resolve_dn_command(self.session_cookie, root, True))
+        except ResponseError as err:
+            mylogger('Hierarchical query on %s failed, falling back to the getters: %s', root, err)
+            await asyncio.gather(*(getattr(self, SUBSYSTEM_GETTERS[subsystem])() for subsystem in subsystems))
+            self.round_trips_saved = 0
+            return self
+        self.inventory.update(fan_out_inventory(mos, subsystems, self._make))
+        if 'chassis' in subsystems:
+            self.serial_no = self.inventory['chassis']['serial']
+            self.model = self.inventory['chassis']['model']
+            self.total_memory = self.inventory['chassis']['totalMemory']
+            self.name = self.inventory['chassis']['name']
+            self.operPower = self.inventory['chassis']['operPower']
+        self.round_trips_saved = getter_round_trips(subsystems) - 1
+        count_round_trips_saved(self.ipaddress, self.round_trips_saved)
+        return self
+
+def inventory_task(*getters):
+    """
+    Return a Fleet task that awaits the named AsyncUcsServer getters concurrently and returns the server's inventory,
+    e.g. inventory_task('get_chassis_info', 'get_interface_inventory')
+    """
+    async def task(server):
+        await asyncio.gather(*(getattr(server, getter)() for getter in getters))
+        return server.inventory
+    return task
+
+class Fleet():
+    """
+    Run a coroutine against many CIMCs from one event loop.
+
+    At most concurrency hosts are worked on at a time, and at most per_host connections are opened to
+    any one CIMC. credentials optionally maps a host to {'username': ..., 'password': ...}; the
+    '0.0.0.0' entry is used for hosts that aren't listed, falling back to username/password.
+    With a session_cache, hosts are logged in with cached cookies where possible, and with models=True
+    inventories hold cimc_models objects.
+    """
+
+    def __init__(self, hosts, username=None, password=None, credentials=None, concurrency=FLEET_CONCURRENCY,
+                 per_host=HOST_CONCURRENCY, scheme='https', timeout=REQUEST_TIMEOUT, session_cache=None, models=False):
+        self.hosts = hosts
+        self.username = username
+        self.password = password
+        self.credentials = credentials or {}
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.scheme = scheme
+        self.timeout = timeout
+        self.session_cache = session_cache
+        self.models = models
+
+    def credentials_for(self, host):
+        creds = self.credentials.get(host) or self.credentials.get(WILDCARD_HOST) or {}
+        return creds.get('username', self.username), creds.get('password', self.password)
+
+    async def run(self, task):
+        """
+        Log in to every host, await task(server) and log out again.
+        Async generator yielding a FleetResult per host, in the order they finish. A failing host
+        yields a FleetResult with the exception in .error and doesn't affect the other hosts.
+        """
+        results = asyncio.Queue()
+        hosts = iter(self.hosts)
+        host_limits = defaultdict(lambda: asyncio.Semaphore(self.per_host))
+
+        async with client_session(self.concurrency, self.per_host) as session:
+
+            async def run_host(host):
+                username, password = self.credentials_for(host)
+                start = time.monotonic()
+                async with host_limits[host]:
+                    try:
+                        async with AsyncUcsServer(host, username, password, session=session, scheme=self.scheme,
+                                                  timeout=self.timeout, session_cache=self.session_cache,
+                                                  models=self.models) as server:
+                            value = await task(server)
+                        return FleetResult(host, value, None, time.monotonic() - start)
+                    except Exception as err:
+                        mylogger('%s: %s: %s', host, type(err).__name__, err)
+                        return FleetResult(host, None, err, time.monotonic() - start)
+
+            async def worker():
+                for host in hosts:
+                    await results.put(await run_host(host))
+                await results.put(None)
+
+            workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+            try:
+                running = len(workers)
+                while running:
+                    result = await results.get()
+                    if result is None:
+                        running -= 1
+                    else:
+                        yield result
+            finally:
+                for worker_task in workers:
+                    worker_task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+    def collect(self, task):
+        """
+        Blocking helper: run task against every host and return the list of FleetResults
+        """
+        async def gather_results():
+            return [result async for result in self.run(task)]
+        return asyncio.run(gather_results())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+
+"""
+Persistent inventory cache.
+
+InventoryCache keeps each host's inventory on disk, one JSON file per subsystem (chassis, fw, pci,
+drives, adaptor, bios, ...) with the time it was fetched, so that any tool can answer from the cache
+and only go to the CIMC for subsystems that are older than their TTL.
+
+UcsServer getters decorated with @cached_subsystem consult the server's inventory_cache according to
+a mode:
+    CACHE    serve a fresh cached copy, fetch live if it is missing or stale (the default)
+    REFRESH  serve any cached copy immediately, and refetch in a background thread if it is stale
+    LIVE     always fetch from the CIMC, and update the cache
+"""
+
+import os
+import re
+import json
+import time
+import threading
+import functools
+from collections import namedtuple
+
+from cveLogger import mylogger
+from cimc_mo import to_json
+
+INVENTORY_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pycimc', 'inventory')
+
+CACHE = 'cache'
+REFRESH = 'refresh'
+LIVE = 'live'
+CACHE_MODES = (CACHE, REFRESH, LIVE)
+
+# Seconds before a cached subsystem is considered stale. Hardware layout and identity hardly change,
+# health and usage do.
+DEFAULT_TTLS = {
+    'chassis': 24 * 3600,
+    'pci': 24 * 3600,
+    'adaptor': 6 * 3600,
+    'storageControllers': 6 * 3600,
+    'fw': 3600,
+    'bios': 3600,
+    'cimc': 3600,
+    'mgmtIf': 3600,
+    'boot_order': 900,
+    'drives': 900,
+    'drive_usage': 300,
+    'psu': 300,
+}
+DEFAULT_TTL = 900
+
+CacheEntry = namedtuple('CacheEntry', ['value', 'fetched', 'age', 'fresh'])
+
+class InventoryCache():
+    """
+    On-disk inventory cache keyed by host and subsystem
+    """
+
+    def __init__(self, directory=INVENTORY_CACHE_DIR, ttls=None):
+        self.directory = directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self._refreshing = {}
+        self._refreshing_lock = threading.Lock()
+
+    def _path(self, host, subsystem):
+        host_dir = os.path.join(self.directory, re.sub(r'[^A-Za-z0-9._-]', '_', host))
+        return os.path.join(host_dir, re.sub(r'[^A-Za-z0-9._-]', '_', subsystem) + '.json')
+
+    def ttl(self, subsystem):
+        return self.ttls.get(subsystem, DEFAULT_TTL)
+
+    def get(self, host, subsystem):
+        """
+        Return the CacheEntry for host/subsystem, stale or not, or None if nothing is cached
+        """
+        try:
+            with open(self._path(host, subsystem)) as cache_file:
+                cached = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        age = time.time() - cached['fetched']
+        return CacheEntry(cached['value'], cached['fetched'], age, age <= self.ttl(subsystem))
+
+    def put(self, host, subsystem, value, fetched=None):
+        path = self._path(host, subsystem)
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w') as cache_file:
+            json.dump({'fetched': fetched if fetched is not None else time.time(), 'value': value}, cache_file, default=to_json)
+        os.replace(tmp_path, path)
+
+    def discard(self, host, subsystem=None):
+        """
+        Drop one cached subsystem of host, or all of them
+        """
+        subsystems = [subsystem] if subsystem else self.subsystems(host)
+        for name in subsystems:
+            try:
+                os.remove(self._path(host, name))
+            except OSError:
+                pass
+
+    def subsystems(self, host):
+        host_dir = os.path.dirname(self._path(host, 'x'))
+        try:
+            return sorted(name[:-len('.json')] for name in os.listdir(host_dir) if name.endswith('.json'))
+        except OSError:
+            return []
+
+    def inventory(self, host, subsystems=None, fresh_only=False):
+        """
+        Return the cached inventory of host as a dict of subsystem: value, without contacting the CIMC
+        """
+        out = {}
+        for subsystem in subsystems or self.subsystems(host):
+            entry = self.get(host, subsystem)
+            if entry is not None and (entry.fresh or not fresh_only):
+                out[subsystem] = entry.value
+        return out
+
+    def refresh_in_background(self, host, subsystem, fetch):
+        """
+        Run fetch() in a daemon thread, unless a refresh of host/subsystem is already running
+        """
+        key = (host, subsystem)
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return self._refreshing[key]
+
+            def run():
+                try:
+                    fetch()
+                except Exception as err:
+                    mylogger('Background refresh of %s for %s failed: %s', subsystem, host, err)
+                finally:
+                    with self._refreshing_lock:
+                        self._refreshing.pop(key, None)
+
+            thread = threading.Thread(target=run, name=f'inventory-refresh-{host}-{subsystem}', daemon=True)
+            self._refreshing[key] = thread
+            thread.start()
+            return thread
+
+    def wait(self, host=None, timeout=None):
+        """
+        Wait for the running background refreshes (of one host) to finish
+        """
+        with self._refreshing_lock:
+            threads = [thread for (refresh_host, _), thread in self._refreshing.items()
+                       if host is None or refresh_host == host]
+        for thread in threads:
+            thread.join(timeout)
+
+def cached_subsystem(subsystem, returns='self', loaded=None):
+    """
+    Decorator for UcsServer getters that store their result in self.inventory[subsystem].
+
+    When the server has an inventory_cache, the getter takes an extra mode= keyword (default
+    server.cache_mode) and is only run when the mode calls for a live fetch. On a cache hit it
+    returns self, or True with returns=True, like the getter itself would. loaded names a method
+    that is called after the subsystem was filled in from the cache, for derived attributes.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def getter(self, *args, mode=None, **kw):
+            cache = getattr(self, 'inventory_cache', None)
+            if cache is None:
+                return method(self, *args, **kw)
+            mode = mode or self.cache_mode
+            if mode not in CACHE_MODES:
+                raise ValueError(f'Unknown cache mode {mode!r}, expected one of {CACHE_MODES}')
+
+            def fetch():
+                result = method(self, *args, **kw)
+                if subsystem in self.inventory:
+                    cache.put(self.ipaddress, subsystem, self.inventory[subsystem])
+                return result
+
+            entry = cache.get(self.ipaddress, subsystem) if mode != LIVE else None
+            if entry is None or (mode == CACHE and not entry.fresh):
+                return fetch()
+            self.inventory[subsystem] = entry.value
+            if loaded is not None:
+                getattr(self, loaded)()
+            if not entry.fresh:
+                cache.refresh_in_background(self.ipaddress, subsystem, fetch)
+            return self if returns == 'self' else returns
+        return getter
+    return decorator
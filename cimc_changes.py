@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+
+"""
+Change sets: configuration changes collected up front and pushed in bulk.
+
+Every setter on UcsServer sends one configConfMo, so provisioning a server with ten settings costs ten
+round trips to a slow BMC. A ChangeSet collects the pending modifications instead, checks each one
+against the schema (the cimc_models classes generated from the XSD) as it is added, and
+UcsServer.apply_changes() sends them as configConfMos requests of up to CONF_MOS_BATCH objects:
+
+    changes = myServer.changes()
+    myServer.setHostname('rack-42', changes=changes)
+    myServer.set_sol_adminstate('enable', changes=changes)
+    changes.add('biosVfIntelHyperThreadingTech', f'{BIOS_SETTINGS_DN}/Intel-HyperThreading-Tech',
+                vpIntelHyperThreadingTech='enabled')
+    results = changes.apply()       # {dn: ChangeResult}
+
+Changes can also be worked out from a desired state. UcsServer.converge({dn: (classId, {attribute: value})})
+compares the targets with the inventory (fetching what isn't there) and only sends the attributes that
+differ, so re-running a playbook against servers that already match sends nothing; dry_run=True returns
+the plan instead. The setters diff against the inventory they read from in the same way.
+"""
+
+from collections import namedtuple
+
+from cimc_mo import model
+import cimc_xml
+
+# Objects per configConfMos request. Firmware that takes fewer gets its batches split (see
+# UcsServer.apply_changes), and a server remembers the size that worked in conf_mos_limit.
+CONF_MOS_BATCH = 32
+
+# Attributes the CIMC never reports back (so can't be compared, and are sent whenever they are given), and
+# ones that name the object (which go along with any write to it, but don't make one on their own).
+WRITE_ONLY = frozenset(['pwd'])
+NAMING = frozenset(['id'])
+
+Change = namedtuple('Change', ['class_id', 'dn', 'attrib', 'hierarchical'])
+
+# A change converge() would make: diff is {attribute: (current value, desired value)}, exists is False if
+# the object isn't there yet
+PlannedChange = namedtuple('PlannedChange', ['class_id', 'dn', 'diff', 'exists'])
+
+class ChangeResult(namedtuple('ChangeResult', ['dn', 'class_id', 'error_code', 'error_descr', 'mo'])):
+    """
+    The outcome of one change: the object as the CIMC reported it back, or the error it answered with
+    """
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.error_code is None
+
+def validate_change(class_id, attrib):
+    """
+    Raise ValueError if the schema has no class_id, or class_id has no such attribute or doesn't allow a value
+    """
+    cls = model(class_id)
+    if cls is None:
+        raise ValueError(f'Unknown managed object class {class_id!r}')
+    unknown = sorted(key for key in attrib if key not in cls._slots)
+    if unknown:
+        raise ValueError(f'{class_id} has no attribute {", ".join(unknown)}')
+    invalid = cls.from_attrib(attrib).invalid()
+    if invalid:
+        raise ValueError(f'{class_id} does not allow ' +
+                         ', '.join(f'{key}={value!r} (one of {sorted(cls._enums[key])})' for key, value in invalid.items()))
+
+def same_value(class_id, key, current, desired):
+    if current is None:
+        return False
+    current, desired = str(current), str(desired)
+    if current == desired:
+        return True
+    # enumerated values come back in whatever case the firmware prefers ('Yes', 'yes', 'Enabled')
+    cls = model(class_id)
+    return cls is not None and key in cls._enums and current.lower() == desired.lower()
+
+def diff_attributes(class_id, current, desired):
+    """
+    Return {attribute: (current value, desired value)} for the attributes of desired that current doesn't
+    match. Write-only attributes can't be compared and are left out; current None means the object doesn't exist.
+    """
+    current = current or {}
+    return {key: (current.get(key), str(value)) for key, value in desired.items()
+            if key not in WRITE_ONLY and not same_value(class_id, key, current.get(key), value)}
+
+def changed_attributes(class_id, current, desired):
+    """
+    The part of desired that needs sending: nothing if current already matches it and there are no write-only
+    attributes, otherwise the attributes that differ plus the write-only and naming ones
+    """
+    if current is None:
+        return dict(desired)
+    diff = diff_attributes(class_id, current, desired)
+    if not diff and WRITE_ONLY.isdisjoint(desired):
+        return {}
+    return {key: value for key, value in desired.items() if key in diff or key in WRITE_ONLY or key in NAMING}
+
+class ChangeSet():
+    """
+    Pending managed object modifications, in the order they were added. Changes to the same dn are merged.
+    """
+
+    def __init__(self, server=None, validate=True):
+        self.server = server
+        self.validate = validate
+        self._changes = {}
+
+    def add(self, class_id, dn, hierarchical=False, **attrib):
+        """
+        Queue setting attrib on the object at dn. Raises ValueError if the change doesn't fit the schema.
+        """
+        attrib = {key: str(value) for key, value in attrib.items()}
+        attrib.pop('dn', None)
+        pending = self._changes.get(dn)
+        if pending is not None:
+            if pending.class_id != class_id:
+                raise ValueError(f'{dn} is already queued as a {pending.class_id}, not a {class_id}')
+            attrib = dict(pending.attrib, **attrib)
+            hierarchical = hierarchical or pending.hierarchical
+        if self.validate:
+            validate_change(class_id, attrib)
+        self._changes[dn] = Change(class_id, dn, attrib, hierarchical)
+        return self
+
+    def discard(self, dn):
+        self._changes.pop(dn, None)
+
+    def clear(self):
+        self._changes.clear()
+
+    def __len__(self):
+        return len(self._changes)
+
+    def __iter__(self):
+        return iter(list(self._changes.values()))
+
+    def __contains__(self, dn):
+        return dn in self._changes
+
+    def __repr__(self):
+        return f'ChangeSet({list(self._changes.values())!r})'
+
+    def apply(self):
+        """
+        Send the pending changes through the server the set was made for, and clear them.
+        Returns {dn: ChangeResult}.
+        """
+        if self.server is None:
+            raise ValueError('This ChangeSet is not bound to a server; use UcsServer.apply_changes()')
+        results = self.server.apply_changes(self)
+        self.clear()
+        return results
+
+def change_element(change):
+    return cimc_xml.mo(change.class_id, dict(change.attrib, dn=change.dn))
+
+def conf_mo_command(cookie, change):
+    """
+    The configConfMo request for one change
+    """
+    return cimc_xml.conf_mo(cookie, change.dn, [change_element(change)], change.hierarchical)
+
+def conf_mos_command(cookie, changes):
+    """
+    The configConfMos request for a batch of changes: one <pair key="dn"> per object
+    """
+    hierarchical = any(change.hierarchical for change in changes)
+    return cimc_xml.conf_mos(cookie, [(change.dn, change_element(change)) for change in changes], hierarchical)
+
+def conf_mos_results(response_element, changes):
+    """
+    Map the outConfigs of a configConfMos response back to the changes, by dn
+    """
+    returned = {}
+    for pair in response_element.iterfind('outConfigs/pair'):
+        returned[pair.get('key')] = pair[0].attrib if len(pair) else None
+    return {change.dn: ChangeResult(change.dn, change.class_id, None, None, returned.get(change.dn))
+            for change in changes}
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+
+"""
+Helpers for CIMC distinguished names.
+
+A dn is the '/'-separated path of relative names (rn's) from the root of the object tree, e.g.
+'sys/rack-unit-1/adaptor-2/ext-eth-0'. An rn may carry a bracketed naming value that itself contains
+'/' (e.g. 'vmedia-map-[nfs/share]'), so a plain dn.split('/') is not always safe.
+"""
+
+from functools import lru_cache
+from collections import defaultdict
+
+@lru_cache(maxsize=65536)
+def parse_dn(dn):
+    """
+    Split a dn into the tuple of its rn's, keeping '/' inside [] with its rn
+    """
+    if '[' not in dn:
+        return tuple(dn.split('/'))
+    rns = []
+    start = 0
+    depth = 0
+    for pos, char in enumerate(dn):
+        if char == '[':
+            depth += 1
+        elif char == ']':
+            depth = max(0, depth - 1)
+        elif char == '/' and depth == 0:
+            rns.append(dn[start:pos])
+            start = pos + 1
+    rns.append(dn[start:])
+    return tuple(rns)
+
+def dn_rn(dn, level):
+    """
+    Return the rn at position level of dn, or None if the dn is not that deep
+    """
+    rns = parse_dn(dn)
+    return rns[level] if -len(rns) <= level < len(rns) else None
+
+def parent_dn(dn):
+    return '/'.join(parse_dn(dn)[:-1])
+
+def index_by(objects, key):
+    """
+    Group attribute dicts into a dict of lists by key(obj), preserving their order.
+    Objects for which key() returns None are left out.
+    """
+    index = defaultdict(list)
+    for obj in objects:
+        value = key(obj)
+        if value is not None:
+            index[value].append(obj)
+    return index
@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+
+"""
+Event-driven inventory updates.
+
+Instead of re-polling every class, an EventSubscriber keeps one eventSubscribe stream open to the
+CIMC and applies each configMoChangeEvent (created, modified, deleted or removed managed object) to
+UcsServer.inventory by dn. Subsystems whose shape is derived rather than a plain list of objects
+(the adaptor tree, BIOS settings, boot order) are refetched on their own instead. When the stream
+drops, or event ids show that events were missed, the subscriber reconnects and resyncs every
+subsystem already in the inventory with a live fetch.
+
+The stream is a sequence of XML documents, each preceded by its length in bytes on a line of its own.
+"""
+
+import re
+import time
+import socket
+import threading
+import xml.etree.ElementTree as ET
+
+from cveLogger import mylogger
+from exception_mapper import *
+from cimc_cache import LIVE
+from cimc_session import is_session_error
+import cimc_xml
+
+RECONNECT_DELAY = 5.0
+MAX_RECONNECT_DELAY = 300.0
+
+# classId: (subsystem, key) for objects kept in a list at inventory[subsystem] or inventory[subsystem][key]
+LIST_CLASSES = {
+    'pciEquipSlot': ('pci', None),
+    'equipmentPsu': ('psu', None),
+    'storageController': ('storageControllers', None),
+    'storageLocalDisk': ('drives', 'storageLocalDisk'),
+    'storageVirtualDrive': ('drives', 'storageVirtualDrive'),
+    'storageLocalDiskUsage': ('drive_usage', None),
+}
+# classId: subsystems holding a single object of the class
+OBJECT_CLASSES = {
+    'computeRackUnit': ('chassis',),
+    'mgmtIf': ('mgmtIf', 'cimc'),
+}
+# classId prefix: subsystem that is refetched when one of its objects changes
+REFETCH_PREFIXES = (
+    ('adaptor', 'adaptor'),
+    ('bios', 'bios'),
+    ('lsboot', 'boot_order'),
+)
+SUBSYSTEM_GETTERS = {
+    'chassis': 'get_chassis_info',
+    'cimc': 'get_cimc_info',
+    'boot_order': 'getBootOrder',
+    'drives': 'get_drive_inventory',
+    'drive_usage': 'get_local_drive_usage',
+    'adaptor': 'get_interface_inventory',
+    'pci': 'get_pci_inventory',
+    'storageControllers': 'getStorageControllerInventory',
+    'psu': 'get_psu_inventory',
+    'bios': 'get_bios_settings',
+    'mgmtIf': 'getMgmtIf',
+    'fw': 'get_fw_versions',
+}
+
+class EventStreamParser():
+    """
+    Split an event stream, fed in arbitrary chunks, into its XML documents
+    """
+    LENGTH_RE = re.compile(rb'\s*(\d+)\r?\n')
+
+    def __init__(self):
+        self._buffer = b''
+
+    def feed(self, chunk):
+        """
+        Return the list of elements completed by this chunk
+        """
+        self._buffer += chunk
+        documents = []
+        while True:
+            document = self._next_document()
+            if document is None:
+                return documents
+            documents.append(ET.fromstring(document))
+
+    def _next_document(self):
+        match = self.LENGTH_RE.match(self._buffer)
+        if match:
+            end = match.end() + int(match.group(1))
+            if len(self._buffer) < end:
+                return None
+            document, self._buffer = self._buffer[match.end():end], self._buffer[end:]
+            return document
+        stripped = self._buffer.lstrip()
+        if not stripped.startswith(b'<'):
+            return None
+        # the subscribe acknowledgement may come without a length line
+        tag = re.match(rb'<([\w:]+)', stripped)
+        start_end = stripped.find(b'>')
+        if tag is None or start_end < 0:
+            return None
+        end = start_end + 1 if stripped[start_end - 1:start_end] == b'/' else None
+        if end is None:
+            close = stripped.find(b'</' + tag.group(1) + b'>')
+            if close < 0:
+                return None
+            end = close + len(tag.group(1)) + 3
+        document, self._buffer = stripped[:end], stripped[end:]
+        return document
+
+def event_subsystems(class_id):
+    """
+    Return the inventory subsystems that an object of class_id belongs to
+    """
+    if class_id in LIST_CLASSES:
+        return (LIST_CLASSES[class_id][0],)
+    if class_id in OBJECT_CLASSES:
+        return OBJECT_CLASSES[class_id]
+    if class_id == 'firmwareRunning':
+        return ('fw',)
+    for prefix, subsystem in REFETCH_PREFIXES:
+        if class_id.startswith(prefix):
+            return (subsystem,)
+    return ()
+
+class EventSubscriber(threading.Thread):
+    """
+    Daemon thread that keeps server.inventory current from the CIMC's event stream until stop() is called.
+
+    on_change, if given, is called as on_change(subsystem, class_id, dn, status) after each applied change.
+    With resync_on_start, every subsystem already in the inventory is fetched again once subscribed.
+    """
+
+    def __init__(self, server, on_change=None, resync_on_start=False, idle_timeout=None,
+                 reconnect_delay=RECONNECT_DELAY):
+        super().__init__(name=f'event-subscriber-{server.ipaddress}', daemon=True)
+        self.server = server
+        self.on_change = on_change
+        self.idle_timeout = idle_timeout
+        self.reconnect_delay = reconnect_delay
+        self.events = 0
+        self.resyncs = 0
+        self.subscribed = threading.Event()
+        self._needs_resync = resync_on_start
+        self._last_eid = None
+        self._response = None
+        self._index = {}
+        # subsystem: [(class_id, dn, status), ...] of the changes waiting for a refetch
+        self._stale = {}
+        self._stopped = threading.Event()
+
+    def run(self):
+        delay = self.reconnect_delay
+        while not self._stopped.is_set():
+            try:
+                self._listen()
+            except Exception as err:
+                if self._stopped.is_set():
+                    break
+                mylogger('Event stream from %s failed: %s', self.server.ipaddress, err)
+            # back off while subscribing keeps failing, reconnect quickly after a stream that was up
+            delay = self.reconnect_delay if self.subscribed.is_set() else min(delay * 2, MAX_RECONNECT_DELAY)
+            self.subscribed.clear()
+            self._needs_resync = True
+            self._stopped.wait(delay)
+
+    def stop(self):
+        self._stopped.set()
+        response = self._response
+        if response is None:
+            return
+        # Closing the response would wait for the lock held by the blocked reader; shutting the socket
+        # down wakes the reader up instead, and it closes the response itself
+        sock = getattr(getattr(response.raw, '_connection', None), 'sock', None)
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _listen(self):
+        command_string = cimc_xml.event_subscribe(self.server.session_cookie)
+        transport = self.server.transport
+        with RemapExceptions():
+            self._response = transport.session.post(transport.url, data=cimc_xml.encode(command_string), stream=True, verify=transport.verify,
+                                                    timeout=(transport.connect_timeout, self.idle_timeout))
+        with self._response:
+            parser = EventStreamParser()
+            for chunk in self._response.iter_content(chunk_size=None):
+                for document in parser.feed(chunk):
+                    self._handle(document, command_string)
+                if self._stopped.is_set():
+                    return
+        raise ConnectionError(f'Event stream from {self.server.ipaddress} closed')
+
+    def _handle(self, document, command_string):
+        if document.tag == 'eventSubscribe':
+            if 'errorCode' in document.attrib:
+                err = ResponseError("'%s': '%s'" % (document.get('errorCode'), document.get('errorDescr')),
+                                    document.get('errorCode'), document.get('errorDescr'))
+                if is_session_error(err):
+                    self.server._renew_session(err, command_string)
+                raise err
+            self._last_eid = None
+            if self._needs_resync:
+                self.resync()
+            else:
+                self._reindex()
+            self.subscribed.set()
+            return
+        events = [document] if document.tag == 'configMoChangeEvent' else document.iter('configMoChangeEvent')
+        for event in events:
+            eid = event.get('inEid')
+            if eid is not None and eid.isdigit():
+                if self._last_eid is not None and int(eid) != self._last_eid + 1:
+                    mylogger('Missed events from %s (%s after %s), resyncing', self.server.ipaddress, eid, self._last_eid)
+                    self._last_eid = int(eid)
+                    self.resync()
+                    continue
+                self._last_eid = int(eid)
+            for in_config in event.iter('inConfig'):
+                for element in in_config:
+                    self.apply(element.tag, dict(element.attrib))
+        self.flush()
+
+    def resync(self):
+        """
+        Fetch every subsystem already in the inventory again from the CIMC
+        """
+        for subsystem in list(self.server.inventory):
+            getter = SUBSYSTEM_GETTERS.get(subsystem)
+            if getter is not None:
+                getattr(self.server, getter)(mode=LIVE)
+        self._needs_resync = False
+        self._stale.clear()
+        self.resyncs += 1
+        self._reindex()
+
+    def _reindex(self):
+        self._index = {}
+        for class_id, (subsystem, key) in LIST_CLASSES.items():
+            for obj in self._objects(subsystem, key) or ():
+                self._index[obj.get('dn')] = obj
+
+    def _objects(self, subsystem, key):
+        inventory = self.server.inventory
+        if subsystem not in inventory:
+            return None
+        if key is None:
+            return inventory[subsystem]
+        return inventory[subsystem].setdefault(key, [])
+
+    def flush(self):
+        """
+        Refetch the subsystems that apply() marked stale
+        """
+        while self._stale:
+            subsystem, changes = self._stale.popitem()
+            getattr(self.server, SUBSYSTEM_GETTERS[subsystem])(mode=LIVE)
+            self._store(subsystem)
+            if self.on_change is not None:
+                for class_id, dn, status in changes:
+                    self.on_change(subsystem, class_id, dn, status)
+        self._reindex()
+
+    def _store(self, subsystem):
+        cache = getattr(self.server, 'inventory_cache', None)
+        if cache is not None:
+            cache.put(self.server.ipaddress, subsystem, self.server.inventory[subsystem])
+
+    def apply(self, class_id, attrib):
+        """
+        Apply one changed managed object to the inventory. Returns the list of subsystems it touched.
+        Subsystems that have to be refetched are only marked, for the next flush().
+        """
+        status = attrib.pop('status', '') or 'modified'
+        dn = attrib.get('dn')
+        inventory = self.server.inventory
+        touched = []
+        for subsystem in event_subsystems(class_id):
+            if subsystem not in inventory or dn is None and class_id not in OBJECT_CLASSES:
+                continue
+            if class_id in LIST_CLASSES:
+                self._apply_to_list(class_id, dn, attrib, status)
+            elif class_id in OBJECT_CLASSES:
+                if status in ('deleted', 'removed'):
+                    continue
+                inventory[subsystem].update(attrib)
+                if subsystem == 'chassis':
+                    self.server._set_chassis_attributes()
+            elif subsystem == 'fw':
+                if status in ('deleted', 'removed'):
+                    inventory['fw'].pop(dn, None)
+                elif 'version' in attrib and 'fw-boot-loader' not in dn:
+                    inventory['fw'][dn] = attrib['version']
+            else:
+                self._stale.setdefault(subsystem, []).append((class_id, dn, status))
+            touched.append(subsystem)
+        self.events += 1
+        if touched:
+            inventory.invalidate()
+        for subsystem in touched:
+            if subsystem in self._stale:
+                continue
+            self._store(subsystem)
+            if self.on_change is not None:
+                self.on_change(subsystem, class_id, dn, status)
+        return touched
+
+    def _apply_to_list(self, class_id, dn, attrib, status):
+        subsystem, key = LIST_CLASSES[class_id]
+        objects = self._objects(subsystem, key)
+        obj = self._index.get(dn)
+        if status in ('deleted', 'removed'):
+            if obj is not None:
+                del self._index[dn]
+                objects[:] = [other for other in objects if other is not obj]
+        elif obj is not None:
+            obj.update(attrib)
+        else:
+            objects.append(attrib)
+            self._index[dn] = attrib
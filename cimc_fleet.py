@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+
+"""
+Run a UcsServer task across many CIMCs from a bounded thread pool.
+
+FleetExecutor logs in to each host, calls task(server) and logs out again, and yields a HostResult per
+host as it finishes. Every failure stays with its host: a login error, an exception from the task or a
+host that runs past host_timeout turns into that host's result and the run carries on.
+
+    def power(server):
+        server.get_chassis_info()
+        return server.inventory['chassis']['operPower']
+
+    executor = FleetExecutor(hosts, 'admin', 'password', workers=64, rate=20, subnet_rate=5, retries=2)
+    for result in executor.run(power):
+        print(result.host, result.value if result.ok else result.error_class, f'{result.elapsed:.1f}s')
+
+rate caps how many hosts are started per second across the fleet and subnet_rate per subnet (/24 by
+default), so a 3,000-host job doesn't hit one rack's switch or an AAA server with hundreds of logins at
+once. Hosts that can't be connected to are retried up to retries times with exponential backoff and full
+jitter. A task that failed after a request went out (a read timeout or a dropped connection) is only
+retried with run(task, idempotent=True): the CIMC may have carried out a configConfMo whose reply was
+lost, and running the task again would repeat it. cimc_async.Fleet is the asyncio counterpart for
+read-only sweeps.
+"""
+
+import time
+import random
+import ipaddress
+import threading
+from collections import namedtuple, defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from pycimc import UcsServer
+from cimc_transport import CimcTransport
+from cimc_async import WILDCARD_HOST
+from cimc_metrics import count_retry
+from cveLogger import mylogger
+from exception_mapper import ConnectionError, TimeoutError, ConnectError, ConnectTimeoutError
+
+FLEET_WORKERS = 32
+HOST_TIMEOUT = 600.0
+SUBNET_PREFIX = 24
+RETRY_BACKOFF = 1.0
+# failures before the request was sent, safe to retry for any task
+RETRYABLE = (ConnectError, ConnectTimeoutError)
+# and failures after it, which only tasks that can safely run twice retry
+IDEMPOTENT_RETRYABLE = (ConnectionError, TimeoutError)
+# longest the result loop sleeps before checking host deadlines again
+POLL_INTERVAL = 1.0
+
+class HostResult(namedtuple('HostResult', ['host', 'value', 'error', 'elapsed', 'attempts'])):
+    """
+    What a task returned for one host, or the exception it failed with, and how long it took in how many attempts
+    """
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    @property
+    def error_class(self):
+        return type(self.error).__name__ if self.error is not None else None
+
+class RateLimiter():
+    """
+    Token bucket shared between threads: acquire() returns once one of rate tokens per second is free.
+    Up to burst tokens can be taken at once after an idle period.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # take the token now, even if it isn't there yet, and wait for it outside the lock
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait_time:
+            time.sleep(wait_time)
+
+def subnet(host, prefix=SUBNET_PREFIX):
+    """
+    The network a host is in, e.g. '10.1.2.0/24' for '10.1.2.3' or '10.1.2.3:443'; a hostname is its own subnet
+    """
+    address = host.rsplit(':', 1)[0] if host.count(':') == 1 else host.strip('[]')
+    try:
+        return str(ipaddress.ip_network(f'{address}/{prefix}', strict=False))
+    except ValueError:
+        return host
+
+class FleetExecutor():
+    """
+    Run a callable against many CIMCs from a pool of worker threads.
+
+    credentials optionally maps a host to {'username': ..., 'password': ...}; the '0.0.0.0' entry is used for
+    hosts that aren't listed, falling back to username/password. server_kwargs (session_cache, models,
+    inventory_cache, ...) are passed on to every UcsServer, and scheme to its CimcTransport.
+    """
+
+    def __init__(self, hosts, username=None, password=None, credentials=None, workers=FLEET_WORKERS, rate=None,
+                 subnet_rate=None, subnet_prefix=SUBNET_PREFIX, host_timeout=HOST_TIMEOUT, retries=0,
+                 retry_on=RETRYABLE, backoff=RETRY_BACKOFF, scheme='https', **server_kwargs):
+        self.hosts = list(hosts)
+        self.username = username
+        self.password = password
+        self.credentials = credentials or {}
+        self.workers = workers
+        self.subnet_prefix = subnet_prefix
+        self.host_timeout = host_timeout
+        self.retries = retries
+        self.retry_on = retry_on
+        self.backoff = backoff
+        self.scheme = scheme
+        self.server_kwargs = server_kwargs
+        self._limiter = RateLimiter(rate) if rate else None
+        self._subnet_limiters = defaultdict(lambda: RateLimiter(subnet_rate)) if subnet_rate else None
+        self._subnet_lock = threading.Lock()
+
+    def credentials_for(self, host):
+        creds = self.credentials.get(host) or self.credentials.get(WILDCARD_HOST) or {}
+        return creds.get('username', self.username), creds.get('password', self.password)
+
+    def server(self, host):
+        """
+        The UcsServer a task runs against; override to customise it
+        """
+        username, password = self.credentials_for(host)
+        kwargs = dict(self.server_kwargs)
+        kwargs.setdefault('transport', CimcTransport(host, scheme=self.scheme))
+        return UcsServer(host, username, password, **kwargs)
+
+    def throttle(self, host):
+        if self._subnet_limiters is not None:
+            with self._subnet_lock:
+                limiter = self._subnet_limiters[subnet(host, self.subnet_prefix)]
+            limiter.acquire()
+        if self._limiter is not None:
+            self._limiter.acquire()
+
+    def run(self, task, idempotent=False):
+        """
+        Run task(server) against every host. Generator yielding a HostResult per host, in the order they finish.
+        A host still running after host_timeout gets a TimeoutError result and its connections are closed; the
+        worker thread is released as soon as its current request returns.
+
+        With idempotent=True, read timeouts and dropped connections are retried as well: only for tasks that
+        can be run twice on a host, like inventory reads.
+        """
+        started = {}
+        servers = {}
+        retry_on = IDEMPOTENT_RETRYABLE if idempotent else self.retry_on
+        pool = ThreadPoolExecutor(self.workers, thread_name_prefix='pycimc-fleet')
+        try:
+            futures = {pool.submit(self._run_host, host, task, started, servers, retry_on): host
+                       for host in self.hosts}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=self._poll_timeout(pending, futures, started),
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+                if self.host_timeout is None:
+                    continue
+                now = time.monotonic()
+                for future in [future for future in pending
+                               if now - started.get(futures[future], (now,))[0] > self.host_timeout]:
+                    pending.discard(future)
+                    host = futures[future]
+                    start, attempts = started[host]
+                    mylogger('%s: still running after %.0fs, giving up on it', host, self.host_timeout)
+                    server = servers.get(host)
+                    if server is not None:
+                        server.close()
+                    yield HostResult(host, None, TimeoutError(f'{host} did not finish within {self.host_timeout}s'),
+                                     now - start, attempts)
+        finally:
+            # don't wait for abandoned hosts, or for queued ones if the caller stopped early
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def collect(self, task, idempotent=False):
+        """
+        Run task against every host and return the list of HostResults
+        """
+        return list(self.run(task, idempotent))
+
+    def _poll_timeout(self, pending, futures, started):
+        if self.host_timeout is None:
+            return None
+        now = time.monotonic()
+        deadlines = [started[futures[future]][0] + self.host_timeout - now for future in pending
+                     if futures[future] in started]
+        return max(0.0, min(deadlines + [POLL_INTERVAL]))
+
+    def _run_host(self, host, task, started, servers, retry_on):
+        attempts = 0
+        while True:
+            self.throttle(host)
+            attempts += 1
+            start = started.get(host, (time.monotonic(),))[0]
+            started[host] = (start, attempts)
+            server = self.server(host)
+            servers[host] = server
+            try:
+                server.login()
+                try:
+                    value = task(server)
+                finally:
+                    try:
+                        server.logout()
+                    except Exception as err:
+                        mylogger('%s: logout failed: %s', host, err)
+                return HostResult(host, value, None, time.monotonic() - start, attempts)
+            except retry_on as err:
+                if attempts > self.retries:
+                    mylogger('%s: %s: %s', host, type(err).__name__, err)
+                    return HostResult(host, None, err, time.monotonic() - start, attempts)
+                delay = random.uniform(0, self.backoff * 2 ** (attempts - 1))
+                mylogger('%s: %s: %s, retrying in %.1fs', host, type(err).__name__, err, delay)
+                count_retry(host, 'task')
+                time.sleep(delay)
+            except Exception as err:
+                mylogger('%s: %s: %s', host, type(err).__name__, err)
+                return HostResult(host, None, err, time.monotonic() - start, attempts)
+            finally:
+                server.close()
+
+def summary(results):
+    """
+    Count results by outcome: {'ok': n, 'ConnectionError': n, ...}
+    """
+    counts = defaultdict(int)
+    for result in results:
+        counts['ok' if result.ok else result.error_class] += 1
+    return dict(counts)
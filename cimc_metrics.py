@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+
+"""
+In-process request metrics for pycimc.
+
+Every XML API request is counted into REGISTRY by host, XML method and classId: request and error
+counts, bytes sent and received, retries and a latency histogram. UcsServer methods decorated with
+@instrumented get a per-method latency histogram as well. Recording is a dict update under a lock,
+cheap enough to leave on; set REGISTRY.enabled = False to turn it off.
+
+Read the numbers with REGISTRY.snapshot(), or hand the registry to an exporter:
+    REGISTRY.add_exporter(PrometheusFileExporter('/var/lib/node_exporter/pycimc.prom'))
+    REGISTRY.export()
+"""
+
+import os
+import json
+import math
+import time
+import bisect
+import threading
+import functools
+from collections import defaultdict
+
+# Upper bounds in seconds; CIMCs answer in tens of milliseconds to tens of seconds
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+REQUEST_LABELS = ('host', 'method', 'classId')
+
+class Histogram():
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        # one count per bucket plus the +Inf overflow, not cumulative
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+class MetricsRegistry():
+    """
+    Counters, gauges and histograms keyed by metric name and a tuple of label values
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._labels = {}
+        self._help = {}
+        self._counters = defaultdict(float)
+        self._gauges = set()
+        self._histograms = {}
+        self._exporters = []
+
+    def describe(self, name, labels, help_text=''):
+        self._labels[name] = tuple(labels)
+        self._help[name] = help_text
+
+    def inc(self, name, label_values, value=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[(name, label_values)] += value
+
+    def set(self, name, label_values, value):
+        """
+        Set a gauge: a value that goes up and down, like a queue depth
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._gauges.add(name)
+            self._counters[(name, label_values)] = value
+
+    def observe(self, name, label_values, value):
+        if not self.enabled:
+            return
+        key = (name, label_values)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def snapshot(self):
+        """
+        Return the current values as a plain dict:
+        {name: [{'labels': {...}, 'value': n} or {'labels': {...}, 'count': n, 'sum': s, 'buckets': [[le, n], ...]}]}
+        """
+        with self._lock:
+            counters = list(self._counters.items())
+            histograms = [(key, list(h.buckets), list(h.counts), h.sum, h.count) for key, h in self._histograms.items()]
+        out = defaultdict(list)
+        for (name, label_values), value in sorted(counters):
+            out[name].append({'labels': self._label_dict(name, label_values), 'value': value})
+        for (name, label_values), buckets, counts, total, count in sorted(histograms, key=lambda h: h[0]):
+            cumulative = []
+            running = 0
+            for bound, bucket_count in zip(buckets + ['+Inf'], counts):
+                running += bucket_count
+                cumulative.append([bound, running])
+            out[name].append({'labels': self._label_dict(name, label_values), 'count': count, 'sum': total,
+                              'buckets': cumulative})
+        return dict(out)
+
+    def _label_dict(self, name, label_values):
+        return dict(zip(self._labels.get(name, ()), label_values))
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def to_prometheus(self):
+        """
+        Render the snapshot in the Prometheus text exposition format
+        """
+        lines = []
+        for name, samples in self.snapshot().items():
+            is_histogram = 'buckets' in samples[0]
+            if self._help.get(name):
+                lines.append(f'# HELP {name} {self._help[name]}')
+            kind = 'histogram' if is_histogram else 'gauge' if name in self._gauges else 'counter'
+            lines.append(f'# TYPE {name} {kind}')
+            for sample in samples:
+                labels = sample['labels']
+                if not is_histogram:
+                    lines.append(f'{name}{format_labels(labels)} {format_value(sample["value"])}')
+                    continue
+                for bound, count in sample['buckets']:
+                    le = bound if bound == '+Inf' else f'{bound:g}'
+                    lines.append(f'{name}_bucket{format_labels(labels, le=le)} {count}')
+                lines.append(f'{name}_sum{format_labels(labels)} {format_value(sample["sum"])}')
+                lines.append(f'{name}_count{format_labels(labels)} {sample["count"]}')
+        return '\n'.join(lines) + '\n'
+
+    def add_exporter(self, exporter):
+        """
+        Register a callable that is passed the registry on every export()
+        """
+        self._exporters.append(exporter)
+
+    def export(self):
+        for exporter in self._exporters:
+            exporter(self)
+
+def format_value(value):
+    """
+    A sample value in full (counters keep counting past 1e6, which '%g' would round), whole numbers as ints
+    """
+    value = float(value)
+    if value != value:
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if value.is_integer() and abs(value) < 2 ** 53:
+        return str(int(value))
+    return repr(value)
+
+def format_labels(labels, **extra):
+    labels = dict(labels, **extra)
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n') for value in labels.values())
+    return '{' + ','.join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + '}'
+
+def write_atomic(path, text):
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w') as out_file:
+        out_file.write(text)
+    os.replace(tmp_path, path)
+
+class PrometheusFileExporter():
+    """
+    Write the registry in Prometheus text format, e.g. for node_exporter's textfile collector
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, registry):
+        write_atomic(self.path, registry.to_prometheus())
+
+class JsonFileExporter():
+
+    def __init__(self, path, indent=None):
+        self.path = path
+        self.indent = indent
+
+    def __call__(self, registry):
+        write_atomic(self.path, registry.to_json(indent=self.indent))
+
+REGISTRY = MetricsRegistry()
+REGISTRY.describe('pycimc_requests_total', REQUEST_LABELS, 'XML API requests sent')
+REGISTRY.describe('pycimc_request_errors_total', REQUEST_LABELS + ('error',), 'XML API requests that failed')
+REGISTRY.describe('pycimc_request_seconds', REQUEST_LABELS, 'XML API request latency')
+REGISTRY.describe('pycimc_bytes_sent_total', REQUEST_LABELS, 'XML API request body bytes')
+REGISTRY.describe('pycimc_bytes_received_total', REQUEST_LABELS, 'XML API response body bytes')
+REGISTRY.describe('pycimc_retries_total', ('host', 'reason'), 'Connection retries and session re-logins')
+REGISTRY.describe('pycimc_method_seconds', ('host', 'method'), 'UcsServer method latency')
+REGISTRY.describe('pycimc_method_errors_total', ('host', 'method', 'error'), 'UcsServer methods that raised')
+REGISTRY.describe('pycimc_round_trips_saved_total', ('host',), 'Queries saved by get_full_inventory()')
+REGISTRY.describe('pycimc_queue_depth', ('host',), 'Requests waiting for a slot at the CIMC')
+REGISTRY.describe('pycimc_in_flight', ('host',), 'Requests the CIMC is working on')
+REGISTRY.describe('pycimc_concurrency_limit', ('host',), 'Requests allowed in flight to the CIMC')
+REGISTRY.describe('pycimc_queue_wait_seconds', ('host',), 'Time requests waited for a slot at the CIMC')
+REGISTRY.describe('pycimc_backoffs_total', ('host', 'reason'), 'Times the concurrency limit for a CIMC was cut')
+REGISTRY.describe('pycimc_coalesced_total', ('host', 'method'), 'Queries answered by an identical query in flight')
+
+def observe_request(host, method, class_id, elapsed, bytes_sent, bytes_received, error=None, registry=REGISTRY):
+    """
+    Record one XML API request
+    """
+    if not registry.enabled:
+        return
+    labels = (host, method, class_id)
+    registry.inc('pycimc_requests_total', labels)
+    registry.observe('pycimc_request_seconds', labels, elapsed)
+    registry.inc('pycimc_bytes_sent_total', labels, bytes_sent)
+    registry.inc('pycimc_bytes_received_total', labels, bytes_received)
+    if error is not None:
+        registry.inc('pycimc_request_errors_total', labels + (error_label(error),))
+
+def count_retry(host, reason, count=1, registry=REGISTRY):
+    if count:
+        registry.inc('pycimc_retries_total', (host, reason), count)
+
+def count_round_trips_saved(host, count, registry=REGISTRY):
+    if count:
+        registry.inc('pycimc_round_trips_saved_total', (host,), count)
+
+def count_coalesced(host, method, registry=REGISTRY):
+    registry.inc('pycimc_coalesced_total', (host, method))
+
+def observe_scheduler(host, waiting, in_flight, limit, registry=REGISTRY):
+    if not registry.enabled:
+        return
+    registry.set('pycimc_queue_depth', (host,), waiting)
+    registry.set('pycimc_in_flight', (host,), in_flight)
+    registry.set('pycimc_concurrency_limit', (host,), limit)
+
+def error_label(error):
+    # ResponseError carries the CIMC's errorCode, which is more useful than the class name
+    error_code = getattr(error, 'error_code', None)
+    return f'{type(error).__name__}:{error_code}' if error_code else type(error).__name__
+
+def instrumented(method):
+    """
+    Decorator for UcsServer methods: record their latency, and errors, under pycimc_method_seconds
+    """
+    @functools.wraps(method)
+    def timed(self, *args, **kw):
+        if not REGISTRY.enabled:
+            return method(self, *args, **kw)
+        tstart = time.perf_counter()
+        try:
+            return method(self, *args, **kw)
+        except Exception as err:
+            REGISTRY.inc('pycimc_method_errors_total', (self.ipaddress, method.__name__, error_label(err)))
+            raise
+        finally:
+            REGISTRY.observe('pycimc_method_seconds', (self.ipaddress, method.__name__), time.perf_counter() - tstart)
+    return timed
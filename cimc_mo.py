@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+
+"""
+Compact managed objects.
+
+A ManagedObject holds the attributes of one CIMC object in __slots__ instead of a per-instance dict,
+and shares one copy of every enumerated value (and of the usual 'yes'/'no'/'Enabled'... strings)
+between all objects. The classes themselves (ComputeRackUnit, StorageLocalDisk, AdaptorHostEthIf, ...)
+are generated from the XML API schema by gen_models.py into cimc_models.py.
+
+ManagedObjects are mutable mappings: obj['serial'], obj.get('dn'), obj.update(...), dict(obj) and
+'serial' in obj work as on the attribute dicts the getters used to return, and obj.serial works too.
+Values are kept as the strings the CIMC sent; typed(name) converts one using the schema type.
+Attributes the class does not know about are kept in a small dict that is only created when needed.
+"""
+
+import sys
+import keyword
+from collections.abc import MutableMapping
+
+# classId -> ManagedObject subclass, filled in by cimc_models
+MODELS = {}
+
+# value -> the one shared copy of it
+INTERNED = {}
+
+def _to_bool(value):
+    return value.lower() in ('true', 'yes', '1', 'enabled', 'on')
+
+CONVERTERS = {'int': int, 'float': float, 'bool': _to_bool, 'str': str}
+
+def slot_name(attribute):
+    """
+    The Python identifier an attribute is stored under: keywords and non-identifiers get mangled
+    """
+    name = attribute.replace('-', '_').replace('.', '_')
+    if keyword.iskeyword(name) or not name.isidentifier():
+        name += '_'
+    return name
+
+class ManagedObject(MutableMapping):
+    """
+    Base class of the generated managed object classes
+    """
+    __slots__ = ('_extra',)
+
+    class_id = None
+    # attribute name -> slot name, for every attribute the schema (or the sample inventory) knows about
+    _slots = {}
+    # attribute name -> 'int', 'float', 'bool' or 'str'
+    _types = {}
+    # attribute name -> frozenset of allowed values, for enumerated attributes
+    _enums = {}
+
+    def __init__(self, attrib=(), **kwargs):
+        self._extra = None
+        self.update(attrib, **kwargs)
+
+    @classmethod
+    def from_attrib(cls, attrib):
+        """
+        Build an object from an attribute dict, e.g. the attrib of a parsed Mo
+        """
+        obj = cls.__new__(cls)
+        slots = cls._slots
+        extra = None
+        for key, value in attrib.items():
+            if value.__class__ is str:
+                value = INTERNED.get(value, value)
+            slot = slots.get(key)
+            if slot is not None:
+                setattr(obj, slot, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[sys.intern(key)] = value
+        obj._extra = extra
+        return obj
+
+    @classmethod
+    def from_element(cls, element):
+        return cls.from_attrib(element.attrib)
+
+    def __getitem__(self, key):
+        slot = self._slots.get(key)
+        if slot is not None:
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        slot = self._slots.get(key)
+        if slot is not None:
+            setattr(self, slot, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[sys.intern(key)] = value
+
+    def __delitem__(self, key):
+        slot = self._slots.get(key)
+        if slot is not None:
+            try:
+                delattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __iter__(self):
+        for key, slot in self._slots.items():
+            if hasattr(self, slot):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        slot = self._slots.get(key)
+        if slot is not None:
+            return hasattr(self, slot)
+        return self._extra is not None and key in self._extra
+
+    def __eq__(self, other):
+        if isinstance(other, (ManagedObject, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __reduce__(self):
+        return (self.__class__.from_attrib, (dict(self.items()),))
+
+    def copy(self):
+        return self.__class__.from_attrib(dict(self.items()))
+
+    def typed(self, key, default=None):
+        """
+        Return an attribute converted to its schema type (int, float, bool or str), or default if it
+        is missing or does not convert (the CIMC reports e.g. 'N/A' for some numbers)
+        """
+        value = self.get(key)
+        if value is None:
+            return default
+        try:
+            return CONVERTERS[self._types.get(key, 'str')](value)
+        except ValueError:
+            return default
+
+    def invalid(self):
+        """
+        Return {attribute: value} for the enumerated attributes whose value the schema does not allow
+        """
+        return {key: self[key] for key, allowed in self._enums.items() if key in self and self[key] not in allowed}
+
+def model(class_id):
+    """
+    Return the ManagedObject class for class_id, or None if there is none
+    """
+    if not MODELS:
+        import cimc_models
+    return MODELS.get(class_id)
+
+def make(class_id, attrib):
+    """
+    Return attrib as a ManagedObject of class_id, or unchanged if the class is unknown
+    """
+    cls = MODELS.get(class_id) or model(class_id)
+    return cls.from_attrib(attrib) if cls is not None else attrib
+
+def to_json(obj):
+    """
+    json.dump default= hook for inventories that hold ManagedObjects
+    """
+    if isinstance(obj, ManagedObject):
+        return dict(obj.items())
+    raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
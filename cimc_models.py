@@ -0,0 +1,2757 @@
+#!/usr/bin/env python
+
+# Generated by gen_models.py from RACK-IN-NEW.xsd and sample_inventory.json. Do not edit.
+
+"""
+Managed object classes of the CIMC XML API, see cimc_mo
+"""
+
+from cimc_mo import ManagedObject, MODELS, INTERNED
+
+E0 = frozenset(('Africa/Abidjan', 'Africa/Accra', 'Africa/Addis Ababa', 'Africa/Algiers', 'Africa/Asmara', 'Africa/Bamako', 'Africa/Bangui', 'Africa/Banjul', 'Africa/Bissau', 'Africa/Blantyre', 'Africa/Brazzaville', 'Africa/Bujumbura', 'Africa/Cairo', 'Africa/Casablanca', 'Africa/Ceuta', 'Africa/Conakry', 'Africa/Dakar', 'Africa/Dar es Salaam', 'Africa/Djibouti', 'Africa/Douala', 'Africa/El Aaiun', 'Africa/Freetown', 'Africa/Gaborone', 'Africa/Harare', 'Africa/Johannesburg', 'Africa/Juba', 'Africa/Kampala', 'Africa/Khartoum', 'Africa/Kigali', 'Africa/Kinshasa', 'Africa/Lagos', 'Africa/Libreville', 'Africa/Lome', 'Africa/Luanda', 'Africa/Lubumbashi', 'Africa/Lusaka', 'Africa/Malabo', 'Africa/Maputo', 'Africa/Maseru', 'Africa/Mbabane', 'Africa/Mogadishu', 'Africa/Monrovia', 'Africa/Nairobi', 'Africa/Ndjamena', 'Africa/Niamey', 'Africa/Nouakchott', 'Africa/Ouagadougou', 'Africa/Porto-Novo', 'Africa/Sao Tome', 'Africa/Tripoli', 'Africa/Tunis', 'Africa/Windhoek', 'America/Adak', 'America/Anchorage', 'America/Anguilla', 'America/Antigua', 'America/Araguaina', 'America/Argentina/Buenos Aires', 'America/Argentina/Catamarca', 'America/Argentina/Cordoba', 'America/Argentina/Jujuy', 'America/Argentina/La Rioja', 'America/Argentina/Mendoza', 'America/Argentina/Rio Gallegos', 'America/Argentina/Salta', 'America/Argentina/San Juan', 'America/Argentina/San Luis', 'America/Argentina/Tucuman', 'America/Argentina/Ushuaia', 'America/Aruba', 'America/Asuncion', 'America/Atikokan', 'America/Bahia', 'America/Bahia Banderas', 'America/Barbados', 'America/Belem', 'America/Belize', 'America/Blanc-Sablon', 'America/Boa Vista', 'America/Bogota', 'America/Boise', 'America/Cambridge Bay', 'America/Campo Grande', 'America/Cancun', 'America/Caracas', 'America/Cayenne', 'America/Cayman', 'America/Chicago', 'America/Chihuahua', 'America/Costa Rica', 'America/Creston', 'America/Cuiaba', 'America/Curacao', 'America/Danmarkshavn', 'America/Dawson', 'America/Dawson Creek', 'America/Denver', 'America/Detroit', 'America/Dominica', 'America/Edmonton', 'America/Eirunepe', 'America/El Salvador', 'America/Fortaleza', 'America/Glace Bay', 'America/Godthab', 'America/Goose Bay', 'America/Grand Turk', 'America/Grenada', 'America/Guadeloupe', 'America/Guatemala', 'America/Guayaquil', 'America/Guyana', 'America/Halifax', 'America/Havana', 'America/Hermosillo', 'America/Indiana/Indianapolis', 'America/Indiana/Knox', 'America/Indiana/Marengo', 'America/Indiana/Petersburg', 'America/Indiana/Tell City', 'America/Indiana/Vevay', 'America/Indiana/Vincennes', 'America/Indiana/Winamac', 'America/Inuvik', 'America/Iqaluit', 'America/Jamaica', 'America/Juneau', 'America/Kentucky/Louisville', 'America/Kentucky/Monticello', 'America/Kralendijk', 'America/La Paz', 'America/Lima', 'America/Los Angeles', 'America/Lower Princes', 'America/Maceio', 'America/Managua', 'America/Manaus', 'America/Marigot', 'America/Martinique', 'America/Matamoros', 'America/Mazatlan', 'America/Menominee', 'America/Merida', 'America/Metlakatla', 'America/Mexico City', 'America/Miquelon', 'America/Moncton', 'America/Monterrey', 'America/Montevideo', 'America/Montreal', 'America/Montserrat', 'America/Nassau', 'America/New York', 'America/Nipigon', 'America/Nome', 'America/Noronha', 'America/North Dakota/Beulah', 'America/North Dakota/Center', 'America/North Dakota/New Salem', 'America/Ojinaga', 'America/Panama', 'America/Pangnirtung', 'America/Paramaribo', 'America/Phoenix', 'America/Port of Spain', 'America/Port-au-Prince', 'America/Porto Velho', 'America/Puerto Rico', 'America/Rainy River', 'America/Rankin Inlet', 'America/Recife', 'America/Regina', 'America/Resolute', 'America/Rio Branco', 'America/Santa Isabel', 'America/Santarem', 'America/Santiago', 'America/Santo Domingo', 'America/Sao Paulo', 'America/Scoresbysund', 'America/Shiprock', 'America/Sitka', 'America/St Barthelemy', 'America/St Johns', 'America/St Kitts', 'America/St Lucia', 'America/St Thomas', 'America/St Vincent', 'America/Swift Current', 'America/Tegucigalpa', 'America/Thule', 'America/Thunder Bay', 'America/Tijuana', 'America/Toronto', 'America/Tortola', 'America/Vancouver', 'America/Whitehorse', 'America/Winnipeg', 'America/Yakutat', 'America/Yellowknife', 'Antarctica/Casey', 'Antarctica/Davis', 'Antarctica/DumontDUrville', 'Antarctica/Macquarie', 'Antarctica/Mawson', 'Antarctica/McMurdo', 'Antarctica/Palmer', 'Antarctica/Rothera', 'Antarctica/South Pole', 'Antarctica/Syowa', 'Antarctica/Troll', 'Antarctica/Vostok', 'Arctic/Longyearbyen', 'Asia/Aden', 'Asia/Almaty', 'Asia/Amman', 'Asia/Anadyr', 'Asia/Aqtau', 'Asia/Aqtobe', 'Asia/Ashgabat', 'Asia/Baghdad', 'Asia/Bahrain', 'Asia/Baku', 'Asia/Bangkok', 'Asia/Beirut', 'Asia/Bishkek', 'Asia/Brunei', 'Asia/Choibalsan', 'Asia/Chongqing', 'Asia/Colombo', 'Asia/Damascus', 'Asia/Dhaka', 'Asia/Dili', 'Asia/Dubai', 'Asia/Dushanbe', 'Asia/Gaza', 'Asia/Harbin', 'Asia/Hebron', 'Asia/Ho Chi Minh', 'Asia/Hong Kong', 'Asia/Hovd', 'Asia/Irkutsk', 'Asia/Jakarta', 'Asia/Jayapura', 'Asia/Jerusalem', 'Asia/Kabul', 'Asia/Kamchatka', 'Asia/Karachi', 'Asia/Kashgar', 'Asia/Kathmandu', 'Asia/Khandyga', 'Asia/Kolkata', 'Asia/Krasnoyarsk', 'Asia/Kuala Lumpur', 'Asia/Kuching', 'Asia/Kuwait', 'Asia/Macau', 'Asia/Magadan', 'Asia/Makassar', 'Asia/Manila', 'Asia/Muscat', 'Asia/Nicosia', 'Asia/Novokuznetsk', 'Asia/Novosibirsk', 'Asia/Omsk', 'Asia/Oral', 'Asia/Phnom Penh', 'Asia/Pontianak', 'Asia/Pyongyang', 'Asia/Qatar', 'Asia/Qyzylorda', 'Asia/Rangoon', 'Asia/Riyadh', 'Asia/Sakhalin', 'Asia/Samarkand', 'Asia/Seoul', 'Asia/Shanghai', 'Asia/Singapore', 'Asia/Taipei', 'Asia/Tashkent', 'Asia/Tbilisi', 'Asia/Tehran', 'Asia/Thimphu', 'Asia/Tokyo', 'Asia/Ulaanbaatar', 'Asia/Urumqi', 'Asia/Ust-Nera', 'Asia/Vientiane', 'Asia/Vladivostok', 'Asia/Yakutsk', 'Asia/Yekaterinburg', 'Asia/Yerevan', 'Atlantic/Azores', 'Atlantic/Bermuda', 'Atlantic/Canary', 'Atlantic/Cape Verde', 'Atlantic/Faroe', 'Atlantic/Madeira', 'Atlantic/Reykjavik', 'Atlantic/South Georgia', 'Atlantic/St Helena', 'Atlantic/Stanley', 'Australia/Adelaide', 'Australia/Brisbane', 'Australia/Broken Hill', 'Australia/Currie', 'Australia/Darwin', 'Australia/Eucla', 'Australia/Hobart', 'Australia/Lindeman', 'Australia/Lord Howe', 'Australia/Melbourne', 'Australia/Perth', 'Australia/Sydney', 'Europe/Amsterdam', 'Europe/Andorra', 'Europe/Athens', 'Europe/Belgrade', 'Europe/Berlin', 'Europe/Bratislava', 'Europe/Brussels', 'Europe/Bucharest', 'Europe/Budapest', 'Europe/Busingen', 'Europe/Chisinau', 'Europe/Copenhagen', 'Europe/Dublin', 'Europe/Gibraltar', 'Europe/Guernsey', 'Europe/Helsinki', 'Europe/Isle of Man', 'Europe/Istanbul', 'Europe/Jersey', 'Europe/Kaliningrad', 'Europe/Kiev', 'Europe/Lisbon', 'Europe/Ljubljana', 'Europe/London', 'Europe/Luxembourg', 'Europe/Madrid', 'Europe/Malta', 'Europe/Mariehamn', 'Europe/Minsk', 'Europe/Monaco', 'Europe/Moscow', 'Europe/Oslo', 'Europe/Paris', 'Europe/Podgorica', 'Europe/Prague', 'Europe/Riga', 'Europe/Rome', 'Europe/Samara', 'Europe/San Marino', 'Europe/Sarajevo', 'Europe/Simferopol', 'Europe/Skopje', 'Europe/Sofia', 'Europe/Stockholm', 'Europe/Tallinn', 'Europe/Tirane', 'Europe/Uzhgorod', 'Europe/Vaduz', 'Europe/Vatican', 'Europe/Vienna', 'Europe/Vilnius', 'Europe/Volgograd', 'Europe/Warsaw', 'Europe/Zagreb', 'Europe/Zaporozhye', 'Europe/Zurich', 'Indian/Antananarivo', 'Indian/Chagos', 'Indian/Christmas', 'Indian/Cocos', 'Indian/Comoro', 'Indian/Kerguelen', 'Indian/Mahe', 'Indian/Maldives', 'Indian/Mauritius', 'Indian/Mayotte', 'Indian/Reunion', 'Pacific/Apia', 'Pacific/Auckland', 'Pacific/Chatham', 'Pacific/Chuuk', 'Pacific/Easter', 'Pacific/Efate', 'Pacific/Enderbury', 'Pacific/Fakaofo', 'Pacific/Fiji', 'Pacific/Funafuti', 'Pacific/Galapagos', 'Pacific/Gambier', 'Pacific/Guadalcanal', 'Pacific/Guam', 'Pacific/Honolulu', 'Pacific/Johnston', 'Pacific/Kiritimati', 'Pacific/Kosrae', 'Pacific/Kwajalein', 'Pacific/Majuro', 'Pacific/Marquesas', 'Pacific/Midway', 'Pacific/Nauru', 'Pacific/Niue', 'Pacific/Norfolk', 'Pacific/Noumea', 'Pacific/Pago Pago', 'Pacific/Palau', 'Pacific/Pitcairn', 'Pacific/Pohnpei', 'Pacific/Port Moresby', 'Pacific/Rarotonga', 'Pacific/Saipan', 'Pacific/Tahiti', 'Pacific/Tarawa', 'Pacific/Tongatapu', 'Pacific/Wake', 'Pacific/Wallis', 'UTC'))
+E1 = frozenset(('Disabled', 'Enabled', 'disabled', 'enabled'))
+E2 = frozenset(('', 'created', 'deleted', 'modified', 'removed'))
+E3 = frozenset(('bmc-reset-default', 'bmc-reset-immediate', 'cmos-reset-immediate', 'cycle-immediate', 'diagnostic-interrupt', 'down', 'hard-reset-immediate', 'soft-shut-down', 'up'))
+E4 = frozenset(('115200', '19200', '38400', '57600', '9600'))
+E5 = frozenset(('com0', 'com1'))
+E6 = frozenset(('off', 'on'))
+E7 = frozenset(('No', 'Yes', 'no', 'yes'))
+E8 = frozenset(('clear',))
+E9 = frozenset(('SEL', 'Syslog'))
+E10 = frozenset(('Yes', 'yes'))
+E11 = frozenset(('disabled', 'full', 'limited'))
+E12 = frozenset(('commit', 'no-commit'))
+E13 = frozenset(('informs', 'traps'))
+E14 = frozenset(('v2c', 'v3'))
+E15 = frozenset(('condition', 'critical', 'informational', 'major', 'minor', 'warning'))
+E16 = frozenset(('critical', 'informational', 'major', 'minor', 'warning'))
+E17 = frozenset(('clear', 'send-test-mail'))
+E18 = frozenset(('delete-client-certificate', 'delete-client-private-key', 'delete-root-ca-certificate'))
+E19 = frozenset(('activate-external-cert',))
+E20 = frozenset(('trigger',))
+E21 = frozenset(('ftp', 'http', 'scp', 'sftp', 'tftp'))
+E22 = frozenset(('delete-all-saved-mappings',))
+E23 = frozenset(('admin', 'read-only', 'user'))
+E24 = frozenset(('reset-event-filters',))
+E25 = frozenset(('none', 'power-cycle', 'power-off', 'reboot'))
+E26 = frozenset(('remote', 'usb'))
+E27 = frozenset(('reset-power-profile-default', 'start-power-char'))
+E28 = frozenset(('alert', 'alert,shutdown', 'none', 'shutdown'))
+E29 = frozenset(('1', '2', '3', '4', '5'))
+E30 = frozenset(('lan',))
+E31 = frozenset(('read-only',))
+E32 = frozenset(('pxe',))
+E33 = frozenset(('virtual-media',))
+E34 = frozenset(('read-only', 'read-write'))
+E35 = frozenset(('storage',))
+E36 = frozenset(('read-write',))
+E37 = frozenset(('efi',))
+E38 = frozenset(('Legacy', 'Uefi'))
+E39 = frozenset(('VMEDIA',))
+E40 = frozenset(('', 'cimc-mapped-dvd', 'cimc-mapped-hdd', 'kvm-mapped-dvd', 'kvm-mapped-fdd', 'kvm-mapped-hdd'))
+E41 = frozenset(('', 'read-only-local', 'read-only-remote', 'read-write-drive', 'read-write-local', 'read-write-remote'))
+E42 = frozenset(('PXE',))
+E43 = frozenset(('', 'IPv4', 'IPv6'))
+E44 = frozenset(('HTTP',))
+E45 = frozenset(('', 'DHCP', 'Static'))
+E46 = frozenset(('LOCALHDD',))
+E47 = frozenset(('LOCALCDD',))
+E48 = frozenset(('SDCARD',))
+E49 = frozenset(('', 'SDCARD', 'flex-flash', 'flex-util'))
+E50 = frozenset(('USB',))
+E51 = frozenset(('', 'usb-cd', 'usb-fdd', 'usb-hdd'))
+E52 = frozenset(('SAN',))
+E53 = frozenset(('ISCSI',))
+E54 = frozenset(('PCHSTORAGE',))
+E55 = frozenset(('NVME',))
+E56 = frozenset(('UEFISHELL',))
+E57 = frozenset(('clear-one-time-boot-device',))
+E58 = frozenset(('huu', 'hv', 'none', 'scu'))
+E59 = frozenset(('Disabled', 'Enabled', 'disabled', 'enabled', 'platform-default'))
+E60 = frozenset(('Disabled', 'Enabled', 'LOMs Only', 'disabled', 'enabled', 'platform-default'))
+E61 = frozenset(('13', '5', 'Infinite', 'platform-default'))
+E62 = frozenset(('15', '45', '90', 'platform-default'))
+E63 = frozenset(('custom', 'enterprise', 'high-throughput', 'hpc', 'platform-default'))
+E64 = frozenset(('115200', '19200', '38400', '57600', '9600', 'platform-default'))
+E65 = frozenset(('com-0', 'com-1', 'disabled', 'enabled', 'platform-default', 'serial-port-a'))
+E66 = frozenset(('none', 'platform-default', 'rts-cts'))
+E67 = frozenset(('pc-ansi', 'platform-default', 'vt-utf8', 'vt100', 'vt100-plus'))
+E68 = frozenset(('ESCN', 'LINUX', 'SCO', 'VT100', 'VT400', 'XTERMR6', 'platform-default'))
+E69 = frozenset(('Always Enable', 'Bootloader', 'platform-default'))
+E70 = frozenset(('Base', 'Config 1', 'Config 2', 'platform-default'))
+E71 = frozenset(('do-nothing', 'platform-default', 'power-off', 'reset'))
+E72 = frozenset(('10-minutes', '15-minutes', '20-minutes', '5-minutes', 'platform-default'))
+E73 = frozenset(('adddc-sparing', 'lockstep', 'maximum-performance', 'mirror-mode-1lm', 'mirroring', 'partial-mirror-mode-1lm', 'platform-default', 'sparing'))
+E74 = frozenset(('Disabled', 'Hard PPR', 'disabled', 'platform-default'))
+E75 = frozenset(('Acoustic', 'Balanced', 'High Power', 'Low Power', 'Maximum Power', 'Performance'))
+E76 = frozenset(('grid', 'n-plus-one', 'non-redundant'))
+E77 = frozenset(('last-state', 'reset', 'stay-off'))
+E78 = frozenset(('fixed', 'random'))
+E79 = frozenset(('1500-m', '300-m', '3000-m', '900-m', 'auto', 'platform-default'))
+E80 = frozenset(('Auto', 'Disabled', 'Force L0s', 'L1 Only', 'platform-default'))
+E81 = frozenset(('Auto', 'Disabled', 'Enabled', 'auto', 'disabled', 'enabled', 'platform-default'))
+E82 = frozenset(('Disabled', 'Enabled', 'Legacy Only', 'UEFI Only', 'disabled', 'enabled', 'platform-default'))
+E83 = frozenset(('Auto', 'Disabled', 'GEN1', 'GEN2', 'GEN3', 'platform-default'))
+E84 = frozenset(('Disabled', 'Enabled', 'X2APIC', 'XAPIC', 'disabled', 'enabled', 'platform-default'))
+E85 = frozenset(('Offboard', 'Onboard', 'Onboard VGA Disabled', 'platform-default'))
+E86 = frozenset(('Max Efficient', 'Max Performance', 'Set by Intel NM', 'platform-default'))
+E87 = frozenset(('AHCI', 'Disabled', 'LSI SW RAID', 'platform-default'))
+E88 = frozenset(('Auto', 'Disabled', 'Enabled', 'disabled', 'enabled', 'platform-default'))
+E89 = frozenset(('Auto', 'Off', 'platform-default'))
+E90 = frozenset(('Auto', 'FOUR (2 + 2)', 'FOUR (4 + 0)', 'SIX (3 + 3)', 'THREE (3 + 0)', 'TWO (1 + 1)', 'TWO (2 + 0)', 'platform-default'))
+E91 = frozenset(('1', '10', '11', '12', '13', '14', '15', '16', '17', '18', '19', '2', '20', '21', '22', '23', '24', '25', '26', '27', '28', '3', '4', '5', '6', '7', '8', '9', 'all', 'platform-default'))
+E92 = frozenset(('balanced-energy', 'balanced-performance', 'balanced-power', 'energy-efficient', 'performance', 'platform-default', 'power'))
+E93 = frozenset(('custom', 'disabled', 'energy-efficient', 'performance', 'platform-default'))
+E94 = frozenset(('auto', 'disabled', 'fast', 'platform-default', 'slow'))
+E95 = frozenset(('Auto', 'Balanced', 'Energy Efficient', 'Performance', 'platform-default'))
+E96 = frozenset(('1x', '2x', '3x', '4x', 'Auto', 'platform-default'))
+E97 = frozenset(('BIOS', 'OS', 'platform-default'))
+E98 = frozenset(('Disabled', 'HWPM Native Mode', 'HWPM OOB Mode', 'NATIVE MODE', 'Native Mode with no Legacy', 'OOB MODE', 'platform-default'))
+E99 = frozenset(('IOH0 24k IOH1 40k', 'IOH0 32k IOH1 32k', 'IOH0 40k IOH1 24k', 'IOH0 48k IOH1 16k', 'IOH0 56k IOH1 8k', 'platform-default'))
+E100 = frozenset(('No', 'Yes', 'platform-default'))
+E101 = frozenset(('auto', 'performance-mode', 'platform-default', 'power-saving-mode'))
+E102 = frozenset(('1 GB', '2 GB', '2.5 GB', '3 GB', 'Auto', 'platform-default'))
+E103 = frozenset(('1-way', '2-way', '3-way', '4-way', 'auto', 'platform-default'))
+E104 = frozenset(('1-way', '2-way', '4-way', '8-way', 'auto', 'platform-default'))
+E105 = frozenset(('1 Way Node Interleave', '2 Way Node Interleave', '4 Way Node Interleave', '8 Way Node Interleave', 'Disabled', 'Enabled', 'disabled', 'enabled', 'platform-default'))
+E106 = frozenset(('inter-socket', 'intra-socket', 'platform-default'))
+E107 = frozenset(('Intel RSTe', 'LSI SW RAID', 'platform-default'))
+E108 = frozenset(('HW ALL', 'SW ALL', 'SW ANY', 'platform-default'))
+E109 = frozenset(('Auto', 'C0 C1 State', 'C0/C1', 'C2', 'C6 Non Retention', 'C6 Retention', 'C6 non Retention', 'No Limit', 'platform-default'))
+E110 = frozenset(('Balanced Performance', 'Balanced Power', 'Performance', 'Power', 'platform-default'))
+E111 = frozenset(('Auto', 'Disabled', 'disabled', 'platform-default'))
+E112 = frozenset(('Auto', 'Channel', 'Die', 'None', 'Socket', 'platform-default'))
+E113 = frozenset(('1 KB', '2 KB', '256 Bytes', '512 Bytes', 'Auto', 'platform-default'))
+E114 = frozenset(('Auto', 'Performance', 'Power', 'platform-default'))
+E115 = frozenset(('Auto', 'Manual', 'platform-default'))
+E116 = frozenset(('bios', 'os', 'platform-default'))
+E117 = frozenset(('6.4-gt/s', '7.2-gt/s', '8.0-gt/s', '9.6-gt/s', 'auto', 'platform-default'))
+E118 = frozenset(('auto', 'cluster-on-die', 'early-snoop', 'home-directory-snoop', 'home-directory-snoop-with-osb', 'home-snoop', 'platform-default'))
+E119 = frozenset(('dimm-sparing', 'platform-default', 'rank-sparing'))
+E120 = frozenset(('Loose', 'Strict', 'platform-default'))
+E121 = frozenset(('Balanced', 'I/O Sensitive', 'NUMA', 'UMA', 'platform-default'))
+E122 = frozenset(('1-way Interleave', '2-way Interleave', 'Auto', 'platform-default'))
+E123 = frozenset(('Maximum', 'Minimum', 'Normal', 'platform-default'))
+E124 = frozenset(('Disabled', 'Percentage', 'Value in GB', 'disabled', 'platform-default'))
+E125 = frozenset(('Disabled', 'Recipe 1', 'Recipe 2', 'Recipe 3', 'platform-default'))
+E126 = frozenset(('BW Optimized', 'Balanced Profile', 'Latency Optimized', 'platform-default'))
+E127 = frozenset(('Auto', 'Default', 'Option 1', 'Option 2', 'Option 3', 'Option 4', 'Option 5', 'platform-default'))
+E128 = frozenset(('Level 1', 'Level 2', 'Normal', 'platform-default'))
+E129 = frozenset(('10.4GT/s', '9.6GT/s', 'Auto', 'platform-default'))
+E130 = frozenset(('Auto', 'Disabled', 'ZeroPointFive', 'platform-default'))
+E131 = frozenset(('1x Refresh', '2x Refresh', 'platform-default'))
+E132 = frozenset(('High', 'Low', 'platform-default'))
+E133 = frozenset(('CLTT with PECI', 'Disabled', 'platform-default'))
+E134 = frozenset(('253 ASIDs', '509 ASIDs', 'Auto', 'platform-default'))
+E135 = frozenset(('cifs', 'nfs', 'www'))
+E136 = frozenset(('save-unmapped-volume',))
+E137 = frozenset(('delete-volume', 'remap-volume'))
+E138 = frozenset(('primary', 'secondary'))
+E139 = frozenset(('tcp', 'udp'))
+E140 = frozenset(('alert', 'critical', 'debug', 'emergency', 'error', 'informational', 'notice', 'warning'))
+E141 = frozenset(('adaptor-reset', 'adaptor-reset-default'))
+E142 = frozenset(('0', '1', '2', '3'))
+E143 = frozenset(('10Gbps', '1Gbps', '40Gbps', '4x10Gbps', 'Auto'))
+E144 = frozenset(('Auto', 'Off', 'cl74', 'cl91'))
+E145 = frozenset(('OFF', 'ON', 'off', 'on'))
+E146 = frozenset(('ACCESS', 'TRUNK'))
+E147 = frozenset(('IDLE', 'MIN'))
+E148 = frozenset(('INTx', 'MSI', 'MSIx'))
+E149 = frozenset(('0', '1', '2', '4', '5', '6'))
+E150 = frozenset(('rebuild',))
+E151 = frozenset(('fc-initiator', 'fc-nvme-initiator', 'fc-nvme-target', 'fc-target'))
+E152 = frozenset(('adaptor', 'blade-bios', 'blade-controller', 'device-connector', 'sas-expander', 'sioc'))
+E153 = frozenset(('cancel-pending-activate', 'trigger'))
+E154 = frozenset(('backup', 'running'))
+E155 = frozenset(('scp', 'sftp'))
+E156 = frozenset(('scp', 'sftp', 'tftp', 'www'))
+E157 = frozenset(('microsd', 'pxe', 'vmedia'))
+E158 = frozenset(('scp',))
+E159 = frozenset(('delay', 'delay_reboot', 'immediate'))
+E160 = frozenset(('microsd', 'pxeboot', 'sd', 'vmedia'))
+E161 = frozenset(('Disabled', 'Enabled'))
+E162 = frozenset(('no', 'yes'))
+E163 = frozenset(('cisco_card', 'dedicated', 'shared_lom', 'shared_lom_10g', 'shared_lom_ext', 'shipping'))
+E164 = frozenset(('1', '10', '11', '12', '2', '4', '5', '9', 'flex-lom', 'mlom', 'riser1', 'riser2', 'riser3'))
+E165 = frozenset(('active-active', 'active-standby', 'none'))
+E166 = frozenset(('100Mbps', '10Mbps', '1Gbps', 'auto'))
+E167 = frozenset(('auto', 'full', 'half'))
+E168 = frozenset(('clearAll', 'clearFilter1', 'clearFilter2', 'clearFilter3', 'clearFilter4'))
+E169 = frozenset(('ldap-user-db', 'local-user-db', 'tacacs-user-db'))
+E170 = frozenset(('active', 'inactive'))
+E171 = frozenset(('ldap-user-db', 'local-user-db'))
+E172 = frozenset(('configured-domain', 'extracted-configured-domain', 'extracted-domain'))
+E173 = frozenset(('anonymous', 'configured-credentials', 'login-credentials'))
+E174 = frozenset(('', 'admin', 'read-only', 'user'))
+E175 = frozenset(('', 'authnopriv', 'authpriv', 'noauthnopriv'))
+E176 = frozenset(('', 'MD5', 'SHA'))
+E177 = frozenset(('', 'AES'))
+E178 = frozenset(('local', 'remote'))
+E179 = frozenset(('disable-self-encrypt', 'enable-self-encrypt', 'modify-self-encrypt', 'switch-local-to-remote', 'switch-remote-to-local', 'unlock-secured-drives'))
+E180 = frozenset(('0', '1', '10', '5', '50', '6', '60'))
+E181 = frozenset(('Always Write Back', 'Write Back Good BBU', 'Write Through', 'always-write-back', 'default', 'write-back-good-bbu', 'write-through'))
+E182 = frozenset(('1024k', '128k', '16k', '256k', '32k', '512k', '64k', '8k', 'default'))
+E183 = frozenset(('always-read-ahead', 'default', 'no-read-ahead'))
+E184 = frozenset(('cached-io', 'default', 'direct-io'))
+E185 = frozenset(('blocked', 'default', 'read-only', 'read-write'))
+E186 = frozenset(('default', 'disabled', 'enabled', 'unchanged'))
+E187 = frozenset(('enable-self-encrypt',))
+E188 = frozenset(('1', '2', '3', '4'))
+E189 = frozenset(('0', '10', '12', '2', '4', '6', '8'))
+E190 = frozenset(('block', 'raw'))
+E191 = frozenset(('disable-security', 'enable-security', 'modify-passphrase', 'reset-factory-default', 'secure-erase', 'unlock-dimms'))
+E192 = frozenset(('host-managed', 'imc-managed'))
+E193 = frozenset(('1', '2', '3', '4', 'ALL'))
+E194 = frozenset(('ALL',))
+E195 = frozenset(('app-direct', 'app-direct-non-interleaved'))
+E196 = frozenset(('clear-all-config', 'clear-boot-drive', 'clear-cache', 'clear-foreign-config', 'delete-all-vds-reset-pds', 'disable-jbod', 'enable-jbod', 'get-tty-log', 'import-foreign-config', 'reset-default-config'))
+E197 = frozenset(('reset-card-configuration',))
+E198 = frozenset(('cancel-update', 'disable-vd', 'enable-vd', 'erase-vd', 'update-vd'))
+E199 = frozenset(('map', 'unmap'))
+E200 = frozenset(('configure-cards', 'configure-firmware-mode', 'reset-flexflash-controller', 'reset-partition-default', 'sync-card-configuration'))
+E201 = frozenset(('none', 'slot-1', 'slot-2'))
+E202 = frozenset(('mirror', 'util'))
+E203 = frozenset(('Non-Removable', 'Removable', 'non-removable', 'removable'))
+E204 = frozenset(('slot-1', 'slot-2'))
+E205 = frozenset(('active', 'initializing'))
+E206 = frozenset(('clear-errors',))
+E207 = frozenset(('disable-vd', 'enable-vd', 'erase-vd', 'sync-vd', 'update-vd'))
+E208 = frozenset(('abort-copyback', 'disable-sed-foreign-drives', 'disable-self-encrypt', 'enable-self-encrypt', 'locator-led-off', 'locator-led-on', 'make-dedicated-hot-spare', 'make-global-hot-spare', 'make-jbod', 'make-unconfigured-good', 'pause-copyback', 'prepare-for-removal', 'remove-hot-spare', 'resume-copyback', 'set-boot-drive', 'start-copyback', 'undo-prepare-for-removal'))
+E209 = frozenset(('cancel-initialization', 'clear-transport-ready', 'enable-self-encrypt', 'hide-virtual-drive', 'reconstruct-virtual-drive', 'set-boot-drive', 'set-transport-ready', 'start-fast-initialization', 'start-full-initialization', 'unhide-virtual-drive'))
+E210 = frozenset(('exclude-all', 'include-all', 'include-dhsp'))
+E211 = frozenset(('0', '1', '5', '6'))
+E212 = frozenset(('disable-auto-learn', 'enable-auto-learn', 'start-learn-cycle'))
+E213 = frozenset(('clear', 'content-key-upload', 'remote-key-upload'))
+E214 = frozenset(('ftp', 'http', 'none', 'scp', 'sftp', 'tftp'))
+E215 = frozenset(('content-cert-upload', 'remote-cert-upload'))
+E216 = frozenset(('delete-ca-certificate', 'test-ldap-binding'))
+E217 = frozenset(('recover-pcie-switch',))
+
+COMMON_VALUES = ('10Gbps', '6.0 Gb/s', '64 KB', '952720 MB', 'Adaptive', 'CE', 'Cisco Systems Inc', 'Direct', 'Disabled', 'Enabled', 'GEN3', 'Good', 'HDD', 'N/A', 'Online', 'Optimal', 'RAID 0', 'Read-Write', 'SAS', 'SEAGATE', 'ST91000640SS', 'Unchanged', 'auto', 'blade-controller', 'disabled', 'enabled', 'equipped', 'false', 'inactive', 'no', 'online', 'physical', 'policy', 'read-only', 'system', 'true', 'up', 'virtual')
+
+class AaaLdap(ManagedObject):
+    """CIMC LDAP"""
+    __slots__ = ('adminState', 'attribute', 'basedn', 'bindDn', 'bindMethod', 'dn', 'dnsDomainSource', 'dnsSearchDomain', 'dnsSearchForest', 'domain', 'encryption', 'filter', 'groupAttribute', 'groupAuth', 'groupNestedSearch', 'ldapServer1', 'ldapServer2', 'ldapServer3', 'ldapServer4', 'ldapServer5', 'ldapServer6', 'ldapServerPort1', 'ldapServerPort2', 'ldapServerPort3', 'ldapServerPort4', 'ldapServerPort5', 'ldapServerPort6', 'locateDirectoryUsingDNS', 'password', 'rn', 'status', 'timeout', 'userSearchPrecedence')
+    class_id = 'aaaLdap'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'groupNestedSearch': 'int', 'ldapServerPort1': 'int', 'ldapServerPort2': 'int', 'ldapServerPort3': 'int', 'ldapServerPort4': 'int', 'ldapServerPort5': 'int', 'ldapServerPort6': 'int', 'timeout': 'int'}
+    _enums = {'adminState': E1, 'bindMethod': E173, 'dnsDomainSource': E172, 'encryption': E1, 'groupAuth': E1, 'locateDirectoryUsingDNS': E7, 'status': E2, 'userSearchPrecedence': E171}
+
+class AaaLdapRoleGroup(ManagedObject):
+    """CIMC LDAP Groups"""
+    __slots__ = ('adminAction', 'dn', 'domain', 'id', 'name', 'rn', 'role', 'status')
+    class_id = 'aaaLdapRoleGroup'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'id': 'int'}
+    _enums = {'adminAction': E8, 'role': E174, 'status': E2}
+
+class AaaTacacsPlus(ManagedObject):
+    """CIMC TACACS"""
+    __slots__ = ('adminState', 'dn', 'fallbackAuthentication', 'rn', 'status', 'timeout')
+    class_id = 'aaaTacacsPlus'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'timeout': 'int'}
+    _enums = {'adminState': E1, 'fallbackAuthentication': E1, 'status': E2}
+
+class AaaTacacsPlusServer(ManagedObject):
+    """CIMC TACACS Server"""
+    __slots__ = ('adminAction', 'dn', 'id', 'ipAddress', 'key', 'port', 'rn', 'status')
+    class_id = 'aaaTacacsPlusServer'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'id': 'int', 'port': 'int'}
+    _enums = {'adminAction': E8, 'status': E2}
+
+class AaaUser(ManagedObject):
+    """User"""
+    __slots__ = ('accountStatus', 'adminAction', 'dn', 'id', 'name', 'priv', 'pwd', 'rn', 'status')
+    class_id = 'aaaUser'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'id': 'int'}
+    _enums = {'accountStatus': E170, 'adminAction': E8, 'priv': E23, 'status': E2}
+
+class AaaUserAuthPrecedence(ManagedObject):
+    """User Authentication Precedence"""
+    __slots__ = ('authPrecedence1', 'authPrecedence2', 'authPrecedence3', 'dn', 'rn', 'status')
+    class_id = 'aaaUserAuthPrecedence'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'authPrecedence1': E169, 'authPrecedence2': E169, 'authPrecedence3': E169, 'status': E2}
+
+class AaaUserSSHKey(ManagedObject):
+    """User SSH Key"""
+    __slots__ = ('adminAction', 'dn', 'id', 'protocol', 'pwd', 'remoteFile', 'remoteServer', 'rn', 'sshKey', 'status', 'user')
+    class_id = 'aaaUserSSHKey'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'id': 'int'}
+    _enums = {'adminAction': E213, 'protocol': E214, 'status': E2}
+
+class AdaptorCfgBackup(ManagedObject):
+    """VIC Backup"""
+    __slots__ = ('adminState', 'dn', 'hostname', 'proto', 'pwd', 'remoteFile', 'rn', 'status', 'user')
+    class_id = 'adaptorCfgBackup'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E20, 'proto': E21, 'status': E2}
+
+class AdaptorCfgImporter(ManagedObject):
+    """VIC Importer"""
+    __slots__ = ('adminState', 'dn', 'hostname', 'proto', 'pwd', 'remoteFile', 'rn', 'status', 'user')
+    class_id = 'adaptorCfgImporter'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E20, 'proto': E21, 'status': E2}
+
+class AdaptorEthCompQueueProfile(ManagedObject):
+    """Eth Comp Queue Profile"""
+    __slots__ = ('count', 'dn', 'rn', 'status')
+    class_id = 'adaptorEthCompQueueProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'count': 'int'}
+    _enums = {'status': E2}
+
+class AdaptorEthGenProfile(ManagedObject):
+    """Eth vNIC General Properties"""
+    __slots__ = ('arfs', 'dn', 'geneveOffload', 'multiQueue', 'noOfSubVNICs', 'nvgre', 'order', 'pciLink', 'rateLimit', 'rn', 'status', 'trustedClassOfService', 'uplinkFailbackTimeout', 'uplinkFailover', 'vlan', 'vlanMode', 'vmq', 'vxlan')
+    class_id = 'adaptorEthGenProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'noOfSubVNICs': 'int', 'pciLink': 'int'}
+    _enums = {'arfs': E1, 'geneveOffload': E1, 'multiQueue': E1, 'nvgre': E1, 'status': E2, 'trustedClassOfService': E1, 'uplinkFailover': E1, 'vlanMode': E146, 'vmq': E1, 'vxlan': E1}
+
+class AdaptorEthISCSIProfile(ManagedObject):
+    """Eth VNIC iSCSI If"""
+    __slots__ = ('dhcpISCSI', 'dhcpId', 'dhcpNetworkSettings', 'dhcpTimeout', 'dn', 'initiatorChapName', 'initiatorChapSecret', 'initiatorGateway', 'initiatorIPAddress', 'initiatorName', 'initiatorPrimaryDns', 'initiatorPriority', 'initiatorSecondaryDns', 'initiatorSubnetMask', 'initiatorTCPTimeout', 'linkBusyRetryCount', 'linkupTimeout', 'primaryTargetBootLun', 'primaryTargetChapName', 'primaryTargetChapSecret', 'primaryTargetIPAddress', 'primaryTargetName', 'rn', 'secondaryTargetBootLun', 'secondaryTargetChapName', 'secondaryTargetChapSecret', 'secondaryTargetIPAddress', 'secondaryTargetName', 'status')
+    class_id = 'adaptorEthISCSIProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'dhcpTimeout': 'int', 'initiatorTCPTimeout': 'int', 'linkBusyRetryCount': 'int', 'linkupTimeout': 'int', 'primaryTargetBootLun': 'int', 'secondaryTargetBootLun': 'int'}
+    _enums = {'dhcpISCSI': E1, 'dhcpNetworkSettings': E1, 'initiatorPriority': E138, 'status': E2}
+
+class AdaptorEthInterruptProfile(ManagedObject):
+    """Eth Interrupt Profile"""
+    __slots__ = ('coalescingTime', 'coalescingType', 'count', 'dn', 'mode', 'rn', 'status')
+    class_id = 'adaptorEthInterruptProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'coalescingTime': 'int', 'count': 'int'}
+    _enums = {'coalescingType': E147, 'mode': E148, 'status': E2}
+
+class AdaptorEthMultiQueueProfile(ManagedObject):
+    """Eth Multi Queue Profile"""
+    __slots__ = ('completionCount', 'dn', 'multiQueueMemoryRegions', 'multiQueuePairs', 'multiQueueResourceGroups', 'multiQueueRoceVersion2', 'receiveCount', 'rn', 'status', 'transmitCount')
+    class_id = 'adaptorEthMultiQueueProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'completionCount': 'int', 'multiQueueMemoryRegions': 'int', 'multiQueuePairs': 'int', 'multiQueueResourceGroups': 'int', 'receiveCount': 'int', 'transmitCount': 'int'}
+    _enums = {'multiQueueRoceVersion2': E1, 'status': E2}
+
+class AdaptorEthOffloadProfile(ManagedObject):
+    """Eth Offload Profile"""
+    __slots__ = ('dn', 'largeReceive', 'rn', 'status', 'tcpRxChecksum', 'tcpSegment', 'tcpTxChecksum')
+    class_id = 'adaptorEthOffloadProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'largeReceive': E1, 'status': E2, 'tcpRxChecksum': E1, 'tcpSegment': E1, 'tcpTxChecksum': E1}
+
+class AdaptorEthRdmaProfile(ManagedObject):
+    """Eth RDMA profile"""
+    __slots__ = ('dn', 'memoryRegions', 'queuePairs', 'rdmaClassOfService', 'resourceGroups', 'rn', 'roceVersion2', 'status')
+    class_id = 'adaptorEthRdmaProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'memoryRegions': 'int', 'queuePairs': 'int', 'resourceGroups': 'int'}
+    _enums = {'rdmaClassOfService': E149, 'roceVersion2': E1, 'status': E2}
+
+class AdaptorEthRecvQueueProfile(ManagedObject):
+    """Eth Recv Queue Profile"""
+    __slots__ = ('count', 'dn', 'ringSize', 'rn', 'status')
+    class_id = 'adaptorEthRecvQueueProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'count': 'int', 'ringSize': 'int'}
+    _enums = {'status': E2}
+
+class AdaptorEthUSNICProfile(ManagedObject):
+    """Eth VNIC USNIC Configuration"""
+    __slots__ = ('classOfService', 'coalescingTime', 'coalescingType', 'completionQueueCount', 'dn', 'interruptCount', 'largeReceive', 'receiveQueueCount', 'receiveQueueRingSize', 'rn', 'status', 'tcpRxChecksum', 'tcpSegment', 'tcpTxChecksum', 'transmitQueueCount', 'transmitQueueRingSize', 'usnicCount')
+    class_id = 'adaptorEthUSNICProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'coalescingTime': 'int', 'completionQueueCount': 'int', 'interruptCount': 'int', 'receiveQueueCount': 'int', 'receiveQueueRingSize': 'int', 'transmitQueueCount': 'int', 'transmitQueueRingSize': 'int', 'usnicCount': 'int'}
+    _enums = {'coalescingType': E147, 'largeReceive': E1, 'status': E2, 'tcpRxChecksum': E1, 'tcpSegment': E1, 'tcpTxChecksum': E1}
+
+class AdaptorEthWorkQueueProfile(ManagedObject):
+    """Eth Work Queue Profile"""
+    __slots__ = ('count', 'dn', 'ringSize', 'rn', 'status')
+    class_id = 'adaptorEthWorkQueueProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'count': 'int', 'ringSize': 'int'}
+    _enums = {'status': E2}
+
+class AdaptorExtEthIf(ManagedObject):
+    """Ext Eth If"""
+    __slots__ = ('adminFecMode', 'adminSpeed', 'dn', 'ifType', 'linkState', 'mac', 'operSpeed', 'portId', 'rn', 'status', 'transport')
+    class_id = 'adaptorExtEthIf'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminFecMode': E144, 'adminSpeed': E143, 'portId': E142, 'status': E2}
+
+class AdaptorExtIpV6RssHashProfile(ManagedObject):
+    """Ext Ip V6 Rss Hash Profile"""
+    __slots__ = ('dn', 'ipHash', 'rn', 'status', 'tcpHash')
+    class_id = 'adaptorExtIpV6RssHashProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'ipHash': E1, 'status': E2, 'tcpHash': E1}
+
+class AdaptorFcBootTable(ManagedObject):
+    """Host Fc VNIC Boot Table"""
+    __slots__ = ('bootLun', 'dn', 'index', 'rn', 'status', 'targetWwpn')
+    class_id = 'adaptorFcBootTable'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'bootLun': 'int', 'index': 'int'}
+    _enums = {'status': E2}
+
+class AdaptorFcCdbWorkQueueProfile(ManagedObject):
+    """Fc Cdb Work Queue Profile"""
+    __slots__ = ('count', 'dn', 'ringSize', 'rn', 'status')
+    class_id = 'adaptorFcCdbWorkQueueProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'count': 'int', 'ringSize': 'int'}
+    _enums = {'status': E2}
+
+class AdaptorFcErrorRecoveryProfile(ManagedObject):
+    """Fc Error Recovery Profile"""
+    __slots__ = ('dn', 'errorDetectTimeout', 'fcpErrorRecovery', 'ioTimeoutRetry', 'linkDownTimeout', 'portDownIoRetryCount', 'portDownTimeout', 'resourceAllocationTimeout', 'rn', 'status')
+    class_id = 'adaptorFcErrorRecoveryProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'errorDetectTimeout': 'int', 'ioTimeoutRetry': 'int', 'linkDownTimeout': 'int', 'portDownIoRetryCount': 'int', 'portDownTimeout': 'int', 'resourceAllocationTimeout': 'int'}
+    _enums = {'fcpErrorRecovery': E1, 'status': E2}
+
+class AdaptorFcGenProfile(ManagedObject):
+    """Fc vNIC General Properties"""
+    __slots__ = ('classOfService', 'dn', 'mac', 'maxDataFieldSize', 'order', 'pciLink', 'persistentLunBind', 'rateLimit', 'rn', 'status', 'vhbaType', 'vlan')
+    class_id = 'adaptorFcGenProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'maxDataFieldSize': 'int', 'pciLink': 'int'}
+    _enums = {'persistentLunBind': E1, 'status': E2, 'vhbaType': E151}
+
+class AdaptorFcInterruptProfile(ManagedObject):
+    """Fc Interrupt Profile"""
+    __slots__ = ('dn', 'mode', 'rn', 'status')
+    class_id = 'adaptorFcInterruptProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'mode': E148, 'status': E2}
+
+class AdaptorFcPortFLogiProfile(ManagedObject):
+    """Fc Port F Logi Profile"""
+    __slots__ = ('dn', 'retries', 'rn', 'status', 'timeout')
+    class_id = 'adaptorFcPortFLogiProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'timeout': 'int'}
+    _enums = {'status': E2}
+
+class AdaptorFcPortPLogiProfile(ManagedObject):
+    """Fc Port P Logi Profile"""
+    __slots__ = ('dn', 'retries', 'rn', 'status', 'timeout')
+    class_id = 'adaptorFcPortPLogiProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'retries': 'int', 'timeout': 'int'}
+    _enums = {'status': E2}
+
+class AdaptorFcPortProfile(ManagedObject):
+    """Fc Port Profile"""
+    __slots__ = ('dn', 'ioThrottleCount', 'lunQueueDepth', 'lunsPerTarget', 'rn', 'status')
+    class_id = 'adaptorFcPortProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'ioThrottleCount': 'int', 'lunQueueDepth': 'int', 'lunsPerTarget': 'int'}
+    _enums = {'status': E2}
+
+class AdaptorFcRecvQueueProfile(ManagedObject):
+    """Fc Recv Queue Profile"""
+    __slots__ = ('dn', 'ringSize', 'rn', 'status')
+    class_id = 'adaptorFcRecvQueueProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'ringSize': 'int'}
+    _enums = {'status': E2}
+
+class AdaptorFcWorkQueueProfile(ManagedObject):
+    """Fc Work Queue Profile"""
+    __slots__ = ('dn', 'ringSize', 'rn', 'status')
+    class_id = 'adaptorFcWorkQueueProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'ringSize': 'int'}
+    _enums = {'status': E2}
+
+class AdaptorGenProfile(ManagedObject):
+    """VIC General Properties"""
+    __slots__ = ('dn', 'fipMode', 'lldp', 'portChannelEnable', 'rn', 'status', 'vntagMode')
+    class_id = 'adaptorGenProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'fipMode': E1, 'lldp': E1, 'portChannelEnable': E1, 'status': E2, 'vntagMode': E1}
+
+class AdaptorHostEthIf(ManagedObject):
+    """Host Eth VNIC If"""
+    __slots__ = ('advancedFilter', 'cdn', 'channelNumber', 'classOfService', 'dn', 'ifType', 'iscsiBoot', 'mac', 'mtu', 'name', 'portProfile', 'pxeBoot', 'rn', 'status', 'uplinkPort', 'usnicCount')
+    class_id = 'adaptorHostEthIf'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'channelNumber': 'int', 'mtu': 'int'}
+    _enums = {'advancedFilter': E1, 'pxeBoot': E1, 'status': E2, 'uplinkPort': E142}
+
+class AdaptorHostFcIf(ManagedObject):
+    """Host Fc VNIC If"""
+    __slots__ = ('adminPersistentBindings', 'channelNumber', 'dn', 'name', 'portProfile', 'rn', 'sanBoot', 'status', 'uplinkPort', 'wwnn', 'wwpn')
+    class_id = 'adaptorHostFcIf'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'channelNumber': 'int'}
+    _enums = {'adminPersistentBindings': E150, 'sanBoot': E1, 'status': E2, 'uplinkPort': E142}
+
+class AdaptorIpV4RssHashProfile(ManagedObject):
+    """Ip V4 Rss Hash Profile"""
+    __slots__ = ('dn', 'ipHash', 'rn', 'status', 'tcpHash')
+    class_id = 'adaptorIpV4RssHashProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'ipHash': E1, 'status': E2, 'tcpHash': E1}
+
+class AdaptorIpV6RssHashProfile(ManagedObject):
+    """Ip V6 Rss Hash Profile"""
+    __slots__ = ('dn', 'ipHash', 'rn', 'status', 'tcpHash')
+    class_id = 'adaptorIpV6RssHashProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'ipHash': E1, 'status': E2, 'tcpHash': E1}
+
+class AdaptorLinkTraining(ManagedObject):
+    """VIC Link Training"""
+    __slots__ = ('childAction', 'dn', 'linkTraining', 'rn', 'status')
+    class_id = 'adaptorLinkTraining'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'linkTraining': E145, 'status': E2}
+
+class AdaptorRssProfile(ManagedObject):
+    """Rss Profile"""
+    __slots__ = ('dn', 'receiveSideScaling', 'rn', 'status')
+    class_id = 'adaptorRssProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'receiveSideScaling': E1, 'status': E2}
+
+class AdaptorUnit(ManagedObject):
+    """CISCO VIC Unit"""
+    __slots__ = ('adminState', 'cimcManagementEnabled', 'description', 'dn', 'id', 'model', 'pciAddr', 'pciSlot', 'presence', 'rn', 'serial', 'status', 'vendor')
+    class_id = 'adaptorUnit'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E141, 'status': E2}
+
+class AdvancedPowerProfile(ManagedObject):
+    """Advanced Power Profile Configuration"""
+    __slots__ = ('allowThrottle', 'corrAction', 'corrTime', 'cpuPowerLimit', 'cpuSafeThrotLvl', 'dn', 'hardCap', 'memSafeThrotLvl', 'memoryPowerLimit', 'missRdgTimeout', 'platSafeThrotLvl', 'platformThermal', 'powerLimit', 'profileEnabled', 'rn', 'status', 'suspendPeriod', 'thermalPowLimit')
+    class_id = 'advancedPowerProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'corrTime': 'int', 'cpuPowerLimit': 'int', 'cpuSafeThrotLvl': 'int', 'memSafeThrotLvl': 'int', 'memoryPowerLimit': 'int', 'missRdgTimeout': 'int', 'platSafeThrotLvl': 'int', 'platformThermal': 'int', 'powerLimit': 'int', 'thermalPowLimit': 'int'}
+    _enums = {'allowThrottle': E7, 'corrAction': E28, 'hardCap': E7, 'profileEnabled': E7, 'status': E2}
+
+class BiosSettings(ManagedObject):
+    """Bios Tokens Settings"""
+    __slots__ = ('dn', 'rn', 'status')
+    class_id = 'biosSettings'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2}
+
+class BiosUnit(ManagedObject):
+    """biosUnit"""
+    __slots__ = ('dn', 'model', 'rn', 'status')
+    class_id = 'biosUnit'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfASPMSupport(ManagedObject):
+    """biosVfASPMSupport"""
+    __slots__ = ('dn', 'rn', 'status', 'vpASPMSupport')
+    class_id = 'biosVfASPMSupport'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpASPMSupport': E80}
+
+class BiosVfAdjacentCacheLinePrefetch(ManagedObject):
+    """biosVfAdjacentCacheLinePrefetch"""
+    __slots__ = ('dn', 'rn', 'status', 'vpAdjacentCacheLinePrefetch')
+    class_id = 'biosVfAdjacentCacheLinePrefetch'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpAdjacentCacheLinePrefetch': E59}
+
+class BiosVfAdvancedMemTest(ManagedObject):
+    """biosVfAdvancedMemTest"""
+    __slots__ = ('dn', 'rn', 'status', 'vpAdvancedMemTest')
+    class_id = 'biosVfAdvancedMemTest'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpAdvancedMemTest': E88}
+
+class BiosVfAltitude(ManagedObject):
+    """biosVfAltitude"""
+    __slots__ = ('dn', 'rn', 'status', 'vpAltitude')
+    class_id = 'biosVfAltitude'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpAltitude': E79}
+
+class BiosVfAltitudeParam(ManagedObject):
+    """biosVfAltitudeParam"""
+    __slots__ = ('dn', 'rn', 'status', 'vpAltitude')
+    class_id = 'biosVfAltitudeParam'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfAssertNMIOnPERR(ManagedObject):
+    """biosVfAssertNMIOnPERR"""
+    __slots__ = ('dn', 'rn', 'status', 'vpAssertNMIOnPERR')
+    class_id = 'biosVfAssertNMIOnPERR'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpAssertNMIOnPERR': E59}
+
+class BiosVfAssertNMIOnSERR(ManagedObject):
+    """biosVfAssertNMIOnSERR"""
+    __slots__ = ('dn', 'rn', 'status', 'vpAssertNMIOnSERR')
+    class_id = 'biosVfAssertNMIOnSERR'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpAssertNMIOnSERR': E59}
+
+class BiosVfAutoCCState(ManagedObject):
+    """biosVfAutoCCState"""
+    __slots__ = ('dn', 'rn', 'status', 'vpAutoCCState')
+    class_id = 'biosVfAutoCCState'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpAutoCCState': E59}
+
+class BiosVfAutonumousCstateEnable(ManagedObject):
+    """biosVfAutonumousCstateEnable"""
+    __slots__ = ('dn', 'rn', 'status', 'vpAutonumousCstateEnable')
+    class_id = 'biosVfAutonumousCstateEnable'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpAutonumousCstateEnable': E59}
+
+class BiosVfBmeDmaMitigation(ManagedObject):
+    """biosVfBmeDmaMitigation"""
+    __slots__ = ('dn', 'rn', 'status', 'vpBmeDmaMitigation')
+    class_id = 'biosVfBmeDmaMitigation'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpBmeDmaMitigation': E59}
+
+class BiosVfBootOptionNumRetry(ManagedObject):
+    """biosVfBootOptionNumRetry"""
+    __slots__ = ('dn', 'rn', 'status', 'vpBootOptionNumRetry')
+    class_id = 'biosVfBootOptionNumRetry'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpBootOptionNumRetry': E61}
+
+class BiosVfBootOptionReCoolDown(ManagedObject):
+    """biosVfBootOptionReCoolDown"""
+    __slots__ = ('dn', 'rn', 'status', 'vpBootOptionReCoolDown')
+    class_id = 'biosVfBootOptionReCoolDown'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpBootOptionReCoolDown': E62}
+
+class BiosVfBootOptionRetry(ManagedObject):
+    """biosVfBootOptionRetry"""
+    __slots__ = ('dn', 'rn', 'status', 'vpBootOptionRetry')
+    class_id = 'biosVfBootOptionRetry'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpBootOptionRetry': E59}
+
+class BiosVfBootOrderRules(ManagedObject):
+    """biosVfBootOrderRules"""
+    __slots__ = ('dn', 'rn', 'status', 'vpUCSMBootOrderRule')
+    class_id = 'biosVfBootOrderRules'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfBootPerformanceMode(ManagedObject):
+    """biosVfBootPerformanceMode"""
+    __slots__ = ('dn', 'rn', 'status', 'vpBootPerformanceMode')
+    class_id = 'biosVfBootPerformanceMode'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpBootPerformanceMode': E86}
+
+class BiosVfCDNEnable(ManagedObject):
+    """biosVfCDNEnable"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCDNEnable')
+    class_id = 'biosVfCDNEnable'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCDNEnable': E59}
+
+class BiosVfCDNSupport(ManagedObject):
+    """biosVfCDNSupport"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCDNSupport')
+    class_id = 'biosVfCDNSupport'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCDNSupport': E60}
+
+class BiosVfCPUEnergyPerformance(ManagedObject):
+    """biosVfCPUEnergyPerformance"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCPUEnergyPerformance')
+    class_id = 'biosVfCPUEnergyPerformance'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCPUEnergyPerformance': E92}
+
+class BiosVfCPUEngPerfBias(ManagedObject):
+    """biosVfCPUEngPerfBias"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCPUEnergyPerformance')
+    class_id = 'biosVfCPUEngPerfBias'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfCPUFreqFloor(ManagedObject):
+    """biosVfCPUFreqFloor"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCPUFrequencyFloor')
+    class_id = 'biosVfCPUFreqFloor'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfCPUFrequencyFloor(ManagedObject):
+    """biosVfCPUFrequencyFloor"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCPUFrequencyFloor')
+    class_id = 'biosVfCPUFrequencyFloor'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCPUFrequencyFloor': E59}
+
+class BiosVfCPUPerformance(ManagedObject):
+    """biosVfCPUPerformance"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCPUPerformance')
+    class_id = 'biosVfCPUPerformance'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCPUPerformance': E63}
+
+class BiosVfCPUPowerManagement(ManagedObject):
+    """biosVfCPUPowerManagement"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCPUPowerManagement')
+    class_id = 'biosVfCPUPowerManagement'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCPUPowerManagement': E93}
+
+class BiosVfCRQos(ManagedObject):
+    """biosVfCRQos"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCRQos')
+    class_id = 'biosVfCRQos'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCRQos': E125}
+
+class BiosVfCbsCmnCpuCpb(ManagedObject):
+    """biosVfCbsCmnCpuCpb"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCbsCmnCpuCpb')
+    class_id = 'biosVfCbsCmnCpuCpb'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCbsCmnCpuCpb': E111}
+
+class BiosVfCbsCmnCpuGenDowncoreCtrl(ManagedObject):
+    """biosVfCbsCmnCpuGenDowncoreCtrl"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCbsCmnCpuGenDowncoreCtrl')
+    class_id = 'biosVfCbsCmnCpuGenDowncoreCtrl'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCbsCmnCpuGenDowncoreCtrl': E90}
+
+class BiosVfCbsCmnCpuGlobalCstateCtrl(ManagedObject):
+    """biosVfCbsCmnCpuGlobalCstateCtrl"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCbsCmnCpuGlobalCstateCtrl')
+    class_id = 'biosVfCbsCmnCpuGlobalCstateCtrl'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCbsCmnCpuGlobalCstateCtrl': E88}
+
+class BiosVfCbsCmnCpuL1StreamHwPrefetcher(ManagedObject):
+    """biosVfCbsCmnCpuL1StreamHwPrefetcher"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCbsCmnCpuL1StreamHwPrefetcher')
+    class_id = 'biosVfCbsCmnCpuL1StreamHwPrefetcher'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCbsCmnCpuL1StreamHwPrefetcher': E88}
+
+class BiosVfCbsCmnCpuL2StreamHwPrefetcher(ManagedObject):
+    """biosVfCbsCmnCpuL2StreamHwPrefetcher"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCbsCmnCpuL2StreamHwPrefetcher')
+    class_id = 'biosVfCbsCmnCpuL2StreamHwPrefetcher'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCbsCmnCpuL2StreamHwPrefetcher': E88}
+
+class BiosVfCbsCmnDeterminismSlider(ManagedObject):
+    """biosVfCbsCmnDeterminismSlider"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCbsCmnDeterminismSlider')
+    class_id = 'biosVfCbsCmnDeterminismSlider'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCbsCmnDeterminismSlider': E114}
+
+class BiosVfCbsCmnGnbNbIOMMU(ManagedObject):
+    """biosVfCbsCmnGnbNbIOMMU"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCbsCmnGnbNbIOMMU')
+    class_id = 'biosVfCbsCmnGnbNbIOMMU'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCbsCmnGnbNbIOMMU': E88}
+
+class BiosVfCbsCmnMemCtrlBankGroupSwapDdr4(ManagedObject):
+    """biosVfCbsCmnMemCtrlBankGroupSwapDdr4"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCbsCmnMemCtrlBankGroupSwapDdr4')
+    class_id = 'biosVfCbsCmnMemCtrlBankGroupSwapDdr4'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCbsCmnMemCtrlBankGroupSwapDdr4': E88}
+
+class BiosVfCbsCmnMemMapBankInterleaveDdr4(ManagedObject):
+    """biosVfCbsCmnMemMapBankInterleaveDdr4"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCbsCmnMemMapBankInterleaveDdr4')
+    class_id = 'biosVfCbsCmnMemMapBankInterleaveDdr4'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCbsCmnMemMapBankInterleaveDdr4': E111}
+
+class BiosVfCbsCmncTDPCtl(ManagedObject):
+    """biosVfCbsCmncTDPCtl"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCbsCmncTDPCtl')
+    class_id = 'biosVfCbsCmncTDPCtl'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCbsCmncTDPCtl': E115}
+
+class BiosVfCbsDfCmnMemIntlv(ManagedObject):
+    """biosVfCbsDfCmnMemIntlv"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCbsDfCmnMemIntlv')
+    class_id = 'biosVfCbsDfCmnMemIntlv'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCbsDfCmnMemIntlv': E112}
+
+class BiosVfCbsDfCmnMemIntlvSize(ManagedObject):
+    """biosVfCbsDfCmnMemIntlvSize"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCbsDfCmnMemIntlvSize')
+    class_id = 'biosVfCbsDfCmnMemIntlvSize'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCbsDfCmnMemIntlvSize': E113}
+
+class BiosVfCiscoAdaptiveMemTraining(ManagedObject):
+    """biosVfCiscoAdaptiveMemTraining"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCiscoAdaptiveMemTraining')
+    class_id = 'biosVfCiscoAdaptiveMemTraining'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCiscoAdaptiveMemTraining': E59}
+
+class BiosVfCiscoDebugLevel(ManagedObject):
+    """biosVfCiscoDebugLevel"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCiscoDebugLevel')
+    class_id = 'biosVfCiscoDebugLevel'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCiscoDebugLevel': E123}
+
+class BiosVfCiscoOpromLaunchOptimization(ManagedObject):
+    """biosVfCiscoOpromLaunchOptimization"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCiscoOpromLaunchOptimization')
+    class_id = 'biosVfCiscoOpromLaunchOptimization'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCiscoOpromLaunchOptimization': E59}
+
+class BiosVfCkeLowPolicy(ManagedObject):
+    """biosVfCkeLowPolicy"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCkeLowPolicy')
+    class_id = 'biosVfCkeLowPolicy'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCkeLowPolicy': E94}
+
+class BiosVfClosedLoopThermThrotl(ManagedObject):
+    """biosVfClosedLoopThermThrotl"""
+    __slots__ = ('dn', 'rn', 'status', 'vpClosedLoopThermThrotl')
+    class_id = 'biosVfClosedLoopThermThrotl'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpClosedLoopThermThrotl': E59}
+
+class BiosVfCmciEnable(ManagedObject):
+    """biosVfCmciEnable"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCmciEnable')
+    class_id = 'biosVfCmciEnable'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCmciEnable': E59}
+
+class BiosVfConfigTDP(ManagedObject):
+    """biosVfConfigTDP"""
+    __slots__ = ('dn', 'rn', 'status', 'vpConfigTDP')
+    class_id = 'biosVfConfigTDP'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpConfigTDP': E59}
+
+class BiosVfConfigTDPLevel(ManagedObject):
+    """biosVfConfigTDPLevel"""
+    __slots__ = ('dn', 'rn', 'status', 'vpConfigTDPLevel')
+    class_id = 'biosVfConfigTDPLevel'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpConfigTDPLevel': E128}
+
+class BiosVfConsoleRedirection(ManagedObject):
+    """biosVfConsoleRedirection"""
+    __slots__ = ('dn', 'rn', 'status', 'vpBaudRate', 'vpConsoleRedirection', 'vpFlowControl', 'vpLegacyOSRedirection', 'vpPuttyKeyPad', 'vpRedirectionAfterPOST', 'vpTerminalType')
+    class_id = 'biosVfConsoleRedirection'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpBaudRate': E64, 'vpConsoleRedirection': E65, 'vpFlowControl': E66, 'vpLegacyOSRedirection': E59, 'vpPuttyKeyPad': E68, 'vpRedirectionAfterPOST': E69, 'vpTerminalType': E67}
+
+class BiosVfConsoleredirection(ManagedObject):
+    """biosVfConsoleredirection"""
+    __slots__ = ('dn', 'rn', 'status', 'vpBaudRate', 'vpConsoleRedirection', 'vpFlowControl', 'vpPuttyKeyPad', 'vpRedirectionAfterPOST', 'vpTerminalType')
+    class_id = 'biosVfConsoleredirection'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfCoreMultiProcessing(ManagedObject):
+    """biosVfCoreMultiProcessing"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCoreMultiProcessing')
+    class_id = 'biosVfCoreMultiProcessing'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCoreMultiProcessing': E91}
+
+class BiosVfCrfastgoConfig(ManagedObject):
+    """biosVfCrfastgoConfig"""
+    __slots__ = ('dn', 'rn', 'status', 'vpCrfastgoConfig')
+    class_id = 'biosVfCrfastgoConfig'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpCrfastgoConfig': E127}
+
+class BiosVfDCPMMFirmwareDowngrade(ManagedObject):
+    """biosVfDCPMMFirmwareDowngrade"""
+    __slots__ = ('dn', 'rn', 'status', 'vpDCPMMFirmwareDowngrade')
+    class_id = 'biosVfDCPMMFirmwareDowngrade'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpDCPMMFirmwareDowngrade': E59}
+
+class BiosVfDCUPrefetch(ManagedObject):
+    """biosVfDCUPrefetch"""
+    __slots__ = ('dn', 'rn', 'status', 'vpIPPrefetch', 'vpStreamerPrefetch')
+    class_id = 'biosVfDCUPrefetch'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpIPPrefetch': E59, 'vpStreamerPrefetch': E59}
+
+class BiosVfDRAMClockThrottling(ManagedObject):
+    """biosVfDRAMClockThrottling"""
+    __slots__ = ('dn', 'rn', 'status', 'vpDRAMClockThrottling')
+    class_id = 'biosVfDRAMClockThrottling'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpDRAMClockThrottling': E95}
+
+class BiosVfDemandScrub(ManagedObject):
+    """biosVfDemandScrub"""
+    __slots__ = ('dn', 'rn', 'status', 'vpDemandScrub')
+    class_id = 'biosVfDemandScrub'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpDemandScrub': E59}
+
+class BiosVfDemandScrubParam(ManagedObject):
+    """biosVfDemandScrubParam"""
+    __slots__ = ('dn', 'rn', 'status', 'vpDemandScrub')
+    class_id = 'biosVfDemandScrubParam'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfDirectCacheAccess(ManagedObject):
+    """biosVfDirectCacheAccess"""
+    __slots__ = ('dn', 'rn', 'status', 'vpDirectCacheAccess')
+    class_id = 'biosVfDirectCacheAccess'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpDirectCacheAccess': E81}
+
+class BiosVfDramRefreshRate(ManagedObject):
+    """biosVfDramRefreshRate"""
+    __slots__ = ('dn', 'rn', 'status', 'vpDramRefreshRate')
+    class_id = 'biosVfDramRefreshRate'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpDramRefreshRate': E96}
+
+class BiosVfDramSwThermalThrottling(ManagedObject):
+    """biosVfDramSwThermalThrottling"""
+    __slots__ = ('dn', 'rn', 'status', 'vpDramSwThermalThrottling')
+    class_id = 'biosVfDramSwThermalThrottling'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpDramSwThermalThrottling': E59}
+
+class BiosVfEPPEnable(ManagedObject):
+    """biosVfEPPEnable"""
+    __slots__ = ('dn', 'rn', 'status', 'vpEPPEnable')
+    class_id = 'biosVfEPPEnable'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpEPPEnable': E59}
+
+class BiosVfEPPProfile(ManagedObject):
+    """biosVfEPPProfile"""
+    __slots__ = ('dn', 'rn', 'status', 'vpEPPProfile')
+    class_id = 'biosVfEPPProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpEPPProfile': E110}
+
+class BiosVfEnableClockSpreadSpec(ManagedObject):
+    """biosVfEnableClockSpreadSpec"""
+    __slots__ = ('dn', 'rn', 'status', 'vpEnableClockSpreadSpec')
+    class_id = 'biosVfEnableClockSpreadSpec'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpEnableClockSpreadSpec': E59}
+
+class BiosVfEnergyEfficientTurbo(ManagedObject):
+    """biosVfEnergyEfficientTurbo"""
+    __slots__ = ('dn', 'rn', 'status', 'vpEnergyEfficientTurbo')
+    class_id = 'biosVfEnergyEfficientTurbo'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpEnergyEfficientTurbo': E59}
+
+class BiosVfEngPerfTuning(ManagedObject):
+    """biosVfEngPerfTuning"""
+    __slots__ = ('dn', 'rn', 'status', 'vpEngPerfTuning')
+    class_id = 'biosVfEngPerfTuning'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpEngPerfTuning': E97}
+
+class BiosVfEnhancedIntelSpeedStepTech(ManagedObject):
+    """biosVfEnhancedIntelSpeedStepTech"""
+    __slots__ = ('dn', 'rn', 'status', 'vpEnhancedIntelSpeedStepTech')
+    class_id = 'biosVfEnhancedIntelSpeedStepTech'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpEnhancedIntelSpeedStepTech': E59}
+
+class BiosVfExecuteDisableBit(ManagedObject):
+    """biosVfExecuteDisableBit"""
+    __slots__ = ('dn', 'rn', 'status', 'vpExecuteDisableBit')
+    class_id = 'biosVfExecuteDisableBit'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpExecuteDisableBit': E59}
+
+class BiosVfExtendedAPIC(ManagedObject):
+    """biosVfExtendedAPIC"""
+    __slots__ = ('dn', 'rn', 'status', 'vpExtendedAPIC')
+    class_id = 'biosVfExtendedAPIC'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpExtendedAPIC': E84}
+
+class BiosVfFRB2Enable(ManagedObject):
+    """biosVfFRB2Enable"""
+    __slots__ = ('dn', 'rn', 'status', 'vpFRB2Enable')
+    class_id = 'biosVfFRB2Enable'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpFRB2Enable': E59}
+
+class BiosVfHWPMEnable(ManagedObject):
+    """biosVfHWPMEnable"""
+    __slots__ = ('dn', 'rn', 'status', 'vpHWPMEnable')
+    class_id = 'biosVfHWPMEnable'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpHWPMEnable': E98}
+
+class BiosVfHardwarePrefetch(ManagedObject):
+    """biosVfHardwarePrefetch"""
+    __slots__ = ('dn', 'rn', 'status', 'vpHardwarePrefetch')
+    class_id = 'biosVfHardwarePrefetch'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpHardwarePrefetch': E59}
+
+class BiosVfIMCInterleave(ManagedObject):
+    """biosVfIMCInterleave"""
+    __slots__ = ('dn', 'rn', 'status', 'vpIMCInterleave')
+    class_id = 'biosVfIMCInterleave'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpIMCInterleave': E122}
+
+class BiosVfIOHResource(ManagedObject):
+    """biosVfIOHResource"""
+    __slots__ = ('dn', 'rn', 'status', 'vpIOHResource')
+    class_id = 'biosVfIOHResource'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpIOHResource': E99}
+
+class BiosVfIPV4HTTP(ManagedObject):
+    """biosVfIPV4HTTP"""
+    __slots__ = ('dn', 'rn', 'status', 'vpIPV4HTTP')
+    class_id = 'biosVfIPV4HTTP'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpIPV4HTTP': E59}
+
+class BiosVfIPV4PXE(ManagedObject):
+    """biosVfIPV4PXE"""
+    __slots__ = ('dn', 'rn', 'status', 'vpIPV4PXE')
+    class_id = 'biosVfIPV4PXE'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpIPV4PXE': E59}
+
+class BiosVfIPV6HTTP(ManagedObject):
+    """biosVfIPV6HTTP"""
+    __slots__ = ('dn', 'rn', 'status', 'vpIPV6HTTP')
+    class_id = 'biosVfIPV6HTTP'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpIPV6HTTP': E59}
+
+class BiosVfIPV6PXE(ManagedObject):
+    """biosVfIPV6PXE"""
+    __slots__ = ('dn', 'rn', 'status', 'vpIPV6PXE')
+    class_id = 'biosVfIPV6PXE'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpIPV6PXE': E59}
+
+class BiosVfIntelHyperThreadingTech(ManagedObject):
+    """biosVfIntelHyperThreadingTech"""
+    __slots__ = ('dn', 'rn', 'status', 'vpIntelHyperThreadingTech')
+    class_id = 'biosVfIntelHyperThreadingTech'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpIntelHyperThreadingTech': E59}
+
+class BiosVfIntelSpeedSelect(ManagedObject):
+    """biosVfIntelSpeedSelect"""
+    __slots__ = ('dn', 'rn', 'status', 'vpIntelSpeedSelect')
+    class_id = 'biosVfIntelSpeedSelect'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpIntelSpeedSelect': E70}
+
+class BiosVfIntelTurboBoostTech(ManagedObject):
+    """biosVfIntelTurboBoostTech"""
+    __slots__ = ('dn', 'rn', 'status', 'vpIntelTurboBoostTech')
+    class_id = 'biosVfIntelTurboBoostTech'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpIntelTurboBoostTech': E59}
+
+class BiosVfIntelVTForDirectedIO(ManagedObject):
+    """biosVfIntelVTForDirectedIO"""
+    __slots__ = ('dn', 'rn', 'status', 'vpIntelVTDATSSupport', 'vpIntelVTDCoherencySupport', 'vpIntelVTDInterruptRemapping', 'vpIntelVTDPassThroughDMASupport', 'vpIntelVTForDirectedIO')
+    class_id = 'biosVfIntelVTForDirectedIO'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpIntelVTDATSSupport': E59, 'vpIntelVTDCoherencySupport': E59, 'vpIntelVTDInterruptRemapping': E59, 'vpIntelVTDPassThroughDMASupport': E59, 'vpIntelVTForDirectedIO': E59}
+
+class BiosVfIntelVTfordirectedIO(ManagedObject):
+    """biosVfIntelVTfordirectedIO"""
+    __slots__ = ('dn', 'rn', 'status', 'vpIntelVTDATSSupport', 'vpIntelVTDCoherencySupport', 'vpIntelVTForDirectedIO')
+    class_id = 'biosVfIntelVTfordirectedIO'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfIntelVirtualizationTechnology(ManagedObject):
+    """biosVfIntelVirtualizationTechnology"""
+    __slots__ = ('dn', 'rn', 'status', 'vpIntelVirtualizationTechnology')
+    class_id = 'biosVfIntelVirtualizationTechnology'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpIntelVirtualizationTechnology': E59}
+
+class BiosVfIohErrorEn(ManagedObject):
+    """biosVfIohErrorEn"""
+    __slots__ = ('dn', 'rn', 'status', 'vpIohErrorEnable')
+    class_id = 'biosVfIohErrorEn'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpIohErrorEnable': E100}
+
+class BiosVfKTIPrefetch(ManagedObject):
+    """biosVfKTIPrefetch"""
+    __slots__ = ('dn', 'rn', 'status', 'vpKTIPrefetch')
+    class_id = 'biosVfKTIPrefetch'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpKTIPrefetch': E59}
+
+class BiosVfLLCPrefetch(ManagedObject):
+    """biosVfLLCPrefetch"""
+    __slots__ = ('dn', 'rn', 'status', 'vpLLCPrefetch')
+    class_id = 'biosVfLLCPrefetch'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpLLCPrefetch': E59}
+
+class BiosVfLOMPortOptionROM(ManagedObject):
+    """biosVfLOMPortOptionROM"""
+    __slots__ = ('dn', 'rn', 'status', 'vpLOMPort0State', 'vpLOMPort1State', 'vpLOMPort2State', 'vpLOMPort3State', 'vpLOMPortsAllState')
+    class_id = 'biosVfLOMPortOptionROM'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpLOMPort0State': E82, 'vpLOMPort1State': E82, 'vpLOMPort2State': E82, 'vpLOMPort3State': E82, 'vpLOMPortsAllState': E59}
+
+class BiosVfLegacyUSBSupport(ManagedObject):
+    """biosVfLegacyUSBSupport"""
+    __slots__ = ('dn', 'rn', 'status', 'vpLegacyUSBSupport')
+    class_id = 'biosVfLegacyUSBSupport'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpLegacyUSBSupport': E81}
+
+class BiosVfLvDIMMSupport(ManagedObject):
+    """biosVfLvDIMMSupport"""
+    __slots__ = ('dn', 'rn', 'status', 'vpLvDDRMode')
+    class_id = 'biosVfLvDIMMSupport'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpLvDDRMode': E101}
+
+class BiosVfMMCFGBase(ManagedObject):
+    """biosVfMMCFGBase"""
+    __slots__ = ('dn', 'rn', 'status', 'vpMMCFGBase')
+    class_id = 'biosVfMMCFGBase'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpMMCFGBase': E102}
+
+class BiosVfMemoryInterleave(ManagedObject):
+    """biosVfMemoryInterleave"""
+    __slots__ = ('dn', 'rn', 'status', 'vpChannelInterLeave', 'vpMemoryInterLeave', 'vpRankInterLeave')
+    class_id = 'biosVfMemoryInterleave'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpChannelInterLeave': E103, 'vpMemoryInterLeave': E105, 'vpRankInterLeave': E104}
+
+class BiosVfMemoryMappedIOAbove4GB(ManagedObject):
+    """biosVfMemoryMappedIOAbove4GB"""
+    __slots__ = ('dn', 'rn', 'status', 'vpMemoryMappedIOAbove4GB')
+    class_id = 'biosVfMemoryMappedIOAbove4GB'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpMemoryMappedIOAbove4GB': E59}
+
+class BiosVfMemoryRefreshRate(ManagedObject):
+    """biosVfMemoryRefreshRate"""
+    __slots__ = ('dn', 'rn', 'status', 'vpMemoryRefreshRate')
+    class_id = 'biosVfMemoryRefreshRate'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpMemoryRefreshRate': E131}
+
+class BiosVfMemorySizeLimit(ManagedObject):
+    """biosVfMemorySizeLimit"""
+    __slots__ = ('dn', 'rn', 'status', 'vpMemorySizeLimit')
+    class_id = 'biosVfMemorySizeLimit'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2}
+
+class BiosVfMemoryThermalThrottling(ManagedObject):
+    """biosVfMemoryThermalThrottling"""
+    __slots__ = ('dn', 'rn', 'status', 'vpMemoryThermalThrottling')
+    class_id = 'biosVfMemoryThermalThrottling'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpMemoryThermalThrottling': E133}
+
+class BiosVfMemorymappedIOabove4GB(ManagedObject):
+    """biosVfMemorymappedIOabove4GB"""
+    __slots__ = ('dn', 'rn', 'status', 'vpMemoryMappedIOAbove4GB')
+    class_id = 'biosVfMemorymappedIOabove4GB'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfMirroringMode(ManagedObject):
+    """biosVfMirroringMode"""
+    __slots__ = ('dn', 'rn', 'status', 'vpMirroringMode')
+    class_id = 'biosVfMirroringMode'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpMirroringMode': E106}
+
+class BiosVfNUMAOptimized(ManagedObject):
+    """biosVfNUMAOptimized"""
+    __slots__ = ('dn', 'rn', 'status', 'vpNUMAOptimized')
+    class_id = 'biosVfNUMAOptimized'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpNUMAOptimized': E59}
+
+class BiosVfNUMAoptimized(ManagedObject):
+    """biosVfNUMAoptimized"""
+    __slots__ = ('dn', 'rn', 'status', 'vpNUMAOptimized')
+    class_id = 'biosVfNUMAoptimized'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfNetworkStack(ManagedObject):
+    """biosVfNetworkStack"""
+    __slots__ = ('dn', 'rn', 'status', 'vpNetworkStack')
+    class_id = 'biosVfNetworkStack'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpNetworkStack': E59}
+
+class BiosVfNvmdimmPerformConfig(ManagedObject):
+    """biosVfNvmdimmPerformConfig"""
+    __slots__ = ('dn', 'rn', 'status', 'vpNvmdimmPerformConfig')
+    class_id = 'biosVfNvmdimmPerformConfig'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpNvmdimmPerformConfig': E126}
+
+class BiosVfOSBootWatchdogTimer(ManagedObject):
+    """biosVfOSBootWatchdogTimer"""
+    __slots__ = ('dn', 'rn', 'status', 'vpOSBootWatchdogTimer')
+    class_id = 'biosVfOSBootWatchdogTimer'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpOSBootWatchdogTimer': E59}
+
+class BiosVfOSBootWatchdogTimerParam(ManagedObject):
+    """biosVfOSBootWatchdogTimerParam"""
+    __slots__ = ('dn', 'rn', 'status', 'vpOSBootWatchdogTimer')
+    class_id = 'biosVfOSBootWatchdogTimerParam'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfOSBootWatchdogTimerPolicy(ManagedObject):
+    """biosVfOSBootWatchdogTimerPolicy"""
+    __slots__ = ('dn', 'rn', 'status', 'vpOSBootWatchdogTimerPolicy')
+    class_id = 'biosVfOSBootWatchdogTimerPolicy'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpOSBootWatchdogTimerPolicy': E71}
+
+class BiosVfOSBootWatchdogTimerTimeOut(ManagedObject):
+    """biosVfOSBootWatchdogTimerTimeOut"""
+    __slots__ = ('dn', 'rn', 'status', 'vpOSBootWatchdogTimerTimeout')
+    class_id = 'biosVfOSBootWatchdogTimerTimeOut'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfOSBootWatchdogTimerTimeout(ManagedObject):
+    """biosVfOSBootWatchdogTimerTimeout"""
+    __slots__ = ('dn', 'rn', 'status', 'vpOSBootWatchdogTimerTimeout')
+    class_id = 'biosVfOSBootWatchdogTimerTimeout'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpOSBootWatchdogTimerTimeout': E72}
+
+class BiosVfOnboardNIC(ManagedObject):
+    """biosVfOnboardNIC"""
+    __slots__ = ('dn', 'rn', 'status', 'vpOnboard10GbitLOM', 'vpOnboardGbitLOM')
+    class_id = 'biosVfOnboardNIC'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpOnboard10GbitLOM': E59, 'vpOnboardGbitLOM': E59}
+
+class BiosVfOnboardStorage(ManagedObject):
+    """biosVfOnboardStorage"""
+    __slots__ = ('dn', 'rn', 'status', 'vpOnboardSCUStorageSupport')
+    class_id = 'biosVfOnboardStorage'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpOnboardSCUStorageSupport': E59}
+
+class BiosVfOnboardStorageSWStack(ManagedObject):
+    """biosVfOnboardStorageSWStack"""
+    __slots__ = ('dn', 'rn', 'status', 'vpOnboardSCUStorageSWStack')
+    class_id = 'biosVfOnboardStorageSWStack'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpOnboardSCUStorageSWStack': E107}
+
+class BiosVfOoBMgmtPort(ManagedObject):
+    """biosVfOoBMgmtPort"""
+    __slots__ = ('dn', 'rn', 'status', 'vpOutOfBandMgmtPort')
+    class_id = 'biosVfOoBMgmtPort'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfOutOfBandMgmtPort(ManagedObject):
+    """biosVfOutOfBandMgmtPort"""
+    __slots__ = ('dn', 'rn', 'status', 'vpOutOfBandMgmtPort')
+    class_id = 'biosVfOutOfBandMgmtPort'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpOutOfBandMgmtPort': E59}
+
+class BiosVfPCIOptionROMs(ManagedObject):
+    """biosVfPCIOptionROMs"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPCIOptionROMs')
+    class_id = 'biosVfPCIOptionROMs'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPCIOptionROMs': E82}
+
+class BiosVfPCISlotOptionROMEnable(ManagedObject):
+    """biosVfPCISlotOptionROMEnable"""
+    __slots__ = ('dn', 'rn', 'status', 'vpACSControlGPU1State', 'vpACSControlGPU2State', 'vpACSControlGPU3State', 'vpACSControlGPU4State', 'vpACSControlGPU5State', 'vpACSControlGPU6State', 'vpACSControlGPU7State', 'vpACSControlGPU8State', 'vpACSControlSlot11State', 'vpACSControlSlot12State', 'vpACSControlSlot13State', 'vpACSControlSlot14State', 'vpPcieSlotMSTORRAIDOptionROM', 'vpPcieSlotNvme1LinkSpeed', 'vpPcieSlotNvme1OptionROM', 'vpPcieSlotNvme2LinkSpeed', 'vpPcieSlotNvme2OptionROM', 'vpPcieSlotNvme3LinkSpeed', 'vpPcieSlotNvme3OptionROM', 'vpPcieSlotNvme4LinkSpeed', 'vpPcieSlotNvme4OptionROM', 'vpPcieSlotNvme5LinkSpeed', 'vpPcieSlotNvme5OptionROM', 'vpPcieSlotNvme6LinkSpeed', 'vpPcieSlotNvme6OptionROM', 'vpSlot10LinkSpeed', 'vpSlot10State', 'vpSlot11LinkSpeed', 'vpSlot11State', 'vpSlot12LinkSpeed', 'vpSlot12State', 'vpSlot13State', 'vpSlot14State', 'vpSlot1LinkSpeed', 'vpSlot1State', 'vpSlot2LinkSpeed', 'vpSlot2State', 'vpSlot3LinkSpeed', 'vpSlot3State', 'vpSlot4LinkSpeed', 'vpSlot4State', 'vpSlot5LinkSpeed', 'vpSlot5State', 'vpSlot6LinkSpeed', 'vpSlot6State', 'vpSlot7LinkSpeed', 'vpSlot7State', 'vpSlot8LinkSpeed', 'vpSlot8State', 'vpSlot9LinkSpeed', 'vpSlot9State', 'vpSlotFLOMLinkSpeed', 'vpSlotFrontNvme1LinkSpeed', 'vpSlotFrontNvme2LinkSpeed', 'vpSlotFrontSlot5LinkSpeed', 'vpSlotFrontSlot6LinkSpeed', 'vpSlotGPU1State', 'vpSlotGPU2State', 'vpSlotGPU3State', 'vpSlotGPU4State', 'vpSlotGPU5State', 'vpSlotGPU6State', 'vpSlotGPU7State', 'vpSlotGPU8State', 'vpSlotHBALinkSpeed', 'vpSlotHBAState', 'vpSlotLOM1Link', 'vpSlotLOM2Link', 'vpSlotMLOMLinkSpeed', 'vpSlotMLOMState', 'vpSlotMRAIDLinkSpeed', 'vpSlotMRAIDState', 'vpSlotMezzState', 'vpSlotN10State', 'vpSlotN11State', 'vpSlotN12State', 'vpSlotN13State', 'vpSlotN14State', 'vpSlotN15State', 'vpSlotN16State', 'vpSlotN17State', 'vpSlotN18State', 'vpSlotN19State', 'vpSlotN1State', 'vpSlotN20State', 'vpSlotN21State', 'vpSlotN22State', 'vpSlotN23State', 'vpSlotN24State', 'vpSlotN2State', 'vpSlotN3State', 'vpSlotN4State', 'vpSlotN5State', 'vpSlotN6State', 'vpSlotN7State', 'vpSlotN8State', 'vpSlotN9State', 'vpSlotRAIDLinkSpeed', 'vpSlotRAIDState', 'vpSlotRearNvme1LinkSpeed', 'vpSlotRearNvme1State', 'vpSlotRearNvme2LinkSpeed', 'vpSlotRearNvme2State', 'vpSlotRearNvme3State', 'vpSlotRearNvme4State', 'vpSlotRearNvme5State', 'vpSlotRearNvme6State', 'vpSlotRearNvme7State', 'vpSlotRearNvme8State', 'vpSlotRiser1LinkSpeed', 'vpSlotRiser1Slot1LinkSpeed', 'vpSlotRiser1Slot2LinkSpeed', 'vpSlotRiser1Slot3LinkSpeed', 'vpSlotRiser2LinkSpeed', 'vpSlotRiser2Slot4LinkSpeed', 'vpSlotRiser2Slot5LinkSpeed', 'vpSlotRiser2Slot6LinkSpeed', 'vpSlotSASState', 'vpSlotSSDSlot1LinkSpeed', 'vpSlotSSDSlot2LinkSpeed')
+    class_id = 'biosVfPCISlotOptionROMEnable'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpACSControlGPU1State': E59, 'vpACSControlGPU2State': E59, 'vpACSControlGPU3State': E59, 'vpACSControlGPU4State': E59, 'vpACSControlGPU5State': E59, 'vpACSControlGPU6State': E59, 'vpACSControlGPU7State': E59, 'vpACSControlGPU8State': E59, 'vpACSControlSlot11State': E59, 'vpACSControlSlot12State': E59, 'vpACSControlSlot13State': E59, 'vpACSControlSlot14State': E59, 'vpPcieSlotMSTORRAIDOptionROM': E59, 'vpPcieSlotNvme1LinkSpeed': E83, 'vpPcieSlotNvme1OptionROM': E59, 'vpPcieSlotNvme2LinkSpeed': E83, 'vpPcieSlotNvme2OptionROM': E59, 'vpPcieSlotNvme3LinkSpeed': E83, 'vpPcieSlotNvme3OptionROM': E59, 'vpPcieSlotNvme4LinkSpeed': E83, 'vpPcieSlotNvme4OptionROM': E59, 'vpPcieSlotNvme5LinkSpeed': E83, 'vpPcieSlotNvme5OptionROM': E59, 'vpPcieSlotNvme6LinkSpeed': E83, 'vpPcieSlotNvme6OptionROM': E59, 'vpSlot10LinkSpeed': E83, 'vpSlot10State': E82, 'vpSlot11LinkSpeed': E83, 'vpSlot11State': E59, 'vpSlot12LinkSpeed': E83, 'vpSlot12State': E59, 'vpSlot13State': E59, 'vpSlot14State': E59, 'vpSlot1LinkSpeed': E83, 'vpSlot1State': E82, 'vpSlot2LinkSpeed': E83, 'vpSlot2State': E82, 'vpSlot3LinkSpeed': E83, 'vpSlot3State': E82, 'vpSlot4LinkSpeed': E83, 'vpSlot4State': E82, 'vpSlot5LinkSpeed': E83, 'vpSlot5State': E82, 'vpSlot6LinkSpeed': E83, 'vpSlot6State': E82, 'vpSlot7LinkSpeed': E83, 'vpSlot7State': E82, 'vpSlot8LinkSpeed': E83, 'vpSlot8State': E82, 'vpSlot9LinkSpeed': E83, 'vpSlot9State': E82, 'vpSlotFLOMLinkSpeed': E83, 'vpSlotFrontNvme1LinkSpeed': E83, 'vpSlotFrontNvme2LinkSpeed': E83, 'vpSlotFrontSlot5LinkSpeed': E83, 'vpSlotFrontSlot6LinkSpeed': E83, 'vpSlotGPU1State': E59, 'vpSlotGPU2State': E59, 'vpSlotGPU3State': E59, 'vpSlotGPU4State': E59, 'vpSlotGPU5State': E59, 'vpSlotGPU6State': E59, 'vpSlotGPU7State': E59, 'vpSlotGPU8State': E59, 'vpSlotHBALinkSpeed': E83, 'vpSlotHBAState': E82, 'vpSlotLOM1Link': E59, 'vpSlotLOM2Link': E59, 'vpSlotMLOMLinkSpeed': E83, 'vpSlotMLOMState': E82, 'vpSlotMRAIDLinkSpeed': E83, 'vpSlotMRAIDState': E59, 'vpSlotMezzState': E82, 'vpSlotN10State': E59, 'vpSlotN11State': E59, 'vpSlotN12State': E59, 'vpSlotN13State': E59, 'vpSlotN14State': E59, 'vpSlotN15State': E59, 'vpSlotN16State': E59, 'vpSlotN17State': E59, 'vpSlotN18State': E59, 'vpSlotN19State': E59, 'vpSlotN1State': E82, 'vpSlotN20State': E59, 'vpSlotN21State': E59, 'vpSlotN22State': E59, 'vpSlotN23State': E59, 'vpSlotN24State': E59, 'vpSlotN2State': E82, 'vpSlotN3State': E59, 'vpSlotN4State': E59, 'vpSlotN5State': E59, 'vpSlotN6State': E59, 'vpSlotN7State': E59, 'vpSlotN8State': E59, 'vpSlotN9State': E59, 'vpSlotRAIDLinkSpeed': E83, 'vpSlotRAIDState': E59, 'vpSlotRearNvme1LinkSpeed': E83, 'vpSlotRearNvme1State': E59, 'vpSlotRearNvme2LinkSpeed': E83, 'vpSlotRearNvme2State': E59, 'vpSlotRearNvme3State': E59, 'vpSlotRearNvme4State': E59, 'vpSlotRearNvme5State': E59, 'vpSlotRearNvme6State': E59, 'vpSlotRearNvme7State': E59, 'vpSlotRearNvme8State': E59, 'vpSlotRiser1LinkSpeed': E83, 'vpSlotRiser1Slot1LinkSpeed': E83, 'vpSlotRiser1Slot2LinkSpeed': E83, 'vpSlotRiser1Slot3LinkSpeed': E83, 'vpSlotRiser2LinkSpeed': E83, 'vpSlotRiser2Slot4LinkSpeed': E83, 'vpSlotRiser2Slot5LinkSpeed': E83, 'vpSlotRiser2Slot6LinkSpeed': E83, 'vpSlotSASState': E82, 'vpSlotSSDSlot1LinkSpeed': E83, 'vpSlotSSDSlot2LinkSpeed': E83}
+
+class BiosVfPCIeRASSupport(ManagedObject):
+    """biosVfPCIeRASSupport"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPCIeRASSupport')
+    class_id = 'biosVfPCIeRASSupport'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPCIeRASSupport': E59}
+
+class BiosVfPCIeSSDHotPlugSupport(ManagedObject):
+    """biosVfPCIeSSDHotPlugSupport"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPCIeSSDHotPlugSupport')
+    class_id = 'biosVfPCIeSSDHotPlugSupport'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPCIeSSDHotPlugSupport': E59}
+
+class BiosVfPOSTErrorPause(ManagedObject):
+    """biosVfPOSTErrorPause"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPOSTErrorPause')
+    class_id = 'biosVfPOSTErrorPause'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPOSTErrorPause': E59}
+
+class BiosVfPSata(ManagedObject):
+    """biosVfPSata"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPSata')
+    class_id = 'biosVfPSata'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPSata': E87}
+
+class BiosVfPStateCoordType(ManagedObject):
+    """biosVfPStateCoordType"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPStateCoordType')
+    class_id = 'biosVfPStateCoordType'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPStateCoordType': E108}
+
+class BiosVfPackageCStateLimit(ManagedObject):
+    """biosVfPackageCStateLimit"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPackageCStateLimit')
+    class_id = 'biosVfPackageCStateLimit'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPackageCStateLimit': E109}
+
+class BiosVfPanicHighWatermark(ManagedObject):
+    """biosVfPanicHighWatermark"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPanicHighWatermark')
+    class_id = 'biosVfPanicHighWatermark'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPanicHighWatermark': E132}
+
+class BiosVfPartialMirrorModeConfig(ManagedObject):
+    """biosVfPartialMirrorModeConfig"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPartialMirrorModeConfig')
+    class_id = 'biosVfPartialMirrorModeConfig'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPartialMirrorModeConfig': E124}
+
+class BiosVfPartialMirrorPercent(ManagedObject):
+    """biosVfPartialMirrorPercent"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPartialMirrorPercent')
+    class_id = 'biosVfPartialMirrorPercent'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2}
+
+class BiosVfPartialMirrorValue1(ManagedObject):
+    """biosVfPartialMirrorValue1"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPartialMirrorValue1')
+    class_id = 'biosVfPartialMirrorValue1'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2}
+
+class BiosVfPartialMirrorValue2(ManagedObject):
+    """biosVfPartialMirrorValue2"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPartialMirrorValue2')
+    class_id = 'biosVfPartialMirrorValue2'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2}
+
+class BiosVfPartialMirrorValue3(ManagedObject):
+    """biosVfPartialMirrorValue3"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPartialMirrorValue3')
+    class_id = 'biosVfPartialMirrorValue3'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2}
+
+class BiosVfPartialMirrorValue4(ManagedObject):
+    """biosVfPartialMirrorValue4"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPartialMirrorValue4')
+    class_id = 'biosVfPartialMirrorValue4'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2}
+
+class BiosVfPatrolScrub(ManagedObject):
+    """biosVfPatrolScrub"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPatrolScrub')
+    class_id = 'biosVfPatrolScrub'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPatrolScrub': E59}
+
+class BiosVfPatrolScrubDuration(ManagedObject):
+    """biosVfPatrolScrubDuration"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPatrolScrubDuration')
+    class_id = 'biosVfPatrolScrubDuration'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2}
+
+class BiosVfPatrolScrubParam(ManagedObject):
+    """biosVfPatrolScrubParam"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPatrolScrub')
+    class_id = 'biosVfPatrolScrubParam'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfPchUsb30Mode(ManagedObject):
+    """biosVfPchUsb30Mode"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPchUsb30Mode')
+    class_id = 'biosVfPchUsb30Mode'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPchUsb30Mode': E59}
+
+class BiosVfPciRomClp(ManagedObject):
+    """biosVfPciRomClp"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPciRomClp')
+    class_id = 'biosVfPciRomClp'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPciRomClp': E59}
+
+class BiosVfPcieARISupport(ManagedObject):
+    """biosVfPcieARISupport"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPcieARISupport')
+    class_id = 'biosVfPcieARISupport'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPcieARISupport': E88}
+
+class BiosVfPciePllSsc(ManagedObject):
+    """biosVfPciePllSsc"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPciePllSsc')
+    class_id = 'biosVfPciePllSsc'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPciePllSsc': E130}
+
+class BiosVfPcieSlotsCdnEnable(ManagedObject):
+    """biosVfPcieSlotsCdnEnable"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPcieSlotsCdnEnable')
+    class_id = 'biosVfPcieSlotsCdnEnable'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPcieSlotsCdnEnable': E59}
+
+class BiosVfPowerOnPasswordSupport(ManagedObject):
+    """biosVfPowerOnPasswordSupport"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPOPSupport')
+    class_id = 'biosVfPowerOnPasswordSupport'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPOPSupport': E59}
+
+class BiosVfProcessorC1E(ManagedObject):
+    """biosVfProcessorC1E"""
+    __slots__ = ('dn', 'rn', 'status', 'vpProcessorC1E')
+    class_id = 'biosVfProcessorC1E'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpProcessorC1E': E59}
+
+class BiosVfProcessorC3Report(ManagedObject):
+    """biosVfProcessorC3Report"""
+    __slots__ = ('dn', 'rn', 'status', 'vpProcessorC3Report')
+    class_id = 'biosVfProcessorC3Report'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpProcessorC3Report': E59}
+
+class BiosVfProcessorC6Report(ManagedObject):
+    """biosVfProcessorC6Report"""
+    __slots__ = ('dn', 'rn', 'status', 'vpProcessorC6Report')
+    class_id = 'biosVfProcessorC6Report'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpProcessorC6Report': E59}
+
+class BiosVfProcessorCState(ManagedObject):
+    """biosVfProcessorCState"""
+    __slots__ = ('dn', 'rn', 'status', 'vpProcessorCState')
+    class_id = 'biosVfProcessorCState'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpProcessorCState': E59}
+
+class BiosVfPwrPerfTuning(ManagedObject):
+    """biosVfPwrPerfTuning"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPwrPerfTuning')
+    class_id = 'biosVfPwrPerfTuning'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpPwrPerfTuning': E116}
+
+class BiosVfQPIConfig(ManagedObject):
+    """biosVfQPIConfig"""
+    __slots__ = ('dn', 'rn', 'status', 'vpQPILinkFrequency')
+    class_id = 'biosVfQPIConfig'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpQPILinkFrequency': E117}
+
+class BiosVfQpiLinkSpeed(ManagedObject):
+    """biosVfQpiLinkSpeed"""
+    __slots__ = ('dn', 'rn', 'status', 'vpQpiLinkSpeed')
+    class_id = 'biosVfQpiLinkSpeed'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpQpiLinkSpeed': E129}
+
+class BiosVfQpiSnoopMode(ManagedObject):
+    """biosVfQpiSnoopMode"""
+    __slots__ = ('dn', 'rn', 'status', 'vpQpiSnoopMode')
+    class_id = 'biosVfQpiSnoopMode'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpQpiSnoopMode': E118}
+
+class BiosVfResumeOnACPowerLoss(ManagedObject):
+    """Resume AC On Power Loss Config"""
+    __slots__ = ('delay', 'delayType', 'dn', 'rn', 'status', 'vpResumeOnACPowerLoss')
+    class_id = 'biosVfResumeOnACPowerLoss'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'delay': 'int'}
+    _enums = {'delayType': E78, 'status': E2, 'vpResumeOnACPowerLoss': E77}
+
+class BiosVfSEV(ManagedObject):
+    """biosVfSEV"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSEV')
+    class_id = 'biosVfSEV'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpSEV': E134}
+
+class BiosVfSMEE(ManagedObject):
+    """biosVfSMEE"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSMEE')
+    class_id = 'biosVfSMEE'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpSMEE': E59}
+
+class BiosVfSataModeSelect(ManagedObject):
+    """biosVfSataModeSelect"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSataModeSelect')
+    class_id = 'biosVfSataModeSelect'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpSataModeSelect': E87}
+
+class BiosVfSelectMemoryRASConfiguration(ManagedObject):
+    """biosVfSelectMemoryRASConfiguration"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSelectMemoryRASConfiguration')
+    class_id = 'biosVfSelectMemoryRASConfiguration'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpSelectMemoryRASConfiguration': E73}
+
+class BiosVfSelectMemoryRASconfiguration(ManagedObject):
+    """biosVfSelectMemoryRASconfiguration"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSelectMemoryRASConfiguration')
+    class_id = 'biosVfSelectMemoryRASconfiguration'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfSelectPprType(ManagedObject):
+    """biosVfSelectPprType"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSelectPprType')
+    class_id = 'biosVfSelectPprType'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpSelectPprType': E74}
+
+class BiosVfSerialPortAEnable(ManagedObject):
+    """biosVfSerialPortAEnable"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSerialPortAEnable')
+    class_id = 'biosVfSerialPortAEnable'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpSerialPortAEnable': E59}
+
+class BiosVfSinglePCTLEnable(ManagedObject):
+    """biosVfSinglePCTLEnable"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSinglePCTLEnable')
+    class_id = 'biosVfSinglePCTLEnable'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpSinglePCTLEnable': E100}
+
+class BiosVfSmtMode(ManagedObject):
+    """biosVfSmtMode"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSmtMode')
+    class_id = 'biosVfSmtMode'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpSmtMode': E89}
+
+class BiosVfSnoopyModeFor2LM(ManagedObject):
+    """biosVfSnoopyModeFor2LM"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSnoopyModeFor2LM')
+    class_id = 'biosVfSnoopyModeFor2LM'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpSnoopyModeFor2LM': E59}
+
+class BiosVfSnoopyModeForAD(ManagedObject):
+    """biosVfSnoopyModeForAD"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSnoopyModeForAD')
+    class_id = 'biosVfSnoopyModeForAD'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpSnoopyModeForAD': E59}
+
+class BiosVfSparingMode(ManagedObject):
+    """biosVfSparingMode"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSparingMode')
+    class_id = 'biosVfSparingMode'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpSparingMode': E119}
+
+class BiosVfSrIov(ManagedObject):
+    """biosVfSrIov"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSrIov')
+    class_id = 'biosVfSrIov'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpSrIov': E59}
+
+class BiosVfSubNumaClustering(ManagedObject):
+    """biosVfSubNumaClustering"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSNC')
+    class_id = 'biosVfSubNumaClustering'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpSNC': E88}
+
+class BiosVfSvmMode(ManagedObject):
+    """biosVfSvmMode"""
+    __slots__ = ('dn', 'rn', 'status', 'vpSvmMode')
+    class_id = 'biosVfSvmMode'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpSvmMode': E59}
+
+class BiosVfTPMControl(ManagedObject):
+    """biosVfTPMControl"""
+    __slots__ = ('dn', 'rn', 'status', 'vpTPMControl')
+    class_id = 'biosVfTPMControl'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpTPMControl': E59}
+
+class BiosVfTPMSupport(ManagedObject):
+    """biosVfTPMSupport"""
+    __slots__ = ('dn', 'rn', 'status', 'vpTPMSupport')
+    class_id = 'biosVfTPMSupport'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpTPMSupport': E59}
+
+class BiosVfTSME(ManagedObject):
+    """biosVfTSME"""
+    __slots__ = ('dn', 'rn', 'status', 'vpTSME')
+    class_id = 'biosVfTSME'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpTSME': E88}
+
+class BiosVfTXTSupport(ManagedObject):
+    """biosVfTXTSupport"""
+    __slots__ = ('dn', 'rn', 'status', 'vpTXTSupport')
+    class_id = 'biosVfTXTSupport'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpTXTSupport': E59}
+
+class BiosVfUCSMBootOrderRuleControl(ManagedObject):
+    """biosVfUCSMBootOrderRuleControl"""
+    __slots__ = ('dn', 'rn', 'status', 'vpUCSMBootOrderRule')
+    class_id = 'biosVfUCSMBootOrderRuleControl'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpUCSMBootOrderRule': E120}
+
+class BiosVfUFSDisable(ManagedObject):
+    """biosVfUFSDisable"""
+    __slots__ = ('dn', 'rn', 'status', 'vpUFSDisable')
+    class_id = 'biosVfUFSDisable'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpUFSDisable': E59}
+
+class BiosVfUSBBootConfig(ManagedObject):
+    """biosVfUSBBootConfig"""
+    __slots__ = ('dn', 'rn', 'status', 'vpMakeDeviceNonBootable')
+    class_id = 'biosVfUSBBootConfig'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpMakeDeviceNonBootable': E59}
+
+class BiosVfUSBEmulation(ManagedObject):
+    """biosVfUSBEmulation"""
+    __slots__ = ('dn', 'rn', 'status', 'vpUSBEmul6064')
+    class_id = 'biosVfUSBEmulation'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpUSBEmul6064': E59}
+
+class BiosVfUSBEmulationSupport(ManagedObject):
+    """biosVfUSBEmulationSupport"""
+    __slots__ = ('dn', 'rn', 'status', 'vpUSBEmul6064')
+    class_id = 'biosVfUSBEmulationSupport'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfUSBPortsConfig(ManagedObject):
+    """biosVfUSBPortsConfig"""
+    __slots__ = ('dn', 'rn', 'status', 'vpAllUsbDevices', 'vpUsbPortFront', 'vpUsbPortInternal', 'vpUsbPortKVM', 'vpUsbPortRear', 'vpUsbPortSDCard', 'vpUsbPortVMedia')
+    class_id = 'biosVfUSBPortsConfig'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpAllUsbDevices': E59, 'vpUsbPortFront': E59, 'vpUsbPortInternal': E59, 'vpUsbPortKVM': E59, 'vpUsbPortRear': E59, 'vpUsbPortSDCard': E59, 'vpUsbPortVMedia': E59}
+
+class BiosVfUsbXhciSupport(ManagedObject):
+    """biosVfUsbXhciSupport"""
+    __slots__ = ('dn', 'rn', 'status', 'vpUsbXhciSupport')
+    class_id = 'biosVfUsbXhciSupport'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpUsbXhciSupport': E59}
+
+class BiosVfVMDEnable(ManagedObject):
+    """biosVfVMDEnable"""
+    __slots__ = ('dn', 'rn', 'status', 'vpVMDEnable')
+    class_id = 'biosVfVMDEnable'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpVMDEnable': E59}
+
+class BiosVfVgaPriority(ManagedObject):
+    """biosVfVgaPriority"""
+    __slots__ = ('dn', 'rn', 'status', 'vpVgaPriority')
+    class_id = 'biosVfVgaPriority'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpVgaPriority': E85}
+
+class BiosVfWorkLoadConfig(ManagedObject):
+    """biosVfWorkLoadConfig"""
+    __slots__ = ('dn', 'rn', 'status', 'vpWorkLoadConfig')
+    class_id = 'biosVfWorkLoadConfig'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpWorkLoadConfig': E121}
+
+class BiosVfXPTPrefetch(ManagedObject):
+    """biosVfXPTPrefetch"""
+    __slots__ = ('dn', 'rn', 'status', 'vpXPTPrefetch')
+    class_id = 'biosVfXPTPrefetch'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2, 'vpXPTPrefetch': E88}
+
+class BiosVfdramrefreshrate(ManagedObject):
+    """biosVfdramrefreshrate"""
+    __slots__ = ('dn', 'rn', 'status', 'vpDramRefreshRate')
+    class_id = 'biosVfdramrefreshrate'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class BiosVfpstatecoord(ManagedObject):
+    """biosVfpstatecoord"""
+    __slots__ = ('dn', 'rn', 'status', 'vpPStateCoordType')
+    class_id = 'biosVfpstatecoord'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class CertificateManagement(ManagedObject):
+    """Certificate Management"""
+    __slots__ = ('adminAction', 'dn', 'rn', 'status')
+    class_id = 'certificateManagement'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E19, 'status': E2}
+
+class CommHttp(ManagedObject):
+    """Http"""
+    __slots__ = ('adminState', 'dn', 'port', 'redirectState', 'rn', 'sessionTimeout', 'status')
+    class_id = 'commHttp'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'port': 'int', 'sessionTimeout': 'int'}
+    _enums = {'adminState': E1, 'redirectState': E1, 'status': E2}
+
+class CommHttps(ManagedObject):
+    """Https"""
+    __slots__ = ('adminState', 'dn', 'port', 'rn', 'sessionTimeout', 'status')
+    class_id = 'commHttps'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'port': 'int', 'sessionTimeout': 'int'}
+    _enums = {'adminState': E1, 'status': E2}
+
+class CommIpmiLan(ManagedObject):
+    """IpmiLan"""
+    __slots__ = ('adminState', 'dn', 'key', 'priv', 'rn', 'status')
+    class_id = 'commIpmiLan'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E1, 'priv': E23, 'status': E2}
+
+class CommKvm(ManagedObject):
+    """Kvm"""
+    __slots__ = ('adminState', 'dn', 'encryptionState', 'localVideoState', 'port', 'rn', 'status', 'totalSessions')
+    class_id = 'commKvm'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'port': 'int', 'totalSessions': 'int'}
+    _enums = {'adminState': E1, 'encryptionState': E1, 'localVideoState': E1, 'status': E2}
+
+class CommMailAlert(ManagedObject):
+    """Mail Alert"""
+    __slots__ = ('adminState', 'dn', 'fromAddress', 'ipAddress', 'minSeverityLevel', 'port', 'rn', 'status')
+    class_id = 'commMailAlert'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'port': 'int'}
+    _enums = {'adminState': E1, 'minSeverityLevel': E15, 'status': E2}
+
+class CommNtpProvider(ManagedObject):
+    """Ntp Provider"""
+    __slots__ = ('dn', 'ntpEnable', 'ntpServer1', 'ntpServer2', 'ntpServer3', 'ntpServer4', 'rn', 'status')
+    class_id = 'commNtpProvider'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'ntpEnable': E7, 'status': E2}
+
+class CommRedfish(ManagedObject):
+    """Redfish"""
+    __slots__ = ('adminState', 'dn', 'rn', 'status')
+    class_id = 'commRedfish'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E1, 'status': E2}
+
+class CommSavedVMediaMap(ManagedObject):
+    """Network Mounted Saved VMedia"""
+    __slots__ = ('adminAction', 'dn', 'rn', 'status', 'volumeName')
+    class_id = 'commSavedVMediaMap'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E137, 'status': E2}
+
+class CommSnmp(ManagedObject):
+    """Snmp"""
+    __slots__ = ('adminState', 'com2Sec', 'community', 'configChange', 'dn', 'engineIdKey', 'port', 'rn', 'status', 'sysContact', 'sysLocation', 'trapCommunity')
+    class_id = 'commSnmp'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'port': 'int'}
+    _enums = {'adminState': E1, 'com2Sec': E11, 'configChange': E12, 'status': E2}
+
+class CommSnmpConfigCommit(ManagedObject):
+    """Snmp Configuration Commit"""
+    __slots__ = ('commit', 'dn', 'rn', 'status')
+    class_id = 'commSnmpConfigCommit'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'commit': E10, 'status': E2}
+
+class CommSnmpTrap(ManagedObject):
+    """Snmp Trap"""
+    __slots__ = ('adminAction', 'adminState', 'configChange', 'dn', 'hostname', 'id', 'notificationType', 'port', 'rn', 'status', 'user', 'version')
+    class_id = 'commSnmpTrap'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'id': 'int', 'port': 'int'}
+    _enums = {'adminAction': E8, 'adminState': E1, 'configChange': E12, 'notificationType': E13, 'status': E2, 'version': E14}
+
+class CommSnmpUser(ManagedObject):
+    """Snmp User"""
+    __slots__ = ('adminAction', 'auth', 'authPwd', 'configChange', 'dn', 'id', 'name', 'privacy', 'privacyPwd', 'rn', 'securityLevel', 'status')
+    class_id = 'commSnmpUser'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'id': 'int'}
+    _enums = {'adminAction': E8, 'auth': E176, 'configChange': E12, 'privacy': E177, 'securityLevel': E175, 'status': E2}
+
+class CommSsh(ManagedObject):
+    """Ssh"""
+    __slots__ = ('adminState', 'dn', 'port', 'rn', 'sessionTimeout', 'status')
+    class_id = 'commSsh'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'port': 'int', 'sessionTimeout': 'int'}
+    _enums = {'adminState': E1, 'status': E2}
+
+class CommSyslog(ManagedObject):
+    """Syslog"""
+    __slots__ = ('dn', 'localSeverity', 'remoteSeverity', 'rn', 'status')
+    class_id = 'commSyslog'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'localSeverity': E140, 'remoteSeverity': E140, 'status': E2}
+
+class CommSyslogClient(ManagedObject):
+    """Syslog Client"""
+    __slots__ = ('adminAction', 'adminState', 'dn', 'hostname', 'name', 'port', 'proto', 'rn', 'status')
+    class_id = 'commSyslogClient'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'port': 'int'}
+    _enums = {'adminAction': E8, 'adminState': E1, 'name': E138, 'proto': E139, 'status': E2}
+
+class CommVMedia(ManagedObject):
+    """VMedia"""
+    __slots__ = ('adminAction', 'adminState', 'dn', 'encryptionState', 'lowPowerUsbState', 'rn', 'status')
+    class_id = 'commVMedia'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E22, 'adminState': E1, 'encryptionState': E1, 'lowPowerUsbState': E1, 'status': E2}
+
+class CommVMediaMap(ManagedObject):
+    """Network Mounted VMedia"""
+    __slots__ = ('adminAction', 'dn', 'map', 'mountOptions', 'password', 'remoteFile', 'remoteShare', 'rn', 'status', 'username', 'volumeName')
+    class_id = 'commVMediaMap'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E136, 'map': E135, 'status': E2}
+
+class ComputeBoard(ManagedObject):
+    """computeBoard"""
+    __slots__ = ('dn', 'rn', 'status')
+    class_id = 'computeBoard'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class ComputeRackUnit(ManagedObject):
+    """Rack Unit"""
+    __slots__ = ('adaptorSecureUpdate', 'adminPower', 'assetTag', 'availableMemory', 'dn', 'memorySpeed', 'model', 'name', 'numOfAdaptors', 'numOfCores', 'numOfCoresEnabled', 'numOfCpus', 'numOfEthHostIfs', 'numOfFcHostIfs', 'numOfThreads', 'operPower', 'originalUuid', 'presence', 'resetComponents', 'rn', 'serial', 'serverId', 'smartUsbAccess', 'status', 'totalMemory', 'usrLbl', 'uuid', 'vendor')
+    class_id = 'computeRackUnit'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adaptorSecureUpdate': E1, 'adminPower': E3, 'smartUsbAccess': E1, 'status': E2}
+
+class EquipmentLocatorLed(ManagedObject):
+    """Locator Led"""
+    __slots__ = ('adminState', 'dn', 'rn', 'status')
+    class_id = 'equipmentLocatorLed'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E6, 'status': E2}
+
+class EquipmentPsuColdRedundancy(ManagedObject):
+    """Cold Reduncdancy"""
+    __slots__ = ('dn', 'enabled', 'rn', 'status')
+    class_id = 'equipmentPsuColdRedundancy'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'enabled': E7, 'status': E2}
+
+class EventManagement(ManagedObject):
+    """Event Management"""
+    __slots__ = ('adminAction', 'adminState', 'dn', 'rn', 'status')
+    class_id = 'eventManagement'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E24, 'adminState': E1, 'status': E2}
+
+class FanPolicy(ManagedObject):
+    """Fan Policy Configuration"""
+    __slots__ = ('configuredFanPolicy', 'dn', 'rn', 'status')
+    class_id = 'fanPolicy'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'configuredFanPolicy': E75, 'status': E2}
+
+class FirmwareBootUnit(ManagedObject):
+    """Boot Image"""
+    __slots__ = ('adminState', 'dn', 'image', 'resetOnActivate', 'rn', 'status')
+    class_id = 'firmwareBootUnit'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E153, 'image': E154, 'resetOnActivate': E7, 'status': E2}
+
+class FirmwareRunning(ManagedObject):
+    """firmwareRunning"""
+    __slots__ = ('deployment', 'dn', 'rn', 'status', 'type', 'version')
+    class_id = 'firmwareRunning'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class FirmwareUpdatable(ManagedObject):
+    """Updatable"""
+    __slots__ = ('adminState', 'dn', 'protocol', 'pwd', 'remotePath', 'remoteServer', 'rn', 'secureBoot', 'source', 'status', 'type', 'usbPath', 'user')
+    class_id = 'firmwareUpdatable'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E20, 'protocol': E21, 'source': E26, 'status': E2, 'type': E152}
+
+class HuuFirmwareUpdateCancel(ManagedObject):
+    """Terminate Non-Interactive HUU Operation"""
+    __slots__ = ('adminState', 'dn', 'rn', 'status')
+    class_id = 'huuFirmwareUpdateCancel'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E20, 'status': E2}
+
+class HuuFirmwareUpdater(ManagedObject):
+    """Host Upgrade Utility"""
+    __slots__ = ('adminState', 'bootMedium', 'cimcSecureBoot', 'dn', 'doForceDown', 'gracefulTimeout', 'mapType', 'mountOption', 'password', 'remoteIp', 'remoteShare', 'rn', 'skipMemoryTest', 'status', 'stopOnError', 'timeOut', 'updateComponent', 'updateType', 'username', 'verifyUpdate')
+    class_id = 'huuFirmwareUpdater'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'gracefulTimeout': 'int', 'timeOut': 'int'}
+    _enums = {'adminState': E20, 'bootMedium': E160, 'cimcSecureBoot': E7, 'doForceDown': E162, 'mapType': E135, 'skipMemoryTest': E161, 'status': E2, 'stopOnError': E7, 'updateType': E159, 'verifyUpdate': E7}
+
+class IodSnapshotCancel(ManagedObject):
+    """Terminate Non-Interactive Offline Diagnostics Operation"""
+    __slots__ = ('adminState', 'dn', 'rn', 'status', 'timeOut')
+    class_id = 'iodSnapshotCancel'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'timeOut': 'int'}
+    _enums = {'adminState': E20, 'status': E2}
+
+class IodSnapshotStart(ManagedObject):
+    """Start Non-Interactive Offline Diagnostics Operation"""
+    __slots__ = ('adminState', 'dn', 'isoShare', 'isoShareIp', 'isoShareType', 'mountOption', 'password', 'remoteShareFile', 'remoteShareIp', 'remoteSharePassword', 'remoteSharePath', 'remoteShareType', 'remoteShareUsername', 'rn', 'status', 'timeOut', 'username')
+    class_id = 'iodSnapshotStart'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'timeOut': 'int'}
+    _enums = {'adminState': E20, 'isoShareType': E135, 'remoteShareType': E155, 'status': E2}
+
+class IpBlocking(ManagedObject):
+    """CIMC Network Security"""
+    __slots__ = ('dn', 'enable', 'failCount', 'failWindow', 'penaltyTime', 'rn', 'status')
+    class_id = 'ipBlocking'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'failCount': 'int', 'failWindow': 'int', 'penaltyTime': 'int'}
+    _enums = {'enable': E7, 'status': E2}
+
+class IpFiltering(ManagedObject):
+    """CIMC Network Security"""
+    __slots__ = ('adminAction', 'dn', 'enable', 'filter1', 'filter2', 'filter3', 'filter4', 'rn', 'status')
+    class_id = 'ipFiltering'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E168, 'enable': E7, 'status': E2}
+
+class KmipManagement(ManagedObject):
+    """Key Management Interoperability Protocol"""
+    __slots__ = ('adminAction', 'dn', 'rn', 'secureKeyManagement', 'status')
+    class_id = 'kmipManagement'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E18, 'secureKeyManagement': E1, 'status': E2}
+
+class LdapCACertificate(ManagedObject):
+    """ldap CA Certificate"""
+    __slots__ = ('adminAction', 'dn', 'pwd', 'rn', 'status', 'user')
+    class_id = 'ldapCACertificate'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E216, 'status': E2}
+
+class LdapCACertificateManagement(ManagedObject):
+    """Ldap CA Certificate Management"""
+    __slots__ = ('bindingCertificate', 'dn', 'rn', 'status')
+    class_id = 'ldapCACertificateManagement'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'bindingCertificate': E1, 'status': E2}
+
+class LsbootCdd(ManagedObject):
+    """Cdd"""
+    __slots__ = ('dn', 'name', 'order', 'rn', 'state', 'status', 'type')
+    class_id = 'lsbootCdd'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'order': 'int'}
+    _enums = {'state': E1, 'status': E2, 'type': E47}
+
+class LsbootDef(ManagedObject):
+    """Configured Boot Order Table"""
+    __slots__ = ('dn', 'name', 'rebootOnUpdate', 'rn', 'status')
+    class_id = 'lsbootDef'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'rebootOnUpdate': E7, 'status': E2}
+
+class LsbootDevPrecision(ManagedObject):
+    """Configured Second Level Boot Order Table"""
+    __slots__ = ('configuredBootMode', 'dn', 'reapply', 'rebootOnUpdate', 'rn', 'status')
+    class_id = 'lsbootDevPrecision'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'configuredBootMode': E38, 'reapply': E7, 'rebootOnUpdate': E7, 'status': E2}
+
+class LsbootEfi(ManagedObject):
+    """EFI Shell"""
+    __slots__ = ('access', 'dn', 'order', 'rn', 'status', 'type')
+    class_id = 'lsbootEfi'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'access': E31, 'order': E29, 'status': E2, 'type': E37}
+
+class LsbootHdd(ManagedObject):
+    """Hdd"""
+    __slots__ = ('boot_loader_descr', 'boot_loader_name', 'boot_loader_path', 'dn', 'name', 'order', 'rn', 'slot', 'state', 'status', 'subtype', 'type')
+    class_id = 'lsbootHdd'
+    _slots = dict(zip(('boot-loader-descr', 'boot-loader-name', 'boot-loader-path', 'dn', 'name', 'order', 'rn', 'slot', 'state', 'status', 'subtype', 'type'), __slots__))
+    _types = {'order': 'int'}
+    _enums = {'state': E1, 'status': E2, 'subtype': E46, 'type': E46}
+
+class LsbootHttp(ManagedObject):
+    """Http"""
+    __slots__ = ('dn', 'dnsserver', 'gateway', 'ipConfigType', 'ipaddress', 'iptype', 'macAddress', 'name', 'netmaskOrIPv6Prefix', 'order', 'port', 'rn', 'slot', 'state', 'status', 'subtype', 'type', 'uri')
+    class_id = 'lsbootHttp'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'order': 'int'}
+    _enums = {'ipConfigType': E45, 'iptype': E43, 'state': E1, 'status': E2, 'subtype': E44, 'type': E44}
+
+class LsbootIscsi(ManagedObject):
+    """Iscsi"""
+    __slots__ = ('dn', 'name', 'order', 'port', 'rn', 'slot', 'state', 'status', 'subtype', 'type')
+    class_id = 'lsbootIscsi'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'order': 'int'}
+    _enums = {'state': E1, 'status': E2, 'subtype': E53, 'type': E53}
+
+class LsbootLan(ManagedObject):
+    """Lan"""
+    __slots__ = ('access', 'dn', 'order', 'prot', 'rn', 'status', 'type')
+    class_id = 'lsbootLan'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'access': E31, 'order': E29, 'prot': E32, 'status': E2, 'type': E30}
+
+class LsbootLocalStorage(ManagedObject):
+    """Local Storage"""
+    __slots__ = ('dn', 'rn', 'status')
+    class_id = 'lsbootLocalStorage'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2}
+
+class LsbootNVMe(ManagedObject):
+    """NVMe"""
+    __slots__ = ('dn', 'name', 'order', 'rn', 'state', 'status', 'type')
+    class_id = 'lsbootNVMe'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'order': 'int'}
+    _enums = {'state': E1, 'status': E2, 'type': E55}
+
+class LsbootPchStorage(ManagedObject):
+    """PCH Storage"""
+    __slots__ = ('dn', 'lun', 'name', 'order', 'rn', 'state', 'status', 'type')
+    class_id = 'lsbootPchStorage'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'order': 'int'}
+    _enums = {'state': E1, 'status': E2, 'type': E54}
+
+class LsbootPxe(ManagedObject):
+    """Pxe"""
+    __slots__ = ('dn', 'iptype', 'macAddress', 'name', 'order', 'port', 'rn', 'slot', 'state', 'status', 'subtype', 'type')
+    class_id = 'lsbootPxe'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'order': 'int'}
+    _enums = {'iptype': E43, 'state': E1, 'status': E2, 'subtype': E42, 'type': E42}
+
+class LsbootSan(ManagedObject):
+    """San"""
+    __slots__ = ('boot_loader_descr', 'boot_loader_name', 'boot_loader_path', 'dn', 'lun', 'name', 'order', 'rn', 'slot', 'state', 'status', 'subtype', 'type')
+    class_id = 'lsbootSan'
+    _slots = dict(zip(('boot-loader-descr', 'boot-loader-name', 'boot-loader-path', 'dn', 'lun', 'name', 'order', 'rn', 'slot', 'state', 'status', 'subtype', 'type'), __slots__))
+    _types = {'order': 'int'}
+    _enums = {'state': E1, 'status': E2, 'subtype': E52, 'type': E52}
+
+class LsbootSd(ManagedObject):
+    """Sd"""
+    __slots__ = ('dn', 'lun', 'name', 'order', 'rn', 'state', 'status', 'subtype', 'type')
+    class_id = 'lsbootSd'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'order': 'int'}
+    _enums = {'state': E1, 'status': E2, 'subtype': E49, 'type': E48}
+
+class LsbootStorage(ManagedObject):
+    """Storage"""
+    __slots__ = ('access', 'dn', 'order', 'rn', 'status', 'type')
+    class_id = 'lsbootStorage'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'access': E36, 'order': E29, 'status': E2, 'type': E35}
+
+class LsbootUefiShell(ManagedObject):
+    """Uefi Shell"""
+    __slots__ = ('dn', 'name', 'order', 'rn', 'state', 'status', 'type')
+    class_id = 'lsbootUefiShell'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'order': 'int'}
+    _enums = {'state': E1, 'status': E2, 'type': E56}
+
+class LsbootUsb(ManagedObject):
+    """Usb"""
+    __slots__ = ('dn', 'name', 'order', 'rn', 'state', 'status', 'subtype', 'type')
+    class_id = 'lsbootUsb'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'order': 'int'}
+    _enums = {'state': E1, 'status': E2, 'subtype': E51, 'type': E50}
+
+class LsbootVMedia(ManagedObject):
+    """Virtual Media"""
+    __slots__ = ('access', 'dn', 'name', 'order', 'rn', 'state', 'status', 'subtype', 'type')
+    class_id = 'lsbootVMedia'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'order': 'int'}
+    _enums = {'access': E41, 'state': E1, 'status': E2, 'subtype': E40, 'type': E39}
+
+class LsbootVirtualMedia(ManagedObject):
+    """Virtual Media"""
+    __slots__ = ('access', 'dn', 'order', 'rn', 'status', 'type')
+    class_id = 'lsbootVirtualMedia'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'access': E34, 'order': E29, 'status': E2, 'type': E33}
+
+class MailRecipient(ManagedObject):
+    """Mail Recipient"""
+    __slots__ = ('adminAction', 'dn', 'email', 'id', 'rn', 'severity', 'status')
+    class_id = 'mailRecipient'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'id': 'int'}
+    _enums = {'adminAction': E17, 'severity': E16, 'status': E2}
+
+class MemoryPersistentMemoryBackup(ManagedObject):
+    """Backup"""
+    __slots__ = ('dn', 'hostname', 'proto', 'pwd', 'remoteFile', 'rn', 'status', 'user')
+    class_id = 'memoryPersistentMemoryBackup'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'proto': E21, 'status': E2}
+
+class MemoryPersistentMemoryDimms(ManagedObject):
+    """Persistent Memory DIMMs"""
+    __slots__ = ('dn', 'rn', 'socketId', 'socketLocalDimmNumbers', 'status')
+    class_id = 'memoryPersistentMemoryDimms'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'socketId': E193, 'status': E2}
+
+class MemoryPersistentMemoryGoal(ManagedObject):
+    """Persistent Memory Goal"""
+    __slots__ = ('dn', 'memoryModePercentage', 'persistentMemoryType', 'rn', 'socketId', 'status')
+    class_id = 'memoryPersistentMemoryGoal'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'memoryModePercentage': 'int'}
+    _enums = {'persistentMemoryType': E195, 'socketId': E194, 'status': E2}
+
+class MemoryPersistentMemoryImporter(ManagedObject):
+    """Importer"""
+    __slots__ = ('dn', 'hostname', 'proto', 'pwd', 'rebootOnUpdate', 'remoteFile', 'rn', 'status', 'user')
+    class_id = 'memoryPersistentMemoryImporter'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'proto': E21, 'rebootOnUpdate': E7, 'status': E2}
+
+class MemoryPersistentMemoryLocalSecurity(ManagedObject):
+    """Persistent Memory Local Security"""
+    __slots__ = ('childAction', 'deployedSecurePassphrase', 'dn', 'rn', 'securePassphrase', 'status')
+    class_id = 'memoryPersistentMemoryLocalSecurity'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2}
+
+class MemoryPersistentMemoryLogicalConfiguration(ManagedObject):
+    """Persistent Memory Logical Configuration"""
+    __slots__ = ('adminAction', 'dn', 'forceConfig', 'mgmtMode', 'rebootOnUpdate', 'rn', 'status')
+    class_id = 'memoryPersistentMemoryLogicalConfiguration'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E191, 'forceConfig': E7, 'mgmtMode': E192, 'rebootOnUpdate': E7, 'status': E2}
+
+class MemoryPersistentMemoryLogicalNamespace(ManagedObject):
+    """Persistent Memory Logical Namespace"""
+    __slots__ = ('capacity', 'dn', 'mode', 'name', 'rn', 'socketId', 'socketLocalDimmNumber', 'status')
+    class_id = 'memoryPersistentMemoryLogicalNamespace'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'mode': E190, 'socketId': E188, 'socketLocalDimmNumber': E189, 'status': E2}
+
+class MemoryPersistentMemorySecurity(ManagedObject):
+    """Persistent Memory Security"""
+    __slots__ = ('dn', 'rn', 'status')
+    class_id = 'memoryPersistentMemorySecurity'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'status': E2}
+
+class MgmtBackup(ManagedObject):
+    """Backup"""
+    __slots__ = ('adminState', 'dn', 'hostname', 'passphrase', 'proto', 'pwd', 'remoteFile', 'rn', 'source', 'status', 'usbPath', 'user')
+    class_id = 'mgmtBackup'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E1, 'proto': E21, 'source': E26, 'status': E2}
+
+class MgmtController(ManagedObject):
+    """mgmtController"""
+    __slots__ = ('dn', 'rn', 'status')
+    class_id = 'mgmtController'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class MgmtIf(ManagedObject):
+    """CIMC Network Settings"""
+    __slots__ = ('adminDuplex', 'adminNetSpeed', 'autoNeg', 'ddnsDomain', 'ddnsEnable', 'ddnsRefreshInterval', 'description', 'dhcpEnable', 'dn', 'dnsAlternate', 'dnsPreferred', 'dnsUsingDhcp', 'extEnabled', 'extGw', 'extIp', 'extMask', 'hostname', 'id', 'ifType', 'mac', 'nicMode', 'nicRedundancy', 'portProfile', 'rn', 'status', 'subject', 'v6dhcpEnable', 'v6dnsAlternate', 'v6dnsPreferred', 'v6dnsUsingDhcp', 'v6extEnabled', 'v6extGw', 'v6extIp', 'v6prefix', 'vicSlot', 'vlanEnable', 'vlanId', 'vlanPriority')
+    class_id = 'mgmtIf'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'ddnsRefreshInterval': 'int', 'v6prefix': 'int', 'vlanId': 'int', 'vlanPriority': 'int'}
+    _enums = {'adminDuplex': E167, 'adminNetSpeed': E166, 'autoNeg': E1, 'ddnsEnable': E7, 'dhcpEnable': E7, 'dnsUsingDhcp': E7, 'nicMode': E163, 'nicRedundancy': E165, 'status': E2, 'v6dhcpEnable': E7, 'v6dnsUsingDhcp': E7, 'v6extEnabled': E7, 'vicSlot': E164, 'vlanEnable': E7}
+
+class MgmtImporter(ManagedObject):
+    """Importer"""
+    __slots__ = ('adminState', 'dn', 'hostname', 'passphrase', 'proto', 'pwd', 'remoteFile', 'rn', 'source', 'status', 'usbPath', 'user')
+    class_id = 'mgmtImporter'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E1, 'proto': E21, 'source': E26, 'status': E2}
+
+class MgmtInventory(ManagedObject):
+    """Inventory"""
+    __slots__ = ('adminState', 'dn', 'hostname', 'proto', 'pwd', 'remoteFile', 'rn', 'status', 'user')
+    class_id = 'mgmtInventory'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E20, 'proto': E21, 'status': E2}
+
+class OneTimeBootDevice(ManagedObject):
+    """Boot Device Override Priority"""
+    __slots__ = ('device', 'dn', 'rn', 'status')
+    class_id = 'oneTimeBootDevice'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'device': E58, 'status': E2}
+
+class OneTimePrecisionBootDevice(ManagedObject):
+    """Precision Boot Device Override Priority"""
+    __slots__ = ('adminAction', 'device', 'dn', 'rebootOnUpdate', 'rn', 'status')
+    class_id = 'oneTimePrecisionBootDevice'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E57, 'rebootOnUpdate': E7, 'status': E2}
+
+class OsiCancel(ManagedObject):
+    """Terminate Non-Interactive operating system installation."""
+    __slots__ = ('adminState', 'dn', 'rn', 'status', 'timeOut')
+    class_id = 'osiCancel'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'timeOut': 'int'}
+    _enums = {'adminState': E20, 'status': E2}
+
+class OsiStart(ManagedObject):
+    """Start Non-Interactive Operating System installation."""
+    __slots__ = ('adminState', 'answerFilePassword', 'answerFileShareFile', 'answerFileShareIp', 'answerFileSharePath', 'answerFileShareType', 'answerFileUsername', 'bootMedium', 'configShareFile', 'configShareIp', 'configSharePassword', 'configSharePath', 'configShareType', 'configShareUsername', 'dn', 'isoShare', 'isoShareIp', 'isoShareType', 'mountOption', 'password', 'remoteShareFile', 'remoteShareIp', 'remoteSharePassword', 'remoteSharePath', 'remoteShareType', 'remoteShareUsername', 'rn', 'status', 'timeOut', 'username')
+    class_id = 'osiStart'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'timeOut': 'int'}
+    _enums = {'adminState': E20, 'answerFileShareType': E156, 'bootMedium': E157, 'configShareType': E156, 'isoShareType': E135, 'remoteShareType': E158, 'status': E2}
+
+class PciEquipSlot(ManagedObject):
+    """pciEquipSlot"""
+    __slots__ = ('controllerReported', 'dn', 'id', 'model', 'rn', 'smbiosId', 'status', 'vendor')
+    class_id = 'pciEquipSlot'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {}
+
+class PlatformEventFilters(ManagedObject):
+    """Platform Event Filters"""
+    __slots__ = ('action', 'dn', 'id', 'rn', 'status')
+    class_id = 'platformEventFilters'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'id': 'int'}
+    _enums = {'action': E25, 'status': E2}
+
+class PowerBudget(ManagedObject):
+    """Power Cap Configuration"""
+    __slots__ = ('adminAction', 'adminState', 'dn', 'powCharEnable', 'rn', 'status')
+    class_id = 'powerBudget'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E27, 'adminState': E1, 'powCharEnable': E1, 'status': E2}
+
+class PsuRedundancyPolicy(ManagedObject):
+    """PSU Redundancy Policy Configuration"""
+    __slots__ = ('dn', 'redundancyPolicy', 'rn', 'status')
+    class_id = 'psuRedundancyPolicy'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'redundancyPolicy': E76, 'status': E2}
+
+class SecureLdap(ManagedObject):
+    """Secure Ldap"""
+    __slots__ = ('adminAction', 'adminState', 'certificateContent', 'dn', 'protocol', 'pwd', 'remoteFile', 'remoteServer', 'rn', 'status', 'user')
+    class_id = 'secureLdap'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E215, 'adminState': E1, 'protocol': E214, 'status': E2}
+
+class SelfEncryptStorageController(ManagedObject):
+    """Self encrypt physical drives and virtual drive group."""
+    __slots__ = ('adminAction', 'dn', 'existingSecurityKey', 'keyId', 'keyManagement', 'rn', 'securityKey', 'status')
+    class_id = 'selfEncryptStorageController'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E179, 'keyManagement': E178, 'status': E2}
+
+class SolIf(ManagedObject):
+    """If"""
+    __slots__ = ('adminState', 'comport', 'dn', 'rn', 'speed', 'sshPort', 'status')
+    class_id = 'solIf'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'sshPort': 'int'}
+    _enums = {'comport': E5, 'speed': E4, 'status': E2}
+
+class StandardPowerProfile(ManagedObject):
+    """Standard Power Profile Configuration"""
+    __slots__ = ('allowThrottle', 'corrAction', 'corrTime', 'dn', 'hardCap', 'powerLimit', 'profileEnabled', 'rn', 'status', 'suspendPeriod')
+    class_id = 'standardPowerProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'corrTime': 'int', 'powerLimit': 'int'}
+    _enums = {'allowThrottle': E7, 'corrAction': E28, 'hardCap': E7, 'profileEnabled': E7, 'status': E2}
+
+class StorageController(ManagedObject):
+    """LSI Storage Adapter"""
+    __slots__ = ('adminAction', 'dn', 'id', 'model', 'presence', 'rn', 'status')
+    class_id = 'storageController'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E196, 'status': E2}
+
+class StorageControllerNVMe(ManagedObject):
+    """Storage NVMe Adapter"""
+    __slots__ = ('adminAction', 'dn', 'rn', 'status')
+    class_id = 'storageControllerNVMe'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E217, 'status': E2}
+
+class StorageFlexFlashController(ManagedObject):
+    """Flex Flash Adapter"""
+    __slots__ = ('adminAction', 'autoSync', 'cardSlot', 'configuredMode', 'dn', 'nonUtilPartitionName', 'partitionName', 'rn', 'status', 'virtualDrive')
+    class_id = 'storageFlexFlashController'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E200, 'autoSync': E7, 'cardSlot': E201, 'configuredMode': E202, 'status': E2, 'virtualDrive': E203}
+
+class StorageFlexFlashOperationalProfile(ManagedObject):
+    """Flex Flash Operational Profile"""
+    __slots__ = ('adminAction', 'dn', 'ioReadErrorThreshold', 'ioWriteErrorThreshold', 'raidPrimaryMember', 'raidSecondaryRole', 'rdErrCountSlot1Threshold', 'rdErrCountSlot2Threshold', 'rn', 'status', 'virtualDrivesEnabled', 'wrErrCountSlot1Threshold', 'wrErrCountSlot2Threshold')
+    class_id = 'storageFlexFlashOperationalProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'ioReadErrorThreshold': 'int', 'ioWriteErrorThreshold': 'int', 'rdErrCountSlot1Threshold': 'int', 'rdErrCountSlot2Threshold': 'int', 'wrErrCountSlot1Threshold': 'int', 'wrErrCountSlot2Threshold': 'int'}
+    _enums = {'adminAction': E206, 'raidPrimaryMember': E204, 'raidSecondaryRole': E205, 'status': E2}
+
+class StorageFlexFlashVirtualDrive(ManagedObject):
+    """Flex Flash Virtual Drive"""
+    __slots__ = ('adminAction', 'dn', 'rn', 'status')
+    class_id = 'storageFlexFlashVirtualDrive'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E207, 'status': E2}
+
+class StorageFlexFlashVirtualDriveImageMap(ManagedObject):
+    """Flex Flash Virtual Drive Image Mapping"""
+    __slots__ = ('adminAction', 'dn', 'map', 'mountOptions', 'password', 'remoteFile', 'remoteShare', 'rn', 'status', 'toEnableMapping', 'username')
+    class_id = 'storageFlexFlashVirtualDriveImageMap'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E199, 'map': E135, 'status': E2, 'toEnableMapping': E7}
+
+class StorageFlexUtilController(ManagedObject):
+    """Flex Util Controller"""
+    __slots__ = ('adminAction', 'dn', 'rn', 'status')
+    class_id = 'storageFlexUtilController'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E197, 'status': E2}
+
+class StorageFlexUtilOperationalProfile(ManagedObject):
+    """Flex Util Operational Profile"""
+    __slots__ = ('dn', 'ioReadErrorThreshold', 'ioWriteErrorThreshold', 'rn', 'status')
+    class_id = 'storageFlexUtilOperationalProfile'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'ioReadErrorThreshold': 'int', 'ioWriteErrorThreshold': 'int'}
+    _enums = {'status': E2}
+
+class StorageFlexUtilVirtualDrive(ManagedObject):
+    """Flex Util Virtual Drive"""
+    __slots__ = ('adminAction', 'dn', 'rn', 'status')
+    class_id = 'storageFlexUtilVirtualDrive'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E198, 'status': E2}
+
+class StorageFlexUtilVirtualDriveImageMap(ManagedObject):
+    """Flex Util Virtual Drive Image Mapping"""
+    __slots__ = ('adminAction', 'dn', 'map', 'mountOptions', 'password', 'remoteFile', 'remoteShare', 'rn', 'status', 'username')
+    class_id = 'storageFlexUtilVirtualDriveImageMap'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E199, 'map': E135, 'status': E2}
+
+class StorageLocalDisk(ManagedObject):
+    """Storage Physical Drive"""
+    __slots__ = ('adminAction', 'coercedSize', 'dedicatedHotSpareForVDId', 'destinationPDId', 'dn', 'driveFirmware', 'driveSerialNumber', 'driveState', 'health', 'id', 'interfaceType', 'linkSpeed', 'mediaType', 'online', 'pdStatus', 'predictiveFailureCount', 'productId', 'rn', 'status', 'vendor')
+    class_id = 'storageLocalDisk'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'dedicatedHotSpareForVDId': 'int', 'destinationPDId': 'int', 'id': 'int'}
+    _enums = {'adminAction': E208, 'status': E2}
+
+class StorageRaidBattery(ManagedObject):
+    """Battery Backup Unit"""
+    __slots__ = ('adminAction', 'dn', 'rn', 'status')
+    class_id = 'storageRaidBattery'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminAction': E212, 'status': E2}
+
+class StorageVirtualDrive(ManagedObject):
+    """Storage RAID Virtual Drive"""
+    __slots__ = ('accessPolicy', 'adminAction', 'allowBackgroundInit', 'autoDeleteOldest', 'autoSnapshot', 'cachePolicy', 'diskCachePolicy', 'dn', 'driveState', 'drivesPerSpan', 'health', 'hotspareAction', 'id', 'name', 'physicalDrivesList', 'raidLevel', 'readAheadPolicy', 'readPolicy', 'requestedWriteCachePolicy', 'rn', 'size', 'spanDepth', 'status', 'stripSize', 'vdStatus', 'virtualDriveName')
+    class_id = 'storageVirtualDrive'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'id': 'int'}
+    _enums = {'accessPolicy': E185, 'adminAction': E209, 'cachePolicy': E184, 'diskCachePolicy': E186, 'hotspareAction': E210, 'raidLevel': E211, 'readPolicy': E183, 'requestedWriteCachePolicy': E181, 'status': E2}
+
+class StorageVirtualDriveCreatorUsingUnusedPhysicalDrive(ManagedObject):
+    """Create new virtual drive from unused physical drives."""
+    __slots__ = ('accessPolicy', 'adminAction', 'adminState', 'cachePolicy', 'diskCachePolicy', 'dn', 'driveGroup', 'raidLevel', 'readPolicy', 'rn', 'size', 'status', 'stripSize', 'virtualDriveName', 'writePolicy')
+    class_id = 'storageVirtualDriveCreatorUsingUnusedPhysicalDrive'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'accessPolicy': E185, 'adminAction': E187, 'adminState': E20, 'cachePolicy': E184, 'diskCachePolicy': E186, 'raidLevel': E180, 'readPolicy': E183, 'status': E2, 'stripSize': E182, 'writePolicy': E181}
+
+class StorageVirtualDriveCreatorUsingVirtualDriveGroup(ManagedObject):
+    """Create a new virtual drive from an existing virtual drive group available in the rack server."""
+    __slots__ = ('accessPolicy', 'adminState', 'cachePolicy', 'diskCachePolicy', 'dn', 'readPolicy', 'rn', 'sharedVirtualDriveId', 'size', 'status', 'stripSize', 'virtualDriveName', 'writePolicy')
+    class_id = 'storageVirtualDriveCreatorUsingVirtualDriveGroup'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {'sharedVirtualDriveId': 'int'}
+    _enums = {'accessPolicy': E185, 'adminState': E20, 'cachePolicy': E184, 'diskCachePolicy': E186, 'readPolicy': E183, 'status': E2, 'stripSize': E182, 'writePolicy': E181}
+
+class SysdebugMEpLog(ManagedObject):
+    """Log"""
+    __slots__ = ('adminState', 'dn', 'rn', 'status', 'type')
+    class_id = 'sysdebugMEpLog'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E8, 'status': E2, 'type': E9}
+
+class SysdebugTechSupportExport(ManagedObject):
+    """Tech Support"""
+    __slots__ = ('adminState', 'dn', 'hostname', 'protocol', 'pwd', 'remoteFile', 'rn', 'source', 'status', 'usbPath', 'user')
+    class_id = 'sysdebugTechSupportExport'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E1, 'protocol': E21, 'source': E26, 'status': E2}
+
+class TopSystem(ManagedObject):
+    """System"""
+    __slots__ = ('ccEnable', 'dn', 'fipsEnable', 'name', 'rn', 'status', 'timeZone')
+    class_id = 'topSystem'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'ccEnable': E1, 'fipsEnable': E1, 'status': E2, 'timeZone': E0}
+
+class VicBackupAll(ManagedObject):
+    """All VIC Backup"""
+    __slots__ = ('adminState', 'dn', 'hostname', 'proto', 'pwd', 'remoteFile', 'rn', 'status', 'user')
+    class_id = 'vicBackupAll'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E20, 'proto': E21, 'status': E2}
+
+class VicImporterAll(ManagedObject):
+    """All VIC Importer"""
+    __slots__ = ('adminState', 'dn', 'hostname', 'proto', 'pwd', 'remoteFile', 'rn', 'status', 'user')
+    class_id = 'vicImporterAll'
+    _slots = dict(zip(__slots__, __slots__))
+    _types = {}
+    _enums = {'adminState': E20, 'proto': E21, 'status': E2}
+
+for _cls in list(globals().values()):
+    if isinstance(_cls, type) and issubclass(_cls, ManagedObject) and _cls.class_id:
+        MODELS[_cls.class_id] = _cls
+        for _values in _cls._enums.values():
+            INTERNED.update((value, value) for value in _values)
+INTERNED.update((value, value) for value in COMMON_VALUES)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+
+"""
+Incremental parsing of CIMC XML API responses.
+
+MoStreamParser is fed the response body in chunks as it arrives and hands back each managed object
+below outConfigs as soon as its start tag has been parsed, as a Mo(classId, dn, attrib, depth) tuple.
+Elements are dropped again once their end tag is seen, so memory stays flat no matter how large a
+hierarchical response gets.
+
+The parsing is done by one of several backends with the same feed()/close() interface:
+
+  - 'lxml': lxml's pull parser, if lxml is installed
+  - 'expat': the expat parser ElementTree is built on, driven directly, so the attributes of each start
+    tag go straight into the Mo without an Element being made at all
+  - 'etree': ElementTree's XMLPullParser (MoStreamParser), always available
+
+mo_parser() makes a parser of the BACKEND in use: the first of PREFERRED_BACKENDS that is available, or the
+one named by the PYCIMC_XML_BACKEND environment variable or set_backend(). All of them raise
+xml.etree.ElementTree.ParseError for malformed XML.
+"""
+
+import os
+import xml.etree.ElementTree as ET
+from xml.parsers import expat
+from collections import namedtuple
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+from cveLogger import mylogger, redact
+from exception_mapper import ResponseError
+
+CHUNK_SIZE = 64 * 1024
+
+# depth is 0 for direct children of outConfigs, 1 for their children and so on.
+# dn is rebuilt from the parent's dn for nested objects that only carry an rn.
+Mo = namedtuple('Mo', ['class_id', 'dn', 'attrib', 'depth'])
+
+def check_response(attrib, command_string=''):
+    """
+    Raise ResponseError if the attributes of a response's root element carry an errorCode
+    """
+    # If something went wrong, the response will have an 'errorCode' key
+    # if so, then print the error message and raise an exception
+    if 'errorCode' in attrib:
+        mylogger('errorCode found. command: %s', redact(command_string))
+        mylogger('errorCode found. response.attrib: %s', attrib)
+        raise ResponseError("'%s': '%s'" % (attrib['errorCode'], attrib.get('errorDescr')),
+                            attrib['errorCode'], attrib.get('errorDescr'))
+
+class MoStreamParser():
+
+    def __init__(self, command_string=''):
+        self.command_string = command_string
+        self._parser = self._pull_parser()
+        self._level = 0
+        self._dns = []
+        self._out_configs = None
+
+    def _pull_parser(self):
+        return ET.XMLPullParser(events=('start', 'end'))
+
+    def feed(self, chunk):
+        """
+        Parse the next chunk of the response and return the list of Mo's that it completed
+        """
+        self._parser.feed(chunk)
+        return self._read_events()
+
+    def close(self):
+        self._parser.close()
+        return self._read_events()
+
+    def _read_events(self):
+        mos = []
+        for event, element in self._parser.read_events():
+            if event == 'start':
+                self._level += 1
+                if self._level == 1:
+                    check_response(element.attrib, self.command_string)
+                elif self._level == 2:
+                    self._out_configs = element
+                else:
+                    attrib = self._attrib(element)
+                    dn = attrib.get('dn')
+                    if dn is None:
+                        parent_dn = self._dns[-1] if self._dns else ''
+                        dn = f'{parent_dn}/{attrib["rn"]}' if 'rn' in attrib else parent_dn
+                    self._dns.append(dn)
+                    mos.append(Mo(element.tag, dn, attrib, self._level - 3))
+            else:
+                if self._level >= 3:
+                    self._dns.pop()
+                    element.clear()
+                    if self._level == 3:
+                        self._out_configs.remove(element)
+                self._level -= 1
+        return mos
+
+    def _attrib(self, element):
+        return element.attrib
+
+class LxmlMoParser(MoStreamParser):
+    """
+    MoStreamParser on lxml's pull parser, which builds the elements in C
+    """
+
+    def _pull_parser(self):
+        return lxml_etree.XMLPullParser(events=('start', 'end'), resolve_entities=False, no_network=True)
+
+    def feed(self, chunk):
+        try:
+            return super().feed(bytes(chunk))
+        except lxml_etree.XMLSyntaxError as err:
+            raise ET.ParseError(str(err)) from err
+
+    def close(self):
+        try:
+            return super().close()
+        except lxml_etree.XMLSyntaxError as err:
+            raise ET.ParseError(str(err)) from err
+
+    def _attrib(self, element):
+        return dict(element.attrib)
+
+class ExpatMoParser():
+    """
+    Mo's straight from expat's start and end tag callbacks, without building elements
+    """
+
+    def __init__(self, command_string=''):
+        self.command_string = command_string
+        self._parser = expat.ParserCreate()
+        self._mos = []
+        # the callbacks run once per element, so they work on locals rather than attributes of self
+        dns = ['']
+        push_dn, pop_dn = dns.append, dns.pop
+        level = 0
+
+        def start(tag, attrib):
+            nonlocal level
+            level += 1
+            if level >= 3:
+                dn = attrib.get('dn')
+                if dn is None:
+                    rn = attrib.get('rn')
+                    dn = f'{dns[-1]}/{rn}' if rn is not None else dns[-1]
+                push_dn(dn)
+                self._mos.append(Mo(tag, dn, attrib, level - 3))
+            elif level == 1:
+                check_response(attrib, command_string)
+
+        def end(tag):
+            nonlocal level
+            if level >= 3:
+                pop_dn()
+            level -= 1
+
+        self._parser.StartElementHandler = start
+        self._parser.EndElementHandler = end
+
+    def feed(self, chunk, final=False):
+        """
+        Parse the next chunk of the response and return the list of Mo's that it completed
+        """
+        try:
+            self._parser.Parse(chunk, final)
+        except expat.ExpatError as err:
+            raise ET.ParseError(str(err)) from err
+        mos, self._mos = self._mos, []
+        return mos
+
+    def close(self):
+        return self.feed(b'', final=True)
+
+BACKENDS = {'etree': MoStreamParser, 'expat': ExpatMoParser}
+if lxml_etree is not None:
+    BACKENDS['lxml'] = LxmlMoParser
+PREFERRED_BACKENDS = ('lxml', 'expat', 'etree')
+
+def set_backend(name=None):
+    """
+    Parse responses with the named backend from now on, or with the first available of PREFERRED_BACKENDS
+    """
+    global BACKEND
+    if name is None:
+        name = next(backend for backend in PREFERRED_BACKENDS if backend in BACKENDS)
+    if name not in BACKENDS:
+        raise ValueError(f'XML backend {name!r} is not available, expected one of {sorted(BACKENDS)}')
+    BACKEND = name
+    return name
+
+BACKEND = None
+set_backend(os.environ.get('PYCIMC_XML_BACKEND') or None)
+
+def mo_parser(command_string='', backend=None):
+    """
+    A streaming Mo parser of the given backend, BACKEND by default
+    """
+    return BACKENDS[backend or BACKEND](command_string)
+
+def iter_mos(chunks, command_string='', backend=None):
+    """
+    Yield the Mo's of a response given as an iterable of byte chunks
+    """
+    parser = mo_parser(command_string, backend)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+def mo_attrib(mo):
+    """
+    Return the attributes of a Mo the way a configResolveClass query reports them: with a dn, and without
+    the rn of a nested object
+    """
+    if 'dn' in mo.attrib:
+        return mo.attrib
+    attrib = {key: value for key, value in mo.attrib.items() if key != 'rn'}
+    attrib['dn'] = mo.dn
+    return attrib
+
+def collect_mos(mos, class_ids, found, make=None):
+    """
+    Append the attributes of every Mo whose class is in class_ids to found[classId].
+    make(classId, attributes), e.g. cimc_mo.make, turns them into something else first
+    """
+    for mo in mos:
+        if mo.class_id in class_ids:
+            attrib = mo_attrib(mo)
+            found[mo.class_id].append(make(mo.class_id, attrib) if make is not None else attrib)
+    return found
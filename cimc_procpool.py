@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+
+"""
+Fleet inventory with the XML parsing done in a pool of worker processes.
+
+With hundreds of hosts in flight, parsing responses and building inventories in the process that does
+the network I/O leaves it bound to one core. ProcessFleet is a cimc_async.Fleet, which keeps the logins
+and I/O in one asyncio event loop, run with a task that ships the raw body of each host's hierarchical
+inventory query (see UcsServer.get_full_inventory) to a ProcessPoolExecutor, which parses it and builds
+the inventory:
+
+    fleet = ProcessFleet(hosts, 'admin', 'password', subsystems=['chassis', 'drives', 'adaptor', 'fw'])
+    store = FleetStore()
+    for result in fleet.collect():
+        if result.error is None:
+            store.add_inventory(result.host, result.value)
+
+Bodies of at least SHARED_MEMORY_MIN bytes are handed over in a multiprocessing.shared_memory block that
+the worker parses in place instead of through a pickled copy. Inventories come back with repeated strings
+(attribute names and values like 'Enabled' or 'Good') stored once, which keeps the pickles small.
+Requires aiohttp.
+"""
+
+import os
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory, resource_tracker
+
+from pycimc import InventoryDict, REQUEST_TIMEOUT, FULL_INVENTORY_SUBSYSTEMS, resolve_dn_command, full_inventory_root, \
+    fan_out_inventory
+from cimc_async import Fleet, FLEET_CONCURRENCY, HOST_CONCURRENCY
+from cimc_parser import CHUNK_SIZE, iter_mos
+from cveLogger import mylogger
+from exception_mapper import ResponseError
+
+# bodies smaller than this are cheaper to pickle than to put in shared memory
+SHARED_MEMORY_MIN = 256 * 1024
+
+def worker_pool(processes=None):
+    """
+    Return a ProcessPoolExecutor for ProcessFleet. The shared memory resource tracker is started first so that
+    the workers use the same one, and a block isn't reported as leaked by a worker that only read it.
+    """
+    resource_tracker.ensure_running()
+    return ProcessPoolExecutor(processes or os.cpu_count())
+
+def parse_inventory(payload, subsystems, command_string=''):
+    """
+    Worker side: parse a hierarchical inventory response and return the inventory of subsystems, compacted.
+    payload is the response body, or the (name, size) of a shared memory block holding it.
+    """
+    if isinstance(payload, tuple):
+        name, size = payload
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            body = block.buf[:size]
+            try:
+                inventory = inventory_from_body(body, subsystems, command_string)
+            finally:
+                body.release()
+        finally:
+            block.close()
+    else:
+        inventory = inventory_from_body(payload, subsystems, command_string)
+    return compact(inventory)
+
+def inventory_from_body(body, subsystems, command_string=''):
+    chunks = (body[offset:offset + CHUNK_SIZE] for offset in range(0, len(body), CHUNK_SIZE))
+    return fan_out_inventory(list(iter_mos(chunks, command_string)), subsystems)
+
+def compact(value, strings=None):
+    """
+    Return value with equal strings replaced by one shared copy, so that pickle writes each of them once
+    """
+    if strings is None:
+        strings = {}
+    if isinstance(value, str):
+        return strings.setdefault(value, value)
+    if isinstance(value, dict):
+        return {strings.setdefault(key, key): compact(item, strings) for key, item in value.items()}
+    if isinstance(value, list):
+        return [compact(item, strings) for item in value]
+    return value
+
+class ProcessFleet(Fleet):
+    """
+    Collect the hierarchical inventory of many CIMCs, parsing the responses in worker processes.
+
+    hosts, credentials, concurrency, per_host, scheme, timeout and session_cache are as for
+    cimc_async.Fleet, which does the logins and network I/O. processes is the size of the worker pool
+    (os.cpu_count() by default); pass pool, from worker_pool(), to share one between runs.
+    """
+
+    def __init__(self, hosts, username=None, password=None, credentials=None, subsystems=FULL_INVENTORY_SUBSYSTEMS,
+                 concurrency=FLEET_CONCURRENCY, per_host=HOST_CONCURRENCY, scheme='https', timeout=REQUEST_TIMEOUT,
+                 session_cache=None, processes=None, pool=None, shared_memory_min=SHARED_MEMORY_MIN):
+        super().__init__(hosts, username, password, credentials, concurrency=concurrency, per_host=per_host,
+                         scheme=scheme, timeout=timeout, session_cache=session_cache)
+        self.subsystems = list(dict.fromkeys(subsystems))
+        self.root = full_inventory_root(self.subsystems)
+        self.processes = processes or os.cpu_count()
+        self.pool = pool
+        self.shared_memory_min = shared_memory_min
+
+    async def parse(self, pool, body, command_string):
+        """
+        Parse body in the pool, through shared memory if it is large enough
+        """
+        loop = asyncio.get_running_loop()
+        if len(body) < self.shared_memory_min:
+            return await loop.run_in_executor(pool, parse_inventory, body, self.subsystems, command_string)
+        block = shared_memory.SharedMemory(create=True, size=len(body))
+        try:
+            block.buf[:len(body)] = body
+            # the body is in the block now, so drop our copy while the worker parses it
+            size = len(body)
+            del body
+            return await loop.run_in_executor(pool, parse_inventory, (block.name, size), self.subsystems,
+                                              command_string)
+        finally:
+            block.close()
+            block.unlink()
+
+    async def inventory(self, server, pool):
+        """
+        Fetch a logged-in server's inventory and have it parsed in the pool
+        """
+        command_string = resolve_dn_command(server.session_cookie, self.root, True)
+        try:
+            try:
+                value = await self.parse(pool, await server.fetch(command_string), command_string)
+            except ResponseError as err:
+                command_string = await server._renew_session(err, command_string)
+                value = await self.parse(pool, await server.fetch(command_string), command_string)
+        except ResponseError as err:
+            # firmware without the hierarchical query: fall back to the getters, parsed in this process
+            mylogger('%s: hierarchical query on %s failed, falling back to the getters: %s', server.ipaddress,
+                     self.root, err)
+            await server.get_full_inventory(self.subsystems)
+            value = server.inventory
+        inventory = InventoryDict()
+        inventory.update(value)
+        return inventory
+
+    async def run(self):
+        """
+        Async generator yielding a FleetResult with each host's inventory, in the order they finish
+        """
+        pool = self.pool or worker_pool(self.processes)
+
+        async def task(server):
+            return await self.inventory(server, pool)
+
+        try:
+            async for result in super().run(task):
+                yield result
+        finally:
+            if self.pool is None:
+                pool.shutdown(cancel_futures=True)
+
+    def collect(self):
+        """
+        Blocking helper: return the list of FleetResults for every host
+        """
+        async def gather_results():
+            return [result async for result in self.run()]
+        return asyncio.run(gather_results())
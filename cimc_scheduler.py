@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+
+"""
+Adaptive per-CIMC request scheduling.
+
+A CIMC has a small service processor, and parallel requests past what it can take come back as
+timeouts, dropped connections and errors rather than as more throughput. Every UcsServer sends its
+requests through the HostScheduler for its host (shared by all UcsServers talking to that host in the
+process), which admits at most limit requests at once and spaces their starts by interval:
+
+  - each request that comes back cleanly raises limit by 1/limit (about one more slot per round trip
+    of the whole window) and halves interval, up to max_limit,
+  - a timeout, connection failure, garbage reply or busy errorCode halves limit (not below min_limit)
+    and doubles interval (up to MAX_INTERVAL),
+  - a clean reply slower than latency_tolerance times the fastest seen for that kind of request
+    halves limit too, before the CIMC gets to the point of failing.
+
+Only one cut is made per window: requests that were already in flight when the limit was cut don't cut it
+again. Queue depth, in-flight requests, the limit and the time spent waiting are exported through
+cimc_metrics.
+"""
+
+import time
+import threading
+from contextlib import contextmanager
+
+from cveLogger import mylogger, request_fields
+from cimc_metrics import REGISTRY, observe_scheduler
+from cimc_transport import POOL_MAXSIZE
+from exception_mapper import ResponseError
+
+INITIAL_LIMIT = 2
+MIN_LIMIT = 1
+MAX_LIMIT = POOL_MAXSIZE
+DECREASE_FACTOR = 0.5
+LATENCY_TOLERANCE = 3.0
+# and at least this many seconds slower, so that jitter on fast replies doesn't count
+LATENCY_SLACK = 0.25
+MIN_INTERVAL = 0.05
+MAX_INTERVAL = 2.0
+# errorCodes that mean the CIMC is too busy, rather than that the request was wrong
+BUSY_CODES = frozenset(['572'])
+
+def is_overload(error):
+    """
+    Whether a failed request points at an overloaded CIMC. ResponseErrors mostly mean a bad request.
+    """
+    if isinstance(error, ResponseError):
+        return error.error_code in BUSY_CODES
+    return error is not None
+
+class HostScheduler():
+    """
+    AIMD concurrency limit and pacing for the requests to one CIMC
+    """
+
+    def __init__(self, host, limit=INITIAL_LIMIT, min_limit=MIN_LIMIT, max_limit=MAX_LIMIT,
+                 latency_tolerance=LATENCY_TOLERANCE):
+        self.host = host
+        self.limit = float(limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.interval = 0.0
+        self.in_flight = 0
+        self.waiting = 0
+        self.waited = 0.0
+        self.backoffs = 0
+        # fastest latency seen per (method, classId)
+        self.baselines = {}
+        self._next_start = 0.0
+        self._last_cut = 0.0
+        self._cond = threading.Condition()
+        self._local = threading.local()
+
+    def acquire(self):
+        """
+        Wait for a slot and return the time the request may start at
+        """
+        start = time.monotonic()
+        with self._cond:
+            self.waiting += 1
+            self._observe()
+            while True:
+                now = time.monotonic()
+                if self.in_flight < int(self.limit) and now >= self._next_start:
+                    break
+                self._cond.wait(self._next_start - now if self.in_flight < int(self.limit) else None)
+            self.waiting -= 1
+            self.in_flight += 1
+            self._next_start = now + self.interval
+            self._observe()
+        waited = now - start
+        self.waited += waited
+        if REGISTRY.enabled:
+            REGISTRY.observe('pycimc_queue_wait_seconds', (self.host,), waited)
+        return now
+
+    def release(self, started, latency, command_string='', error=None):
+        """
+        Free the slot taken at started and adjust the limit to how the request went
+        """
+        key = request_fields(command_string) if command_string else None
+        with self._cond:
+            self.in_flight -= 1
+            reason = None
+            if is_overload(error):
+                reason = type(error).__name__
+            elif error is None and key is not None:
+                baseline = self.baselines.get(key)
+                if baseline is None or latency < baseline:
+                    self.baselines[key] = latency
+                elif latency > baseline * self.latency_tolerance and latency - baseline > LATENCY_SLACK:
+                    reason = 'latency'
+            if reason is not None and started >= self._last_cut:
+                self._cut(reason, error is not None)
+            elif reason is None and error is None:
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+                self.interval = self.interval / 2 if self.interval > MIN_INTERVAL else 0.0
+            self._observe()
+            self._cond.notify_all()
+
+    def _cut(self, reason, failed):
+        self.limit = max(self.min_limit, self.limit * DECREASE_FACTOR)
+        if failed:
+            self.interval = min(MAX_INTERVAL, max(MIN_INTERVAL, self.interval * 2))
+        self._last_cut = time.monotonic()
+        self.backoffs += 1
+        mylogger('%s: backing off after %s, %d requests at a time, %.2fs apart', self.host, reason,
+                 int(self.limit), self.interval)
+        if REGISTRY.enabled:
+            REGISTRY.inc('pycimc_backoffs_total', (self.host, reason))
+
+    def _observe(self):
+        observe_scheduler(self.host, self.waiting, self.in_flight, int(self.limit))
+
+    @contextmanager
+    def slot(self, command_string=''):
+        """
+        Hold a slot for one request. A thread that already holds one (a login from inside a streamed
+        query, say) goes straight through, so a limit of 1 can't deadlock it.
+        """
+        if getattr(self._local, 'depth', 0):
+            self._local.depth += 1
+            try:
+                yield
+            finally:
+                self._local.depth -= 1
+            return
+        started = self.acquire()
+        self._local.depth = 1
+        error = None
+        try:
+            yield
+        except GeneratorExit:
+            # a streamed response the caller stopped reading
+            raise
+        except BaseException as err:
+            error = err
+            raise
+        finally:
+            self._local.depth = 0
+            self.release(started, time.monotonic() - started, command_string, error)
+
+    def stats(self):
+        with self._cond:
+            return {'limit': int(self.limit), 'interval': self.interval, 'in_flight': self.in_flight,
+                    'waiting': self.waiting, 'waited': self.waited, 'backoffs': self.backoffs}
+
+# host -> HostScheduler, shared by every UcsServer in the process
+SCHEDULERS = {}
+_schedulers_lock = threading.Lock()
+
+def scheduler_for(host, **kwargs):
+    """
+    Return the HostScheduler for host, creating it with kwargs the first time
+    """
+    with _schedulers_lock:
+        scheduler = SCHEDULERS.get(host)
+        if scheduler is None:
+            scheduler = SCHEDULERS[host] = HostScheduler(host, **kwargs)
+        return scheduler
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+
+"""
+Session cookie reuse for CIMCs.
+
+SessionCache keeps the aaaLogin cookie for each host/user pair in a small JSON file, locked with
+flock so that several processes (e.g. overlapping cron runs) share one CIMC session instead of each
+logging in and out. SessionKeeper is the background thread that sends aaaKeepAlive before the
+session's outRefreshPeriod runs out.
+"""
+
+import os
+import re
+import json
+import time
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from cveLogger import mylogger
+
+SESSION_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pycimc', 'sessions')
+# A cached cookie is only handed out while at least this much of its refresh period is left
+EXPIRY_MARGIN = 0.1
+# The keeper sends aaaKeepAlive after this fraction of the refresh period
+KEEPALIVE_FRACTION = 0.5
+DEFAULT_REFRESH_PERIOD = 600
+# errorCodes the CIMC returns for an expired, logged-out or otherwise unknown cookie
+SESSION_ERROR_CODES = frozenset(['552', '555'])
+
+def is_session_error(err):
+    return getattr(err, 'error_code', None) in SESSION_ERROR_CODES
+
+class SessionCache():
+    """
+    On-disk cache of CIMC session cookies, keyed by host and username. Passwords are never stored.
+    """
+
+    def __init__(self, directory=SESSION_CACHE_DIR):
+        self.directory = directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._thread_locks = defaultdict(threading.Lock)
+        self._thread_locks_guard = threading.Lock()
+
+    def _path(self, host, username, suffix='.json'):
+        name = re.sub(r'[^A-Za-z0-9._-]', '_', f'{host}_{username}')
+        return os.path.join(self.directory, name + suffix)
+
+    @contextmanager
+    def locked(self, host, username):
+        """
+        Hold an exclusive lock on the host/user entry, across threads and processes.
+        Used around login so that only one caller logs in while the others wait for its cookie.
+        """
+        path = self._path(host, username, '.lock')
+        with self._thread_locks_guard:
+            thread_lock = self._thread_locks[path]
+        # flock only excludes other processes reliably, so threads of this process queue up on thread_lock first
+        with thread_lock:
+            with open(path, 'a') as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def get(self, host, username):
+        """
+        Return the cached session dict (cookie, refresh_period, refreshed, version) if it is still valid, else None
+        """
+        try:
+            with open(self._path(host, username)) as session_file:
+                session = json.load(session_file)
+        except (OSError, ValueError):
+            return None
+        period = session.get('refresh_period') or DEFAULT_REFRESH_PERIOD
+        if time.time() - session.get('refreshed', 0) > period * (1 - EXPIRY_MARGIN):
+            return None
+        return session
+
+    def put(self, host, username, cookie, refresh_period=None, version=None, refreshed=None):
+        session = {
+            'cookie': cookie,
+            'refresh_period': int(refresh_period) if refresh_period else DEFAULT_REFRESH_PERIOD,
+            'refreshed': refreshed if refreshed is not None else time.time(),
+            'version': version,
+        }
+        path = self._path(host, username)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as session_file:
+            json.dump(session, session_file)
+        os.replace(tmp_path, path)
+        return session
+
+    def touch(self, host, username, cookie):
+        """
+        Record a successful keep-alive for cookie, unless another process has replaced it meanwhile
+        """
+        with self.locked(host, username):
+            session = self.get(host, username)
+            if session and session['cookie'] == cookie:
+                self.put(host, username, cookie, session['refresh_period'], session.get('version'))
+
+    def discard(self, host, username, cookie=None):
+        """
+        Forget the cached session. With cookie given, only if it is still the cached one
+        """
+        path = self._path(host, username)
+        try:
+            if cookie is not None:
+                with open(path) as session_file:
+                    if json.load(session_file).get('cookie') != cookie:
+                        return
+            os.remove(path)
+        except (OSError, ValueError):
+            pass
+
+class SessionKeeper(threading.Thread):
+    """
+    Daemon thread that keeps a UcsServer's session alive with server.keep_alive() every
+    KEEPALIVE_FRACTION of the refresh period, until stop() is called.
+    """
+
+    def __init__(self, server, refresh_period, last_refreshed=None):
+        super().__init__(name=f'session-keeper-{server.ipaddress}', daemon=True)
+        self.server = server
+        self.interval = float(refresh_period or DEFAULT_REFRESH_PERIOD) * KEEPALIVE_FRACTION
+        self.last_refreshed = last_refreshed if last_refreshed is not None else time.time()
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(max(0.0, self.last_refreshed + self.interval - time.time())):
+            try:
+                self.server.keep_alive()
+            except Exception as err:
+                mylogger('Keep-alive for %s failed: %s', self.server.ipaddress, err)
+            self.last_refreshed = time.time()
+
+    def stop(self):
+        self._stopped.set()
@@ -0,0 +1,762 @@
+#!/usr/bin/env python
+
+"""
+A fake CIMC for offline functional and load testing.
+
+CimcSimulator serves the XML API on /nuova for any number of virtual hosts, each on its own local
+port, from one asyncio event loop in a background thread. Every host gets its own copy of a managed
+object tree seeded from an inventory fixture in the shape of sample_inventory.json (or a list of
+{'classId': ..., 'dn': ..., <attributes>} objects), and implements:
+
+    aaaLogin, aaaLogout, aaaRefresh, aaaKeepAlive
+    configResolveClass, configResolveChildren, configResolveDn (with inHierarchical)
+    configConfMo, configConfMos
+    eventSubscribe (length-prefixed configMoChangeEvent stream, see emit())
+
+Per-request latency, a per-host concurrency limit, a session cap and random or scripted error
+injection make it usable for reproducing fleet-scale behaviour on one box:
+
+    with CimcSimulator('sample_inventory.json', count=1000, latency=0.05, concurrency=2) as simulator:
+        run_sweep(simulator.addresses)
+
+It can also be run standalone: python cimc_simulator.py --count 1000 --hosts-file hosts.txt
+"""
+
+import os
+import ssl
+import json
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+import threading
+import subprocess
+import xml.etree.ElementTree as ET
+from collections import defaultdict, Counter
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from cimc_dn import parse_dn, parent_dn
+
+RACK_UNIT_DN = 'sys/rack-unit-1'
+REFRESH_PERIOD = 600
+MAX_SESSIONS = 32
+USER_SLOTS = 15
+# classes of the container objects a dump doesn't list, by rn
+CONTAINER_CLASSES = {'mgmt': 'mgmtController', 'board': 'computeBoard'}
+HANG_TIME = 300.0
+
+# errorCodes the simulator answers with, modelled on the CIMC's
+AUTH_FAILED = ('551', 'Authorization failed')
+SESSION_INVALID = ('552', 'Authorization required')
+SESSION_LIMIT = ('572', 'User reached maximum session limit')
+NO_SUCH_OBJECT = ('103', 'Object does not exist')
+BAD_REQUEST = ('101', 'Malformed or unsupported XML API request')
+INJECTED_ERROR = ('500', 'Injected error')
+
+# Kinds of injected failures
+ERROR_KINDS = ('error', 'http500', 'drop', 'hang')
+
+class MoTree():
+    """
+    Managed objects by dn, with a parent -> children and a class -> dns index
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self.children = defaultdict(list)
+        self.by_class = defaultdict(list)
+
+    def add(self, class_id, dn, attrib):
+        """
+        Create the object, or merge attrib into it if it exists. Returns its attributes.
+        """
+        if dn in self.objects:
+            self.objects[dn][1].update(attrib)
+            return self.objects[dn][1]
+        attrib = dict(attrib, dn=dn)
+        attrib.pop('rn', None)
+        attrib.pop('status', None)
+        self.objects[dn] = (class_id, attrib)
+        self.children[parent_dn(dn)].append(dn)
+        self.by_class[class_id].append(dn)
+        return attrib
+
+    def remove(self, dn):
+        for child in list(self.children.get(dn, ())):
+            self.remove(child)
+        class_id, _ = self.objects.pop(dn)
+        self.children[parent_dn(dn)].remove(dn)
+        self.by_class[class_id].remove(dn)
+        self.children.pop(dn, None)
+
+    def copy(self):
+        tree = MoTree()
+        tree.objects = {dn: (class_id, dict(attrib)) for dn, (class_id, attrib) in self.objects.items()}
+        tree.children = defaultdict(list, {dn: list(dns) for dn, dns in self.children.items()})
+        tree.by_class = defaultdict(list, {class_id: list(dns) for class_id, dns in self.by_class.items()})
+        return tree
+
+    def element(self, dn, hierarchical=False, nested=False):
+        """
+        Return the object as an XML element. Nested children carry their rn instead of a dn.
+        """
+        class_id, attrib = self.objects[dn]
+        if nested:
+            attrib = dict(attrib, rn=parse_dn(dn)[-1])
+            del attrib['dn']
+        element = ET.Element(class_id, attrib)
+        if hierarchical:
+            for child in self.children.get(dn, ()):
+                element.append(self.element(child, True, True))
+        return element
+
+    @classmethod
+    def from_fixture(cls, fixture):
+        """
+        Build a tree from a fixture: a path to a JSON file, an inventory dict shaped like
+        sample_inventory.json, or a list of {'classId': ..., 'dn': ..., <attributes>} objects
+        """
+        if isinstance(fixture, str):
+            with open(fixture) as fixture_file:
+                fixture = json.load(fixture_file)
+        tree = cls()
+        if isinstance(fixture, list):
+            for mo in fixture:
+                attrib = {key: value for key, value in mo.items() if key != 'classId'}
+                tree.add(mo['classId'], attrib.pop('dn'), attrib)
+            return tree
+        add_inventory(tree, fixture)
+        return tree
+
+def add_inventory(tree, inventory):
+    """
+    Turn an UcsServer.inventory dump back into the managed objects it was built from
+    """
+    tree.add('topSystem', 'sys', {'name': 'simulated-cimc'})
+    tree.add('computeRackUnit', RACK_UNIT_DN, dict(inventory.get('chassis', {'serial': 'SIM00000000'}), dn=RACK_UNIT_DN))
+    if 'cimc' in inventory:
+        tree.add('mgmtIf', inventory['cimc'].get('dn', f'{RACK_UNIT_DN}/mgmt/if-1'), inventory['cimc'])
+    for slot in inventory.get('pci', []):
+        tree.add('pciEquipSlot', slot['dn'], slot)
+    for psu in inventory.get('psu', []):
+        tree.add('equipmentPsu', psu['dn'], psu)
+    for adaptor in inventory.get('adaptor', []):
+        tree.add('adaptorUnit', adaptor['dn'], {key: value for key, value in adaptor.items() if key != 'port'})
+        for port in adaptor.get('port', []):
+            tree.add('adaptorExtEthIf', port['dn'], {key: value for key, value in port.items() if key != 'vnic'})
+            for vnic in port.get('vnic', []):
+                tree.add('adaptorHostEthIf', vnic['dn'], vnic)
+    drives = inventory.get('drives', {})
+    for class_id in ('storageLocalDisk', 'storageVirtualDrive'):
+        for drive in drives.get(class_id, []):
+            controller_dn = parent_dn(drive['dn'])
+            if controller_dn not in tree.objects:
+                tree.add('storageController', controller_dn, {'id': parse_dn(controller_dn)[-1].split('-', 2)[-1],
+                                                              'model': 'Simulated RAID Controller', 'presence': 'equipped'})
+            tree.add(class_id, drive['dn'], drive)
+    for controller in inventory.get('storageControllers', []):
+        tree.add('storageController', controller['dn'], controller)
+    for dn, version in inventory.get('fw', {}).items():
+        tree.add('firmwareRunning', dn, {'deployment': 'system', 'type': 'blade-controller', 'version': version})
+    if 'bios' in inventory:
+        bios_dn = f'{RACK_UNIT_DN}/bios/bios-settings'
+        tree.add('biosUnit', f'{RACK_UNIT_DN}/bios', {'model': inventory.get('chassis', {}).get('model', '')})
+        tree.add('biosSettings', bios_dn, {})
+        for rn, settings in inventory['bios'].items():
+            tree.add('biosVf' + rn.replace('-', ''), f'{bios_dn}/{rn}', settings)
+    boot_dn = f'{RACK_UNIT_DN}/boot-policy'
+    tree.add('lsbootDef', boot_dn, {'name': 'boot-policy', 'rebootOnUpdate': 'no'})
+    for order, boot_type in enumerate(inventory.get('boot_order') or [], 1):
+        access = 'read-write' if boot_type == 'storage' else 'read-only'
+        tree.add('lsboot' + boot_type.title().replace('-', ''), f'{boot_dn}/{boot_type}-{access}',
+                 {'type': boot_type, 'order': str(order), 'access': access})
+    users = inventory.get('users') or [{'id': '1', 'name': 'admin', 'priv': 'admin', 'accountStatus': 'active'}]
+    for slot in range(1, USER_SLOTS + 1):
+        user = next((user for user in users if user.get('id') == str(slot)), None) or \
+            {'id': str(slot), 'name': '', 'priv': 'read-only', 'accountStatus': 'inactive'}
+        tree.add('aaaUser', f'sys/user-ext/user-{slot}', user)
+    # a hierarchical query only reaches objects whose parents exist
+    for dn in [dn for dn in tree.children if dn and dn not in tree.objects]:
+        tree.add(CONTAINER_CLASSES.get(parse_dn(dn)[-1], 'managedObject'), dn, {})
+
+def self_signed_cert(directory):
+    """
+    Write a throwaway self-signed certificate and key for localhost with the openssl CLI
+    """
+    certfile = os.path.join(directory, 'simulator.crt')
+    keyfile = os.path.join(directory, 'simulator.key')
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '30', '-subj', '/CN=localhost',
+                    '-keyout', keyfile, '-out', certfile], check=True, capture_output=True)
+    return certfile, keyfile
+
+class SimulatedHost():
+    """
+    One virtual CIMC: its managed object tree, sessions, limits and injected errors
+    """
+
+    def __init__(self, simulator, index, tree):
+        self.simulator = simulator
+        self.index = index
+        self.address = None
+        self.credentials = dict(simulator.credentials)
+        self.sessions = {}
+        self.stats = Counter()
+        self.active = 0
+        self.max_active = 0
+        self._base_tree = tree
+        self._tree = None
+        self._injected = []
+        self._subscribers = []
+        self._eid = 0
+        self._semaphore = asyncio.Semaphore(simulator.concurrency) if simulator.concurrency else None
+
+    @property
+    def tree(self):
+        # each host copies the fixture on first use, with a serial number of its own
+        if self._tree is None:
+            self._tree = self._base_tree.copy()
+            rack_unit = self._tree.objects.get(RACK_UNIT_DN)
+            if rack_unit is not None and self.index:
+                rack_unit[1]['serial'] = f'SIM{self.index:08d}'
+        return self._tree
+
+    def inject(self, kind, count=1, method=None, error=INJECTED_ERROR):
+        """
+        Make the next count requests (of XML method, if given) fail: kind is 'error' (errorCode response),
+        'http500', 'drop' (close the connection without a reply) or 'hang' (never reply)
+        """
+        if kind not in ERROR_KINDS:
+            raise ValueError(f'Unknown error kind {kind!r}, expected one of {ERROR_KINDS}')
+        self._injected.append([kind, count, method, error])
+
+    def _next_injection(self, method):
+        for injection in self._injected:
+            kind, count, for_method, error = injection
+            if for_method is None or for_method == method:
+                injection[1] -= 1
+                if injection[1] <= 0:
+                    self._injected.remove(injection)
+                return kind, error
+        for kind, rate in self.simulator.error_rates.items():
+            if rate and random.random() < rate:
+                return kind, INJECTED_ERROR
+        return None, None
+
+    async def handle(self, body):
+        """
+        Return (http status, response body) for one request, or (None, reason) to drop the connection
+        """
+        try:
+            request = ET.fromstring(body)
+        except ET.ParseError:
+            return 200, self.error_response('error', BAD_REQUEST)
+        method = request.tag
+        self.stats[method] += 1
+        kind, error = self._next_injection(method)
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await self.simulator.delay()
+            if kind == 'hang':
+                await asyncio.sleep(self.simulator.hang_time)
+                return None, 'hang'
+            if kind == 'drop':
+                return None, 'drop'
+            if kind == 'http500':
+                return 500, b'Internal Server Error'
+            if kind == 'error':
+                return 200, self.error_response(method, error)
+            return 200, ET.tostring(self.dispatch(method, request))
+        finally:
+            self.active -= 1
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    def error_response(self, method, error, cookie=''):
+        code, descr = error
+        return ET.tostring(ET.Element(method, {'cookie': cookie, 'response': 'yes', 'errorCode': code,
+                                               'invocationResult': code, 'errorDescr': descr}))
+
+    def response(self, request, **attrib):
+        return ET.Element(request.tag, dict({'cookie': request.get('cookie', ''), 'response': 'yes'}, **attrib))
+
+    def fail(self, request, error):
+        code, descr = error
+        return self.response(request, errorCode=code, invocationResult=code, errorDescr=descr)
+
+    def dispatch(self, method, request):
+        if method == 'aaaLogin':
+            return self.login(request)
+        if not self.valid_session(request.get('cookie')):
+            return self.fail(request, SESSION_INVALID)
+        handler = getattr(self, 'do_' + method, None)
+        if handler is None:
+            return self.fail(request, BAD_REQUEST)
+        return handler(request)
+
+    def login(self, request):
+        username = request.get('inName')
+        if username is None or self.credentials.get(username) != request.get('inPassword'):
+            return self.fail(request, AUTH_FAILED)
+        self.expire_sessions()
+        if len(self.sessions) >= self.simulator.max_sessions:
+            return self.fail(request, SESSION_LIMIT)
+        self.stats['logins'] += 1
+        return self.response(request, outCookie=self.new_session(username), outRefreshPeriod=str(REFRESH_PERIOD),
+                             outPriv='admin', outVersion=self.simulator.version)
+
+    def new_session(self, username):
+        cookie = '%d/%08x-%04x' % (time.time(), random.getrandbits(32), self.index % 0x10000)
+        self.sessions[cookie] = (username, time.monotonic() + REFRESH_PERIOD)
+        return cookie
+
+    def valid_session(self, cookie):
+        session = self.sessions.get(cookie)
+        if session is None or session[1] < time.monotonic():
+            self.sessions.pop(cookie, None)
+            return False
+        self.sessions[cookie] = (session[0], time.monotonic() + REFRESH_PERIOD)
+        return True
+
+    def expire_sessions(self):
+        now = time.monotonic()
+        for cookie in [cookie for cookie, (_, expires) in self.sessions.items() if expires < now]:
+            del self.sessions[cookie]
+
+    def do_aaaLogout(self, request):
+        self.sessions.pop(request.get('inCookie'), None)
+        return self.response(request, outStatus='success')
+
+    def do_aaaRefresh(self, request):
+        username, _ = self.sessions.pop(request.get('inCookie') or request.get('cookie'), (request.get('inName'), None))
+        return self.response(request, outCookie=self.new_session(username), outRefreshPeriod=str(REFRESH_PERIOD),
+                             outPriv='admin')
+
+    def do_aaaKeepAlive(self, request):
+        return self.response(request)
+
+    def do_eventUnsubscribe(self, request):
+        self.close_event_streams()
+        return self.response(request)
+
+    def out_configs(self, request, dns):
+        response = self.response(request)
+        out_configs = ET.SubElement(response, 'outConfigs')
+        hierarchical = request.get('inHierarchical') == 'true'
+        for dn in dns:
+            out_configs.append(self.tree.element(dn, hierarchical))
+        return response
+
+    def do_configResolveClass(self, request):
+        response = self.out_configs(request, self.tree.by_class.get(request.get('classId'), ()))
+        response.set('classId', request.get('classId', ''))
+        return response
+
+    def do_configResolveChildren(self, request):
+        class_id = request.get('classId')
+        tree = self.tree
+        dns = [dn for dn in tree.children.get(request.get('inDn'), ())
+               if class_id is None or tree.objects[dn][0] == class_id]
+        return self.out_configs(request, dns)
+
+    def do_configResolveDn(self, request):
+        dn = request.get('dn')
+        response = self.response(request, dn=dn or '')
+        out_config = ET.SubElement(response, 'outConfig')
+        if dn in self.tree.objects:
+            out_config.append(self.tree.element(dn, request.get('inHierarchical') == 'true'))
+        return response
+
+    def do_configConfMo(self, request):
+        dn = request.get('dn')
+        in_config = request.find('inConfig')
+        if dn is None or in_config is None or len(in_config) != 1:
+            return self.fail(request, BAD_REQUEST)
+        if not self.configurable(dn):
+            return self.fail(request, NO_SUCH_OBJECT)
+        self.configure(in_config[0], dn)
+        response = self.response(request, dn=dn)
+        out_config = ET.SubElement(response, 'outConfig')
+        if dn in self.tree.objects:
+            out_config.append(self.tree.element(dn, request.get('inHierarchical') == 'true'))
+        return response
+
+    def do_configConfMos(self, request):
+        # all or nothing, like the CIMC: a bad pair fails the whole request
+        pairs = request.findall('inConfigs/pair')
+        limit = self.simulator.max_conf_mos
+        if not pairs or any(pair.get('key') is None or len(pair) != 1 for pair in pairs) \
+                or (limit is not None and len(pairs) > limit):
+            return self.fail(request, BAD_REQUEST)
+        if not all(self.configurable(pair.get('key')) for pair in pairs):
+            return self.fail(request, NO_SUCH_OBJECT)
+        response = self.response(request)
+        out_configs = ET.SubElement(response, 'outConfigs')
+        hierarchical = request.get('inHierarchical') == 'true'
+        for pair in pairs:
+            dn = pair.get('key')
+            self.configure(pair[0], dn)
+            ET.SubElement(out_configs, 'pair', key=dn).append(self.tree.element(dn, hierarchical))
+        return response
+
+    def configurable(self, dn):
+        # objects can be modified, or created under an existing parent
+        return dn in self.tree.objects or parent_dn(dn) in self.tree.objects
+
+    def configure(self, element, dn):
+        attrib = dict(element.attrib)
+        attrib.pop('dn', None)
+        attrib.pop('rn', None)
+        status = attrib.pop('status', '')
+        if status in ('deleted', 'removed'):
+            if dn in self.tree.objects:
+                self.tree.remove(dn)
+                self.notify(element.tag, dn, status, {})
+            return
+        if element.tag == 'aaaUser' and 'pwd' in attrib:
+            # passwords are write-only
+            self.credentials[attrib.get('name') or self.tree.objects[dn][1].get('name')] = attrib.pop('pwd')
+        created = dn not in self.tree.objects
+        self.tree.add(element.tag, dn, attrib)
+        self.side_effects(element.tag, dn, attrib)
+        self.notify(element.tag, dn, 'created' if created else 'modified', attrib)
+        for child in element:
+            child_dn = child.get('dn') or f'{dn}/{child.get("rn")}'
+            self.configure(child, child_dn)
+
+    def side_effects(self, class_id, dn, attrib):
+        """
+        The few actions whose result shows up in other attributes or objects
+        """
+        objects = self.tree.objects
+        if class_id == 'computeRackUnit' and 'adminPower' in attrib:
+            objects[dn][1]['operPower'] = 'off' if attrib['adminPower'] in ('down', 'soft-shut-down') else 'on'
+        elif class_id == 'storageLocalDisk' and attrib.get('adminAction') == 'make-unconfigured-good':
+            objects[dn][1]['pdStatus'] = 'Unconfigured Good'
+        elif class_id == 'storageVirtualDrive' and attrib.get('adminAction') == 'set-boot-drive':
+            objects[dn][1]['bootDrive'] = 'true'
+        elif class_id == 'storageVirtualDriveCreatorUsingUnusedPhysicalDrive' and attrib.get('adminState') == 'trigger':
+            controller_dn = parent_dn(dn)
+            existing = [objects[child][1]['id'] for child in self.tree.children[controller_dn]
+                        if objects[child][0] == 'storageVirtualDrive']
+            vd_id = str(max([int(vd_id) for vd_id in existing], default=-1) + 1)
+            self.tree.add('storageVirtualDrive', f'{controller_dn}/vd-{vd_id}', {
+                'id': vd_id, 'name': attrib.get('virtualDriveName', ''), 'raidLevel': f'RAID {attrib.get("raidLevel", "")}',
+                'size': attrib.get('size', ''), 'vdStatus': 'Optimal', 'health': 'Good'})
+        if 'adminAction' in attrib:
+            objects[dn][1].pop('adminAction')
+
+    async def stream_events(self, writer):
+        queue = asyncio.Queue()
+        self._subscribers.append(queue)
+        try:
+            while True:
+                document = await queue.get()
+                if document is None:
+                    return
+                await write_chunk(writer, b'%d\n%s' % (len(document), document))
+        finally:
+            self._subscribers.remove(queue)
+
+    def notify(self, class_id, dn, status, attrib):
+        if not self._subscribers:
+            return
+        self._eid += 1
+        event = ET.Element('configMoChangeEvent', {'cookie': '', 'inEid': str(self._eid)})
+        ET.SubElement(ET.SubElement(event, 'inConfig'), class_id, dict(attrib, dn=dn, status=status))
+        document = ET.tostring(event)
+        for queue in self._subscribers:
+            queue.put_nowait(document)
+
+    def emit(self, class_id, dn, status='modified', **attrib):
+        """
+        Change an object as if it happened on the server and send the event to subscribers
+        """
+        if status in ('deleted', 'removed'):
+            self.tree.remove(dn)
+        else:
+            self.tree.add(class_id, dn, attrib)
+        self.notify(class_id, dn, status, attrib)
+
+    def close_event_streams(self):
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+
+async def write_chunk(writer, data):
+    writer.write(b'%x\r\n%s\r\n' % (len(data), data))
+    await writer.drain()
+
+class CimcSimulator():
+    """
+    Run count simulated CIMCs on local ports. Use as a context manager, or start()/stop().
+
+    latency is the per-request delay in seconds, or a (min, max) range. concurrency caps the requests a host
+    works on at once (the rest queue), max_sessions the open sessions per host. error_rates maps an
+    error kind ('error', 'http500', 'drop', 'hang') to the probability of injecting it into any request.
+    With tls (the default) a throwaway self-signed certificate is generated unless certfile/keyfile are given.
+    max_conf_mos caps the objects one configConfMos may carry, like older firmware does (0 rejects them all).
+    """
+
+    def __init__(self, fixture='sample_inventory.json', count=1, bind='127.0.0.1', base_port=0, tls=True,
+                 certfile=None, keyfile=None, latency=0.0, concurrency=None, max_sessions=MAX_SESSIONS,
+                 error_rates=None, credentials=None, version='4.1(3b)', hang_time=HANG_TIME, max_conf_mos=None):
+        self.tree = fixture if isinstance(fixture, MoTree) else MoTree.from_fixture(fixture)
+        self.count = count
+        self.bind = bind
+        self.base_port = base_port
+        self.tls = tls
+        self.certfile = certfile
+        self.keyfile = keyfile
+        self.latency = latency
+        self.concurrency = concurrency
+        self.max_sessions = max_sessions
+        self.error_rates = dict(error_rates or {})
+        self.credentials = credentials or {'admin': 'password'}
+        self.version = version
+        self.hang_time = hang_time
+        self.max_conf_mos = max_conf_mos
+        self.hosts = []
+        self.loop = None
+        self._servers = []
+        self._connections = set()
+        self._thread = None
+        self._cert_dir = None
+
+    @property
+    def addresses(self):
+        return [host.address for host in self.hosts]
+
+    @property
+    def scheme(self):
+        return 'https' if self.tls else 'http'
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_inst, exc_tb):
+        self.stop()
+
+    def host(self, address):
+        """
+        Return the SimulatedHost for an address (or index)
+        """
+        if isinstance(address, int):
+            return self.hosts[address]
+        return next(host for host in self.hosts if host.address == address)
+
+    async def delay(self):
+        latency = self.latency
+        if isinstance(latency, (tuple, list)):
+            latency = random.uniform(*latency)
+        if latency:
+            await asyncio.sleep(latency)
+
+    def ssl_context(self):
+        if not self.tls:
+            return None
+        if self.certfile is None:
+            self._cert_dir = tempfile.TemporaryDirectory()
+            self.certfile, self.keyfile = self_signed_cert(self._cert_dir.name)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(self.certfile, self.keyfile)
+        return context
+
+    async def serve(self):
+        """
+        Start listening on every host's port, in the running event loop
+        """
+        raise_fd_limit(self.count * 4 + 256)
+        context = self.ssl_context()
+        for index in range(self.count):
+            host = SimulatedHost(self, index, self.tree)
+            port = self.base_port + index if self.base_port else 0
+            server = await asyncio.start_server(lambda reader, writer, host=host: self.connection(host, reader, writer),
+                                                self.bind, port, ssl=context, backlog=128)
+            host.address = '%s:%d' % (self.bind, server.sockets[0].getsockname()[1])
+            self.hosts.append(host)
+            self._servers.append(server)
+
+    async def close(self):
+        for host in self.hosts:
+            host.close_event_streams()
+        for server in self._servers:
+            server.close()
+        for task in list(self._connections):
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers = []
+
+    def start(self):
+        """
+        Run the simulator's event loop in a daemon thread and wait until all hosts are listening
+        """
+        started = threading.Event()
+        errors = []
+
+        def run():
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            try:
+                self.loop.run_until_complete(self.serve())
+            except Exception as err:
+                errors.append(err)
+                started.set()
+                return
+            started.set()
+            self.loop.run_forever()
+            self.loop.close()
+
+        self._thread = threading.Thread(target=run, name='cimc-simulator', daemon=True)
+        self._thread.start()
+        started.wait()
+        if errors:
+            raise errors[0]
+        return self
+
+    def stop(self):
+        if self.loop is not None and self._thread is not None:
+            # close the connections (hung ones included) while the loop still runs their handlers to the end
+            asyncio.run_coroutine_threadsafe(self.close(), self.loop).result()
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self._thread = None
+        if self._cert_dir is not None:
+            self._cert_dir.cleanup()
+            self._cert_dir = None
+
+    def call(self, function, *args, **kwargs):
+        """
+        Run function (e.g. a SimulatedHost method) in the simulator's loop from another thread and return its result
+        """
+        async def run():
+            return function(*args, **kwargs)
+        return asyncio.run_coroutine_threadsafe(run(), self.loop).result()
+
+    def emit(self, address, class_id, dn, status='modified', **attrib):
+        """
+        Thread-safe SimulatedHost.emit() for the host at address
+        """
+        return self.call(self.host(address).emit, class_id, dn, status, **attrib)
+
+    def inject(self, address, kind, count=1, method=None, error=INJECTED_ERROR):
+        return self.call(self.host(address).inject, kind, count, method, error)
+
+    async def connection(self, host, reader, writer):
+        """
+        Serve HTTP/1.1 keep-alive requests on one connection
+        """
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = request_line.decode('latin-1').split(None, 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                keep_alive = version.strip() == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                if method != 'POST' or path != '/nuova':
+                    await self.reply(writer, 404, b'Not Found', keep_alive)
+                    continue
+                if body.lstrip().startswith(b'<eventSubscribe'):
+                    await self.subscribe(host, body, writer)
+                    break
+                status, payload = await host.handle(body)
+                if status is None:
+                    break
+                await self.reply(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError, ssl.SSLError):
+            pass
+        except asyncio.CancelledError:
+            # close() cancelled a hung or idle connection. Ending the handler normally keeps the streams
+            # callback from reporting the cancellation as an "Exception in callback" traceback.
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def reply(self, writer, status, payload, keep_alive=True):
+        reason = {200: 'OK', 404: 'Not Found', 500: 'Internal Server Error'}.get(status, '')
+        writer.write(b'HTTP/1.1 %d %s\r\nContent-Type: text/xml\r\nContent-Length: %d\r\nConnection: %s\r\n\r\n%s' %
+                     (status, reason.encode(), len(payload), b'keep-alive' if keep_alive else b'close', payload))
+        await writer.drain()
+
+    async def subscribe(self, host, body, writer):
+        request = ET.fromstring(body)
+        host.stats['eventSubscribe'] += 1
+        writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: text/xml\r\nTransfer-Encoding: chunked\r\n\r\n')
+        if not host.valid_session(request.get('cookie')):
+            await write_chunk(writer, host.error_response('eventSubscribe', SESSION_INVALID, request.get('cookie', '')))
+        else:
+            await write_chunk(writer, ET.tostring(host.response(request)))
+            await host.stream_events(writer)
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+def raise_fd_limit(wanted):
+    """
+    Thousands of hosts need thousands of sockets: raise the soft open file limit as far as allowed
+    """
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY and soft < wanted:
+        limit = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run simulated CIMCs on local ports')
+    parser.add_argument('--fixture', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sample_inventory.json'))
+    parser.add_argument('--count', type=int, default=1)
+    parser.add_argument('--bind', default='127.0.0.1')
+    parser.add_argument('--base-port', type=int, default=0, help='first port; by default any free ports are used')
+    parser.add_argument('--http', action='store_true', help='serve plain HTTP instead of HTTPS')
+    parser.add_argument('--certfile')
+    parser.add_argument('--keyfile')
+    parser.add_argument('--latency', type=float, nargs='+', default=[0.0], help='seconds, or a min and max')
+    parser.add_argument('--concurrency', type=int)
+    parser.add_argument('--max-sessions', type=int, default=MAX_SESSIONS)
+    parser.add_argument('--error-rate', action='append', default=[], metavar='KIND=RATE',
+                        help=f'inject errors, KIND is one of {", ".join(ERROR_KINDS)}')
+    parser.add_argument('--username', default='admin')
+    parser.add_argument('--password', default='password')
+    parser.add_argument('--max-conf-mos', type=int, help='most objects one configConfMos may carry')
+    parser.add_argument('--hosts-file', help='write the host:port addresses to this file')
+    args = parser.parse_args(argv)
+
+    error_rates = {kind: float(rate) for kind, rate in (item.split('=', 1) for item in args.error_rate)}
+    latency = args.latency[0] if len(args.latency) == 1 else tuple(args.latency[:2])
+    simulator = CimcSimulator(args.fixture, count=args.count, bind=args.bind, base_port=args.base_port, tls=not args.http,
+                              certfile=args.certfile, keyfile=args.keyfile, latency=latency,
+                              concurrency=args.concurrency, max_sessions=args.max_sessions, error_rates=error_rates,
+                              credentials={args.username: args.password}, max_conf_mos=args.max_conf_mos)
+    simulator.start()
+    if args.hosts_file:
+        with open(args.hosts_file, 'w') as hosts_file:
+            hosts_file.write('\n'.join(simulator.addresses) + '\n')
+    print(f'{args.count} simulated CIMCs on {simulator.scheme}://{simulator.addresses[0]} ... {simulator.addresses[-1]}')
+    try:
+        simulator._thread.join()
+    except KeyboardInterrupt:
+        simulator.stop()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+"""
+Coalescing of identical read requests to a CIMC (single-flight).
+
+Threads sharing a UcsServer often ask for the same objects at nearly the same time: set_password(),
+createUser() and changeUserSettings() all read every aaaUser, for instance. With a SingleFlight, only the
+first of a set of identical queries (same host, user, method, classId or dn and hierarchy flag) goes to the
+CIMC; the others wait for it and get the same result, or the same error.
+
+With memo, a result is also handed to identical queries made up to memo seconds after it came back.
+Any configConfMo/configConfMos sent to the host forgets its memoized results, so a read that follows a
+write sees the write.
+
+Every caller gets its own copy of the attribute dicts, because getters modify them. A coalesced response is
+read whole before it is shared, rather than streamed, so UcsServer only coalesces when given a single_flight.
+"""
+
+import time
+import threading
+
+from cimc_parser import Mo
+from cimc_metrics import count_coalesced
+from cimc_xml import escape
+
+READ_METHODS = ('configResolveClass', 'configResolveChildren', 'configResolveDn')
+# memoized results are swept for expired ones when there are more than this many
+MEMO_SWEEP = 1024
+
+class Flight():
+    """
+    One request in progress, and what it returned or raised
+    """
+    __slots__ = ('done', 'value', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.waiters = 0
+
+class SingleFlight():
+    """
+    Share the result of a call among the callers of the same key that overlap with it
+    """
+
+    def __init__(self, memo=0.0):
+        self.memo = memo
+        self.coalesced = 0
+        self._flights = {}
+        self._memos = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, function, copy=None):
+        """
+        Return function()'s result, or the result of the call for key already in progress (or memoized).
+        copy(value) is what each caller gets when the value is shared, so one caller can't change another's.
+        """
+        with self._lock:
+            memo = self._memos.get(key)
+            if memo is not None and memo[0] <= time.monotonic():
+                del self._memos[key]
+                memo = None
+            flight = self._flights.get(key) if memo is None else None
+            if memo is None and flight is None:
+                flight = self._flights[key] = Flight()
+                leader = True
+            else:
+                leader = False
+                self.coalesced += 1
+                if flight is not None:
+                    flight.waiters += 1
+        if memo is not None:
+            count_coalesced(key[0], key[2])
+            return copy(memo[1]) if copy else memo[1]
+        if not leader:
+            flight.done.wait()
+            count_coalesced(key[0], key[2])
+            if flight.error is not None:
+                raise flight.error
+            return copy(flight.value) if copy else flight.value
+        try:
+            value = function()
+        except BaseException as err:
+            flight.error = err
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+            raise
+        flight.value = value
+        with self._lock:
+            del self._flights[key]
+            shared = flight.waiters > 0
+            if self.memo > 0:
+                self._remember(key, value)
+                shared = True
+        flight.done.set()
+        # the original stays untouched for the waiters and the memo
+        return copy(value) if shared and copy else value
+
+    def _remember(self, key, value):
+        now = time.monotonic()
+        if len(self._memos) >= MEMO_SWEEP:
+            for expired in [memo_key for memo_key, (expires, _) in self._memos.items() if expires <= now]:
+                del self._memos[expired]
+        self._memos[key] = (now + self.memo, value)
+
+    def forget(self, host=None):
+        """
+        Drop the memoized results for host, or for every host
+        """
+        with self._lock:
+            for key in [key for key in self._memos if host is None or key[0] == host]:
+                del self._memos[key]
+
+def read_key(host, username, command_string, cookie):
+    """
+    The key identical read requests share: None for anything but a query
+    """
+    end = command_string.find(' ')
+    method = command_string[1:end]
+    if method not in READ_METHODS:
+        return None
+    # the cookie changes on a re-login, the query doesn't
+    return host, username, method, command_string.replace(f' cookie="{escape(cookie)}"', '') if cookie else command_string
+
+def copy_mos(mos):
+    return [Mo(mo.class_id, mo.dn, dict(mo.attrib), mo.depth) for mo in mos]
+
+# for UcsServer(single_flight=SINGLE_FLIGHT) to coalesce with every other server in the process that uses it
+SINGLE_FLIGHT = SingleFlight()
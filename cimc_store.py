@@ -0,0 +1,384 @@
+#!/usr/bin/env python
+
+"""
+Columnar fleet inventory store.
+
+FleetStore flattens the inventories of many servers into one table per managed object class
+(storageLocalDisk, firmwareRunning, adaptorHostEthIf, ...), with a 'host' column and one column per
+attribute. Every column is dictionary-encoded: the distinct values are kept once and each row holds a
+small integer code. A filter evaluates its condition once per distinct value and then scans the codes,
+so fleet-wide questions don't walk thousands of nested dicts:
+
+    store = FleetStore()
+    for server in servers:
+        store.add_server(server)
+    store['storageLocalDisk'].where('pdStatus', 'Online', op='!=').rows()
+    store['biosSettings'].where('vpIntelHyperThreadingTech', ('disabled', 'Disabled'), op='in').values('host')
+    store['firmwareRunning'].group_by('dn', 'version')
+
+The scans use numpy when it is installed and C-level itertools otherwise. save() writes a compact
+binary file that load() memory-maps, so a saved fleet opens without parsing anything but the dictionaries.
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+from array import array
+from itertools import compress
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MAGIC = b'PYCIMCS1'
+HEADER = struct.Struct('<8sQ')
+CODE_TYPE = 'I'
+ALIGNMENT = 8
+
+# inventory subsystem -> table for the subsystems that are plain lists of attribute dicts
+LIST_TABLES = {
+    'pci': 'pciEquipSlot',
+    'psu': 'equipmentPsu',
+    'storageControllers': 'storageController',
+    'drive_usage': 'storageLocalDiskUsage',
+    'users': 'aaaUser',
+}
+
+OPERATORS = {
+    '==': lambda wanted: lambda value: value == wanted,
+    '!=': lambda wanted: lambda value: value != wanted,
+    'in': lambda wanted: lambda value: value in wanted,
+    'not in': lambda wanted: lambda value: value not in wanted,
+    '<': lambda wanted: lambda value: value is not None and value < wanted,
+    '<=': lambda wanted: lambda value: value is not None and value <= wanted,
+    '>': lambda wanted: lambda value: value is not None and value > wanted,
+    '>=': lambda wanted: lambda value: value is not None and value >= wanted,
+}
+
+class Column():
+    """
+    A dictionary-encoded column: values[code] for each code in codes. Code 0 is a missing value (None).
+    """
+
+    def __init__(self, values=None, codes=None):
+        self.values = values if values is not None else [None]
+        self.index = {value: code for code, value in enumerate(self.values)}
+        self.codes = codes if codes is not None else array(CODE_TYPE)
+
+    def encode(self, value):
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def append(self, value):
+        if not isinstance(self.codes, array):
+            # a memory-mapped column is copied the first time it changes
+            self.codes = array(CODE_TYPE, self.codes)
+        self.codes.append(self.encode(value) if value is not None else 0)
+
+    def pad(self, rows):
+        if not isinstance(self.codes, array):
+            self.codes = array(CODE_TYPE, self.codes)
+        self.codes.frombytes(bytes(self.codes.itemsize * (rows - len(self.codes))))
+
+    def matching(self, condition):
+        """
+        Return the set of codes whose value satisfies condition(value)
+        """
+        return {code for code, value in enumerate(self.values) if condition(value)}
+
+class Table():
+    """
+    The rows of one managed object class across the fleet
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.columns = {'host': Column()}
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def append(self, host, attrib):
+        attrib = dict(attrib, host=host)
+        for key, value in attrib.items():
+            if isinstance(value, (list, dict)):
+                continue
+            column = self.columns.get(key)
+            if column is None:
+                column = self.columns[key] = Column()
+                column.pad(self.length)
+            column.append(value if isinstance(value, str) or value is None else str(value))
+        self.length += 1
+        for key, column in self.columns.items():
+            if len(column.codes) < self.length:
+                column.append(None)
+
+    def all(self):
+        return Selection(self, None)
+
+    def where(self, column, value, op='=='):
+        return self.all().where(column, value, op)
+
+    def values(self, name):
+        return self.all().values(name)
+
+    def distinct(self, name):
+        return self.all().distinct(name)
+
+    def group_by(self, *names):
+        return self.all().group_by(*names)
+
+    def rows(self, names=None):
+        return self.all().rows(names)
+
+class Selection():
+    """
+    A set of rows of a table, by index. indexes is None for the whole table.
+    """
+
+    def __init__(self, table, indexes):
+        self.table = table
+        self.indexes = indexes
+
+    def __len__(self):
+        return self.table.length if self.indexes is None else len(self.indexes)
+
+    def count(self):
+        return len(self)
+
+    def where(self, column, value, op='=='):
+        """
+        Keep the rows where column op value holds. op is '==', '!=', 'in', 'not in', '<', '<=', '>', '>='
+        (compared as strings), or value is a callable that is given each distinct value and op is ignored.
+        A column the table doesn't have is None on every row.
+        """
+        condition = value if callable(value) else OPERATORS[op](value)
+        column = self.table.columns.get(column)
+        if column is None:
+            if not condition(None):
+                return Selection(self.table, [])
+            return Selection(self.table, self.indexes)
+        wanted = column.matching(condition)
+        return Selection(self.table, scan(column.codes, wanted, self.indexes))
+
+    def _codes(self, name):
+        column = self.table.columns.get(name)
+        if column is None:
+            return None, [0] * len(self)
+        if self.indexes is None:
+            return column, column.codes
+        return column, map(column.codes.__getitem__, self.indexes)
+
+    def values(self, name):
+        """
+        Return the column's value on each row
+        """
+        column, codes = self._codes(name)
+        return list(map(column.values.__getitem__, codes)) if column is not None else [None] * len(self)
+
+    def hosts(self):
+        return self.distinct('host')
+
+    def distinct(self, name):
+        """
+        Return the column's distinct values on these rows, in order of appearance
+        """
+        column, codes = self._codes(name)
+        if column is None:
+            return [None] if len(self) else []
+        return [column.values[code] for code in dict.fromkeys(codes)]
+
+    def group_by(self, *names):
+        """
+        Count the rows per value of one column, or per tuple of values of several: {value: count}
+        """
+        if len(names) == 1:
+            column, codes = self._codes(names[0])
+            if column is None:
+                return {None: len(self)} if len(self) else {}
+            return {column.values[code]: count for code, count in Counter(codes).items()}
+        columns = [self._codes(name) for name in names]
+        counts = Counter(zip(*(codes for _, codes in columns)))
+        return {tuple(column.values[code] if column is not None else None for (column, _), code in zip(columns, key)): count
+                for key, count in counts.items()}
+
+    def rows(self, names=None):
+        """
+        Return the rows as attribute dicts, without missing values
+        """
+        names = names or list(self.table.columns)
+        columns = [(name, self.table.columns[name]) for name in names if name in self.table.columns]
+        indexes = range(self.table.length) if self.indexes is None else self.indexes
+        return [{name: column.values[column.codes[index]] for name, column in columns if column.codes[index]}
+                for index in indexes]
+
+def scan(codes, wanted, indexes=None):
+    """
+    Return the row indexes (of all rows, or of the given ones) whose code is in wanted
+    """
+    if not wanted:
+        return []
+    if numpy is not None:
+        all_codes = numpy.frombuffer(codes, dtype=numpy.uint32)
+        if indexes is None:
+            return numpy.flatnonzero(numpy.isin(all_codes, list(wanted))).tolist()
+        indexes = numpy.asarray(indexes, dtype=numpy.int64)
+        return indexes[numpy.isin(all_codes[indexes], list(wanted))].tolist()
+    if indexes is None:
+        if len(wanted) == 1:
+            code, = wanted
+            return list(compress(range(len(codes)), map(code.__eq__, codes)))
+        return list(compress(range(len(codes)), map(wanted.__contains__, codes)))
+    return list(compress(indexes, map(wanted.__contains__, map(codes.__getitem__, indexes))))
+
+class FleetStore():
+    """
+    Inventory tables of a whole fleet, by managed object class
+    """
+
+    def __init__(self):
+        self.tables = {}
+        self._mmap = None
+
+    def __getitem__(self, name):
+        """
+        The table of a class. A class no server reported is an empty table.
+        """
+        table = self.tables.get(name)
+        return table if table is not None else Table(name)
+
+    def __contains__(self, name):
+        return name in self.tables
+
+    def table(self, name):
+        if name not in self.tables:
+            self.tables[name] = Table(name)
+        return self.tables[name]
+
+    def add(self, host, class_id, attrib):
+        self.table(class_id).append(host, attrib)
+
+    def add_server(self, server):
+        """
+        Add what the getters have put in a UcsServer's (or AsyncUcsServer's) inventory
+        """
+        self.add_inventory(server.ipaddress, server.inventory)
+
+    def add_inventories(self, inventories):
+        """
+        Add {host: inventory}, e.g. from Fleet.collect(inventory_task(...))
+        """
+        for host, inventory in inventories.items():
+            self.add_inventory(host, inventory)
+
+    def add_inventory(self, host, inventory):
+        """
+        Flatten one UcsServer.inventory into the tables
+        """
+        if inventory.get('chassis'):
+            self.add(host, 'computeRackUnit', inventory['chassis'])
+        management = inventory.get('cimc') or inventory.get('mgmtIf')
+        if management:
+            self.add(host, 'mgmtIf', management)
+        for subsystem, class_id in LIST_TABLES.items():
+            for attrib in inventory.get(subsystem) or ():
+                self.add(host, class_id, attrib)
+        for class_id, drives in (inventory.get('drives') or {}).items():
+            for drive in drives:
+                self.add(host, class_id, drive)
+        for adaptor in inventory.get('adaptor') or ():
+            self.add(host, 'adaptorUnit', adaptor)
+            for port in adaptor.get('port', ()):
+                self.add(host, 'adaptorExtEthIf', port)
+                for vnic in port.get('vnic', ()):
+                    self.add(host, 'adaptorHostEthIf', vnic)
+        for dn, version in (inventory.get('fw') or {}).items():
+            self.add(host, 'firmwareRunning', {'dn': dn, 'version': version})
+        if inventory.get('bios'):
+            # one wide row per host: the vp* attribute names are unique across the BIOS tokens
+            settings = {}
+            for token in inventory['bios'].values():
+                settings.update(token)
+            self.add(host, 'biosSettings', settings)
+        for order, boot_type in enumerate(inventory.get('boot_order') or (), 1):
+            self.add(host, 'lsbootDef', {'order': str(order), 'type': boot_type})
+
+    def save(self, path):
+        """
+        Write the store to path: a JSON header with the dictionaries, then the code arrays
+        """
+        header = {'byteorder': sys.byteorder, 'tables': {}}
+        offset = 0
+        for name, table in self.tables.items():
+            columns = {}
+            for column_name, column in table.columns.items():
+                columns[column_name] = {'values': column.values, 'offset': offset}
+                offset += aligned(len(column.codes) * column.codes.itemsize)
+            header['tables'][name] = {'length': table.length, 'columns': columns}
+        header_bytes = json.dumps(header, separators=(',', ':')).encode()
+        header_bytes += b' ' * (aligned(HEADER.size + len(header_bytes)) - HEADER.size - len(header_bytes))
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as out_file:
+            out_file.write(HEADER.pack(MAGIC, len(header_bytes)))
+            out_file.write(header_bytes)
+            for table in self.tables.values():
+                for column in table.columns.values():
+                    data = bytes(memoryview(column.codes).cast('B'))
+                    out_file.write(data + bytes(aligned(len(data)) - len(data)))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Open a saved store. The code arrays stay in the memory-mapped file until a table is added to.
+        """
+        store = cls()
+        with open(path, 'rb') as in_file:
+            store._mmap = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_length = HEADER.unpack_from(store._mmap)
+        if magic != MAGIC:
+            raise ValueError(f'{path} is not a pycimc inventory store')
+        header = json.loads(store._mmap[HEADER.size:HEADER.size + header_length])
+        data = memoryview(store._mmap)[HEADER.size + header_length:]
+        for name, saved in header['tables'].items():
+            table = store.tables[name] = Table(name)
+            table.length = saved['length']
+            table.columns = {}
+            for column_name, column in saved['columns'].items():
+                codes = data[column['offset']:column['offset'] + table.length * 4].cast(CODE_TYPE)
+                if header['byteorder'] != sys.byteorder:
+                    codes = array(CODE_TYPE, codes)
+                    codes.byteswap()
+                table.columns[column_name] = Column(column['values'], codes)
+        return store
+
+    def close(self):
+        """
+        Release the memory-mapped file of a loaded store
+        """
+        if self._mmap is not None:
+            for table in self.tables.values():
+                for column in table.columns.values():
+                    if isinstance(column.codes, memoryview):
+                        column.codes.release()
+                        column.codes = array(CODE_TYPE)
+            self.tables = {}
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_inst, exc_tb):
+        self.close()
+
+def aligned(size):
+    return (size + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cimc_xml import encode
+
+CONNECT_TIMEOUT = 5.0
+READ_TIMEOUT = 30.0
+POOL_MAXSIZE = 4
+CONNECT_RETRIES = 2
+BACKOFF_FACTOR = 0.5
+
+HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Connection": "keep-alive",
+}
+
+class CimcTransport():
+    """
+    Persistent HTTP transport for a single CIMC.
+
+    Keeps one requests.Session with a bounded keep-alive connection pool mounted for the CIMC's
+    /nuova endpoint, so consecutive XML API calls reuse an established TLS connection instead of
+    doing a full handshake per call.
+
+    Only connection-level failures are retried: the request never reached the CIMC, so it is safe
+    to resend even a configConfMo. Read timeouts and HTTP errors are never retried.
+    """
+
+    def __init__(self, host, scheme='https', pool_maxsize=POOL_MAXSIZE, retries=CONNECT_RETRIES,
+                 backoff_factor=BACKOFF_FACTOR, connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT,
+                 verify=False):
+        self.host = host
+        self.url = f'{scheme}://{host}/nuova'
+        self.pool_maxsize = pool_maxsize
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.verify = verify
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        self.session.verify = verify
+        # read=False re-raises a ReadTimeoutError as is, which requests reports as ReadTimeout; read=0
+        # would wrap it in MaxRetryError and turn it into a ConnectionError
+        retry = Retry(total=retries, connect=retries, read=False, status=0, other=0,
+                      backoff_factor=backoff_factor, allowed_methods=None, raise_on_status=False)
+        # pool_block=True caps the number of open sockets to the CIMC at pool_maxsize; extra
+        # callers wait for a free connection instead of opening (and later dropping) new ones
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry, pool_block=True)
+        self.session.mount(f'{scheme}://', adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_inst, exc_tb):
+        self.close()
+
+    def timeout(self, read_timeout=None):
+        """
+        Return the (connect, read) timeout tuple for a request. read_timeout overrides the transport default.
+        """
+        return (self.connect_timeout, read_timeout if read_timeout is not None else self.read_timeout)
+
+    def post(self, command_string, timeout=None, stream=False):
+        """
+        POST an XML API command to the CIMC over the pooled session and return the requests.Response.
+        With stream=True the body is left unread, for iter_content()
+        """
+        # verify is passed per request: a session-level verify=False loses to REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE
+        return self.session.post(self.url, data=encode(command_string), timeout=self.timeout(timeout), stream=stream,
+                                 verify=self.verify)
+
+    def close(self):
+        """
+        Close all pooled connections to the CIMC
+        """
+        self.session.close()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+"""
+Builders for CIMC XML API requests.
+
+Every request goes through a Template compiled once per XML method: attribute values are escaped, no
+whitespace is sent between elements, and the session cookie is added last, after the rest of the
+request has been rendered (and cached, for the queries that are repeated across hosts):
+
+    resolve_class(cookie, 'pciEquipSlot')
+    -> '<configResolveClass classId="pciEquipSlot" inHierarchical="false" cookie="1234/abcd"/>'
+    conf_mo(cookie, 'sys/user-ext/user-3', [mo('aaaUser', {'id': '3', 'pwd': 'a"<&b'})])
+    -> '<configConfMo dn="sys/user-ext/user-3" inHierarchical="false" cookie="1234/abcd"><inConfig>
+        <aaaUser id="3" pwd="a&quot;&lt;&amp;b"/></inConfig></configConfMo>'
+
+The requests are str, like the responses, for logging and session renewal; encode() turns one into the
+UTF-8 bytes that go on the wire.
+"""
+
+from functools import lru_cache
+
+ENCODING = 'utf-8'
+# rendered heads kept per template, e.g. one per classId for configResolveClass
+HEAD_CACHE = 256
+
+ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;',
+                         '\n': '&#10;', '\r': '&#13;', '\t': '&#9;'})
+
+def escape(value):
+    """
+    Escape a value for a double-quoted XML attribute. Booleans become 'true'/'false', as the API wants them.
+    """
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value).translate(ESCAPES)
+
+def encode(command_string):
+    """
+    The bytes to send for a request
+    """
+    return command_string.encode(ENCODING) if isinstance(command_string, str) else command_string
+
+class Template():
+    """
+    One XML API method with a fixed list of attributes, rendered with a precompiled format string
+    """
+
+    def __init__(self, method, *names, cache=True):
+        self.method = method
+        self.names = names
+        self._format = f'<{method}' + ''.join(f' {name}="{{}}"' for name in names)
+        self._close = f'</{method}>'
+        # cache=False for templates that carry a password, which shouldn't outlive the request
+        self.head = lru_cache(maxsize=HEAD_CACHE)(self._head) if cache else self._head
+
+    def _head(self, values):
+        return self._format.format(*map(escape, values))
+
+    def render(self, cookie, *values, body=None):
+        """
+        The request with values for the template's attributes, in order, then the cookie (if any), and body
+        (already rendered XML) as its content
+        """
+        head = self.head(values)
+        if cookie is not None:
+            head = f'{head} cookie="{escape(cookie)}"'
+        if body is None:
+            return head + '/>'
+        return f'{head}>{body}{self._close}'
+
+AAA_LOGIN = Template('aaaLogin', 'inName', 'inPassword', cache=False)
+AAA_LOGOUT = Template('aaaLogout', 'inCookie')
+AAA_REFRESH = Template('aaaRefresh', 'inName', 'inPassword', 'inCookie', cache=False)
+AAA_KEEP_ALIVE = Template('aaaKeepAlive')
+RESOLVE_CLASS = Template('configResolveClass', 'classId', 'inHierarchical')
+RESOLVE_DN = Template('configResolveDn', 'dn', 'inHierarchical')
+RESOLVE_CHILDREN = Template('configResolveChildren', 'inDn', 'inHierarchical')
+RESOLVE_CHILDREN_CLASS = Template('configResolveChildren', 'inDn', 'classId', 'inHierarchical')
+CONF_MO = Template('configConfMo', 'dn', 'inHierarchical')
+CONF_MOS = Template('configConfMos', 'inHierarchical')
+EVENT_SUBSCRIBE = Template('eventSubscribe')
+
+def login(username, password):
+    return AAA_LOGIN.render(None, username, password)
+
+def logout(cookie):
+    return AAA_LOGOUT.render(cookie, cookie)
+
+def refresh(cookie, username, password):
+    return AAA_REFRESH.render(cookie, username, password, cookie)
+
+def keep_alive(cookie):
+    return AAA_KEEP_ALIVE.render(cookie)
+
+def event_subscribe(cookie):
+    return EVENT_SUBSCRIBE.render(cookie)
+
+def resolve_class(cookie, class_id, hierarchical=False):
+    return RESOLVE_CLASS.render(cookie, class_id, bool(hierarchical))
+
+def resolve_dn(cookie, dn, hierarchical=False):
+    return RESOLVE_DN.render(cookie, dn, bool(hierarchical))
+
+def resolve_children(cookie, in_dn, class_id=None, hierarchical=False):
+    if class_id:
+        return RESOLVE_CHILDREN_CLASS.render(cookie, in_dn, class_id, bool(hierarchical))
+    return RESOLVE_CHILDREN.render(cookie, in_dn, bool(hierarchical))
+
+def mo(class_id, attrib, children=()):
+    """
+    A managed object element for inConfig, with already rendered child elements
+    """
+    attrs = ''.join(f' {name}="{escape(value)}"' for name, value in attrib.items())
+    if not children:
+        return f'<{class_id}{attrs}/>'
+    return f'<{class_id}{attrs}>{"".join(children)}</{class_id}>'
+
+def conf_mo(cookie, dn, mos, hierarchical=False):
+    """
+    configConfMo of dn, with the rendered mo() elements in its inConfig
+    """
+    return CONF_MO.render(cookie, dn, bool(hierarchical), body=f'<inConfig>{"".join(mos)}</inConfig>')
+
+def conf_mos(cookie, pairs, hierarchical=False):
+    """
+    configConfMos with one <pair key="dn"> per (dn, rendered mo()) in pairs
+    """
+    body = ''.join(f'<pair key="{escape(dn)}">{element}</pair>' for dn, element in pairs)
+    return CONF_MOS.render(cookie, bool(hierarchical), body=f'<inConfigs>{body}</inConfigs>')
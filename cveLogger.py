@@ -3,12 +3,22 @@ import datetime
 import logging
 from logging.handlers import RotatingFileHandler
 import inspect
+import random
+import re
 
-def initlogging(argvlocal):
-    global logfile 
+# Fetched once; getLogger() takes the logging module lock on every call
+logger = logging.getLogger('mylog')
+
+# Fraction of requests whose command and response bodies are logged at INFO. At DEBUG every body is logged.
+body_sample_rate = 0.0
+
+COOKIE_RE = re.compile(r'\b(cookie|outCookie|inCookie|inPassword|pwd)="[^"]*"')
+CLASS_ID_RE = re.compile(r'(?:classId|inDn)="([^"]*)"')
+
+def initlogging(argvlocal, level=logging.INFO, sample_rate=None):
+    global logfile, body_sample_rate
     mynow = datetime.datetime.now()
     mytimestamp = mynow.strftime("%Y%m%d_%H%M")
-    logger = logging.getLogger('mylog')
     myfmt = logging.Formatter("%(asctime)-15s @ [%(threadName)s] @ %(message)s  ")
     if '/' in argvlocal[0]:
         print(argvlocal[0])
@@ -18,15 +28,58 @@ def initlogging(argvlocal):
     myhandler = RotatingFileHandler('logs/%s_%s.log' % (mytimestamp, myfilename[0:myfilename.find('.',2)]), maxBytes=100000,
                                   backupCount=10)
     myhandler.setFormatter(myfmt)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(level)
     logger.addHandler(myhandler)
+    if sample_rate is not None:
+        body_sample_rate = sample_rate
     #this is to print it on exit
     logfile = myhandler.baseFilename
 
-def mylogger(mymsg):
-    logger = logging.getLogger('mylog')
-    logger.info(mymsg)
+def mylogger(mymsg, *args, level=logging.INFO):
+    """
+    Log mymsg at level. Pass the values as args ('%s' placeholders) rather than an f-string so that
+    nothing is formatted when the level is disabled.
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, mymsg, *args)
+
+def redact(command_string):
+    """Mask session cookies and passwords in an XML API command or response"""
+    return COOKIE_RE.sub(r'\1="***"', command_string)
+
+def request_fields(command_string):
+    """Return the (method, classId or inDn) of an XML API command, e.g. ('configResolveClass', 'pciEquipSlot')"""
+    end = command_string.find(' ')
+    method = command_string[1:end if end > 0 else None].rstrip('/>')
+    match = CLASS_ID_RE.search(command_string)
+    return method, match.group(1) if match else ''
+
+def capture_bodies():
+    """True if this request's bodies should be logged: at DEBUG, or when it is picked by body_sample_rate"""
+    return logger.isEnabledFor(logging.DEBUG) or \
+        (body_sample_rate > 0 and logger.isEnabledFor(logging.INFO) and random.random() < body_sample_rate)
+
+def log_request(host, command_string, status, nbytes, elapsed, response_text=None, error=None):
+    """
+    Emit the single record for one XML API request. The fields are also attached to the record
+    (record.host, record.method, ...) for handlers that want them structured.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    method, class_id = request_fields(command_string)
+    fields = {'host': host, 'method': method, 'classId': class_id, 'status': status,
+              'bytes': nbytes, 'latency_ms': round(elapsed * 1000, 1)}
+    msg = 'host=%s method=%s classId=%s status=%s bytes=%s latency_ms=%s'
+    args = [host, method, class_id, status, nbytes, fields['latency_ms']]
+    if error is not None:
+        msg += ' error=%r'
+        args.append(str(error))
+        fields['error'] = str(error)
+    logger.info(msg, *args, extra=fields)
+    if capture_bodies():
+        logger.log(logging.DEBUG if logger.isEnabledFor(logging.DEBUG) else logging.INFO, 'host=%s command=%s response=%s',
+                   host, redact(command_string), redact(response_text) if response_text is not None else '<streamed>')
 
 def lineno():
     """Returns the current line number in our program."""
-    return inspect.currentframe().f_back.f_lineno
\ No newline at end of file
+    return inspect.currentframe().f_back.f_lineno
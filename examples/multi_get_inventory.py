@@ -1,54 +1,25 @@
 #!/usr/bin/env python
 
-from pycimc import UcsServer
+from cimc_async import Fleet, inventory_task
 import config
-from Queue import Queue
-from threading import Thread, Lock
 from time import time
 
-queue = Queue()
-WORKERS = 50
-
-class ThreadLogin(Thread):
-    '''Threaded Login'''
-    def __init__(self, queue, lock):
-        Thread.__init__(self)
-        self.queue = queue
-        self.lock = lock
-
-    def run(self):
-        while True:
-            host = self.queue.get()
-
-            with UcsServer(host, config.USERNAME, config.PASSWORD) as server:
-                server.get_interface_inventory()
-                out_string = server.ipaddress
-                for int in server.inventory['adaptor']:
-                    out_string += ',SLOT-'+int['pciSlot']
-                    for port in int['port']:
-                        out_string += ',port-'+str(port['portId'])+','+port['adminSpeed']+','+port['linkState']
-                        for vnic in port['vnic']:
-                            out_string += ','+str(vnic['name'])+','+str(vnic['mac'])
-                with self.lock:
-                    print out_string
-
-            self.queue.task_done()
+CONCURRENCY = 200
 
 def main():
-
-    lock = Lock()
-    #spawn a pool of threads, and pass them queue instance
-    for _ in range(WORKERS):
-        t = ThreadLogin(queue, lock)
-        t.daemon = True
-        t.start()
-
-    #populate queue with server addresses
-    for server in config.SERVERS:
-        queue.put(server)
-
-    #wait on the queue until everything has been processed
-    queue.join()
+    fleet = Fleet(config.SERVERS, config.USERNAME, config.PASSWORD, concurrency=CONCURRENCY)
+    for result in fleet.collect(inventory_task('get_interface_inventory')):
+        if result.error:
+            print(f'{result.host},error,{result.error}')
+            continue
+        out_string = result.host
+        for int in result.value['adaptor']:
+            out_string += ',SLOT-'+int['pciSlot']
+            for port in int['port']:
+                out_string += ',port-'+str(port['portId'])+','+port['adminSpeed']+','+port['linkState']
+                for vnic in port['vnic']:
+                    out_string += ','+str(vnic['name'])+','+str(vnic['mac'])
+        print(out_string)
 
 # Run following code when the program starts
 if __name__ == '__main__':
@@ -57,4 +28,4 @@ if __name__ == '__main__':
 
     main()
 
-    print "Total Elapsed Time: %s" % (time() - start)
+    print("Total Elapsed Time: %s" % (time() - start))
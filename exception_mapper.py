@@ -1,7 +1,15 @@
 import requests
+from urllib3.exceptions import ReadTimeoutError, NewConnectionError
 
 class ResponseError(Exception):
-    pass
+    def __init__(self, message='', error_code=None, error_descr=None):
+        super().__init__(message)
+        self.error_code = error_code
+        self.error_descr = error_descr
+
+    def __reduce__(self):
+        # keep the errorCode when the error is sent back from a worker process
+        return type(self), (str(self), self.error_code, self.error_descr)
 
 class PostError(Exception):
     pass
@@ -18,16 +26,48 @@ class SSL_Error(Exception):
 class ConnectionError(Exception):
     pass
 
+class ConnectError(ConnectionError):
+    """
+    The connection to the CIMC could not be opened (refused, unreachable, name not resolved): nothing was sent
+    """
+
+class ConnectTimeoutError(TimeoutError):
+    """
+    The connection to the CIMC was not established in time: nothing was sent
+    """
+
+# matched with isinstance, in order: the most specific types come first. requests.ConnectTimeout is
+# both a Timeout and a ConnectionError, and ReadTimeout is a subclass of Timeout.
 exception_map = {
     PostError: PostError,
+    requests.exceptions.ConnectTimeout: ConnectTimeoutError,
     requests.exceptions.Timeout: TimeoutError,
     requests.exceptions.ConnectionError: ConnectionError,
 }
 
+def remap(error):
+    """
+    The exception type error is raised as, or None to let it through unchanged
+    """
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args and \
+            not isinstance(error, requests.exceptions.Timeout):
+        # urllib3 gives up on a connection with a MaxRetryError that holds the last failure as its reason
+        reason = getattr(error.args[0], 'reason', error.args[0])
+        # a read timeout while streaming the body comes out of iter_content() as a ConnectionError
+        if isinstance(reason, ReadTimeoutError):
+            return TimeoutError
+        if isinstance(reason, NewConnectionError):
+            return ConnectError
+    for source, target in exception_map.items():
+        if isinstance(error, source):
+            return target
+    return None
+
 class RemapExceptions():
     def __enter__(self):
         return self
     def __exit__(self, exc_type, exc_val, exc_tb):
         # logging.exception()
-        if exc_type in exception_map:
-            raise exception_map[exc_type](exc_val)
+        target = remap(exc_val) if exc_val is not None else None
+        if target is not None and not isinstance(exc_val, target):
+            raise target(exc_val)
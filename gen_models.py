@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+
+"""
+Generate cimc_models.py, the compact managed object classes, from the XML API schema.
+
+Every <moClass> complexType in the schema becomes a cimc_mo.ManagedObject subclass (computeRackUnit ->
+ComputeRackUnit) with a slot per schema attribute, its type and its enumerated values. The RACK-IN
+schemas only describe the attributes a client may send, so the read-only attributes a CIMC reports
+(serial, totalMemory, linkState, ...) are taken from inventory fixtures: any UcsServer.inventory dump
+shaped like sample_inventory.json. Attributes that are in neither still work, they just cost a dict.
+
+    python gen_models.py --xsd RACK-IN-NEW.xsd --fixture sample_inventory.json --output cimc_models.py
+"""
+
+import sys
+import argparse
+import xml.etree.ElementTree as ET
+from collections import Counter
+
+from cimc_mo import slot_name
+
+XS = '{http://www.w3.org/2001/XMLSchema}'
+
+XSD_TYPES = {
+    'xs:unsignedInt': 'int', 'xs:unsignedShort': 'int', 'xs:unsignedByte': 'int', 'xs:unsignedLong': 'int',
+    'xs:int': 'int', 'xs:long': 'int', 'xs:short': 'int', 'xs:byte': 'int', 'xs:integer': 'int',
+    'xs:decimal': 'float', 'xs:float': 'float', 'xs:double': 'float', 'xs:boolean': 'bool',
+}
+
+# A value seen this often in the fixtures is shared between objects like an enumerated one
+COMMON_VALUE_COUNT = 3
+MAX_COMMON_VALUE_LENGTH = 32
+
+def restriction(simple_type):
+    """
+    Return (base type, enumerated values) of an xs:simpleType element
+    """
+    restricted = simple_type.find(f'{XS}restriction')
+    if restricted is None:
+        return 'xs:string', ()
+    return restricted.get('base', 'xs:string'), tuple(enum.get('value') for enum in restricted.iter(f'{XS}enumeration'))
+
+def schema_classes(path):
+    """
+    Return {classId: (label, {attribute: (type, enumerated values)})} for the managed objects of a schema
+    """
+    schema = ET.parse(path).getroot()
+    simple_types = {simple_type.get('name'): restriction(simple_type) for simple_type in schema.findall(f'{XS}simpleType')}
+
+    def resolve(type_name, enums=()):
+        # follow named types down to a builtin one, keeping the innermost enumeration
+        seen = set()
+        while type_name in simple_types and type_name not in seen:
+            seen.add(type_name)
+            type_name, type_enums = simple_types[type_name]
+            enums = enums or type_enums
+        return XSD_TYPES.get(type_name, 'str'), enums
+
+    classes = {}
+    for complex_type in schema.findall(f'{XS}complexType'):
+        mo_class = complex_type.find(f'{XS}annotation/{XS}appinfo/moClass')
+        if mo_class is None:
+            continue
+        label = complex_type.find(f'{XS}annotation/{XS}appinfo/label')
+        attributes = {}
+        for attribute in complex_type.findall(f'{XS}attribute'):
+            inline = attribute.find(f'{XS}simpleType')
+            if inline is not None:
+                attributes[attribute.get('name')] = resolve(*restriction(inline))
+            else:
+                attributes[attribute.get('name')] = resolve(attribute.get('type', 'xs:string'))
+        classes[mo_class.get('value')] = (label.get('value') if label is not None else '', attributes)
+    return classes
+
+def fixture_objects(path):
+    """
+    Return the (classId, attributes) of every managed object in an inventory fixture
+    """
+    from cimc_simulator import MoTree
+    tree = MoTree.from_fixture(path)
+    return [(class_id, attrib) for class_id, attrib in tree.objects.values() if class_id and class_id != 'managedObject']
+
+def class_name(class_id):
+    return class_id[0].upper() + class_id[1:]
+
+def generate(xsd_paths, fixture_paths=()):
+    """
+    Return the source of cimc_models.py
+    """
+    classes = {}
+    for path in xsd_paths:
+        for class_id, (label, attributes) in schema_classes(path).items():
+            known_label, known = classes.setdefault(class_id, (label, {}))
+            for name, (type_name, enums) in attributes.items():
+                if name in known:
+                    # a later schema only widens the enumeration
+                    enums = tuple(dict.fromkeys(known[name][1] + enums)) if known[name][1] and enums else ()
+                known[name] = (type_name, enums)
+    values = Counter()
+    for path in fixture_paths:
+        for class_id, attrib in fixture_objects(path):
+            _, known = classes.setdefault(class_id, ('', {'dn': ('str', ()), 'rn': ('str', ()), 'status': ('str', ())}))
+            for name, value in attrib.items():
+                known.setdefault(name, ('str', ()))
+                values[value] += 1
+
+    enum_sets = {}
+    for _, attributes in classes.values():
+        for _, enums in attributes.values():
+            if enums:
+                enum_sets.setdefault(frozenset(enums), f'E{len(enum_sets)}')
+    common = sorted(value for value, count in values.items()
+                    if count >= COMMON_VALUE_COUNT and 0 < len(value) <= MAX_COMMON_VALUE_LENGTH and not value.isdigit())
+
+    lines = [
+        '#!/usr/bin/env python',
+        '',
+        f'# Generated by gen_models.py from {", ".join(xsd_paths)}'
+        + (f' and {", ".join(fixture_paths)}' if fixture_paths else '') + '. Do not edit.',
+        '',
+        '"""',
+        'Managed object classes of the CIMC XML API, see cimc_mo',
+        '"""',
+        '',
+        'from cimc_mo import ManagedObject, MODELS, INTERNED',
+        '',
+    ]
+    for enums, name in enum_sets.items():
+        lines.append(f'{name} = frozenset({tuple(sorted(enums))!r})')
+    lines.append('')
+    lines.append(f'COMMON_VALUES = {tuple(common)!r}')
+    for class_id in sorted(classes):
+        label, attributes = classes[class_id]
+        names = tuple(sorted(attributes))
+        slots = tuple(slot_name(name) for name in names)
+        types = {name: type_name for name, (type_name, _) in sorted(attributes.items()) if type_name != 'str'}
+        enums = ', '.join(f'{name!r}: {enum_sets[frozenset(values)]}'
+                          for name, (_, values) in sorted(attributes.items()) if values)
+        lines += [
+            '',
+            f'class {class_name(class_id)}(ManagedObject):',
+            f'    """{label or class_id}"""',
+            f'    __slots__ = {slots!r}',
+            f'    class_id = {class_id!r}',
+            f'    _slots = dict(zip({names!r}, __slots__))' if names != slots else '    _slots = dict(zip(__slots__, __slots__))',
+            f'    _types = {types!r}',
+            f'    _enums = {{{enums}}}',
+        ]
+    lines += [
+        '',
+        'for _cls in list(globals().values()):',
+        '    if isinstance(_cls, type) and issubclass(_cls, ManagedObject) and _cls.class_id:',
+        '        MODELS[_cls.class_id] = _cls',
+        '        for _values in _cls._enums.values():',
+        '            INTERNED.update((value, value) for value in _values)',
+        'INTERNED.update((value, value) for value in COMMON_VALUES)',
+        '',
+    ]
+    return '\n'.join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate cimc_models.py from the CIMC XML API schema')
+    parser.add_argument('--xsd', nargs='+', default=['RACK-IN-NEW.xsd'])
+    parser.add_argument('--fixture', nargs='*', default=['sample_inventory.json'],
+                        help='inventory dumps to learn read-only attributes from')
+    parser.add_argument('--output', default='cimc_models.py')
+    args = parser.parse_args(argv)
+    source = generate(args.xsd, args.fixture)
+    if args.output == '-':
+        sys.stdout.write(source)
+    else:
+        with open(args.output, 'w') as out_file:
+            out_file.write(source)
+
+if __name__ == '__main__':
+    main()
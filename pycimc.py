@@ -7,20 +7,110 @@ import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 import xml.etree.ElementTree as ET
 from collections import namedtuple, defaultdict
+from collections.abc import MutableMapping
 import time, sys
+import threading
 import inspect
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from pprint import pprint
 import requests
 import logging
 import config
 import cveLogger
-from cveLogger import mylogger
+from cveLogger import mylogger, log_request, request_fields
 from exception_mapper import *
+from cimc_transport import CimcTransport, HEADERS
+from cimc_session import SessionKeeper, is_session_error
+from cimc_metrics import REGISTRY, instrumented, observe_request, count_retry, count_round_trips_saved
+from cimc_events import EventSubscriber, RECONNECT_DELAY, SUBSYSTEM_GETTERS
+from cimc_cache import CACHE, LIVE, cached_subsystem
+from cimc_dn import dn_rn, parent_dn, index_by
+from cimc_parser import CHUNK_SIZE, check_response, iter_mos, collect_mos, mo_attrib
+from cimc_mo import make as make_mo
+from cimc_scheduler import scheduler_for
+from cimc_singleflight import read_key, copy_mos
+import cimc_xml
+from cimc_changes import Change, ChangeSet, ChangeResult, PlannedChange, CONF_MOS_BATCH, WRITE_ONLY, \
+    conf_mo_command, conf_mos_command, conf_mos_results, diff_attributes, changed_attributes
 
 LOGIN_TIMEOUT = 10.0
 REQUEST_TIMEOUT = 30.0
 CREATE_DRIVE_TIMEOUT = 60.0
 
+RACK_UNIT_DN = 'sys/rack-unit-1'
+
+# Subtrees that can be fetched with one hierarchical configResolveChildren(inDn, classId) instead of one
+# configResolveClass per contained class. resolve_classes() only uses a subtree when it covers at least
+# min_classes of the requested classes; the whole rack-unit sweep is a large response for the CIMC to build.
+#   (inDn, classId of the subtree root, classes found in the subtree, min_classes)
+CLASS_SUBTREES = [
+    (RACK_UNIT_DN, 'adaptorUnit', frozenset(['adaptorUnit', 'adaptorExtEthIf', 'adaptorHostEthIf']), 2),
+    (f'{RACK_UNIT_DN}/board', 'storageController', frozenset(['storageController', 'storageLocalDisk',
+                                                             'storageVirtualDrive', 'storageLocalDiskUsage']), 2),
+    ('sys', 'computeRackUnit', frozenset(['computeRackUnit', 'adaptorUnit', 'adaptorExtEthIf', 'adaptorHostEthIf',
+                                          'storageController', 'storageLocalDisk', 'storageVirtualDrive',
+                                          'storageLocalDiskUsage', 'pciEquipSlot', 'equipmentPsu',
+                                          'firmwareRunning', 'mgmtIf']), 4),
+]
+
+# Subsystems get_full_inventory() can fill in, with the classes their getters resolve through resolve_classes()
+# (the others make one query of their own) and the subtree of the rack unit that holds them
+FULL_INVENTORY_SUBSYSTEMS = ('chassis', 'cimc', 'boot_order', 'drives', 'drive_usage', 'adaptor', 'pci',
+                             'storageControllers', 'psu', 'bios', 'fw')
+SUBSYSTEM_CLASSES = {
+    'chassis': ['computeRackUnit'],
+    'drives': ['storageLocalDisk', 'storageVirtualDrive'],
+    'drive_usage': ['storageLocalDiskUsage'],
+    'adaptor': ['adaptorUnit', 'adaptorExtEthIf', 'adaptorHostEthIf'],
+    'pci': ['pciEquipSlot'],
+    'storageControllers': ['storageController'],
+    'psu': ['equipmentPsu'],
+    'fw': ['firmwareRunning'],
+}
+SUBSYSTEM_ROOTS = {
+    'cimc': f'{RACK_UNIT_DN}/mgmt',
+    'boot_order': f'{RACK_UNIT_DN}/boot-policy',
+    'drives': f'{RACK_UNIT_DN}/board',
+    'drive_usage': f'{RACK_UNIT_DN}/board',
+    'storageControllers': f'{RACK_UNIT_DN}/board',
+    'bios': f'{RACK_UNIT_DN}/bios',
+}
+BIOS_SETTINGS_DN = f'{RACK_UNIT_DN}/bios/bios-settings'
+# inventory subsystem -> classId, for the subsystems that hold one object or a list of objects of one class
+INVENTORY_CLASSES = {
+    'chassis': 'computeRackUnit',
+    'cimc': 'mgmtIf',
+    'mgmtIf': 'mgmtIf',
+    'users': 'aaaUser',
+    'pci': 'pciEquipSlot',
+    'psu': 'equipmentPsu',
+    'storageControllers': 'storageController',
+    'drive_usage': 'storageLocalDiskUsage',
+}
+# attributes InventoryDict.lookup() finds objects by, besides the dn
+INDEXED_ATTRIBUTES = ('id', 'name')
+# What setBootOrder() sets, as getBootOrder() reports it
+BOOT_ORDER = ['virtual-media', 'storage']
+
+# Cisco's recommended BIOS tokens for virtualization hosts, applied by set_bios_custom() unless
+# config.CUSTOM_BIOS_SETTINGS says otherwise. Same shape: {rn under bios-settings: (classId, {attribute: value})}
+CUSTOM_BIOS_SETTINGS = {
+    'Intel-HyperThreading-Tech': ('biosVfIntelHyperThreadingTech', {'vpIntelHyperThreadingTech': 'enabled'}),
+    'Core-MultiProcessing': ('biosVfCoreMultiProcessing', {'vpCoreMultiProcessing': 'all'}),
+    'Execute-Disable-Bit': ('biosVfExecuteDisableBit', {'vpExecuteDisableBit': 'enabled'}),
+    'Intel-Virtualization-Technology': ('biosVfIntelVirtualizationTechnology', {'vpIntelVirtualizationTechnology': 'enabled'}),
+    'Intel-VT-for-directed-IO': ('biosVfIntelVTForDirectedIO', {'vpIntelVTForDirectedIO': 'enabled'}),
+    'Intel-Turbo-Boost-Tech': ('biosVfIntelTurboBoostTech', {'vpIntelTurboBoostTech': 'enabled'}),
+    'Enhanced-Intel-SpeedStep-Tech': ('biosVfEnhancedIntelSpeedStepTech', {'vpEnhancedIntelSpeedStepTech': 'enabled'}),
+    'CPU-Performance': ('biosVfCPUPerformance', {'vpCPUPerformance': 'enterprise'}),
+    'CPU-EngPerfBias': ('biosVfCPUEnergyPerformance', {'vpCPUEnergyPerformance': 'performance'}),
+    'Processor-C1E': ('biosVfProcessorC1E', {'vpProcessorC1E': 'disabled'}),
+    'Processor-C6-Report': ('biosVfProcessorC6Report', {'vpProcessorC6Report': 'disabled'}),
+    'NUMA-optimized': ('biosVfNUMAOptimized', {'vpNUMAOptimized': 'enabled'}),
+    'Direct-Cache-Access': ('biosVfDirectCacheAccess', {'vpDirectCacheAccess': 'enabled'}),
+}
+
 Version = namedtuple('Version',['major','minor','maintenance'])   # Class variable - data shared
 VirtualDrive = namedtuple('VirtualDrive',['drive_path', 'virtual_drive_name', 'raid_level', 'raid_size', 'drive_group', 'write_policy'])
 
@@ -34,17 +124,140 @@ def timeit(method):
         return result
     return timed
 
+class InventoryIndex():
+    """
+    The objects of an inventory by dn, by (classId, 'id' or 'name', value) and by parent dn.
+    Entries are (classId, object); BIOS tokens have the classId of CUSTOM_BIOS_SETTINGS, or None.
+    """
+
+    def __init__(self, inventory):
+        self.by_dn = defaultdict(list)
+        self.by_attribute = defaultdict(list)
+        self.children = defaultdict(list)
+        for class_id, dn, obj in inventory_objects(inventory):
+            entries = self.by_dn[dn]
+            # mgmtIf is in the inventory twice, as 'cimc' and as 'mgmtIf'
+            duplicate = any(entry_class == class_id for entry_class, _ in entries)
+            entries.append((class_id, obj))
+            if duplicate:
+                continue
+            for attribute in INDEXED_ATTRIBUTES:
+                value = obj.get(attribute)
+                if value is not None:
+                    self.by_attribute[(class_id, attribute, str(value))].append((class_id, obj))
+            self.children[parent_dn(dn)].append((class_id, obj))
+
 class InventoryDict(defaultdict):
+    """
+    UcsServer.inventory: the getters' results by subsystem, with lookup() and children() served from an
+    InventoryIndex that is rebuilt on the first lookup after the inventory changed
+    """
 
     # pprint doesn't know how to handle defaultdict - it wants a dict __repr__.
     # Let's override its __repr__ method so that it prints out like a regular dict
     __repr__ = dict.__repr__
+    # a class attribute, so that copies (which don't carry instance attributes) start without an index
+    _index = None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._index = None
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._index = None
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._index = None
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._index = None
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self._index = None
+        return super().pop(*args)
+
+    def popitem(self):
+        self._index = None
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self._index = None
+
+    def invalidate(self):
+        """
+        Rebuild the index on the next lookup. Needed after objects in the inventory were changed in place.
+        """
+        self._index = None
+
+    def index(self):
+        index = self._index
+        if index is None:
+            index = self._index = InventoryIndex(self)
+        return index
+
+    def lookup(self, class_id=None, dn=None, id=None, name=None):
+        """
+        The object with the given dn, or of class_id with the given id and/or name; None if there is none
+        """
+        index = self.index()
+        if dn is not None:
+            candidates = index.by_dn.get(dn, ())
+        elif class_id is None:
+            raise ValueError('lookup() by id or name needs a class_id')
+        elif id is not None:
+            candidates = index.by_attribute.get((class_id, 'id', str(id)), ())
+        elif name is not None:
+            candidates = index.by_attribute.get((class_id, 'name', str(name)), ())
+        else:
+            raise ValueError('lookup() needs a dn, id or name')
+        for obj_class, obj in candidates:
+            if (class_id is None or obj_class == class_id) and (id is None or str(obj.get('id')) == str(id)) \
+                    and (name is None or obj.get('name') == name):
+                return obj
+        return None
+
+    def children(self, dn):
+        """
+        The objects directly below dn
+        """
+        return [obj for _, obj in self.index().children.get(dn, ())]
 
 class UcsServer():
 
     version = Version(0,6,0)
 
-    def __init__(self, ipaddress, username, password):
+    def __init__(self, ipaddress, username, password, transport=None, session_cache=None, keep_alive=None,
+                 inventory_cache=None, cache_mode=CACHE, models=False, scheduler=None, single_flight=None):
+        """
+        transport is an optional CimcTransport for tuning the connection pool, retries and timeouts.
+        By default each server gets its own pooled keep-alive transport that lives until __exit__/close()
+
+        session_cache is an optional cimc_session.SessionCache. With one, login() reuses a still-valid cached
+        cookie for this host and user, and logout() leaves the session open for the next caller.
+        keep_alive starts a background aaaKeepAlive before the refresh period runs out; it defaults to on
+        when a session_cache is given.
+
+        inventory_cache is an optional cimc_cache.InventoryCache. With one, the inventory getters answer from
+        the cache according to cache_mode (cimc_cache.CACHE, REFRESH or LIVE), which each call can override
+        with mode=.
+
+        With models=True the getters store cimc_models objects (ComputeRackUnit, StorageLocalDisk, ...)
+        instead of attribute dicts. They read the same but take a fraction of the memory; see cimc_mo.
+
+        Requests go through scheduler, a cimc_scheduler.HostScheduler that adapts how many requests the CIMC is
+        sent at once to how it copes. By default it is the one shared by every UcsServer for this host;
+        scheduler=False sends requests unscheduled.
+
+        With single_flight, a cimc_singleflight.SingleFlight such as cimc_singleflight.SINGLE_FLIGHT, identical
+        queries that overlap, from threads sharing this server or from other servers for the same host and user,
+        are sent once. Their responses are then read whole before being shared instead of streamed, so it is off
+        by default.
+        """
         self.session_cookie = None
         self.session_refresh_period = None
         self.status_message = ''
@@ -55,6 +268,20 @@ class UcsServer():
         self.model = 'not queried'
         self.total_memory = 0
         self.inventory = InventoryDict()
+        self.transport = transport if transport is not None else CimcTransport(ipaddress)
+        self.session_cache = session_cache
+        self.keep_alive_enabled = keep_alive if keep_alive is not None else session_cache is not None
+        self.inventory_cache = inventory_cache
+        self.cache_mode = cache_mode
+        self.models = models
+        self._make = make_mo if models else None
+        self.round_trips_saved = 0
+        self.conf_mos_limit = CONF_MOS_BATCH
+        self.scheduler = scheduler_for(ipaddress) if scheduler is None else scheduler or None
+        self.single_flight = single_flight or None
+        self._keeper = None
+        self._subscriber = None
+        self._login_lock = threading.Lock()
 
     def __enter__(self):
         if self.login():
@@ -64,15 +291,122 @@ class UcsServer():
         if exc_type is not None:
             print(str(exc_inst.args[0]))
             # print '%s' % exc_tb.__dict__
+            self.close()
             return True
         # print 'Returning None which is a false value, meaning, no execeptions were handled'
-        self.logout()
+        try:
+            self.logout()
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Stop the keep-alive and event threads and release the pooled connections to the CIMC. The session cookie is left untouched.
+        """
+        self._stop_keeper()
+        self.unsubscribe_events()
+        self.transport.close()
+
+    def _post(self, command_string, timeout=None):
+        """
+        Send an XML API command over this server's pooled transport.
+        If the CIMC rejects the session cookie (expired, or logged out elsewhere), log in again once and resend.
+        """
+        try:
+            with self._slot(command_string):
+                return post_request(self.ipaddress, command_string, timeout=timeout, transport=self.transport)
+        except ResponseError as err:
+            command_string = self._renew_session(err, command_string)
+            with self._slot(command_string):
+                return post_request(self.ipaddress, command_string, timeout=timeout, transport=self.transport)
+        finally:
+            if self.single_flight is not None and command_string.startswith('<configConf'):
+                # memoized reads of this host may be stale now
+                self.single_flight.forget(self.ipaddress)
+
+    def _stream(self, command_string, timeout=None):
+        """
+        Like _post(), but parse the response incrementally and yield its managed objects as cimc_parser.Mo's.
+        With single_flight, a query identical to one already in flight waits for that one's result instead,
+        see cimc_singleflight.
+        """
+        key = read_key(self.ipaddress, self.username, command_string, self.session_cookie) \
+            if self.single_flight is not None else None
+        if key is None:
+            yield from self._stream_request(command_string, timeout)
+        else:
+            yield from self.single_flight.do(key, lambda: list(self._stream_request(command_string, timeout)), copy_mos)
+
+    def _stream_request(self, command_string, timeout=None):
+        try:
+            with self._slot(command_string):
+                yield from stream_request(self.ipaddress, command_string, timeout=timeout, transport=self.transport)
+        except ResponseError as err:
+            # errors are reported on the response's root element, before any Mo has been yielded
+            command_string = self._renew_session(err, command_string)
+            with self._slot(command_string):
+                yield from stream_request(self.ipaddress, command_string, timeout=timeout, transport=self.transport)
 
-    # @timeit
-    def login(self):
+    def _slot(self, command_string):
+        """
+        A slot for one request from this server's scheduler, see cimc_scheduler
+        """
+        return self.scheduler.slot(command_string) if self.scheduler is not None else nullcontext()
+
+    def _mo(self, mo):
+        """
+        The attributes of a streamed Mo, as a cimc_models object if this server uses models
+        """
+        return self._make(mo.class_id, mo.attrib) if self._make is not None else mo.attrib
+
+    def _conf_mo(self, class_id, dn, attrib, changes=None, hierarchical=False, timeout=None, current=None):
+        """
+        Queue a change in the ChangeSet changes, or send it right away as a configConfMo.
+        Given the object's current attributes, only what differs is sent (nothing, if it all matches) and
+        current is updated once the CIMC took the change.
+        Returns the response element, or None if the change was queued or there was nothing to send.
+        """
+        if current is not None:
+            attrib = changed_attributes(class_id, current, attrib)
+            if not attrib:
+                mylogger('%s on %s already as requested, nothing to send', dn, self.ipaddress)
+                return None
+        if changes is not None:
+            changes.add(class_id, dn, hierarchical, **attrib)
+            return None
+        change = Change(class_id, dn, {key: str(value) for key, value in attrib.items()}, hierarchical)
+        response_element = self._post(conf_mo_command(self.session_cookie, change), timeout=timeout)
+        if current is not None:
+            current.update((key, value) for key, value in change.attrib.items() if key not in WRITE_ONLY)
+            self.inventory.invalidate()
+        return response_element
+
+    def _renew_session(self, err, command_string):
+        """
+        Re-raise err unless it is a session error for a command carrying our cookie. Otherwise log in
+        again (once, however many threads hit the error) and return the command with the new cookie.
+        """
+        old_cookie = self.session_cookie
+        if not is_session_error(err) or not old_cookie or old_cookie not in command_string \
+                or command_string.startswith('<aaaLog'):
+            raise err
+        mylogger('Session for %s is no longer valid (%s), logging in again', self.ipaddress, err)
+        count_retry(self.ipaddress, 'session')
+        with self._login_lock:
+            if self.session_cookie == old_cookie:
+                if self.session_cache is not None:
+                    self.session_cache.discard(self.ipaddress, self.username, old_cookie)
+                self.login(force=True)
+        return command_string.replace(old_cookie, self.session_cookie)
+
+    @instrumented
+    def login(self, force=False):
         """
         Log in to the CIMC using the instance's ipaddress, username, and password configured during init()
 
+        With a session_cache, a still-valid cached cookie is reused instead unless force is True, and a new
+        cookie is written back to the cache for other processes.
+
         XML Query:
         <aaaLogin inName='admin' inPassword='password'></aaaLogin>" -X POST https://172.29.85.36/nuova --insecure
         XML Response:
@@ -80,10 +414,31 @@ class UcsServer():
             outPriv="admin" outSessionId="43" outVersion="1.5(4)"> </aaaLogin>
 
         """
-        command_string = "<aaaLogin inName='%s' inPassword='%s'></aaaLogin>" % (self.username, self.password)
+        if self.session_cache is None:
+            self._aaa_login()
+            self._start_keeper()
+            return self
+        with self.session_cache.locked(self.ipaddress, self.username):
+            cached = None if force else self.session_cache.get(self.ipaddress, self.username)
+            if cached:
+                mylogger('Reusing cached session for %s@%s', self.username, self.ipaddress)
+                self.session_cookie = cached['cookie']
+                self.session_refresh_period = str(cached['refresh_period'])
+                if cached.get('version'):
+                    self.version = cached['version']
+                self._start_keeper(cached['refreshed'])
+                return self
+            self._aaa_login()
+            self.session_cache.put(self.ipaddress, self.username, self.session_cookie,
+                                   self.session_refresh_period, self.version)
+        self._start_keeper()
+        return self
+
+    def _aaa_login(self):
+        command_string = cimc_xml.login(self.username, self.password)
         try:
             with RemapExceptions():
-                response = post_request(self.ipaddress, command_string, timeout=LOGIN_TIMEOUT)
+                response = self._post(command_string, timeout=LOGIN_TIMEOUT)
                 if 'outCookie' in response.attrib:
                     self.session_cookie = response.attrib['outCookie']
                 if 'outRefreshPeriod' in response.attrib:
@@ -101,19 +456,30 @@ class UcsServer():
             mylogger(f'Could not connect to {self.ipaddress}: {err}')
             raise err
 
-    # @timeit
-    def logout(self):
+    @instrumented
+    def logout(self, force=False):
         """
         Log out of the server instance. Invalidates the current session cookie in self.session_cookie
+
+        With a session_cache the session is kept open for reuse, unless force is True.
         """
-        command_string = "<aaaLogout cookie='%s' inCookie='%s'></aaaLogout>" % (self.session_cookie, self.session_cookie)
-        auth_response = post_request(self.ipaddress, command_string)
+        self._stop_keeper()
+        if self.inventory_cache is not None:
+            # background refreshes still need the session
+            self.inventory_cache.wait(self.ipaddress)
+        if self.session_cache is not None:
+            if not force:
+                return
+            self.session_cache.discard(self.ipaddress, self.username, self.session_cookie)
+        command_string = cimc_xml.logout(self.session_cookie)
+        auth_response = self._post(command_string)
 
         if 'errorCode' in auth_response:
             self.status_message = f"Logout Error: Server returned status code {auth_response['errorCode']}: {auth_response['errorDescr']}"
             mylogger(f"Logout Error: Server returned status code {auth_response['errorCode']}: {auth_response['errorDescr']}")
             raise Exception
 
+    @instrumented
     def set_power_state(self, power_state, force=False):
         """
         Change the power state of the server.
@@ -125,106 +491,183 @@ class UcsServer():
                 "diagnostic-interrupt"
         """
         if force:
-            command_string = '''<configConfMo cookie="%s" dn="sys/rack-unit-1" inHierarchical="false">\
-            <inConfig>\
-            <computeRackUnit dn="sys/rack-unit-1" adminPower="%s"></computeRackUnit>
-            </inConfig>\
-            </configConfMo>''' % (self.session_cookie, power_state)
-            response_element = post_request(self.ipaddress, command_string)
+            command_string = cimc_xml.conf_mo(self.session_cookie, RACK_UNIT_DN,
+                                              [cimc_xml.mo('computeRackUnit', {'dn': RACK_UNIT_DN, 'adminPower': power_state})])
+            response_element = self._post(command_string)
             return True
         else:
             print('power() must be called with "force=True" to change the power status of the server')
             return False
 
+    @instrumented
     def refresh_cookie(self):
-        pass
+        """
+        Swap the session cookie for a new one with aaaRefresh
+        """
+        command_string = cimc_xml.refresh(self.session_cookie, self.username, self.password)
+        with RemapExceptions():
+            response = self._post(command_string, timeout=LOGIN_TIMEOUT)
+            old_cookie = self.session_cookie
+            if 'outCookie' in response.attrib:
+                self.session_cookie = response.attrib['outCookie']
+            if 'outRefreshPeriod' in response.attrib:
+                self.session_refresh_period = response.attrib['outRefreshPeriod']
+            if self.session_cache is not None:
+                with self.session_cache.locked(self.ipaddress, self.username):
+                    self.session_cache.put(self.ipaddress, self.username, self.session_cookie,
+                                           self.session_refresh_period, self.version)
+            mylogger('Refreshed session cookie for %s', self.ipaddress)
+            return old_cookie != self.session_cookie
+
+    @instrumented
+    def keep_alive(self):
+        """
+        Extend the current session with aaaKeepAlive, keeping the same cookie
+        """
+        with RemapExceptions():
+            self._post(cimc_xml.keep_alive(self.session_cookie), timeout=LOGIN_TIMEOUT)
+        if self.session_cache is not None:
+            self.session_cache.touch(self.ipaddress, self.username, self.session_cookie)
+        return True
 
+    def _start_keeper(self, last_refreshed=None):
+        if not self.keep_alive_enabled or self._keeper is not None:
+            return
+        self._keeper = SessionKeeper(self, self.session_refresh_period, last_refreshed)
+        self._keeper.start()
+
+    def _stop_keeper(self):
+        if self._keeper is not None:
+            self._keeper.stop()
+            self._keeper = None
+
+    def subscribe_events(self, on_change=None, resync_on_start=False, idle_timeout=None, reconnect_delay=None):
+        """
+        Keep self.inventory current from the CIMC's event stream in a background thread, instead of
+        re-polling. Fetch the subsystems of interest first; only those are updated. See cimc_events.
+        """
+        self.unsubscribe_events()
+        self._subscriber = EventSubscriber(self, on_change=on_change, resync_on_start=resync_on_start,
+                                           idle_timeout=idle_timeout, reconnect_delay=reconnect_delay or RECONNECT_DELAY)
+        self._subscriber.start()
+        return self._subscriber
+
+    def unsubscribe_events(self):
+        if self._subscriber is not None:
+            self._subscriber.stop()
+            self._subscriber = None
+
+    @instrumented
+    def resolve_classes(self, class_ids):
+        """
+        Fetch every managed object of the given classes, with as few round trips as possible.
+        Returns a dict of classId: [attribute dict, ...]
+
+        Classes that share a subtree in CLASS_SUBTREES are fetched together with a single hierarchical
+        configResolveChildren on the subtree's parent. Any remaining classes (or all of them, if the
+        firmware rejects the hierarchical query) are sent as single-class configResolveClass queries
+        in parallel over the pooled connections.
+        """
+        class_ids = list(dict.fromkeys(class_ids))
+        found = {class_id: [] for class_id in class_ids}
+        subtree_queries, single_classes = plan_class_queries(class_ids)
+        for parent_dn, root_class, wanted in subtree_queries:
+            try:
+                collect_mos(self._stream(resolve_children_command(self.session_cookie, parent_dn, root_class, True)),
+                            wanted, found, self._make)
+            except ResponseError as err:
+                mylogger('Hierarchical query on %s failed, falling back to class queries: %s', parent_dn, err)
+                single_classes.extend(class_id for class_id in class_ids if class_id in wanted)
+
+        def resolve_class(class_id):
+            return collect_mos(self._stream(resolve_class_command(self.session_cookie, class_id)), (class_id,), found,
+                               self._make)
+
+        if len(single_classes) == 1:
+            resolve_class(single_classes[0])
+        elif single_classes:
+            workers = min(len(single_classes), getattr(self.transport, 'pool_maxsize', 1))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(resolve_class, single_classes))
+        return found
+
+    @instrumented
+    @cached_subsystem('chassis', loaded='_set_chassis_attributes')
     def get_chassis_info(self):
         """
         Get the top-level chassis info and record useful info like serial number, model, memory, etc, in server.inventory['chassis'] sub-dictionary
         """
-        chassis_dict = {}
         with RemapExceptions():
-            command_string = '<configResolveClass cookie="%s" inHierarchical="false" classId="computeRackUnit"/>' % self.session_cookie
-            response_element = post_request(self.ipaddress, command_string)
-            for key,value in response_element.find('.//computeRackUnit').items():
-                chassis_dict[key] = value
-            self.inventory['chassis'] = chassis_dict
-            self.serial_no = self.inventory['chassis']['serial']
-            self.model = self.inventory['chassis']['model']
-            self.total_memory = self.inventory['chassis']['totalMemory']
-            self.name = self.inventory['chassis']['name']
-            self.operPower = self.inventory['chassis']['operPower']
+            self.inventory['chassis'] = self.resolve_classes(['computeRackUnit'])['computeRackUnit'][0].copy()
+            self._set_chassis_attributes()
             return self
 
+    def _set_chassis_attributes(self):
+        self.serial_no = self.inventory['chassis']['serial']
+        self.model = self.inventory['chassis']['model']
+        self.total_memory = self.inventory['chassis']['totalMemory']
+        self.name = self.inventory['chassis']['name']
+        self.operPower = self.inventory['chassis']['operPower']
+
+    @instrumented
+    @cached_subsystem('cimc')
     def get_cimc_info(self):
         with RemapExceptions():
-            command_string = '<configResolveChildren cookie="%s" inHierarchical="true" inDn="sys/rack-unit-1/mgmt"/>' % self.session_cookie
-            response_element = post_request(self.ipaddress, command_string)
-            out_configs = response_element.find('outConfigs')
-            self.inventory['cimc'] = out_configs.find('mgmtIf').attrib
+            mos = self._stream(resolve_children_command(self.session_cookie, f'{RACK_UNIT_DN}/mgmt', hierarchical=True))
+            self.inventory['cimc'] = [self._mo(mo) for mo in mos if mo.class_id == 'mgmtIf' and mo.depth == 0][0]
 
+    @instrumented
+    @cached_subsystem('boot_order')
     def getBootOrder(self):
-        bootorder_dict = {}
         with RemapExceptions():
-            command_string = f'<configResolveChildren cookie="{self.session_cookie}" inHierarchical="false" inDn="sys/rack-unit-1/boot-policy"/>'
-            response_element = post_request(self.ipaddress, command_string)
-            out_configs = response_element.find('outConfigs')
-            for i in out_configs.getchildren():
-                mylogger(f'i:{i}, i.attrib:{i.attrib}')
-                try:
-                    if i.attrib.get('type'):
-                        bootorder_dict[i.attrib['order']] = i.attrib['type']
-                    else:
-                        mylogger(f'Skipping as no type in this item with dn: {i.attrib.get("dn")}')
-                except Exception as e:
-                    mylogger(f'Caught exception: {e.with_traceback}')
-                    self.inventory['boot_order'] = None
-                    return self
-
-            # represent the boot order as an ordered list from the returned dict based on the 'order' key
-            #   {'1': 'virtual-media', '3': 'storage', '2': 'lan'} becomes ['virtual-media', 'lan', 'storage']
-            self.inventory['boot_order'] = [bootorder_dict[key] for key in sorted(bootorder_dict)]
+            mos = self._stream(resolve_children_command(self.session_cookie, f'{RACK_UNIT_DN}/boot-policy'))
+            self.inventory['boot_order'] = boot_order(mos)
             return self
 
+    @instrumented
     def setBootOrder(self):
-        commandString = f'<configConfMo cookie="{self.session_cookie}" inHierarchical="false" dn="{self.inventory["mgmtIf"].get("dn")}">\
-            <inConfig> <lsbootVirtualMedia access="read-only" order="1" type="virtual-media" dn="sys/rack-unit-1/boot-policy/vm-read-only" ></lsbootVirtualMedia><lsbootStorage dn="sys/rack-unit-1/boot-policy/storage-read-write" access="read-write" order="2" type="storage" ></lsbootStorage><lsbootBootSecurity dn="sys/rack-unit-1/boot-policy/boot-security" secureBoot="disabled" ></lsbootBootSecurity> </inConfig> </configConfMo>'
-        responseElement = post_request(self.ipaddress, commandString)
+        """
+        Boot from virtual media, then storage. Nothing is sent if the server already boots that way.
+        """
+        if self.inventory.get('boot_order') is None:
+            self.getBootOrder()
+        if self.inventory.get('boot_order') == BOOT_ORDER:
+            mylogger('Boot order of %s already %s, nothing to send', self.ipaddress, BOOT_ORDER)
+            return True
+        commandString = cimc_xml.conf_mo(self.session_cookie, self.inventory["mgmtIf"].get("dn"), [
+            cimc_xml.mo('lsbootVirtualMedia', {'access': 'read-only', 'order': '1', 'type': 'virtual-media',
+                                               'dn': 'sys/rack-unit-1/boot-policy/vm-read-only'}),
+            cimc_xml.mo('lsbootStorage', {'dn': 'sys/rack-unit-1/boot-policy/storage-read-write', 'access': 'read-write',
+                                          'order': '2', 'type': 'storage'}),
+            cimc_xml.mo('lsbootBootSecurity', {'dn': 'sys/rack-unit-1/boot-policy/boot-security', 'secureBoot': 'disabled'})])
+        responseElement = self._post(commandString)
         if responseElement.attrib.get('errorCode'):
             mylogger(f'Error: failed to set boot order')
             return False
         else:
             mylogger(f'Success: changed boot order')
+            self.inventory['boot_order'] = list(BOOT_ORDER)
             return True
 
+    @instrumented
+    @cached_subsystem('drives')
     def get_drive_inventory(self):
         """
         Retrieve both physical and virtual drive inventories.
         Populate <instance>.inventory['drives'] with the resulting dictionary
         """
-        drive_dict = {'storageLocalDisk':[], 'storageVirtualDrive':[]}
-        command_string = ['<configResolveClass cookie="%s" inHierarchical="false" classId="storageLocalDisk"/>' % self.session_cookie,
-                          '<configResolveClass cookie="%s" inHierarchical="false" classId="storageVirtualDrive"/>' % self.session_cookie]
         with RemapExceptions():
-            for command in command_string:
-                response_element = post_request(self.ipaddress, command)
-                out_configs = response_element.find('outConfigs')
-                for config in out_configs.getchildren():
-                    drive_dict[config.tag].append(config.attrib)
-            self.inventory['drives'] = drive_dict
+            self.inventory['drives'] = self.resolve_classes(['storageLocalDisk', 'storageVirtualDrive'])
             return self
 
+    @instrumented
+    @cached_subsystem('drive_usage')
     def get_local_drive_usage(self):
-        local_drive_usage_list=[]
-        command_string = '<configResolveClass cookie="%s" inHierarchical="false" classId="storageLocalDiskUsage"/>' % self.session_cookie
-        response_element = post_request(self.ipaddress, command_string)
-        out_configs = response_element.find('outConfigs')
-        for config in out_configs.getchildren():
-            local_drive_usage_list.append(config.attrib)
-        self.inventory['drive_usage'] = local_drive_usage_list
+        with RemapExceptions():
+            self.inventory['drive_usage'] = self.resolve_classes(['storageLocalDiskUsage'])['storageLocalDiskUsage']
         return self
 
+    @instrumented
     def configure_pd_as_unconfigured_good_from_jbod(self, controller_path, phys_drive_id, force=False):
         """
         <configConfMo cookie='$REPLACE_ACTUAL_COOKIE_VALUE' inHierarchical='true' dn='sys/rack-unit-1/board/storage-SAS-SLOT-4/pd-8'>
@@ -235,35 +678,28 @@ class UcsServer():
         </configConfMo>
         """
         if force:
-            command_string = '''<configConfMo cookie="%s" inHierarchical="true" dn="%s/pd-%s">
-            <inConfig>
-                <storageLocalDisk dn="%s/pd-%s" id='%s'
-                adminAction='make-unconfigured-good'/>
-            </inConfig>
-        </configConfMo>''' % (self.session_cookie, controller_path, phys_drive_id, controller_path, phys_drive_id, phys_drive_id)
+            dn = f'{controller_path}/pd-{phys_drive_id}'
+            command_string = cimc_xml.conf_mo(self.session_cookie, dn, [cimc_xml.mo('storageLocalDisk', {
+                'dn': dn, 'id': phys_drive_id, 'adminAction': 'make-unconfigured-good'})], hierarchical=True)
             print(f'will execute {command_string}')
             # Just printing out for now. Don't actually execute the command
-            #  response_element = post_request(self.ipaddress, command_string, timeout=CREATE_DRIVE_TIMEOUT)
+            #  response_element = self._post(command_string, timeout=CREATE_DRIVE_TIMEOUT)
         else:
             print('configure_pd_as_unconfigured_good_from_jbod() must be called with "force=True" to force to JBOD')
             return False
 
-    def setDriveAsUnconfigGood(self, driveId):
-        try:
-            myDn = [drive for drive in self.inventory['drives'].get('storageLocalDisk') if drive['id'] == str(driveId)][0].get('dn')
-        except Exception as e:
-            mylogger(f'Caught exception: {e.with_traceback}')
+    @instrumented
+    def setDriveAsUnconfigGood(self, driveId, changes=None):
+        myDrive = self.inventory.lookup('storageLocalDisk', id=driveId)
+        if myDrive is None:
             mylogger(f'Could not find drive with drive ID: {driveId}. Verify drive ID and ensure drive inventory is already retrieved.')
             return False
+        myDn = myDrive.get('dn')
 
-        commandString = f'<configConfMo cookie="{self.session_cookie}" inHierarchical="true" dn="{myDn}">\
-            <inConfig>\
-                <storageLocalDisk dn="{myDn}" id="{driveId}"\
-                adminAction="make-unconfigured-good"/>\
-            </inConfig></configConfMo>'
-        
-        responseElement = post_request(self.ipaddress, commandString, timeout = CREATE_DRIVE_TIMEOUT)
-
+        responseElement = self._conf_mo('storageLocalDisk', myDn, {'id': driveId, 'adminAction': 'make-unconfigured-good'},
+                                        changes, hierarchical=True, timeout=CREATE_DRIVE_TIMEOUT)
+        if responseElement is None:
+            return True
         if responseElement.attrib.get('errorCode'):
             mylogger(f'Error: failed to set drive {driveId} to unconfigured good')
             return False
@@ -271,22 +707,18 @@ class UcsServer():
             mylogger(f'Success: set drive {driveId} to unconfigured good')
             return True
 
-    def setVirtualDriveAsBootable(self, virtualDriveName):
-        try:
-            myVirtualDrive = [drive for drive in self.inventory['drives'].get('storageVirtualDrive') if drive['name'] == virtualDriveName][0]
-        except Exception as e:
-            mylogger(f'Caught exception: {e.with_traceback}')
+    @instrumented
+    def setVirtualDriveAsBootable(self, virtualDriveName, changes=None):
+        myVirtualDrive = self.inventory.lookup('storageVirtualDrive', name=virtualDriveName)
+        if myVirtualDrive is None:
             mylogger(f'Could not find virtual drive with name: {virtualDriveName}. Verify drive name and ensure drive inventory is already retrieved.')
             return False
         
-        commandString = f'<configConfMo cookie="{self.session_cookie}" inHierarchical="true" dn="{myVirtualDrive.get("dn")}">\
-            <inConfig>\
-                <storageVirtualDrive dn="{myVirtualDrive.get("dn")}" id="{myVirtualDrive.get("id")}"\
-                adminAction="set-boot-drive"/>\
-            </inConfig></configConfMo>'
-        
-        responseElement = post_request(self.ipaddress, commandString, timeout = CREATE_DRIVE_TIMEOUT)
-
+        responseElement = self._conf_mo('storageVirtualDrive', myVirtualDrive.get('dn'),
+                                        {'id': myVirtualDrive.get('id'), 'adminAction': 'set-boot-drive'},
+                                        changes, hierarchical=True, timeout=CREATE_DRIVE_TIMEOUT)
+        if responseElement is None:
+            return True
         if responseElement.attrib.get('errorCode'):
             mylogger(f'Error: failed to set virtual drive {myVirtualDrive.get("dn")} to boot drive')
             return False
@@ -309,7 +741,7 @@ class UcsServer():
         else:
             print('No drive inventory found! Please run "get_drive_inventory() on the server instance first.')
 
-    @timeit
+    @instrumented
     def create_virtual_drive(self, controller_path, virtual_drive_name, raid_level, raid_size, drive_group, 
         write_policy, strip_size="64k", force=False, debug=False):
         """
@@ -326,93 +758,46 @@ class UcsServer():
         </configConfMo>
         """
         if force:
-            command_string = f'<configConfMo cookie="{self.session_cookie}" inHierarchical="false" dn="{controller_path}/virtual-drive-create">\
-               <inConfig>\
-                  <storageVirtualDriveCreatorUsingUnusedPhysicalDrive dn="{controller_path}/virtual-drive-create"\
-                   virtualDriveName="{virtual_drive_name}"\
-                   raidLevel="{raid_level}"\
-                   size="{raid_size}"\
-                   driveGroup="[{drive_group}]"\
-                   writePolicy="{write_policy}"\
-                   stripSize="{strip_size}"\
-                   adminState="trigger"/>\
-               </inConfig>\
-            </configConfMo>'
+            dn = f'{controller_path}/virtual-drive-create'
+            command_string = cimc_xml.conf_mo(self.session_cookie, dn, [cimc_xml.mo(
+                'storageVirtualDriveCreatorUsingUnusedPhysicalDrive', {
+                    'dn': dn, 'virtualDriveName': virtual_drive_name, 'raidLevel': raid_level, 'size': raid_size,
+                    'driveGroup': f'[{drive_group}]', 'writePolicy': write_policy, 'stripSize': strip_size,
+                    'adminState': 'trigger'})])
             if debug:
-                mylogger(f'XML Drive create command: {command_string}')
-            response_element = post_request(self.ipaddress, command_string, timeout=CREATE_DRIVE_TIMEOUT)
+                mylogger('XML Drive create command: %s', command_string, level=logging.DEBUG)
+            response_element = self._post(command_string, timeout=CREATE_DRIVE_TIMEOUT)
             return True
         else:
             print('create_virtual_drive() must be called with "force=True" to create the drive')
             return False
 
+    @instrumented
+    @cached_subsystem('adaptor', returns=True)
     def get_interface_inventory(self):
         """
-        Get network interface inventory with three calls:
-            query adaptorUnit classId to find all adaptors
-            query adaptorExtEthIf classId to find all physical network interfaces
-            query adaptorHostEthIf classId to find all vNIC interfaces
-        Combine all of the results in a hierarchical dict structure and return it in self.inventory['interfaces']
+        Get network interface inventory for three classes, fetched together by resolve_classes():
+            adaptorUnit to find all adaptors
+            adaptorExtEthIf to find all physical network interfaces
+            adaptorHostEthIf to find all vNIC interfaces
+        Combine all of the results in a hierarchical dict structure and return it in self.inventory['adaptor']
         """
-
-        adaptorUnit_list = []
-        adaptorHostEthIf_list = []
-        adaptorExtEthIf_list = []
+        # adaptorUnit:
+        #  {'dn': 'sys/rack-unit-1/adaptor-2', 'cimcManagementEnabled': 'no', 'vendor': 'Cisco Systems Inc', 'description': '', 'presence': 'equipped', 'model': 'UCSC-PCIE-CSC-02', 'adminState': 'policy', 'pciSlot': '2', 'pciAddr': '64', 'serial': 'FCH17457FSM', 'id': '2'}
+        #  {'dn': 'sys/rack-unit-1/adaptor-5', 'cimcManagementEnabled': 'no', 'vendor': 'Cisco Systems Inc', 'description': '', 'presence': 'equipped', 'model': 'UCSC-PCIE-CSC-02', 'adminState': 'policy', 'pciSlot': '5', 'pciAddr': '73', 'serial': 'FCH17457FUC', 'id': '5'}
         with RemapExceptions():
-            # query adaptorUnit classId to find all adaptors
-            #  {'dn': 'sys/rack-unit-1/adaptor-2', 'cimcManagementEnabled': 'no', 'vendor': 'Cisco Systems Inc', 'description': '', 'presence': 'equipped', 'model': 'UCSC-PCIE-CSC-02', 'adminState': 'policy', 'pciSlot': '2', 'pciAddr': '64', 'serial': 'FCH17457FSM', 'id': '2'}
-            #  {'dn': 'sys/rack-unit-1/adaptor-5', 'cimcManagementEnabled': 'no', 'vendor': 'Cisco Systems Inc', 'description': '', 'presence': 'equipped', 'model': 'UCSC-PCIE-CSC-02', 'adminState': 'policy', 'pciSlot': '5', 'pciAddr': '73', 'serial': 'FCH17457FUC', 'id': '5'}
-
-            command_string = '<configResolveClass cookie="%s" inHierarchical="false" classId="%s"/>' %\
-                             (self.session_cookie, 'adaptorUnit')
-            response_element = post_request(self.ipaddress, command_string)
-            out_configs = response_element.find('outConfigs')
-            for config in out_configs.getchildren():
-                adaptorUnit_list.append(config.attrib)
-            #self.inventory['adaptor'] = adaptorUnit_list
-            # query adaptorExtEthIf classId to find all physical network interfaces
-            command_string = '<configResolveClass cookie="%s" inHierarchical="false" classId="%s"/>' %\
-                             (self.session_cookie, 'adaptorExtEthIf')
-            response_element = post_request(self.ipaddress, command_string)
-            out_configs = response_element.find('outConfigs')
-            for config in out_configs.getchildren():
-                adaptorExtEthIf_list.append(config.attrib)
-            #self.inventory['ext_eth_if'] = adaptorExtEthIf_list
-
-            # query adaptorHostEthIf classId to find all vNIC interfaces
-            command_string = '<configResolveClass cookie="%s" inHierarchical="false" classId="%s"/>' %\
-                             (self.session_cookie, 'adaptorHostEthIf')
-            response_element = post_request(self.ipaddress, command_string)
-            out_configs = response_element.find('outConfigs')
-            for config in out_configs.getchildren():
-                adaptorHostEthIf_list.append(config.attrib)
-            #self.inventory['host_eth_if'] = adaptorHostEthIf_list
-
-        # Build a nested JSON structure with adaptor, physical ports, and vnics
-        out_list = []
-        for adaptor in adaptorUnit_list:
-            # create an empty list of ports for each adaptor
-            if 'port' not in adaptor:
-                adaptor['port'] = []
-            for port in adaptorExtEthIf_list:
-                # create an empty list of vnics for each port
-                if 'vnic' not in port:
-                    port['vnic'] = []
-                # If this port is on the current adaptor, append its dict to the 'port' list
-                if adaptor['dn'].split('/')[2] == port['dn'].split('/')[2]:
-                    adaptor['port'].append(port)
-                    for vnic in adaptorHostEthIf_list:
-                        # If this vnic is on the current adaptor and is also on the current port,
-                        #  append it to the port's vnic list
-                        if (adaptor['dn'].split('/')[2] == vnic['dn'].split('/')[2]) and (vnic.get('uplinkPort') == port['portId']):
-                            port['vnic'].append(vnic)
-
-            out_list.append(adaptor)
-
-        mylogger(f'Setting adaptor to: {out_list}')
+            interfaces = self.resolve_classes(['adaptorUnit', 'adaptorExtEthIf', 'adaptorHostEthIf'])
+        adaptorUnit_list = interfaces['adaptorUnit']
+        adaptorExtEthIf_list = interfaces['adaptorExtEthIf']
+        adaptorHostEthIf_list = interfaces['adaptorHostEthIf']
+
+        out_list = build_adaptor_tree(adaptorUnit_list, adaptorExtEthIf_list, adaptorHostEthIf_list)
+        mylogger('Setting adaptor to: %s', out_list, level=logging.DEBUG)
         self.inventory['adaptor'] = out_list
         return True
 
+    @instrumented
+    @cached_subsystem('pci')
     def get_pci_inventory(self):
         """
         Query the pciEquipSlot class to get all PCI cards
@@ -421,26 +806,18 @@ class UcsServer():
         pciEquipSlot : {'dn': 'sys/rack-unit-1/equipped-slot-5', 'smbiosId': '5', 'controllerReported': '5', 'vendor': '0x1137', 'model': 'UCS VIC 1225 10Gbps 2 port CNA SFP+', 'id': '5'}
         """
 
-        pciEquipSlot_list = []
         with RemapExceptions():
-            command_string = '<configResolveClass cookie="%s" inHierarchical="false" classId="pciEquipSlot"/>' % self.session_cookie
-            response_element = post_request(self.ipaddress, command_string)
-            out_configs = response_element.find('outConfigs')
-            for config in out_configs.getchildren():
-                pciEquipSlot_list.append(config.attrib)
-            self.inventory['pci'] = pciEquipSlot_list
+            self.inventory['pci'] = self.resolve_classes(['pciEquipSlot'])['pciEquipSlot']
 
+    @instrumented
+    @cached_subsystem('storageControllers', returns=True)
     def getStorageControllerInventory(self):
-        storageControllers = []
         with RemapExceptions():
-            command_string = f'<configResolveClass cookie="{self.session_cookie}" inHierarchical="false" classId="storageController"/>'
-            response_element = post_request(self.ipaddress, command_string)
-            out_configs = response_element.find('outConfigs')
-            for config in out_configs.getchildren():
-                storageControllers.append(config.attrib)
-            self.inventory['storageControllers'] = storageControllers
+            self.inventory['storageControllers'] = self.resolve_classes(['storageController'])['storageController']
             return True
 
+    @instrumented
+    @cached_subsystem('psu')
     def get_psu_inventory(self):
         """
         Query the equipmentPsu class to get the power supply inventory and status on the server
@@ -455,79 +832,196 @@ class UcsServer():
         </configResolveClass>
         """
 
-        psu_list = []
         with RemapExceptions():
-            command_string = '<configResolveClass cookie="%s" inHierarchical="false" classId="equipmentPsu"/>' % self.session_cookie
-            response_element = post_request(self.ipaddress, command_string)
-            out_configs = response_element.find('outConfigs')
-            for config in out_configs.getchildren():
-                psu_list.append(config.attrib)
-            self.inventory['psu'] = psu_list
+            self.inventory['psu'] = self.resolve_classes(['equipmentPsu'])['equipmentPsu']
 
+    @instrumented
+    @cached_subsystem('bios')
     def get_bios_settings(self):
         """
         Query the firmwareRunning class to get all FW versions on the server
         Populate <instance>.inventory['bios'] with the resulting dictionary
         """
         with RemapExceptions():
-            bios_dict = {}
-            command_string = '<configResolveClass cookie="%s" inHierarchical="true" classId="biosSettings"/>' % self.session_cookie
-            response_element = post_request(self.ipaddress,command_string)
-            all_bios_settings = response_element.find('*/biosSettings').getchildren()
-            for i in all_bios_settings:
-                bios_dict[i.attrib['rn']] = {}
-                for key,value in i.items():
-                    if key != 'rn':
-                      bios_dict[i.attrib['rn']][key]=value
-            self.inventory['bios'] = bios_dict
-
-    def set_bios_custom(self):
-        """
-        Set the BIOS settings to Cisco's recommendations for virtualization
-        """
-        #next section commented out by George on 3/3/2022
-        """with RemapExceptions():
-            command_string = configConfMo_prepend_string % self.session_cookie
-            for item in config.CUSTOM_BIOS_SETTINGS:
-                command_string += configConfMo_template.format(item=item)
-            command_string += configConfMo_append_string
-            response_element = post_request(self.ipaddress, command_string)
-        """
-    def set_sol_adminstate(self, state='enable', speed='115200', comport='com0'):
+            mos = self._stream(resolve_class_command(self.session_cookie, 'biosSettings', True))
+            self.inventory['bios'] = bios_settings(mos)
+
+    @instrumented
+    def set_bios_custom(self, settings=None, changes=None):
+        """
+        Set the BIOS settings to Cisco's recommendations for virtualization, or to settings given as
+        {rn: (classId, {attribute: value})}. All tokens go out in one configConfMos; the CIMC applies them
+        at the next boot. Returns {dn: ChangeResult}, or the ChangeSet they were queued in.
+        """
+        if settings is None:
+            settings = getattr(config, 'CUSTOM_BIOS_SETTINGS', CUSTOM_BIOS_SETTINGS)
+        pending = changes if changes is not None else self.changes()
+        for rn, (class_id, attrib) in settings.items():
+            pending.add(class_id, f'{BIOS_SETTINGS_DN}/{rn}', **attrib)
+        if changes is not None:
+            return changes
+        return pending.apply()
+
+    def changes(self, validate=True):
+        """
+        Start a ChangeSet for this server. Pass it to the setters as changes= (or add() to it directly),
+        then apply() it to push everything in as few configConfMos requests as the CIMC takes.
+        """
+        return ChangeSet(self, validate=validate)
+
+    @instrumented
+    def apply_changes(self, changes):
+        """
+        Send the changes in configConfMos batches of up to conf_mos_limit objects and return {dn: ChangeResult}.
+        A batch the CIMC rejects is split in half and retried, down to single configConfMo requests, so one
+        bad change only fails its own dn and firmware with a lower limit (or none) still gets everything.
+        """
+        changes = list(changes)
+        results = {}
+        sent = 0
+        with RemapExceptions():
+            for start in range(0, len(changes), self.conf_mos_limit):
+                sent += self._apply_batch(changes[start:start + self.conf_mos_limit], results)
+        saved = len(changes) - sent
+        if saved > 0:
+            self.round_trips_saved += saved
+            count_round_trips_saved(self.ipaddress, saved)
+        state = inventory_state(self.inventory)
+        for change in changes:
+            if results[change.dn].ok:
+                for current in state.get(change.dn, ()):
+                    current.update((key, value) for key, value in change.attrib.items() if key not in WRITE_ONLY)
+        self.inventory.invalidate()
+        failed = [dn for dn, result in results.items() if not result.ok]
+        mylogger('Applied %d changes to %s in %d requests, %d failed', len(changes), self.ipaddress, sent,
+                 len(failed), level=logging.INFO if not failed else logging.WARNING)
+        return {change.dn: results[change.dn] for change in changes}
+
+    def _apply_batch(self, changes, results):
+        """
+        Apply one batch, filling in results. Returns the number of requests it took.
+        """
+        if len(changes) == 1:
+            change = changes[0]
+            try:
+                response_element = self._post(conf_mo_command(self.session_cookie, change))
+            except ResponseError as err:
+                results[change.dn] = ChangeResult(change.dn, change.class_id, err.error_code or '', err.error_descr, None)
+                return 1
+            out_config = response_element.find('outConfig')
+            mo = out_config[0].attrib if out_config is not None and len(out_config) else None
+            results[change.dn] = ChangeResult(change.dn, change.class_id, None, None, mo)
+            return 1
+        try:
+            response_element = self._post(conf_mos_command(self.session_cookie, changes))
+        except ResponseError as err:
+            mylogger('configConfMos of %d changes rejected by %s (%s), splitting the batch', len(changes),
+                     self.ipaddress, err)
+            half = (len(changes) + 1) // 2
+            sent = 1 + self._apply_batch(changes[:half], results) + self._apply_batch(changes[half:], results)
+            if all(results[change.dn].ok for change in changes):
+                # every change went through on its own, so it was the batch the firmware didn't take
+                self.conf_mos_limit = min(self.conf_mos_limit, half)
+            return sent
+        results.update(conf_mos_results(response_element, changes))
+        return 1
+
+    def current_state(self, dns, mode=None):
+        """
+        Return {dn: current attributes, or None if there is no such object} from the inventory, fetching the
+        objects it doesn't hold (all of them with mode=LIVE). Objects under the same parent come in one query.
+        """
+        state = {}
+        if mode != LIVE:
+            known = inventory_state(self.inventory)
+            state = {dn: known[dn][0] for dn in dns if dn in known}
+        missing = defaultdict(list)
+        for dn in dns:
+            if dn not in state:
+                missing[parent_dn(dn)].append(dn)
+        with RemapExceptions():
+            for parent, wanted in missing.items():
+                if len(wanted) > 1:
+                    command_string = resolve_children_command(self.session_cookie, parent)
+                else:
+                    command_string = resolve_dn_command(self.session_cookie, wanted[0])
+                found = {}
+                for mo in self._stream(command_string):
+                    if mo.depth == 0:
+                        attrib = mo_attrib(mo)
+                        found[attrib.get('dn')] = attrib
+                for dn in wanted:
+                    state[dn] = found.get(dn)
+        return state
+
+    @instrumented
+    def converge(self, desired, dry_run=False, changes=None, mode=None):
+        """
+        Bring the server to a desired state, {dn: (classId, {attribute: value})}, sending only what differs
+        from the current one (see current_state). Objects that don't exist are created.
+        Returns the plan, {dn: PlannedChange}, with dry_run; otherwise the plan is queued in changes if given,
+        or applied, returning {dn: ChangeResult} for the objects that needed a change.
+        """
+        current = self.current_state(list(desired), mode=mode)
+        plan = {}
+        for dn, (class_id, attrib) in desired.items():
+            diff = diff_attributes(class_id, current[dn], attrib)
+            if diff:
+                plan[dn] = PlannedChange(class_id, dn, diff, current[dn] is not None)
+        mylogger('%s: %d of %d objects differ from the desired state', self.ipaddress, len(plan), len(desired))
+        if dry_run:
+            return plan
+        pending = changes if changes is not None else self.changes()
+        for dn, planned in plan.items():
+            class_id, attrib = desired[dn]
+            pending.add(class_id, dn, **changed_attributes(class_id, current[dn], attrib))
+        if changes is not None:
+            return changes
+        return pending.apply() if len(pending) else {}
+
+    @instrumented
+    def set_sol_adminstate(self, state='enable', speed='115200', comport='com0', changes=None):
         """
         Change the admin state of the Serial over LAN feature. Valid states are 'enable' and 'disable'.
         Valid speeds are '115200', '57600', '38400', '19200', '9600'
         Valid COM ports are 'com0' and 'com1'
         """
-        command_string = '<configConfMo cookie="%s" inHierarchical="false" dn="sys/rack-unit-1/sol-if">\
-                            <inConfig><solIf adminState="%s" speed="%s" comport="%s"></solIf>\
-                            </inConfig></configConfMo>' % (self.session_cookie, state, speed, comport)
         with RemapExceptions():
-            response_element = post_request(self.ipaddress, command_string)
-            print(f'Changed SOL admin state to {state}')
+            response_element = self._conf_mo('solIf', f'{RACK_UNIT_DN}/sol-if',
+                                             {'adminState': state, 'speed': speed, 'comport': comport}, changes)
+            if changes is None:
+                print(f'Changed SOL admin state to {state}')
 
+    @instrumented
     def get_users(self, newUser = False, userName = False):
-        command_string = f'<configResolveClass cookie="{self.session_cookie}" inHierarchical="false" classId="aaaUser"/>' 
+        """
+        Store the configured users in self.inventory['users']. With newUser, return the first free user slot;
+        with userName, return that user (None if there is none).
+        """
         with RemapExceptions():
-            response_element = post_request(self.ipaddress, command_string)
-            if newUser:
-                return [user.attrib for user in response_element.findall('*/aaaUser')
-                        if user.attrib['name'] == ''][0]
-            elif userName:
-                return [user.attrib for user in response_element.findall('*/aaaUser')
-                        if user.attrib['name'] == userName][0]
-            else:
-                self.inventory['users'] =  [user.attrib for user in response_element.findall('*/aaaUser')
-                        if user.attrib['name']]
-                return True
+            users = self.resolve_classes(['aaaUser'])['aaaUser']
+        self.inventory['users'] = [user for user in users if user['name']]
+        if newUser:
+            return [user for user in users if user['name'] == ''][0]
+        elif userName:
+            return self.inventory.lookup('aaaUser', name=userName)
+        else:
+            return True
     
-    def createUser(self, uName, pWord, priv = 'admin', accountStatus = 'active'):
-        nextAvail = self.get_users(newUser = True)
-        commandString = f'<configConfMo cookie="{self.session_cookie}" inHierarchical="false" dn="{nextAvail.get("dn")}">\
-            <inConfig> <aaaUser id="{nextAvail.get("id")}" name="{uName}" pwd="{pWord}" priv="{priv}"\
-            accountStatus="{accountStatus}"/> </inConfig> </configConfMo>'
-        
-        responseElement = post_request(self.ipaddress, commandString)
+    @instrumented
+    def createUser(self, uName, pWord, priv = 'admin', accountStatus = 'active', changes=None):
+        """
+        Create the user in the next free slot. A user of that name that already exists is brought in line
+        with pWord, priv and accountStatus instead.
+        """
+        with RemapExceptions():
+            users = self.resolve_classes(['aaaUser'])['aaaUser']
+        self.inventory['users'] = [user for user in users if user['name']]
+        nextAvail = self.inventory.lookup('aaaUser', name=uName) or [user for user in users if user['name'] == ''][0]
+        responseElement = self._conf_mo('aaaUser', nextAvail.get('dn'), {'id': nextAvail.get('id'), 'name': uName, 'pwd': pWord,
+                                        'priv': priv, 'accountStatus': accountStatus}, changes, current=nextAvail)
+        if responseElement is None:
+            return True
         if responseElement.attrib.get('errorCode'):
             mylogger(f'Error: failed to create user: {uName}')
             return False
@@ -535,13 +1029,14 @@ class UcsServer():
             mylogger(f'Success: created user: {uName}')
             return True
     
-    def changeUserSettings(self, uName, pWord, priv = 'admin', accountStatus = 'active'):
+    @instrumented
+    def changeUserSettings(self, uName, pWord, priv = 'admin', accountStatus = 'active', changes=None):
         myUser = self.get_users(userName = uName)
         if myUser:
-            commandString = f'<configConfMo cookie="{self.session_cookie}" inHierarchical="false" dn="{myUser.get("dn")}">\
-                <inConfig> <aaaUser id="{myUser.get("id")}" name="{uName}" pwd="{pWord}" priv="{priv}"\
-                accountStatus="{accountStatus}"/> </inConfig> </configConfMo>'
-            responseElement = post_request(self.ipaddress, commandString)
+            responseElement = self._conf_mo('aaaUser', myUser.get('dn'), {'id': myUser.get('id'), 'name': uName, 'pwd': pWord,
+                                            'priv': priv, 'accountStatus': accountStatus}, changes, current=myUser)
+            if responseElement is None:
+                return True
             if responseElement.attrib.get('errorCode'):
                 mylogger(f'Error: failed to change user settings for user: {uName}')
                 return False
@@ -552,21 +1047,25 @@ class UcsServer():
             mylogger(f'Unable to find user: {uName}')
             return False
 
+    @instrumented
+    @cached_subsystem('mgmtIf', returns=True)
     def getMgmtIf(self):
-        commandString = f'<configResolveClass cookie="{self.session_cookie}" inHierarchical="true" classId="mgmtIf"/>'
-        responseElement = post_request(self.ipaddress, commandString)
-        if responseElement.attrib.get('errorCode'):
+        mgmtIfs = self.resolve_classes(['mgmtIf'])['mgmtIf']
+        if not mgmtIfs:
             mylogger(f'Error: failed to retrieve mgmtIf')
         else:
             mylogger(f'Success: retrieved mgmtIf')
-            self.inventory['mgmtIf'] = responseElement.find('outConfigs')[0].attrib
+            self.inventory['mgmtIf'] = mgmtIfs[0]
             return True
     
-    def setMgmtIp(self, mgmtIp, mgmtSubnet, mgmtGw):
+    @instrumented
+    def setMgmtIp(self, mgmtIp, mgmtSubnet, mgmtGw, changes=None):
         if self.inventory.get('mgmtIf'):
-            commandString = f'<configConfMo cookie="{self.session_cookie}" inHierarchical="false" dn="{self.inventory["mgmtIf"].get("dn")}">\
-            <inConfig> <mgmtIf extIp="{mgmtIp}" extMask="{mgmtSubnet}" extGw="{mgmtGw}" dhcpEnable="no" dnsUsingDhcp="no"/> </inConfig> </configConfMo>'
-            responseElement = post_request(self.ipaddress, commandString)
+            responseElement = self._conf_mo('mgmtIf', self.inventory['mgmtIf'].get('dn'), {'extIp': mgmtIp, 'extMask': mgmtSubnet,
+                                            'extGw': mgmtGw, 'dhcpEnable': 'no', 'dnsUsingDhcp': 'no'}, changes,
+                                            current=self.inventory['mgmtIf'])
+            if responseElement is None:
+                return True
             if responseElement.attrib.get('errorCode'):
                 mylogger(f'Error: failed to set Management IP to: {mgmtIp}')
                 return False
@@ -577,14 +1076,16 @@ class UcsServer():
             mylogger('Error: Management IP not set. Call getMgmtIf before using this method.')
             return False
     
-    def setMgmtIfMode(self, nicMode = "dedicated", nicRedundancy = "none", v6Enabled = "yes"):
+    @instrumented
+    def setMgmtIfMode(self, nicMode = "dedicated", nicRedundancy = "none", v6Enabled = "yes", changes=None):
         if self.inventory.get('mgmtIf'):
-            commandString = f'<configConfMo cookie="{self.session_cookie}" inHierarchical="false" dn="{self.inventory["mgmtIf"].get("dn")}">\
-            <inConfig> <mgmtIf nicMode="{nicMode}" nicRedundancy="{nicRedundancy}" autoNeg="enabled" v6extEnabled="{v6Enabled}"/> </inConfig> </configConfMo>'
-
+            attrib = {'nicMode': nicMode, 'nicRedundancy': nicRedundancy, 'autoNeg': 'enabled', 'v6extEnabled': v6Enabled}
             try:
                 with RemapExceptions():
-                    responseElement = post_request(self.ipaddress, commandString)
+                    responseElement = self._conf_mo('mgmtIf', self.inventory['mgmtIf'].get('dn'), attrib, changes,
+                                                    current=self.inventory['mgmtIf'])
+                    if responseElement is None:
+                        return True
                     if responseElement.attrib.get('errorCode'):
                         mylogger(f'Error: failed to set Management Interfce mode: {nicMode}')
                         return False
@@ -604,11 +1105,13 @@ class UcsServer():
             mylogger('Error: Management Interface mode not set. Call getMgmtIf before using this method.')
             return False
 
-    def setHostname(self, hostname):
+    @instrumented
+    def setHostname(self, hostname, changes=None):
         if self.inventory.get('mgmtIf'):
-            commandString = f'<configConfMo cookie="{self.session_cookie}" inHierarchical="false" dn="{self.inventory["mgmtIf"].get("dn")}">\
-            <inConfig> <mgmtIf hostname="{hostname}"/> </inConfig> </configConfMo>'
-            responseElement = post_request(self.ipaddress, commandString)
+            responseElement = self._conf_mo('mgmtIf', self.inventory['mgmtIf'].get('dn'), {'hostname': hostname}, changes,
+                                            current=self.inventory['mgmtIf'])
+            if responseElement is None:
+                return True
             if responseElement.attrib.get('errorCode'):
                 mylogger(f'Error: failed to set Hostname to: {hostname}')
                 return False
@@ -619,11 +1122,13 @@ class UcsServer():
             mylogger('Error: Hostname not set. Call getMgmtIf before using this method.')
             return False
 
-    def setEnableDhcp(self):
+    @instrumented
+    def setEnableDhcp(self, changes=None):
         if self.inventory.get('mgmtIf'):
-            commandString = f'<configConfMo cookie="{self.session_cookie}" inHierarchical="false" dn="{self.inventory["mgmtIf"].get("dn")}">\
-            <inConfig> <mgmtIf dhcpEnable="Yes"/> </inConfig> </configConfMo>'
-            responseElement = post_request(self.ipaddress, commandString)
+            responseElement = self._conf_mo('mgmtIf', self.inventory['mgmtIf'].get('dn'), {'dhcpEnable': 'Yes'}, changes,
+                                            current=self.inventory['mgmtIf'])
+            if responseElement is None:
+                return True
             if responseElement.attrib.get('errorCode'):
                 mylogger(f'Error: failed to enable DHCP')
                 return False
@@ -634,7 +1139,8 @@ class UcsServer():
             mylogger('Error: DHCP not enabled. Call getMgmtIf before using this method.')
             return False
 
-    def set_password(self, userid, password):
+    @instrumented
+    def set_password(self, userid, password, changes=None):
         """<configConfMo cookie="<cookie>" inHierarchical="false" dn="sys/user-ext/user-3">
                 <inConfig>
                     <aaaUser id="3" pwd="<new_password>" />
@@ -643,66 +1149,361 @@ class UcsServer():
         if not self.inventory['users']:
             self.get_users()
         # Make sure we have the requested user
-        try:
-            (id, dn) = next((user['id'],user['dn'])
-                            for user in self.inventory['users']
-                            if user['name'] == userid)
-        except StopIteration:
+        user = self.inventory.lookup('aaaUser', name=userid)
+        if user is None:
             print(f'Cannot find user {userid}')
             return False
+        (id, dn) = (user['id'], user['dn'])
 
         # ready to go. Change the user password
-        command_string = '<configConfMo cookie="%s" inHierarchical="false" dn="%s">\
-            <inConfig> <aaaUser id="%s" pwd="%s" /> </inConfig> </configConfMo>' % (self.session_cookie, dn, id, password)
         with RemapExceptions():
-            response_element = post_request(self.ipaddress, command_string)
+            response_element = self._conf_mo('aaaUser', dn, {'id': id, 'pwd': password}, changes)
 
-    # @timeit
+    @instrumented
+    @cached_subsystem('fw')
     def get_fw_versions(self):
         """
         Query the firmwareRunning class to get all FW versions on the server
         Populate <instance>.inventory['fw'] with the resulting sorted list
         """
-        fw_dict = {}
-        command_string = '<configResolveClass cookie="%s" inHierarchical="false" classId="firmwareRunning"/>' % self.session_cookie
         with RemapExceptions():
-            response_element = post_request(self.ipaddress,command_string)
-            for i in response_element.iter('firmwareRunning'):
-                # ignore elements with 'fw-boot-loader'. More detail than we care about
-                # we just want 'fw-system' entries
-                if 'fw-boot-loader' not in i.attrib['dn']:
-                    fw_dict[i.attrib['dn']] = i.attrib['version']
-            self.inventory['fw'] = fw_dict
+            self.inventory['fw'] = fw_versions(self.resolve_classes(['firmwareRunning'])['firmwareRunning'])
+            return self
+
+    @instrumented
+    def get_full_inventory(self, subsystems=FULL_INVENTORY_SUBSYSTEMS, mode=None):
+        """
+        Fill in self.inventory for the given subsystems (all of FULL_INVENTORY_SUBSYSTEMS by default) from one
+        hierarchical configResolveDn on the smallest subtree of sys/rack-unit-1 that holds them all, instead of
+        the one or more queries each getter makes. The inventory keys and contents are the same as the getters'.
+
+        self.round_trips_saved is set to the number of queries saved over calling the getters, which is also
+        counted in the pycimc_round_trips_saved_total metric. If the CIMC rejects the hierarchical query, the
+        getters are called instead. With an inventory_cache, subsystems that are fresh in the cache are served
+        from it unless mode is LIVE, and the fetched ones are written back.
+        """
+        subsystems = list(dict.fromkeys(subsystems))
+        full_inventory_root(subsystems)    # raises ValueError for unknown subsystems
+        cache = self.inventory_cache
+        if cache is not None and (mode or self.cache_mode) != LIVE:
+            for subsystem in list(subsystems):
+                entry = cache.get(self.ipaddress, subsystem)
+                if entry is not None and entry.fresh:
+                    self.inventory[subsystem] = entry.value
+                    subsystems.remove(subsystem)
+                    if subsystem == 'chassis':
+                        self._set_chassis_attributes()
+        self.round_trips_saved = 0
+        if not subsystems:
             return self
+        with RemapExceptions():
+            root = full_inventory_root(subsystems)
+            try:
+                mos = list(self._stream(resolve_dn_command(self.session_cookie, root, True)))
+            except ResponseError as err:
+                mylogger('Hierarchical query on %s failed, falling back to the getters: %s', root, err)
+                for subsystem in subsystems:
+                    getattr(self, SUBSYSTEM_GETTERS[subsystem])(mode=LIVE)
+                return self
+            self.inventory.update(fan_out_inventory(mos, subsystems, self._make))
+        if 'chassis' in subsystems:
+            self._set_chassis_attributes()
+        if cache is not None:
+            for subsystem in subsystems:
+                cache.put(self.ipaddress, subsystem, self.inventory[subsystem])
+        self.round_trips_saved = getter_round_trips(subsystems) - 1
+        count_round_trips_saved(self.ipaddress, self.round_trips_saved)
+        mylogger('Full inventory of %s: %s subsystems in one query on %s, %s round trips saved',
+                 self.ipaddress, len(subsystems), root, self.round_trips_saved)
+        return self
+
+resolve_class_command = cimc_xml.resolve_class
+resolve_children_command = cimc_xml.resolve_children
+resolve_dn_command = cimc_xml.resolve_dn
+
+def inventory_objects(inventory):
+    """
+    Yield (classId, dn, object) for every managed object held in an inventory
+    """
+    for subsystem, value in inventory.items():
+        if not value:
+            continue
+        if subsystem in INVENTORY_CLASSES:
+            class_id = INVENTORY_CLASSES[subsystem]
+            for obj in value if isinstance(value, list) else [value]:
+                yield class_id, obj.get('dn'), obj
+        elif subsystem == 'drives':
+            for class_id, drives in value.items():
+                for drive in drives:
+                    yield class_id, drive.get('dn'), drive
+        elif subsystem == 'adaptor':
+            for adaptor in value:
+                yield 'adaptorUnit', adaptor.get('dn'), adaptor
+                for port in adaptor.get('port', ()):
+                    yield 'adaptorExtEthIf', port.get('dn'), port
+                    for vnic in port.get('vnic', ()):
+                        yield 'adaptorHostEthIf', vnic.get('dn'), vnic
+        elif subsystem == 'bios':
+            for rn, settings in value.items():
+                yield CUSTOM_BIOS_SETTINGS.get(rn, (None,))[0], f'{BIOS_SETTINGS_DN}/{rn}', settings
+
+def inventory_state(inventory):
+    """
+    Map every dn in an inventory to the attribute dicts that describe it (mgmtIf is both 'cimc' and 'mgmtIf').
+    BIOS tokens, which are kept by rn, are mapped to their dn under BIOS_SETTINGS_DN.
+    """
+    state = defaultdict(list)
+    def walk(value):
+        if isinstance(value, list):
+            for item in value:
+                walk(item)
+        elif isinstance(value, MutableMapping):
+            if 'dn' in value:
+                state[value['dn']].append(value)
+            for item in value.values():
+                if isinstance(item, (list, MutableMapping)):
+                    walk(item)
+    for subsystem, value in inventory.items():
+        if subsystem == 'bios':
+            for rn, settings in (value or {}).items():
+                state[f'{BIOS_SETTINGS_DN}/{rn}'].append(settings)
+        else:
+            walk(value)
+    return state
+
+def full_inventory_root(subsystems):
+    """
+    The dn of the smallest subtree that holds all the subsystems
+    """
+    unknown = [subsystem for subsystem in subsystems if subsystem not in FULL_INVENTORY_SUBSYSTEMS]
+    if unknown:
+        raise ValueError(f'Unknown subsystems {unknown}, expected some of {FULL_INVENTORY_SUBSYSTEMS}')
+    roots = {SUBSYSTEM_ROOTS.get(subsystem, RACK_UNIT_DN) for subsystem in subsystems}
+    return roots.pop() if len(roots) == 1 else RACK_UNIT_DN
+
+def getter_round_trips(subsystems):
+    """
+    The number of queries the getters of these subsystems make between them
+    """
+    round_trips = 0
+    for subsystem in subsystems:
+        if subsystem in SUBSYSTEM_CLASSES:
+            subtree_queries, single_classes = plan_class_queries(SUBSYSTEM_CLASSES[subsystem])
+            round_trips += len(subtree_queries) + len(single_classes)
+        else:
+            round_trips += 1
+    return round_trips
+
+def fan_out_inventory(mos, subsystems, make=None):
+    """
+    Sort the Mo's of a hierarchical query into the inventory entries of the given subsystems, as the getters
+    would have built them. make is as for collect_mos(). Returns {subsystem: value}.
+    """
+    class_ids = [class_id for subsystem in subsystems for class_id in SUBSYSTEM_CLASSES.get(subsystem, ())]
+    found = collect_mos(mos, class_ids, {class_id: [] for class_id in class_ids}, make)
+    children = index_by(mos, lambda mo: parent_dn(mo.dn))
+    inventory = {}
+    for subsystem in subsystems:
+        if subsystem == 'chassis':
+            inventory['chassis'] = found['computeRackUnit'][0]
+        elif subsystem == 'cimc':
+            management = [mo_attrib(mo) for mo in children.get(f'{RACK_UNIT_DN}/mgmt', ()) if mo.class_id == 'mgmtIf']
+            inventory['cimc'] = make('mgmtIf', management[0]) if make is not None else management[0]
+        elif subsystem == 'boot_order':
+            inventory['boot_order'] = boot_order(children.get(f'{RACK_UNIT_DN}/boot-policy', ()), depth=None)
+        elif subsystem == 'bios':
+            inventory['bios'] = bios_settings(children.get(BIOS_SETTINGS_DN, ()), depth=None)
+        elif subsystem == 'drives':
+            inventory['drives'] = {class_id: found[class_id] for class_id in SUBSYSTEM_CLASSES['drives']}
+        elif subsystem == 'adaptor':
+            inventory['adaptor'] = build_adaptor_tree(found['adaptorUnit'], found['adaptorExtEthIf'],
+                                                      found['adaptorHostEthIf'])
+        elif subsystem == 'fw':
+            inventory['fw'] = fw_versions(found['firmwareRunning'])
+        else:
+            inventory[subsystem] = found[SUBSYSTEM_CLASSES[subsystem][0]]
+    return inventory
+
+def plan_class_queries(class_ids):
+    """
+    Split class_ids into hierarchical subtree queries from CLASS_SUBTREES and the classes left over for
+    single configResolveClass queries.
+    Returns ([(inDn, root classId, set of wanted classes), ...], [classId, ...])
+    """
+    remaining = set(class_ids)
+    subtree_queries = []
+    for parent_dn, root_class, subtree_classes, min_classes in CLASS_SUBTREES:
+        wanted = remaining & subtree_classes
+        if len(wanted) >= min_classes:
+            subtree_queries.append((parent_dn, root_class, wanted))
+            remaining -= wanted
+    return subtree_queries, [class_id for class_id in class_ids if class_id in remaining]
+
+def build_adaptor_tree(adaptorUnit_list, adaptorExtEthIf_list, adaptorHostEthIf_list):
+    """
+    Build a nested JSON structure with adaptor, physical ports, and vnics from the adaptorUnit,
+    adaptorExtEthIf and adaptorHostEthIf attribute dicts. The dicts are modified in place.
+    """
+    # Objects belong to the adaptor named by the third rn of their dn (sys/rack-unit-1/adaptor-N/...)
+    ports_by_adaptor = index_by(adaptorExtEthIf_list, lambda port: dn_rn(port['dn'], 2))
+    vnics_by_uplink = index_by(adaptorHostEthIf_list,
+                               lambda vnic: (dn_rn(vnic['dn'], 2), vnic.get('uplinkPort')))
+    if adaptorUnit_list:
+        # every port gets a vnic list, even one that is on none of the adaptors
+        for port in adaptorExtEthIf_list:
+            port.setdefault('vnic', [])
+    out_list = []
+    for adaptor in adaptorUnit_list:
+        # create an empty list of ports for each adaptor
+        if 'port' not in adaptor:
+            adaptor['port'] = []
+        adaptor_rn = dn_rn(adaptor['dn'], 2)
+        for port in ports_by_adaptor.get(adaptor_rn, ()):
+            adaptor['port'].append(port)
+            port['vnic'].extend(vnics_by_uplink.get((adaptor_rn, port['portId']), ()))
+        out_list.append(adaptor)
+    return out_list
+
+def fw_versions(firmwareRunning_list):
+    """
+    Map each firmwareRunning dn to its version
+    """
+    fw_dict = {}
+    for fw in firmwareRunning_list:
+        # ignore elements with 'fw-boot-loader'. More detail than we care about
+        # we just want 'fw-system' entries
+        if 'fw-boot-loader' not in fw['dn']:
+            fw_dict[fw['dn']] = fw['version']
+    return fw_dict
+
+def bios_settings(mos, depth=1):
+    """
+    Map each child of a hierarchical biosSettings object by its rn to the rest of its attributes.
+    Only Mo's at depth count, or all of them with depth=None
+    """
+    bios_dict = {}
+    for mo in mos:
+        if depth is not None and mo.depth != depth:
+            continue
+        bios_dict[mo.attrib['rn']] = {}
+        for key,value in mo.attrib.items():
+            if key != 'rn':
+                bios_dict[mo.attrib['rn']][key]=value
+    return bios_dict
+
+def boot_order(mos, depth=0):
+    """
+    Represent the boot-policy children as a boot order list, or None if it can't be worked out.
+    Only Mo's at depth count, or all of them with depth=None
+    """
+    bootorder_dict = {}
+    for mo in mos:
+        if depth is not None and mo.depth != depth:
+            continue
+        mylogger('i:%s, i.attrib:%s', mo.class_id, mo.attrib, level=logging.DEBUG)
+        try:
+            if mo.attrib.get('type'):
+                bootorder_dict[mo.attrib['order']] = mo.attrib['type']
+            else:
+                mylogger('Skipping as no type in this item with dn: %s', mo.attrib.get('dn'))
+        except Exception as e:
+            mylogger(f'Caught exception: {e.with_traceback}')
+            return None
+
+    # represent the boot order as an ordered list from the returned dict based on the 'order' key
+    #   {'1': 'virtual-media', '3': 'storage', '2': 'lan'} becomes ['virtual-media', 'lan', 'storage']
+    return [bootorder_dict[key] for key in sorted(bootorder_dict)]
+
+def parse_response(response_text, command_string=''):
+    """
+    Parse an XML API response and raise ResponseError if the CIMC returned an error
+    """
+    response = ET.fromstring(response_text)
+    check_response(response.attrib, command_string)
+    return response
+
+def post_request(server, command_string, timeout=None, transport=None):
+    """
+    POST an XML API command to the server and return the parsed response element.
+    If a CimcTransport is given, the request goes over its pooled keep-alive session, otherwise
+    a one-off connection is made.
+    """
+    start = time.perf_counter()
+    myResp = None
+    try:
+        with RemapExceptions():
+            if transport is not None:
+                myResp = transport.post(command_string, timeout=timeout)
+            else:
+                url = "https://%s/nuova" % server
+                myResp = requests.post(url, data=cimc_xml.encode(command_string), verify=False, headers=HEADERS,
+                                       timeout=timeout if timeout is not None else REQUEST_TIMEOUT)
+            response_text = myResp.text
+            count_retry(server, 'connect', connection_retries(myResp))
+            try:
+                response_element = parse_response(response_text, command_string)
+            except ResponseError as err:
+                record_request(server, command_string, myResp.status_code, len(myResp.content),
+                               time.perf_counter() - start, response_text, err)
+                raise
+            record_request(server, command_string, myResp.status_code, len(myResp.content),
+                           time.perf_counter() - start, response_text)
+            return response_element
+    except (TimeoutError, ConnectionError) as err:
+        # raised to the caller: one unreachable CIMC must not end a run over many
+        record_request(server, command_string, None, 0, time.perf_counter() - start, error=err)
+        raise
+
+def stream_request(server, command_string, timeout=None, transport=None):
+    """
+    POST an XML API command to the server and yield the managed objects of the response as cimc_parser.Mo's,
+    parsing the body as it is read instead of buffering it. Raises ResponseError before the first Mo
+    if the CIMC returned an error.
+    """
+    start = time.perf_counter()
+    status = None
+    nbytes = 0
+    error = None
+
+    def counted(chunks):
+        nonlocal nbytes
+        for chunk in chunks:
+            nbytes += len(chunk)
+            yield chunk
 
-def post_request(server, command_string, timeout=REQUEST_TIMEOUT):
-    url = "https://%s/nuova" % server
-    myHeader = {
-        "Content-Type": "application/x-www-form-urlencoded"
-    }
     try:
         with RemapExceptions():
-            mylogger(f'URL is: {url}')
-            mylogger(f'command_string: {command_string}')
-            myResp = requests.post(url, data=command_string, verify=False, headers=myHeader, timeout=timeout)
-            mylogger(f'Status Code: {myResp.status_code}')
-            mylogger(f'Resp Text: {myResp.text}')
-            response = ET.fromstring(myResp.text)
-            # print 'response.attrib:', response.attrib
-            # If something went wrong, the response will have an 'errorCode' key
-            # if so, then print the error message and raise an exception
-            if 'errorCode' in response.keys():
-                mylogger(f'errorCode found. command: {command_string}')
-                mylogger(f'errorCode found. response.attrib: {response.attrib}')
-                raise ResponseError("'%s': '%s'" % (response.attrib['errorCode'], response.attrib['errorDescr']))
+            if transport is not None:
+                myResp = transport.post(command_string, timeout=timeout, stream=True)
             else:
-                return response
-    except TimeoutError:
-        print(f'Timed out communicating with {server}')
-        sys.exit()
-    # except ConnectionError:
-    #     print 'Network problem connecting to %s' % server
-    #     sys.exit()
+                url = "https://%s/nuova" % server
+                myResp = requests.post(url, data=cimc_xml.encode(command_string), verify=False, headers=HEADERS, stream=True,
+                                       timeout=timeout if timeout is not None else REQUEST_TIMEOUT)
+            with myResp:
+                status = myResp.status_code
+                count_retry(server, 'connect', connection_retries(myResp))
+                yield from iter_mos(counted(myResp.iter_content(chunk_size=CHUNK_SIZE)), command_string)
+    except Exception as err:
+        error = err
+        raise
+    finally:
+        record_request(server, command_string, status, nbytes, time.perf_counter() - start, error=error)
+
+def record_request(server, command_string, status, nbytes, elapsed, response_text=None, error=None):
+    """
+    Log and count one XML API request
+    """
+    log_request(server, command_string, status, nbytes, elapsed, response_text, error)
+    if REGISTRY.enabled:
+        method, class_id = request_fields(command_string)
+        observe_request(server, method, class_id, elapsed, len(command_string), nbytes, error)
+
+def connection_retries(myResp):
+    """
+    Number of times urllib3 retried the connection for this response
+    """
+    retries = getattr(myResp.raw, 'retries', None)
+    return len(retries.history) if retries is not None else 0
 
 
 if __name__ == "__main__":
@@ -9,8 +9,31 @@ setup(name='pycimc',
       author_email='robert@horners.org',
       py_modules=['pycimc',
                   'pycimcexpect',
-                  'exception_mapper'],
+                  'exception_mapper',
+                  'cimc_transport',
+                  'cimc_async',
+                  'cimc_session',
+                  'cimc_parser',
+                  'cimc_dn',
+                  'cimc_metrics',
+                  'cimc_cache',
+                  'cimc_events',
+                  'cimc_simulator',
+                  'cimc_mo',
+                  'cimc_models',
+                  'cimc_store',
+                  'cimc_changes',
+                  'cimc_fleet',
+                  'cimc_scheduler',
+                  'cimc_procpool',
+                  'cimc_xml',
+                  'cimc_singleflight',
+                  'cimc_snapshot'],
       install_requires=[
           "requests >= 2.2.1",
           ],
+      extras_require={
+          "async": ["aiohttp >= 3.8"],
+          "lxml": ["lxml >= 4.6"],
+          },
       )
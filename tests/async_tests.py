@@ -0,0 +1,43 @@
+import unittest
+import asyncio
+import threading
+from http.server import ThreadingHTTPServer
+from cimc_async import AsyncUcsServer, Fleet, inventory_task
+from resolve_tests import FakeCimcHandler
+
+class asyncTest(unittest.TestCase):
+
+    def setUp(self):
+        FakeCimcHandler.requests = []
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), FakeCimcHandler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.host = '127.0.0.1:%d' % self.httpd.server_address[1]
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def testInventoryMatchesSyncShape(self):
+        async def get_inventory():
+            async with AsyncUcsServer(self.host, 'admin', 'password', scheme='http') as server:
+                await server.get_interface_inventory()
+                await server.get_drive_inventory()
+                return server.inventory
+        inventory = asyncio.run(get_inventory())
+        self.assertEqual(FakeCimcHandler.requests, ['aaaLogin', 'configResolveChildren', 'configResolveChildren', 'aaaLogout'])
+        self.assertEqual(inventory['adaptor'][0]['port'][0]['vnic'][0]['name'], 'eth0')
+        self.assertEqual(inventory['drives']['storageVirtualDrive'][0]['dn'], 'sys/rack-unit-1/board/storage-SAS-SLOT-4/vd-0')
+
+    def testFleetIsolatesFailedHosts(self):
+        fleet = Fleet([self.host, '127.0.0.1:1', self.host], 'admin', 'password', concurrency=2, scheme='http', timeout=5)
+        results = fleet.collect(inventory_task('get_chassis_info', 'get_pci_inventory'))
+        self.assertEqual(len(results), 3)
+        failed = [result for result in results if result.error]
+        self.assertEqual([result.host for result in failed], ['127.0.0.1:1'])
+        for result in results:
+            if not result.error:
+                self.assertEqual(result.value['chassis']['serial'], 'FCH1749V0AU')
+                self.assertEqual(result.value['pci'][0]['id'], '2')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+import bench
+
+class benchmarkTest(unittest.TestCase):
+
+    def testMicroBenchmarksReportPerCallTimes(self):
+        results = bench.micro_benchmarks(repeat=1, min_time=0.01)
+        names = [result['name'] for result in results]
+        self.assertIn('command.resolve_class', names)
+        self.assertTrue(any(name.startswith('parse.fromstring.') for name in names))
+        for result in results:
+            self.assertGreater(result['median'], 0)
+
+    def testSweepAndCompare(self):
+        results = bench.macro_benchmarks(hosts=[2], latency=0, modes=['sync'])
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['name'], 'sweep.sync.hosts[2]')
+        self.assertGreater(results[0]['requests_per_host'], len(bench.SWEEP_GETTERS))
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = os.path.join(directory, 'baseline.json')
+            with open(baseline, 'w') as baseline_file:
+                json.dump({'results': [dict(results[0], median=results[0]['median'] / 10)]}, baseline_file)
+            self.assertEqual(bench.main(['--suite', 'macro', '--hosts', '2', '--latency', '0', '--modes', 'sync',
+                                         '--compare', baseline]), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer
+import pycimc
+from cimc_cache import InventoryCache, REFRESH, LIVE
+from cimc_transport import CimcTransport
+from resolve_tests import FakeCimcHandler
+
+class inventoryCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        FakeCimcHandler.requests = []
+        FakeCimcHandler.cookies = {'c'}
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), FakeCimcHandler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.host = '127.0.0.1:%d' % self.httpd.server_address[1]
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache = InventoryCache(self.cache_dir.name, ttls={'pci': 60})
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.cache_dir.cleanup()
+
+    def server(self, **kwargs):
+        myServer = pycimc.UcsServer(self.host, 'admin', 'password', transport=CimcTransport(self.host, scheme='http'),
+                                    inventory_cache=self.cache, **kwargs)
+        myServer.session_cookie = 'c'
+        return myServer
+
+    def testFreshSubsystemIsServedFromCache(self):
+        self.server().get_pci_inventory()
+        myServer = self.server()
+        myServer.get_pci_inventory()
+        self.assertEqual(myServer.inventory['pci'][0]['id'], '2')
+        self.assertEqual(FakeCimcHandler.requests, ['configResolveClass'])
+        self.assertEqual(self.cache.inventory(self.host), {'pci': myServer.inventory['pci']})
+
+    def testChassisAttributesAreRestored(self):
+        self.server().get_chassis_info()
+        myServer = self.server()
+        myServer.get_chassis_info()
+        self.assertEqual(len(FakeCimcHandler.requests), 1)
+        self.assertEqual(myServer.serial_no, myServer.inventory['chassis']['serial'])
+
+    def testStaleSubsystemIsFetched(self):
+        self.cache.put(self.host, 'pci', [{'id': 'old'}], fetched=0)
+        myServer = self.server()
+        myServer.get_pci_inventory()
+        self.assertEqual(myServer.inventory['pci'][0]['id'], '2')
+        self.assertTrue(self.cache.get(self.host, 'pci').fresh)
+
+    def testRefreshServesStaleAndRefetchesInBackground(self):
+        self.cache.put(self.host, 'pci', [{'id': 'old'}], fetched=0)
+        myServer = self.server(cache_mode=REFRESH)
+        myServer.get_pci_inventory()
+        self.assertEqual(myServer.inventory['pci'], [{'id': 'old'}])
+        self.cache.wait(self.host)
+        self.assertEqual(self.cache.get(self.host, 'pci').value[0]['id'], '2')
+
+    def testLiveAlwaysFetches(self):
+        myServer = self.server()
+        myServer.get_pci_inventory()
+        myServer.get_pci_inventory(mode=LIVE)
+        self.assertEqual(FakeCimcHandler.requests, ['configResolveClass', 'configResolveClass'])
+
+if __name__ == '__main__':
+    unittest.main()
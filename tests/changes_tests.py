@@ -0,0 +1,65 @@
+import unittest
+import xml.etree.ElementTree as ET
+from cimc_changes import ChangeSet, conf_mo_command, conf_mos_command, conf_mos_results, diff_attributes, changed_attributes
+import pycimc
+
+class changesTest(unittest.TestCase):
+
+    def testValidation(self):
+        changes = ChangeSet()
+        changes.add('mgmtIf', 'sys/rack-unit-1/mgmt/if-1', hostname='rack-42')
+        changes.add('mgmtIf', 'sys/rack-unit-1/mgmt/if-1', dhcpEnable='no')
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(list(changes)[0].attrib, {'hostname': 'rack-42', 'dhcpEnable': 'no'})
+        with self.assertRaises(ValueError):
+            changes.add('mgmtIf', 'sys/rack-unit-1/mgmt/if-1', nicMode='bogus')
+        with self.assertRaises(ValueError):
+            changes.add('mgmtIf', 'sys/rack-unit-1/mgmt/if-1', noSuchAttribute='1')
+        with self.assertRaises(ValueError):
+            changes.add('noSuchClass', 'sys/nowhere', name='x')
+        with self.assertRaises(ValueError):
+            changes.add('solIf', 'sys/rack-unit-1/mgmt/if-1', speed='9600')
+        ChangeSet(validate=False).add('noSuchClass', 'sys/nowhere', name='x')
+        for rn, (class_id, attrib) in pycimc.CUSTOM_BIOS_SETTINGS.items():
+            changes.add(class_id, f'{pycimc.BIOS_SETTINGS_DN}/{rn}', **attrib)
+        self.assertEqual(len(changes), len(pycimc.CUSTOM_BIOS_SETTINGS) + 1)
+
+    def testCommands(self):
+        changes = ChangeSet()
+        changes.add('aaaUser', 'sys/user-ext/user-3', id=3, pwd='a"<&b')
+        changes.add('solIf', 'sys/rack-unit-1/sol-if', adminState='enable', speed='115200')
+        single = ET.fromstring(conf_mo_command('1234/abcd', list(changes)[0]))
+        self.assertEqual(single.get('dn'), 'sys/user-ext/user-3')
+        self.assertEqual(single.find('inConfig/aaaUser').attrib, {'id': '3', 'pwd': 'a"<&b', 'dn': 'sys/user-ext/user-3'})
+        command = ET.fromstring(conf_mos_command('1234/abcd', list(changes)))
+        self.assertEqual(command.tag, 'configConfMos')
+        self.assertEqual(command.get('cookie'), '1234/abcd')
+        self.assertEqual([pair.get('key') for pair in command.iterfind('inConfigs/pair')],
+                         ['sys/user-ext/user-3', 'sys/rack-unit-1/sol-if'])
+        response = ET.fromstring('<configConfMos cookie="1234/abcd" response="yes"><outConfigs>'
+                                 '<pair key="sys/rack-unit-1/sol-if"><solIf dn="sys/rack-unit-1/sol-if" adminState="enable"/></pair>'
+                                 '</outConfigs></configConfMos>')
+        results = conf_mos_results(response, list(changes))
+        self.assertTrue(all(result.ok for result in results.values()))
+        self.assertEqual(results['sys/rack-unit-1/sol-if'].mo['adminState'], 'enable')
+        self.assertIsNone(results['sys/user-ext/user-3'].mo)
+
+    def testDiff(self):
+        current = {'dn': 'sys/user-ext/user-2', 'id': '2', 'name': 'ops', 'priv': 'admin', 'accountStatus': 'active'}
+        desired = {'id': '2', 'name': 'ops', 'pwd': 'secret', 'priv': 'admin', 'accountStatus': 'active'}
+        self.assertEqual(diff_attributes('aaaUser', current, desired), {})
+        # a password can't be compared, so it is always sent
+        self.assertEqual(changed_attributes('aaaUser', current, desired), {'id': '2', 'pwd': 'secret'})
+        without_password = {key: value for key, value in desired.items() if key != 'pwd'}
+        self.assertEqual(changed_attributes('aaaUser', current, without_password), {})
+        desired['priv'] = 'read-only'
+        self.assertEqual(diff_attributes('aaaUser', current, desired), {'priv': ('admin', 'read-only')})
+        self.assertEqual(changed_attributes('aaaUser', current, desired), {'id': '2', 'pwd': 'secret', 'priv': 'read-only'})
+        self.assertEqual(changed_attributes('aaaUser', None, desired), desired)
+        # enumerated values compare regardless of case, free-form ones don't
+        mgmt_if = {'dhcpEnable': 'yes', 'hostname': 'Rack-42'}
+        self.assertEqual(diff_attributes('mgmtIf', mgmt_if, {'dhcpEnable': 'Yes', 'hostname': 'rack-42'}),
+                         {'hostname': ('Rack-42', 'rack-42')})
+
+if __name__ == '__main__':
+    unittest.main()
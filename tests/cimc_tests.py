@@ -1,11 +1,28 @@
+import os
 import unittest
 import pycimc
 import testConfig
 import cveLogger
 import sys
 import random
+from cimc_simulator import CimcSimulator
 cveLogger.initlogging(sys.argv) 
 
+# Set PYCIMC_SIMULATOR=1 (or simulate = True in testConfig) to run against a local simulated CIMC
+# instead of the BMC at testConfig.myUcsIp
+simulator = None
+
+def setUpModule():
+    global simulator
+    if os.environ.get('PYCIMC_SIMULATOR') or getattr(testConfig, 'simulate', False):
+        fixture = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'sample_inventory.json')
+        simulator = CimcSimulator(fixture, credentials={testConfig.myUname: testConfig.myPword}).start()
+        testConfig.myUcsIp = simulator.addresses[0]
+
+def tearDownModule():
+    if simulator is not None:
+        simulator.stop()
+
 class cimcTest(unittest.TestCase):
 
     def testChangeHostname(self):
@@ -0,0 +1,37 @@
+import json
+import copy
+import os
+import unittest
+from cimc_dn import parse_dn, dn_rn, parent_dn
+from pycimc import build_adaptor_tree
+
+SAMPLE_INVENTORY = os.path.join(os.path.dirname(__file__), '..', 'sample_inventory.json')
+
+class dnTest(unittest.TestCase):
+
+    def testParseDn(self):
+        self.assertEqual(parse_dn('sys/rack-unit-1/adaptor-2/ext-eth-0'), ('sys', 'rack-unit-1', 'adaptor-2', 'ext-eth-0'))
+        self.assertEqual(parse_dn('sys/svc-ext/vmedia-svc/vmmap-[nfs/share]'),
+                         ('sys', 'svc-ext', 'vmedia-svc', 'vmmap-[nfs/share]'))
+        self.assertEqual(dn_rn('sys/rack-unit-1', 2), None)
+        self.assertEqual(parent_dn('sys/rack-unit-1/adaptor-2'), 'sys/rack-unit-1')
+
+    def testAdaptorTreeMatchesSampleInventory(self):
+        with open(SAMPLE_INVENTORY) as inventory_file:
+            expected = json.load(inventory_file)['adaptor']
+        adaptors, ports, vnics = [], [], []
+        for adaptor in copy.deepcopy(expected):
+            for port in adaptor.pop('port'):
+                vnics.extend(port.pop('vnic'))
+                ports.append(port)
+            adaptors.append(adaptor)
+        self.assertEqual(build_adaptor_tree(adaptors, ports, vnics), expected)
+
+    def testPortsOffAnyAdaptorStillGetVnicList(self):
+        ports = [{'dn': 'sys/rack-unit-1/adaptor-9/ext-eth-0', 'portId': '0'}]
+        tree = build_adaptor_tree([{'dn': 'sys/rack-unit-1/adaptor-1'}], ports, [])
+        self.assertEqual(tree, [{'dn': 'sys/rack-unit-1/adaptor-1', 'port': []}])
+        self.assertEqual(ports[0]['vnic'], [])
+
+if __name__ == '__main__':
+    unittest.main()
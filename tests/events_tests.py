@@ -0,0 +1,153 @@
+import queue
+import unittest
+import threading
+import xml.etree.ElementTree as ET
+from http.server import ThreadingHTTPServer
+import pycimc
+from cimc_events import EventStreamParser
+from cimc_transport import CimcTransport
+from resolve_tests import FakeCimcHandler
+
+def change_event(eid, class_id, **attrib):
+    event = ET.Element('configMoChangeEvent', {'cookie': '', 'inEid': str(eid)})
+    ET.SubElement(ET.SubElement(event, 'inConfig'), class_id, attrib)
+    return event
+
+class FakeEventHandler(FakeCimcHandler):
+    # documents to send on the event stream; None ends the stream
+    events = queue.Queue()
+
+    def do_POST(self):
+        if self.headers.get('Content-Length') and self.peek_tag() == 'eventSubscribe':
+            return self.stream_events()
+        return super().do_POST()
+
+    def peek_tag(self):
+        self._body = self.rfile.read(int(self.headers['Content-Length']))
+        self.rfile = PrefixedReader(self._body, self.rfile)
+        return ET.fromstring(self._body).tag
+
+    def stream_events(self):
+        self.rfile.read(len(self._body))
+        self.requests.append('eventSubscribe')
+        self.send_response(200)
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        self.send_document(ET.Element('eventSubscribe', {'response': 'yes'}))
+        while True:
+            document = self.events.get()
+            if document is None:
+                break
+            self.send_document(document)
+        self.wfile.write(b'0\r\n\r\n')
+        self.close_connection = True
+
+    def send_document(self, element):
+        body = ET.tostring(element)
+        data = b'%d\n%s' % (len(body), body)
+        self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+        self.wfile.flush()
+
+class PrefixedReader():
+
+    def __init__(self, prefix, rfile):
+        self.prefix = prefix
+        self.rfile = rfile
+
+    def read(self, size):
+        data, self.prefix = self.prefix[:size], self.prefix[size:]
+        return data + (self.rfile.read(size - len(data)) if size > len(data) else b'')
+
+    def __getattr__(self, name):
+        return getattr(self.rfile, name)
+
+class eventsTest(unittest.TestCase):
+
+    def setUp(self):
+        FakeEventHandler.requests = []
+        FakeEventHandler.cookies = {'c'}
+        FakeEventHandler.events = queue.Queue()
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), FakeEventHandler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        host = '127.0.0.1:%d' % self.httpd.server_address[1]
+        self.myServer = pycimc.UcsServer(host, 'admin', 'password', transport=CimcTransport(host, scheme='http'))
+        self.myServer.session_cookie = 'c'
+        self.changes = queue.Queue()
+
+    def tearDown(self):
+        FakeEventHandler.events.put(None)
+        self.myServer.close()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def subscribe(self):
+        subscriber = self.myServer.subscribe_events(on_change=lambda *change: self.changes.put(change), reconnect_delay=0.05)
+        self.assertTrue(subscriber.subscribed.wait(5))
+        return subscriber
+
+    def testStreamParser(self):
+        parser = EventStreamParser()
+        event = b'<configMoChangeEvent inEid="1"/>'
+        stream = b'<eventSubscribe response="yes"/>' + b'%d\n%s' % (len(event), event) * 2
+        documents = [document for i in range(0, len(stream), 5) for document in parser.feed(stream[i:i + 5])]
+        self.assertEqual([document.tag for document in documents],
+                         ['eventSubscribe', 'configMoChangeEvent', 'configMoChangeEvent'])
+
+    def testChangesAreAppliedByDn(self):
+        self.myServer.get_drive_inventory()
+        self.myServer.get_pci_inventory()
+        self.myServer.get_chassis_info()
+        self.subscribe()
+        FakeEventHandler.events.put(change_event(1, 'storageLocalDisk', status='modified', pdStatus='Failed',
+                                                 dn='sys/rack-unit-1/board/storage-SAS-SLOT-4/pd-1'))
+        FakeEventHandler.events.put(change_event(2, 'pciEquipSlot', status='created', id='5',
+                                                 dn='sys/rack-unit-1/equipped-slot-5'))
+        FakeEventHandler.events.put(change_event(3, 'storageVirtualDrive', status='deleted',
+                                                 dn='sys/rack-unit-1/board/storage-SAS-SLOT-4/vd-0'))
+        FakeEventHandler.events.put(change_event(4, 'computeRackUnit', status='modified', operPower='off',
+                                                 dn='sys/rack-unit-1'))
+        for _ in range(4):
+            self.changes.get(timeout=5)
+        drives = self.myServer.inventory['drives']
+        self.assertEqual(drives['storageLocalDisk'][0]['pdStatus'], 'Failed')
+        self.assertEqual(drives['storageVirtualDrive'], [])
+        self.assertEqual([slot['id'] for slot in self.myServer.inventory['pci']], ['2', '5'])
+        self.assertEqual(self.myServer.operPower, 'off')
+        self.assertEqual(FakeEventHandler.requests.count('configResolveClass') +
+                         FakeEventHandler.requests.count('configResolveChildren'), 3)
+
+    def testDroppedStreamResyncs(self):
+        self.myServer.get_pci_inventory()
+        subscriber = self.subscribe()
+        subscriber.subscribed.clear()
+        FakeEventHandler.events.put(None)
+        self.assertTrue(subscriber.subscribed.wait(5))
+        self.assertEqual(subscriber.resyncs, 1)
+        self.assertEqual(FakeEventHandler.requests,
+                         ['configResolveClass', 'eventSubscribe', 'eventSubscribe', 'configResolveClass'])
+
+    def testMissedEventsResync(self):
+        self.myServer.get_pci_inventory()
+        subscriber = self.subscribe()
+        FakeEventHandler.events.put(change_event(1, 'pciEquipSlot', id='2', model='VIC', dn='sys/rack-unit-1/equipped-slot-2'))
+        self.changes.get(timeout=5)
+        FakeEventHandler.events.put(change_event(5, 'pciEquipSlot', id='2', model='VIC', dn='sys/rack-unit-1/equipped-slot-2'))
+        FakeEventHandler.events.put(change_event(6, 'pciEquipSlot', id='2', model='VIC 2', dn='sys/rack-unit-1/equipped-slot-2'))
+        self.changes.get(timeout=5)
+        self.assertEqual(subscriber.resyncs, 1)
+        self.assertEqual(self.myServer.inventory['pci'][0]['model'], 'VIC 2')
+
+    def testAdaptorChangesRefetchTheTreeOnce(self):
+        self.myServer.get_interface_inventory()
+        self.subscribe()
+        burst = ET.Element('methodVessel')
+        stimuli = ET.SubElement(burst, 'inStimuli')
+        stimuli.append(change_event(1, 'adaptorExtEthIf', linkState='down', dn='sys/rack-unit-1/adaptor-2/ext-eth-0'))
+        stimuli.append(change_event(2, 'adaptorHostEthIf', mtu='9000', dn='sys/rack-unit-1/adaptor-2/host-eth-eth0'))
+        FakeEventHandler.events.put(burst)
+        self.changes.get(timeout=5)
+        self.changes.get(timeout=5)
+        self.assertEqual(FakeEventHandler.requests, ['configResolveChildren', 'eventSubscribe', 'configResolveChildren'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import time
+import socket
+import unittest
+import pycimc
+from cimc_fleet import FleetExecutor, RateLimiter, subnet, summary
+from cimc_simulator import CimcSimulator
+from cimc_transport import CimcTransport
+
+SAMPLE_INVENTORY = os.path.join(os.path.dirname(__file__), '..', 'sample_inventory.json')
+
+def serial(server):
+    server.get_chassis_info()
+    return server.serial_no
+
+def power_cycle(server):
+    return server.set_power_state('cycle-immediate', force=True)
+
+class shortTimeoutExecutor(FleetExecutor):
+    read_timeout = 3.0
+
+    def server(self, host):
+        username, password = self.credentials_for(host)
+        return pycimc.UcsServer(host, username, password,
+                                transport=CimcTransport(host, scheme='http', retries=0, read_timeout=self.read_timeout))
+
+class fleetTest(unittest.TestCase):
+
+    def testSubnet(self):
+        self.assertEqual(subnet('10.1.2.3'), '10.1.2.0/24')
+        self.assertEqual(subnet('10.1.2.3:8443', 16), '10.1.0.0/16')
+        self.assertEqual(subnet('cimc-42.example.com'), 'cimc-42.example.com')
+
+    def testRateLimiter(self):
+        limiter = RateLimiter(20)
+        start = time.perf_counter()
+        for _ in range(6):
+            limiter.acquire()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.24)
+
+    def testFailuresStayWithTheirHost(self):
+        with CimcSimulator(SAMPLE_INVENTORY, count=6, tls=False, hang_time=5.0) as simulator:
+            hosts = simulator.addresses
+            credentials = {hosts[1]: {'password': 'wrong'}}
+            simulator.inject(hosts[2], 'drop')
+            simulator.inject(hosts[3], 'hang', method='configResolveClass')
+            executor = shortTimeoutExecutor(hosts, 'admin', 'password', credentials=credentials, workers=4,
+                                            rate=50, subnet_rate=50, host_timeout=1.5, retries=1, backoff=0.1)
+            start = time.perf_counter()
+            results = {result.host: result for result in executor.run(serial, idempotent=True)}
+            elapsed = time.perf_counter() - start
+        self.assertEqual(len(results), 6)
+        self.assertEqual(results[hosts[1]].error_class, 'ResponseError')
+        self.assertTrue(results[hosts[2]].ok)
+        self.assertEqual(results[hosts[2]].attempts, 2)
+        self.assertEqual(results[hosts[3]].error_class, 'TimeoutError')
+        for index in (0, 4, 5):
+            self.assertEqual(results[hosts[index]].value, f'SIM{index:08d}' if index else 'FCH1749V0AU')
+        self.assertEqual(summary(results.values()), {'ok': 4, 'ResponseError': 1, 'TimeoutError': 1})
+        # the hung host was given up on, not waited for
+        self.assertLess(elapsed, 3.0)
+
+    def testWritesAreNotResent(self):
+        with CimcSimulator(SAMPLE_INVENTORY, count=1, tls=False, hang_time=5.0) as simulator:
+            host = simulator.addresses[0]
+            simulator.inject(host, 'hang', method='configConfMo')
+            executor = shortTimeoutExecutor([host], 'admin', 'password', retries=2, backoff=0.1, host_timeout=None)
+            executor.read_timeout = 0.5
+            result = executor.collect(power_cycle)[0]
+            stats = simulator.host(0).stats
+        self.assertEqual(result.error_class, 'TimeoutError')
+        self.assertEqual(result.attempts, 1)
+        self.assertEqual(stats['configConfMo'], 1)
+
+    def testRefusedConnectionsAreRetried(self):
+        with socket.socket() as listener:
+            # a port nothing listens on
+            listener.bind(('127.0.0.1', 0))
+            host = '127.0.0.1:%d' % listener.getsockname()[1]
+        executor = shortTimeoutExecutor([host], 'admin', 'password', retries=2, backoff=0.01)
+        result = executor.collect(power_cycle)[0]
+        self.assertEqual(result.error_class, 'ConnectError')
+        self.assertEqual(result.attempts, 3)
+
+if __name__ == '__main__':
+    unittest.main()
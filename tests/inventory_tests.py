@@ -0,0 +1,71 @@
+import os
+import json
+import unittest
+import pycimc
+from cimc_simulator import CimcSimulator
+from cimc_transport import CimcTransport
+
+SAMPLE_INVENTORY = os.path.join(os.path.dirname(__file__), '..', 'sample_inventory.json')
+
+def sample_inventory():
+    inventory = pycimc.InventoryDict()
+    with open(SAMPLE_INVENTORY) as f:
+        inventory.update(json.load(f))
+    return inventory
+
+class inventoryTest(unittest.TestCase):
+
+    def testLookup(self):
+        inventory = sample_inventory()
+        drive = inventory.lookup('storageLocalDisk', id=1)
+        self.assertEqual(drive['dn'], 'sys/rack-unit-1/board/storage-SAS-SLOT-4/pd-1')
+        self.assertIs(inventory.lookup(dn=drive['dn']), drive)
+        self.assertIs(inventory.lookup('storageLocalDisk', dn=drive['dn']), drive)
+        self.assertIsNone(inventory.lookup('storageVirtualDrive', dn=drive['dn']))
+        self.assertEqual(inventory.lookup('storageVirtualDrive', name='RAID0_3')['name'], 'RAID0_3')
+        self.assertEqual(inventory.lookup('adaptorHostEthIf', name='eth0')['dn'], 'sys/rack-unit-1/adaptor-2/host-eth-eth0')
+        self.assertEqual(inventory.lookup(dn=f'{pycimc.BIOS_SETTINGS_DN}/ASPM-Support'), {'vpASPMSupport': 'Disabled'})
+        self.assertIs(inventory.lookup(dn=inventory['chassis']['dn']), inventory['chassis'])
+        self.assertIsNone(inventory.lookup('storageLocalDisk', id=999))
+        with self.assertRaises(ValueError):
+            inventory.lookup(name='RAID0_3')
+
+    def testChildren(self):
+        inventory = sample_inventory()
+        adaptor = inventory['adaptor'][0]
+        # by dn, the vNICs are children of the adaptor, not of the port they are nested under in the inventory
+        vnics = [vnic for port in adaptor['port'] for vnic in port['vnic']]
+        self.assertCountEqual(inventory.children(adaptor['dn']), adaptor['port'] + vnics)
+        self.assertEqual(inventory.children('sys/rack-unit-1/adaptor-2/ext-eth-0'), [])
+        self.assertEqual(inventory.children('sys/nowhere'), [])
+
+    def testIndexFollowsChanges(self):
+        inventory = sample_inventory()
+        self.assertIsNotNone(inventory.lookup('storageLocalDisk', id=1))
+        inventory['drives'] = {'storageLocalDisk': [{'dn': 'sys/rack-unit-1/board/storage-SAS-SLOT-4/pd-9', 'id': '9'}]}
+        self.assertIsNone(inventory.lookup('storageLocalDisk', id=1))
+        self.assertIsNotNone(inventory.lookup('storageLocalDisk', id=9))
+        inventory['drives']['storageLocalDisk'][0]['id'] = '10'
+        inventory.invalidate()
+        self.assertIsNotNone(inventory.lookup('storageLocalDisk', id=10))
+        del inventory['drives']
+        self.assertIsNone(inventory.lookup('storageLocalDisk', id=10))
+
+    def testSettersUseTheIndex(self):
+        with CimcSimulator(SAMPLE_INVENTORY, tls=False) as simulator:
+            host = simulator.addresses[0]
+            with pycimc.UcsServer(host, 'admin', 'password', transport=CimcTransport(host, scheme='http')) as myServer:
+                myServer.get_users()
+                admin = myServer.inventory.lookup('aaaUser', name='admin')
+                self.assertEqual(myServer.get_users(userName='admin')['dn'], admin['dn'])
+                self.assertIsNone(myServer.get_users(userName='nobody'))
+                self.assertFalse(myServer.set_password('nobody', 'password'))
+                myServer.set_password('admin', 'password')
+                myServer.getMgmtIf()
+                cimc = myServer.inventory.lookup(dn=myServer.inventory['mgmtIf']['dn'])
+                myServer.setHostname('rack-42')
+                renamed = myServer.inventory.lookup('mgmtIf', dn=cimc['dn'])
+        self.assertEqual(renamed['hostname'], 'rack-42')
+
+if __name__ == '__main__':
+    unittest.main()
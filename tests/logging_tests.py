@@ -0,0 +1,82 @@
+import os
+import logging
+import unittest
+import cveLogger
+import pycimc
+from cimc_simulator import CimcSimulator
+from cimc_transport import CimcTransport
+from cveLogger import log_request, mylogger, request_fields, redact
+
+SAMPLE_INVENTORY = os.path.join(os.path.dirname(__file__), '..', 'sample_inventory.json')
+
+class ListHandler(logging.Handler):
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+class loggingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = ListHandler()
+        cveLogger.logger.addHandler(self.handler)
+        self.old_level = cveLogger.logger.level
+
+    def tearDown(self):
+        cveLogger.logger.removeHandler(self.handler)
+        cveLogger.logger.setLevel(self.old_level)
+        cveLogger.body_sample_rate = 0.0
+
+    def testRequestFields(self):
+        self.assertEqual(request_fields('<configResolveClass cookie="c" inHierarchical="false" classId="pciEquipSlot"/>'),
+                         ('configResolveClass', 'pciEquipSlot'))
+        self.assertEqual(request_fields('<aaaLogout cookie="c" inCookie="c"/>'), ('aaaLogout', ''))
+        self.assertEqual(redact('<aaaLogin outCookie="1234/abcd"/>'), '<aaaLogin outCookie="***"/>')
+
+    def testOneRecordPerRequestAtInfo(self):
+        cveLogger.logger.setLevel(logging.INFO)
+        log_request('10.0.0.1', '<configResolveClass cookie="c" classId="pciEquipSlot"/>', 200, 512, 0.0123, '<body/>')
+        self.assertEqual(len(self.handler.records), 1)
+        record = self.handler.records[0]
+        self.assertEqual((record.host, record.method, record.classId, record.bytes, record.latency_ms),
+                         ('10.0.0.1', 'configResolveClass', 'pciEquipSlot', 512, 12.3))
+        self.assertNotIn('<body/>', record.getMessage())
+
+    def testBodiesAtDebug(self):
+        cveLogger.logger.setLevel(logging.DEBUG)
+        log_request('10.0.0.1', '<configResolveClass cookie="secret" classId="x"/>', 200, 7, 0.001, '<body/>')
+        self.assertEqual(len(self.handler.records), 2)
+        self.assertIn('<body/>', self.handler.records[1].getMessage())
+        self.assertNotIn('secret', self.handler.records[1].getMessage())
+
+    def testDisabledDoesNotFormat(self):
+        cveLogger.logger.setLevel(logging.WARNING)
+
+        class Exploding():
+            def __str__(self):
+                raise AssertionError('formatted while disabled')
+
+        mylogger('value: %s', Exploding())
+        log_request('10.0.0.1', '<configResolveClass classId="x"/>', 200, 7, 0.001, '<body/>')
+        self.assertEqual(self.handler.records, [])
+
+    def testAdaptorTreeIsOnlyLoggedAtDebug(self):
+        with CimcSimulator(SAMPLE_INVENTORY, tls=False) as simulator:
+            host = simulator.addresses[0]
+            with pycimc.UcsServer(host, 'admin', 'password', transport=CimcTransport(host, scheme='http')) as myServer:
+                cveLogger.logger.setLevel(logging.INFO)
+                myServer.get_interface_inventory()
+                at_info = [record for record in self.handler.records if record.msg.startswith('Setting adaptor')]
+                cveLogger.logger.setLevel(logging.DEBUG)
+                myServer.get_interface_inventory()
+                at_debug = [record for record in self.handler.records if record.msg.startswith('Setting adaptor')]
+        self.assertEqual(at_info, [])
+        self.assertEqual(len(at_debug), 1)
+        # the tree is passed along for the handler to format, not formatted up front
+        self.assertIs(at_debug[0].args[0], myServer.inventory['adaptor'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import json
+import unittest
+import threading
+from http.server import ThreadingHTTPServer
+import pycimc
+from cimc_metrics import REGISTRY, MetricsRegistry, PrometheusFileExporter
+from cimc_transport import CimcTransport
+from resolve_tests import FakeCimcHandler
+
+class metricsTest(unittest.TestCase):
+
+    def setUp(self):
+        REGISTRY.reset()
+        FakeCimcHandler.requests = []
+        FakeCimcHandler.cookies = {'c'}
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), FakeCimcHandler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.host = '127.0.0.1:%d' % self.httpd.server_address[1]
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def testRequestsAndMethodsAreCounted(self):
+        myServer = pycimc.UcsServer(self.host, 'admin', 'password', transport=CimcTransport(self.host, scheme='http'))
+        myServer.session_cookie = 'c'
+        myServer.get_psu_inventory()
+        snapshot = REGISTRY.snapshot()
+        requests = {sample['labels']['classId']: sample['value'] for sample in snapshot['pycimc_requests_total']}
+        self.assertEqual(requests, {'equipmentPsu': 1})
+        latency = snapshot['pycimc_request_seconds'][0]
+        self.assertEqual(latency['labels'], {'host': self.host, 'method': 'configResolveClass', 'classId': 'equipmentPsu'})
+        self.assertEqual(latency['count'], 1)
+        self.assertEqual(latency['buckets'][-1], ['+Inf', 1])
+        self.assertGreater(snapshot['pycimc_bytes_received_total'][0]['value'], 0)
+        methods = [sample['labels']['method'] for sample in snapshot['pycimc_method_seconds']]
+        self.assertIn('get_psu_inventory', methods)
+
+    def testSessionErrorsAndReloginsAreCounted(self):
+        myServer = pycimc.UcsServer(self.host, 'admin', 'password', transport=CimcTransport(self.host, scheme='http'))
+        myServer.session_cookie = 'stale'
+        myServer.get_psu_inventory()
+        snapshot = REGISTRY.snapshot()
+        errors = snapshot['pycimc_request_errors_total']
+        self.assertEqual([sample['labels']['error'] for sample in errors], ['ResponseError:552'])
+        self.assertEqual(snapshot['pycimc_retries_total'],
+                         [{'labels': {'host': self.host, 'reason': 'session'}, 'value': 1}])
+
+    def testPrometheusExport(self):
+        registry = MetricsRegistry()
+        registry.describe('x_seconds', ('host',), 'test latency')
+        registry.describe('x_total', ('host',))
+        registry.observe('x_seconds', ('a"b',), 0.2)
+        registry.inc('x_total', ('h',), 3)
+        text = registry.to_prometheus()
+        self.assertIn('# TYPE x_seconds histogram', text)
+        self.assertIn('x_seconds_bucket{host="a\\"b",le="0.25"} 1', text)
+        self.assertIn('x_seconds_count{host="a\\"b"} 1', text)
+        self.assertIn('x_total{host="h"} 3', text)
+        self.assertEqual(json.loads(registry.to_json())['x_total'][0]['value'], 3)
+        # large counters and sums are written in full, not rounded to six digits
+        registry.inc('x_total', ('h',), 12345675)
+        registry.observe('x_seconds', ('a"b',), 12345678.125)
+        text = registry.to_prometheus()
+        self.assertIn('x_total{host="h"} 12345678\n', text)
+        self.assertIn('x_seconds_sum{host="a\\"b"} 12345678.325\n', text)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import sys
+import json
+import pickle
+import unittest
+import xml.etree.ElementTree as ET
+import pycimc
+import cimc_models
+from cimc_mo import ManagedObject, make, to_json
+from cimc_simulator import CimcSimulator
+from cimc_transport import CimcTransport
+from gen_models import generate
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+SAMPLE_INVENTORY = os.path.join(ROOT, 'sample_inventory.json')
+
+class modelsTest(unittest.TestCase):
+
+    def testGeneratedModuleIsCurrent(self):
+        source = generate([os.path.join(ROOT, 'RACK-IN-NEW.xsd')], [SAMPLE_INVENTORY])
+        with open(os.path.join(ROOT, 'cimc_models.py')) as models_file:
+            # only the paths in the header comment may differ
+            self.assertEqual(source.splitlines()[3:], models_file.read().splitlines()[3:])
+
+    def testDictAccess(self):
+        disk = cimc_models.StorageLocalDisk.from_element(
+            ET.fromstring('<storageLocalDisk id="3" dn="sys/rack-unit-1/board/storage-SAS-SLOT-4/pd-3" '
+                          'adminAction="make-jbod" pdStatus="Online" vendorSpecific="x"/>'))
+        self.assertEqual(disk['id'], '3')
+        self.assertEqual(disk.id, '3')
+        self.assertEqual(disk.get('rn'), None)
+        self.assertNotIn('rn', disk)
+        self.assertEqual(disk['vendorSpecific'], 'x')
+        disk['port'] = []
+        disk.setdefault('vnic', []).append(1)
+        self.assertEqual(dict(disk)['vnic'], [1])
+        del disk['vendorSpecific']
+        self.assertEqual(set(disk), {'id', 'dn', 'adminAction', 'pdStatus', 'port', 'vnic'})
+        self.assertEqual(disk, dict(disk))
+        self.assertEqual(pickle.loads(pickle.dumps(disk)), disk)
+        self.assertEqual(json.loads(json.dumps({'drives': [disk]}, default=to_json))['drives'][0]['id'], '3')
+        with self.assertRaises(KeyError):
+            disk['rn']
+
+    def testTypesEnumsAndInterning(self):
+        disk = make('storageLocalDisk', {'id': '7', 'adminAction': 'bogus'})
+        self.assertIsInstance(disk, cimc_models.StorageLocalDisk)
+        self.assertEqual(disk.typed('id'), 7)
+        self.assertEqual(disk.invalid(), {'adminAction': 'bogus'})
+        other = make('storageLocalDisk', {'adminAction': ''.join(['make-', 'jbod'])})
+        self.assertIs(other['adminAction'], make('storageLocalDisk', {'adminAction': 'make-jbod'})['adminAction'])
+        self.assertEqual(make('noSuchClass', {'a': 'b'}), {'a': 'b'})
+
+    def testSmallerThanDicts(self):
+        attrib = dict(json.load(open(SAMPLE_INVENTORY))['chassis'])
+        chassis = cimc_models.ComputeRackUnit.from_attrib(attrib)
+        self.assertLess(sys.getsizeof(chassis), sys.getsizeof(attrib))
+        self.assertIsNone(chassis._extra)
+
+    def testServerModels(self):
+        with CimcSimulator(SAMPLE_INVENTORY, tls=False) as simulator:
+            host = simulator.addresses[0]
+            with pycimc.UcsServer(host, 'admin', 'password', transport=CimcTransport(host, scheme='http'),
+                                  models=True) as myServer:
+                myServer.get_chassis_info()
+                myServer.get_interface_inventory()
+                myServer.get_drive_inventory()
+        with open(SAMPLE_INVENTORY) as inventory_file:
+            expected = json.load(inventory_file)
+        self.assertIsInstance(myServer.inventory['chassis'], cimc_models.ComputeRackUnit)
+        self.assertIsInstance(myServer.inventory['adaptor'][0]['port'][0], ManagedObject)
+        self.assertEqual(json.loads(json.dumps(myServer.inventory['adaptor'], default=to_json)), expected['adaptor'])
+        self.assertEqual(myServer.serial_no, expected['chassis']['serial'])
+
+if __name__ == '__main__':
+    unittest.main()
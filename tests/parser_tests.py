@@ -0,0 +1,59 @@
+import unittest
+import xml.etree.ElementTree as ET
+import cimc_parser
+from cimc_parser import MoStreamParser, iter_mos, collect_mos, mo_parser, set_backend, BACKENDS
+from exception_mapper import ResponseError
+
+RESPONSE = b'<configResolveChildren cookie="c" response="yes" inDn="sys/rack-unit-1/adaptor-1"><outConfigs>' \
+           b'<adaptorHostEthIf name="eth0" dn="sys/rack-unit-1/adaptor-1/host-eth-eth0" mac="00:25:B5:00:00:01">' \
+           b'<adaptorEthGenProfile rn="general" vlan="NONE"/></adaptorHostEthIf>' \
+           b'<adaptorHostEthIf name="eth1" dn="sys/rack-unit-1/adaptor-1/host-eth-eth1" mac="00:25:B5:00:00:02"/>' \
+           b'</outConfigs></configResolveChildren>'
+
+class parserTest(unittest.TestCase):
+
+    def testChunkedFeedMatchesWholeBody(self):
+        whole = list(iter_mos([RESPONSE]))
+        chunked = list(iter_mos(RESPONSE[i:i + 7] for i in range(0, len(RESPONSE), 7)))
+        self.assertEqual(whole, chunked)
+        self.assertEqual([mo.class_id for mo in whole], ['adaptorHostEthIf', 'adaptorEthGenProfile', 'adaptorHostEthIf'])
+        self.assertEqual(whole[1].dn, 'sys/rack-unit-1/adaptor-1/host-eth-eth0/general')
+        self.assertEqual([mo.depth for mo in whole], [0, 1, 0])
+
+    def testCollectAddsDnToNestedObjects(self):
+        found = collect_mos(iter_mos([RESPONSE]), ('adaptorEthGenProfile',), {'adaptorEthGenProfile': []})
+        self.assertEqual(found['adaptorEthGenProfile'],
+                         [{'vlan': 'NONE', 'dn': 'sys/rack-unit-1/adaptor-1/host-eth-eth0/general'}])
+
+    def testErrorCodeRaises(self):
+        parser = MoStreamParser('<configResolveClass/>')
+        with self.assertRaises(ResponseError) as context:
+            parser.feed(b'<configResolveClass response="yes" errorCode="552" errorDescr="Authorization required"/>')
+        self.assertEqual(context.exception.error_code, '552')
+
+    def testFinishedObjectsAreDropped(self):
+        parser = MoStreamParser()
+        parser.feed(RESPONSE[:-len(b'</outConfigs></configResolveChildren>')])
+        self.assertEqual(len(parser._out_configs), 0)
+
+    def testBackendsAgree(self):
+        expected = list(iter_mos([RESPONSE], backend='etree'))
+        for backend in BACKENDS:
+            self.assertEqual(list(iter_mos((RESPONSE[i:i + 7] for i in range(0, len(RESPONSE), 7)), backend=backend)),
+                             expected, backend)
+            with self.assertRaises(ResponseError):
+                mo_parser(backend=backend).feed(b'<configResolveClass response="yes" errorCode="552"/>')
+            with self.assertRaises(ET.ParseError):
+                list(iter_mos([b'<configResolveClass><outConfigs></configResolveClass>'], backend=backend))
+        self.assertIn('expat', BACKENDS)
+        default = cimc_parser.BACKEND
+        try:
+            self.assertEqual(set_backend('etree'), 'etree')
+            self.assertIsInstance(mo_parser(), MoStreamParser)
+            with self.assertRaises(ValueError):
+                set_backend('nonsense')
+        finally:
+            set_backend(default)
+
+if __name__ == '__main__':
+    unittest.main()
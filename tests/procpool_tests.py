@@ -0,0 +1,46 @@
+import os
+import pickle
+import unittest
+import pycimc
+from cimc_procpool import ProcessFleet, compact, worker_pool
+from cimc_simulator import CimcSimulator
+from cimc_transport import CimcTransport
+from exception_mapper import ResponseError
+
+SAMPLE_INVENTORY = os.path.join(os.path.dirname(__file__), '..', 'sample_inventory.json')
+
+class procpoolTest(unittest.TestCase):
+
+    def testCompactSharesStrings(self):
+        inventory = {'psu': [{'operability': ''.join(['oper', 'able']), 'presence': 'equipped'} for _ in range(50)]}
+        compacted = compact(inventory)
+        self.assertEqual(compacted, inventory)
+        self.assertIs(compacted['psu'][0]['operability'], compacted['psu'][49]['operability'])
+        self.assertLess(len(pickle.dumps(compacted)), len(pickle.dumps(inventory)))
+        err = pickle.loads(pickle.dumps(ResponseError("'552': 'denied'", '552', 'denied')))
+        self.assertEqual((str(err), err.error_code, err.error_descr), ("'552': 'denied'", '552', 'denied'))
+
+    def testInventoriesParsedInWorkers(self):
+        with CimcSimulator(SAMPLE_INVENTORY, count=3, tls=False) as simulator:
+            hosts = simulator.addresses
+            with pycimc.UcsServer(hosts[1], 'admin', 'password',
+                                  transport=CimcTransport(hosts[1], scheme='http')) as myServer:
+                myServer.get_full_inventory()
+            expected = dict(myServer.inventory)
+            with worker_pool(2) as pool:
+                # small bodies are pickled, large ones go through shared memory
+                results = {}
+                for shared_memory_min in (1 << 30, 0):
+                    fleet = ProcessFleet(hosts + ['127.0.0.1:1'], 'admin', 'password', scheme='http', pool=pool,
+                                         shared_memory_min=shared_memory_min, timeout=5)
+                    results[shared_memory_min] = {result.host: result for result in fleet.collect()}
+            stats = simulator.host(1).stats
+        for run in results.values():
+            self.assertEqual(dict(run[hosts[1]].value), expected)
+            self.assertEqual(run[hosts[0]].value['chassis']['serial'], 'FCH1749V0AU')
+            self.assertIsNotNone(run['127.0.0.1:1'].error)
+        self.assertEqual(stats['configResolveDn'], 3)
+        self.assertEqual(stats.get('configResolveClass', 0), 0)
+
+if __name__ == '__main__':
+    unittest.main()
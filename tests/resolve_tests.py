@@ -0,0 +1,134 @@
+import unittest
+import threading
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pycimc
+from cimc_transport import CimcTransport
+
+# (classId, rn, attributes, children)
+TREE = ('computeRackUnit', 'rack-unit-1', {'model': 'UCSC-C240-M3S', 'serial': 'FCH1749V0AU', 'name': 'UCS C240 M3S',
+                                          'totalMemory': '262144', 'operPower': 'on'}, [
+    ('adaptorUnit', 'adaptor-2', {'id': '2', 'pciSlot': '2'}, [
+        ('adaptorExtEthIf', 'ext-eth-0', {'portId': '0', 'linkState': 'up'}, []),
+        ('adaptorExtEthIf', 'ext-eth-1', {'portId': '1', 'linkState': 'down'}, []),
+        ('adaptorHostEthIf', 'host-eth-eth0', {'name': 'eth0', 'uplinkPort': '0'}, []),
+    ]),
+    ('pciEquipSlot', 'equipped-slot-2', {'id': '2'}, []),
+    ('biosUnit', 'board', {}, [
+        ('storageController', 'storage-SAS-SLOT-4', {'id': 'SLOT-4'}, [
+            ('storageLocalDisk', 'pd-1', {'id': '1', 'pdStatus': 'Online'}, []),
+            ('storageVirtualDrive', 'vd-0', {'id': '0', 'name': 'RAID1_12'}, []),
+        ]),
+    ]),
+])
+
+def walk(node, parent_dn):
+    class_id, rn, attrib, children = node
+    dn = f'{parent_dn}/{rn}'
+    yield class_id, dn, node
+    for child in children:
+        yield from walk(child, dn)
+
+def to_element(node, dn=None):
+    class_id, rn, attrib, children = node
+    element = ET.Element(class_id, dict(attrib, **({'dn': dn} if dn else {'rn': rn})))
+    for child in children:
+        element.append(to_element(child))
+    return element
+
+class FakeCimcHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    requests = []
+    cookies = set()
+
+    def do_POST(self):
+        request = ET.fromstring(self.rfile.read(int(self.headers['Content-Length'])))
+        self.requests.append(request.tag)
+        response = ET.Element(request.tag, {'response': 'yes'})
+        if request.tag in ('aaaLogin', 'aaaRefresh'):
+            cookie = '1394044707/%08x' % len(self.requests)
+            self.cookies.add(cookie)
+            response.set('outCookie', cookie)
+            response.set('outRefreshPeriod', '600')
+            return self.reply(response)
+        if request.get('cookie') not in self.cookies:
+            response.set('errorCode', '552')
+            response.set('errorDescr', 'Authorization required')
+            return self.reply(response)
+        if request.tag == 'aaaLogout':
+            self.cookies.discard(request.get('inCookie'))
+        if request.tag in ('aaaLogout', 'aaaKeepAlive'):
+            return self.reply(response)
+        out_configs = ET.SubElement(response, 'outConfigs')
+        for class_id, dn, node in walk(TREE, 'sys'):
+            if class_id != request.get('classId'):
+                continue
+            if request.tag == 'configResolveChildren' and dn.rsplit('/', 1)[0] != request.get('inDn'):
+                continue
+            element = to_element(node, dn)
+            if request.get('inHierarchical') != 'true':
+                element[:] = []
+            out_configs.append(element)
+        self.reply(response)
+
+    def reply(self, response):
+        body = ET.tostring(response)
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class resolveTest(unittest.TestCase):
+
+    def setUp(self):
+        FakeCimcHandler.requests = []
+        FakeCimcHandler.cookies = set(['c'])
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), FakeCimcHandler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        host = '127.0.0.1:%d' % self.httpd.server_address[1]
+        self.myServer = pycimc.UcsServer(host, 'admin', 'password', transport=CimcTransport(host, scheme='http'))
+        self.myServer.session_cookie = 'c'
+
+    def tearDown(self):
+        self.myServer.close()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def testInterfaceInventoryIsOneRoundTrip(self):
+        self.assertTrue(self.myServer.get_interface_inventory())
+        self.assertEqual(FakeCimcHandler.requests, ['configResolveChildren'])
+        adaptor = self.myServer.inventory['adaptor'][0]
+        self.assertEqual(adaptor['dn'], 'sys/rack-unit-1/adaptor-2')
+        self.assertEqual([port['dn'] for port in adaptor['port']],
+                         ['sys/rack-unit-1/adaptor-2/ext-eth-0', 'sys/rack-unit-1/adaptor-2/ext-eth-1'])
+        self.assertEqual(adaptor['port'][0]['vnic'],
+                         [{'name': 'eth0', 'uplinkPort': '0', 'dn': 'sys/rack-unit-1/adaptor-2/host-eth-eth0'}])
+        self.assertEqual(adaptor['port'][1]['vnic'], [])
+
+    def testDriveInventoryIsOneRoundTrip(self):
+        self.myServer.get_drive_inventory()
+        self.assertEqual(FakeCimcHandler.requests, ['configResolveChildren'])
+        drives = self.myServer.inventory['drives']
+        self.assertEqual(drives['storageLocalDisk'],
+                         [{'id': '1', 'pdStatus': 'Online', 'dn': 'sys/rack-unit-1/board/storage-SAS-SLOT-4/pd-1'}])
+        self.assertEqual(drives['storageVirtualDrive'][0]['name'], 'RAID1_12')
+
+    def testUnrelatedClassesUseClassQueries(self):
+        found = self.myServer.resolve_classes(['pciEquipSlot', 'storageController'])
+        self.assertEqual(FakeCimcHandler.requests, ['configResolveClass', 'configResolveClass'])
+        self.assertEqual(found['pciEquipSlot'][0]['dn'], 'sys/rack-unit-1/equipped-slot-2')
+        self.assertEqual(found['storageController'][0]['id'], 'SLOT-4')
+
+    def testManyRackUnitClassesUseOneSweep(self):
+        found = self.myServer.resolve_classes(['computeRackUnit', 'pciEquipSlot', 'storageLocalDisk', 'adaptorUnit'])
+        self.assertEqual(FakeCimcHandler.requests, ['configResolveChildren'])
+        self.assertEqual(found['computeRackUnit'][0]['serial'], 'FCH1749V0AU')
+        self.assertEqual(found['pciEquipSlot'][0]['dn'], 'sys/rack-unit-1/equipped-slot-2')
+        self.assertEqual(found['storageLocalDisk'][0]['dn'], 'sys/rack-unit-1/board/storage-SAS-SLOT-4/pd-1')
+        self.assertEqual(found['adaptorUnit'][0]['dn'], 'sys/rack-unit-1/adaptor-2')
+
+if __name__ == "__main__":
+    unittest.main()
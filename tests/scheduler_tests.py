@@ -0,0 +1,71 @@
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import pycimc
+from cimc_metrics import REGISTRY
+from cimc_scheduler import HostScheduler, scheduler_for
+from cimc_simulator import CimcSimulator
+from cimc_transport import CimcTransport
+from exception_mapper import ConnectionError, ResponseError
+
+SAMPLE_INVENTORY = os.path.join(os.path.dirname(__file__), '..', 'sample_inventory.json')
+QUERY = '<configResolveClass cookie="c" inHierarchical="false" classId="pciEquipSlot"/>'
+
+class schedulerTest(unittest.TestCase):
+
+    def setUp(self):
+        REGISTRY.reset()
+
+    def testLimitAdapts(self):
+        scheduler = HostScheduler('10.0.0.1', limit=2, max_limit=4)
+        for _ in range(4):
+            scheduler.release(scheduler.acquire(), 0.1, QUERY)
+        self.assertEqual(scheduler.stats()['limit'], 3)
+        started = [scheduler.acquire(), scheduler.acquire()]
+        scheduler.release(started[0], 0.1, QUERY, ConnectionError('reset'))
+        # the second failure was already in flight when the limit was cut, so it doesn't cut it again
+        scheduler.release(started[1], 0.1, QUERY, ConnectionError('reset'))
+        stats = scheduler.stats()
+        self.assertEqual((stats['limit'], stats['backoffs'], stats['in_flight']), (1, 1, 0))
+        self.assertGreater(stats['interval'], 0)
+        # a rejected request is the caller's problem, a busy CIMC isn't
+        scheduler.limit = 4.0
+        scheduler.release(scheduler.acquire(), 0.1, QUERY, ResponseError('bad', error_code='103'))
+        self.assertEqual(scheduler.stats()['backoffs'], 1)
+        scheduler.release(scheduler.acquire(), 0.1, QUERY, ResponseError('busy', error_code='572'))
+        self.assertEqual(scheduler.stats()['backoffs'], 2)
+        scheduler.limit = 4.0
+        scheduler.release(scheduler.acquire(), 2.0, QUERY)
+        self.assertEqual(scheduler.stats()['backoffs'], 3)
+        snapshot = REGISTRY.snapshot()
+        self.assertEqual(snapshot['pycimc_concurrency_limit'][0]['value'], 2)
+        self.assertEqual(snapshot['pycimc_queue_wait_seconds'][0]['labels'], {'host': '10.0.0.1'})
+        reasons = {sample['labels']['reason']: sample['value'] for sample in snapshot['pycimc_backoffs_total']}
+        self.assertEqual(reasons, {'ConnectionError': 1, 'ResponseError': 1, 'latency': 1})
+        self.assertIs(scheduler_for('10.0.0.9'), scheduler_for('10.0.0.9'))
+
+    def testRequestsAreQueued(self):
+        with CimcSimulator(SAMPLE_INVENTORY, tls=False, latency=0.05) as simulator:
+            host = simulator.addresses[0]
+            scheduler = HostScheduler(host, limit=2, max_limit=2)
+            myServer = pycimc.UcsServer(host, 'admin', 'password', scheduler=scheduler, single_flight=False,
+                                        transport=CimcTransport(host, scheme='http', retries=0))
+            myServer.login()
+            with ThreadPoolExecutor(6) as executor:
+                list(executor.map(lambda _: myServer.get_pci_inventory(), range(6)))
+            max_active = simulator.host(0).max_active
+            simulator.inject(host, 'drop', method='configResolveClass')
+            failed = None
+            try:
+                myServer.get_pci_inventory()
+            except ConnectionError as err:
+                failed = err
+            stats = scheduler.stats()
+            myServer.logout()
+        self.assertEqual(max_active, 2)
+        self.assertIsNotNone(failed)
+        self.assertEqual((stats['limit'], stats['backoffs'], stats['in_flight']), (1, 1, 0))
+        self.assertGreater(stats['waited'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+import pycimc
+import cimc_session
+from cimc_session import SessionCache
+from cimc_transport import CimcTransport
+from resolve_tests import FakeCimcHandler
+
+class sessionTest(unittest.TestCase):
+
+    def setUp(self):
+        FakeCimcHandler.requests = []
+        FakeCimcHandler.cookies = set()
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), FakeCimcHandler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.host = '127.0.0.1:%d' % self.httpd.server_address[1]
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache = SessionCache(self.cache_dir.name)
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.cache_dir.cleanup()
+
+    def server(self, **kwargs):
+        return pycimc.UcsServer(self.host, 'admin', 'password', transport=CimcTransport(self.host, scheme='http'),
+                                session_cache=self.cache, **kwargs)
+
+    def testCachedCookieIsReused(self):
+        with self.server() as myServer:
+            myServer.get_pci_inventory()
+        with self.server() as myServer:
+            myServer.get_pci_inventory()
+            self.assertEqual(myServer.inventory['pci'][0]['id'], '2')
+        self.assertEqual(FakeCimcHandler.requests, ['aaaLogin', 'configResolveClass', 'configResolveClass'])
+
+    def testExpiredCookieIsReplaced(self):
+        with self.server() as myServer:
+            old_cookie = myServer.session_cookie
+            FakeCimcHandler.cookies.clear()
+            myServer.get_pci_inventory()
+            self.assertNotEqual(myServer.session_cookie, old_cookie)
+        self.assertEqual(FakeCimcHandler.requests,
+                         ['aaaLogin', 'configResolveClass', 'aaaLogin', 'configResolveClass'])
+        self.assertEqual(self.cache.get(self.host, 'admin')['cookie'], myServer.session_cookie)
+
+    def testForcedLogoutDiscardsSession(self):
+        myServer = self.server()
+        myServer.login()
+        myServer.logout(force=True)
+        myServer.close()
+        self.assertIsNone(self.cache.get(self.host, 'admin'))
+        self.assertEqual(FakeCimcHandler.requests, ['aaaLogin', 'aaaLogout'])
+
+    def testStaleEntryIsNotReused(self):
+        self.cache.put(self.host, 'admin', 'stale', 600, refreshed=time.time() - 700)
+        self.assertIsNone(self.cache.get(self.host, 'admin'))
+
+    def testKeeperSendsKeepAlive(self):
+        cimc_session.KEEPALIVE_FRACTION, fraction = 0.0001, cimc_session.KEEPALIVE_FRACTION
+        try:
+            myServer = self.server()
+            myServer.login()
+            time.sleep(0.5)
+            myServer.close()
+        finally:
+            cimc_session.KEEPALIVE_FRACTION = fraction
+        self.assertIn('aaaKeepAlive', FakeCimcHandler.requests)
+
+    def testRefreshCookie(self):
+        myServer = self.server(keep_alive=False)
+        myServer.login()
+        old_cookie = myServer.session_cookie
+        self.assertTrue(myServer.refresh_cookie())
+        self.assertEqual(self.cache.get(self.host, 'admin')['cookie'], myServer.session_cookie)
+        self.assertNotEqual(old_cookie, myServer.session_cookie)
+        myServer.close()
+
+if __name__ == "__main__":
+    unittest.main()
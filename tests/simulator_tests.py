@@ -0,0 +1,240 @@
+import os
+import json
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import pycimc
+from cimc_simulator import CimcSimulator
+from cimc_transport import CimcTransport
+from exception_mapper import ResponseError, ConnectionError
+
+SAMPLE_INVENTORY = os.path.join(os.path.dirname(__file__), '..', 'sample_inventory.json')
+
+class simulatorTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.simulator = CimcSimulator(SAMPLE_INVENTORY, count=3, tls=False, max_sessions=2, concurrency=2).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.simulator.stop()
+
+    def server(self, index=0, **kwargs):
+        host = self.simulator.addresses[index]
+        return pycimc.UcsServer(host, 'admin', 'password', transport=CimcTransport(host, scheme='http', retries=0),
+                                **kwargs)
+
+    def testInventoryMatchesFixture(self):
+        with self.server() as myServer:
+            myServer.get_chassis_info()
+            myServer.get_interface_inventory()
+            myServer.get_drive_inventory()
+            myServer.get_fw_versions()
+            myServer.getBootOrder()
+            myServer.get_bios_settings()
+        with open(SAMPLE_INVENTORY) as inventory_file:
+            expected = json.load(inventory_file)
+        self.assertEqual(myServer.inventory['adaptor'], expected['adaptor'])
+        self.assertEqual(myServer.inventory['fw'], expected['fw'])
+        self.assertEqual(myServer.inventory['boot_order'], expected['boot_order'])
+        self.assertEqual(myServer.inventory['bios'], expected['bios'])
+        self.assertEqual(len(myServer.inventory['drives']['storageLocalDisk']), 24)
+        self.assertEqual(myServer.serial_no, expected['chassis']['serial'])
+
+    def testFullInventoryInOneQuery(self):
+        with self.server() as myServer:
+            for getter in ('get_chassis_info', 'get_cimc_info', 'getBootOrder', 'get_drive_inventory',
+                           'get_local_drive_usage', 'get_interface_inventory', 'get_pci_inventory',
+                           'getStorageControllerInventory', 'get_psu_inventory', 'get_bios_settings', 'get_fw_versions'):
+                getattr(myServer, getter)()
+        expected = dict(myServer.inventory)
+        host = self.simulator.host(0)
+        queries = dict(host.stats)
+        with self.server() as myServer:
+            myServer.get_full_inventory()
+        self.assertEqual(host.stats['configResolveDn'], queries.get('configResolveDn', 0) + 1)
+        self.assertEqual(host.stats['configResolveClass'], queries['configResolveClass'])
+        self.assertEqual(host.stats['configResolveChildren'], queries['configResolveChildren'])
+        self.assertEqual(dict(myServer.inventory), expected)
+        self.assertEqual(myServer.round_trips_saved, len(pycimc.FULL_INVENTORY_SUBSYSTEMS) - 1)
+        self.assertEqual(myServer.serial_no, expected['chassis']['serial'])
+        with self.server() as myServer:
+            myServer.get_full_inventory(['drives', 'storageControllers'])
+        self.assertEqual(set(myServer.inventory), {'drives', 'storageControllers'})
+        self.assertEqual(myServer.inventory['drives'], expected['drives'])
+        self.assertEqual(myServer.round_trips_saved, 1)
+        with self.assertRaises(ValueError):
+            myServer.get_full_inventory(['nonsense'])
+
+    def testChangeSetInOneRequest(self):
+        host = self.simulator.host(1)
+        with self.server(1) as myServer:
+            myServer.getMgmtIf()
+            before = dict(host.stats)
+            changes = myServer.changes()
+            myServer.setHostname('rack-42', changes=changes)
+            myServer.setMgmtIfMode('shared_lom', changes=changes)
+            myServer.set_sol_adminstate('enable', '9600', changes=changes)
+            myServer.set_bios_custom(changes=changes)
+            results = changes.apply()
+        self.assertEqual(host.stats['configConfMos'], before.get('configConfMos', 0) + 1)
+        self.assertEqual(host.stats['configConfMo'], before.get('configConfMo', 0))
+        self.assertEqual(len(results), len(pycimc.CUSTOM_BIOS_SETTINGS) + 2)
+        self.assertTrue(all(result.ok for result in results.values()))
+        mgmt_if = results[myServer.inventory['mgmtIf']['dn']].mo
+        self.assertEqual((mgmt_if['hostname'], mgmt_if['nicMode']), ('rack-42', 'shared_lom'))
+        self.assertEqual(host.tree.objects['sys/rack-unit-1/sol-if'][1]['speed'], '9600')
+        self.assertEqual(host.tree.objects[f'{pycimc.BIOS_SETTINGS_DN}/Processor-C1E'][1]['vpProcessorC1E'], 'disabled')
+        self.assertEqual(myServer.round_trips_saved, len(results) - 1)
+
+    def testChangeSetSplitsBatches(self):
+        with CimcSimulator(SAMPLE_INVENTORY, tls=False, max_conf_mos=4) as simulator:
+            host = simulator.addresses[0]
+            with pycimc.UcsServer(host, 'admin', 'password', transport=CimcTransport(host, scheme='http')) as myServer:
+                changes = myServer.changes()
+                for rn, (class_id, attrib) in pycimc.CUSTOM_BIOS_SETTINGS.items():
+                    changes.add(class_id, f'{pycimc.BIOS_SETTINGS_DN}/{rn}', **attrib)
+                changes.add('biosVfProcessorC1E', 'sys/no-such-parent/Processor-C1E', vpProcessorC1E='enabled')
+                results = myServer.apply_changes(changes)
+                limit = myServer.conf_mos_limit
+                again = myServer.set_bios_custom()
+            stats = simulator.host(0).stats
+        failed = [dn for dn, result in results.items() if not result.ok]
+        self.assertEqual(failed, ['sys/no-such-parent/Processor-C1E'])
+        self.assertEqual(results[failed[0]].error_code, '103')
+        self.assertEqual(limit, 4)
+        self.assertTrue(all(result.ok for result in again.values()))
+        self.assertEqual(len(again), len(pycimc.CUSTOM_BIOS_SETTINGS))
+        self.assertGreater(stats['configConfMos'], 4)
+        # the bad change, and the odd one out of the second run's batches of four
+        self.assertEqual(stats['configConfMo'], 2)
+
+    def testConvergeOnlySendsDifferences(self):
+        host = self.simulator.host(2)
+        hyperthreading = f'{pycimc.BIOS_SETTINGS_DN}/Intel-HyperThreading-Tech'
+        desired = {
+            'sys/rack-unit-1/mgmt/if-1': ('mgmtIf', {'hostname': 'C240-FCH1749V0AU', 'dhcpEnable': 'Yes'}),
+            hyperthreading: ('biosVfIntelHyperThreadingTech', {'vpIntelHyperThreadingTech': 'enabled'}),
+            f'{pycimc.BIOS_SETTINGS_DN}/Processor-C1E': ('biosVfProcessorC1E', {'vpProcessorC1E': 'disabled'}),
+        }
+        with self.server(2) as myServer:
+            myServer.get_bios_settings()
+            plan = myServer.converge(desired, dry_run=True)
+            writes = host.stats['configConfMo'] + host.stats['configConfMos']
+            results = myServer.converge(desired)
+            again = myServer.converge(desired, mode=pycimc.LIVE)
+            myServer.getMgmtIf()
+            unchanged = myServer.setHostname('C240-FCH1749V0AU')
+            myServer.inventory['boot_order'] = list(pycimc.BOOT_ORDER)
+            boot_order = myServer.setBootOrder()
+            total = host.stats['configConfMo'] + host.stats['configConfMos']
+        self.assertEqual(set(plan), {'sys/rack-unit-1/mgmt/if-1', f'{pycimc.BIOS_SETTINGS_DN}/Processor-C1E'})
+        self.assertEqual(plan['sys/rack-unit-1/mgmt/if-1'].diff, {'dhcpEnable': ('no', 'Yes')})
+        self.assertTrue(plan['sys/rack-unit-1/mgmt/if-1'].exists)
+        self.assertEqual(set(results), set(plan))
+        self.assertTrue(all(result.ok for result in results.values()))
+        self.assertEqual(again, {})
+        self.assertTrue(unchanged)
+        self.assertTrue(boot_order)
+        # one configConfMos for the plan, nothing for the re-run, the hostname or the boot order
+        self.assertEqual(total, writes + 1)
+        self.assertEqual(myServer.inventory['bios']['Processor-C1E']['vpProcessorC1E'], 'disabled')
+
+    def testPasswordOnlyChangesAreSent(self):
+        host = self.simulator.host(1)
+        with self.server(1) as myServer:
+            myServer.createUser('ops', 'Passw0rd!', priv='read-only')
+            before = host.stats['configConfMo']
+            changed = myServer.changeUserSettings('ops', 'NewPassw0rd!', priv='read-only', accountStatus='active')
+            sent = host.stats['configConfMo'] - before
+            recreated = myServer.createUser('ops', 'Passw0rd!', priv='read-only')
+        self.assertTrue(changed)
+        self.assertTrue(recreated)
+        self.assertEqual(sent, 1)
+        self.assertEqual(host.stats['configConfMo'], before + 2)
+        self.assertEqual(host.credentials['ops'], 'Passw0rd!')
+
+    def testHostsHaveTheirOwnState(self):
+        with self.server(1) as myServer:
+            myServer.set_power_state('down', force=True)
+            myServer.get_chassis_info()
+            self.assertEqual(myServer.operPower, 'off')
+            self.assertEqual(myServer.serial_no, 'SIM00000001')
+        with self.server(2) as myServer:
+            myServer.get_chassis_info()
+            self.assertEqual(myServer.operPower, 'on')
+
+    def testBadPasswordAndSessionCap(self):
+        host = self.simulator.addresses[2]
+        myServer = pycimc.UcsServer(host, 'admin', 'wrong', transport=CimcTransport(host, scheme='http'))
+        with self.assertRaises(ResponseError) as context:
+            myServer.login()
+        self.assertEqual(context.exception.error_code, '551')
+        servers = [self.server(2) for _ in range(3)]
+        servers[0].login()
+        servers[1].login()
+        with self.assertRaises(ResponseError) as context:
+            servers[2].login()
+        self.assertEqual(context.exception.error_code, '572')
+        for myServer in servers[:2]:
+            myServer.logout()
+        servers[2].login()
+        servers[2].logout()
+
+    def testInjectedErrors(self):
+        address = self.simulator.addresses[0]
+        with self.server() as myServer:
+            self.simulator.inject(address, 'error', method='configResolveClass')
+            with self.assertRaises(ResponseError):
+                myServer.get_pci_inventory()
+            self.simulator.inject(address, 'drop')
+            with self.assertRaises(ConnectionError):
+                myServer.get_pci_inventory()
+            myServer.get_pci_inventory()
+            self.assertEqual(len(myServer.inventory['pci']), 3)
+
+    def testEventsReachSubscribers(self):
+        address = self.simulator.addresses[0]
+        with self.server() as myServer:
+            myServer.get_pci_inventory()
+            subscriber = myServer.subscribe_events()
+            self.assertTrue(subscriber.subscribed.wait(5))
+            self.simulator.emit(address, 'pciEquipSlot', 'sys/rack-unit-1/equipped-slot-2', model='Replaced')
+            for _ in range(50):
+                if subscriber.events:
+                    break
+                time.sleep(0.05)
+            slot = [slot for slot in myServer.inventory['pci'] if slot['id'] == '2'][0]
+            self.assertEqual(slot['model'], 'Replaced')
+            myServer.unsubscribe_events()
+
+    def testConcurrencyLimit(self):
+        simulator = CimcSimulator(SAMPLE_INVENTORY, tls=False, latency=0.05, concurrency=1).start()
+        try:
+            host = simulator.addresses[0]
+            # identical queries would be coalesced into one
+            myServer = pycimc.UcsServer(host, 'admin', 'password', transport=CimcTransport(host, scheme='http'),
+                                        single_flight=False)
+            myServer.login()
+            start = time.perf_counter()
+            with ThreadPoolExecutor(4) as executor:
+                list(executor.map(lambda _: myServer.get_pci_inventory(), range(4)))
+            self.assertGreaterEqual(time.perf_counter() - start, 0.2)
+            self.assertEqual(simulator.host(0).max_active, 1)
+            myServer.logout()
+        finally:
+            simulator.stop()
+
+    def testHttpsAndManyHosts(self):
+        with CimcSimulator(SAMPLE_INVENTORY, count=50) as simulator:
+            def fetch(host):
+                with pycimc.UcsServer(host, 'admin', 'password') as myServer:
+                    myServer.get_chassis_info()
+                    return myServer.serial_no
+            with ThreadPoolExecutor(16) as executor:
+                serials = list(executor.map(fetch, simulator.addresses))
+        self.assertEqual(len(set(serials)), 50)
+
+if __name__ == '__main__':
+    unittest.main()
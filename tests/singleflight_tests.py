@@ -0,0 +1,96 @@
+import os
+import time
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import pycimc
+from cimc_metrics import REGISTRY
+from cimc_singleflight import SingleFlight, read_key
+from cimc_simulator import CimcSimulator
+from cimc_transport import CimcTransport
+
+SAMPLE_INVENTORY = os.path.join(os.path.dirname(__file__), '..', 'sample_inventory.json')
+
+class singleFlightTest(unittest.TestCase):
+
+    def testOverlappingCallsShareOneResult(self):
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return {'name': 'admin'}
+
+        key = ('10.0.0.1', 'admin', 'configResolveClass', '<configResolveClass classId="aaaUser"/>')
+        with ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(flight.do, key, slow, dict) for _ in range(4)]
+            while flight.coalesced < 3:
+                time.sleep(0.01)
+            release.set()
+            results = [future.result() for future in futures]
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'name': 'admin'}] * 4)
+        # everyone got their own copy
+        self.assertEqual(len({id(result) for result in results}), 4)
+        # errors are shared too, and nothing is kept without a memo window
+        with self.assertRaises(KeyError):
+            flight.do(key, lambda: {}['missing'])
+        self.assertEqual(flight.do(key, lambda: 'fresh'), 'fresh')
+
+    def testMemoWindow(self):
+        flight = SingleFlight(memo=0.2)
+        key = ('10.0.0.1', 'admin', 'configResolveDn', '<configResolveDn dn="sys"/>')
+        self.assertEqual(flight.do(key, lambda: 1), 1)
+        self.assertEqual(flight.do(key, lambda: 2), 1)
+        flight.forget('10.0.0.1')
+        self.assertEqual(flight.do(key, lambda: 3), 3)
+        time.sleep(0.25)
+        self.assertEqual(flight.do(key, lambda: 4), 4)
+        self.assertIsNone(read_key('10.0.0.1', 'admin', '<configConfMo dn="sys" cookie="c"/>', 'c'))
+        self.assertEqual(read_key('h', 'admin', '<configResolveClass classId="aaaUser" cookie="c"/>', 'c')[3],
+                         read_key('h', 'admin', '<configResolveClass classId="aaaUser" cookie="d"/>', 'd')[3])
+
+    def testConcurrentGettersSendOneQuery(self):
+        REGISTRY.reset()
+        with CimcSimulator(SAMPLE_INVENTORY, tls=False, latency=0.1) as simulator:
+            host = simulator.addresses[0]
+            myServer = pycimc.UcsServer(host, 'admin', 'password', transport=CimcTransport(host, scheme='http'),
+                                        single_flight=SingleFlight(memo=5.0))
+            myServer.login()
+            stats = simulator.host(0).stats
+            with ThreadPoolExecutor(3) as executor:
+                free, admin, _ = executor.map(lambda args: myServer.get_users(*args),
+                                              [(True, False), (False, 'admin'), (False, False)])
+            queries = stats['configResolveClass']
+            myServer.set_password('admin', 'password')
+            myServer.get_users()
+            myServer.logout()
+        self.assertEqual(queries, 1)
+        # the write forgot the memoized users, so they were read again
+        self.assertEqual(stats['configResolveClass'], 2)
+        self.assertEqual(free['name'], '')
+        self.assertEqual(admin['name'], 'admin')
+        self.assertNotIn(free, myServer.inventory['users'])
+        coalesced = {sample['labels']['method']: sample['value'] for sample in REGISTRY.snapshot()['pycimc_coalesced_total']}
+        self.assertEqual(coalesced, {'configResolveClass': 2})
+
+    def testOffByDefault(self):
+        with CimcSimulator(SAMPLE_INVENTORY, tls=False, latency=0.1) as simulator:
+            host = simulator.addresses[0]
+            myServer = pycimc.UcsServer(host, 'admin', 'password', transport=CimcTransport(host, scheme='http'))
+            myServer.login()
+            with ThreadPoolExecutor(3) as executor:
+                list(executor.map(lambda _: myServer.get_users(), range(3)))
+            # the response is streamed, not read whole first
+            mos = myServer._stream('<configResolveClass cookie="%s" inHierarchical="false" classId="aaaUser"/>'
+                                   % myServer.session_cookie)
+            self.assertIsNotNone(next(mos))
+            mos.close()
+            myServer.logout()
+        self.assertIsNone(myServer.single_flight)
+        self.assertEqual(simulator.host(0).stats['configResolveClass'], 4)
+
+if __name__ == '__main__':
+    unittest.main()
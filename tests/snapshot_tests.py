@@ -0,0 +1,127 @@
+import io
+import os
+import copy
+import json
+import tempfile
+import unittest
+import contextlib
+import cimc_snapshot
+from cimc_snapshot import SnapshotWriter, SnapshotReader, save, load
+from cimc_snapshot import FILE_HEADER, RECORD_HEADER, LENGTH, MAGIC, NO_BASE, VALUES, SHAPES, STRUCTURES, SNAPSHOT
+
+SAMPLE_INVENTORY = os.path.join(os.path.dirname(__file__), '..', 'sample_inventory.json')
+
+def fleet(count):
+    with open(SAMPLE_INVENTORY) as inventory_file:
+        inventory = json.load(inventory_file)
+    inventories = {}
+    for index in range(count):
+        host = copy.deepcopy(inventory)
+        host['chassis']['serial'] = f'SIM{index:08d}'
+        for slot, drive in enumerate(host['drives']['storageLocalDisk']):
+            drive['driveSerialNumber'] = f'S{index:04d}{slot:02d}'
+        inventories[f'10.0.0.{index}'] = host
+    return inventories
+
+class snapshotTest(unittest.TestCase):
+
+    def testRoundTrip(self):
+        inventories = fleet(5)
+        inventories['10.0.0.4']['extra'] = {'flags': [True, 1, 1.0, None, '1'], 'empty': {}, 'rows': []}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'fleet.snap')
+            snapshot_id = save(path, inventories, taken=1000.0)
+            loaded = load(path)
+            size = os.path.getsize(path)
+        self.assertEqual(loaded.id, snapshot_id)
+        self.assertEqual(loaded.taken['10.0.0.0'], 1000.0)
+        self.assertEqual(loaded, inventories)
+        self.assertEqual([type(flag) for flag in loaded['10.0.0.4']['extra']['flags']],
+                         [bool, int, float, type(None), str])
+        # the hosts share a structure and the string table, so the four after the first take little room
+        self.assertLess(size, 5 * len(json.dumps(inventories['10.0.0.0'])) / 4)
+        # every host gets its own objects
+        loaded['10.0.0.1']['drives']['storageLocalDisk'][0]['pdStatus'] = 'Failed'
+        self.assertEqual(loaded['10.0.0.2']['drives']['storageLocalDisk'][0]['pdStatus'], 'Online')
+        self.assertEqual(loaded['10.0.0.1'].lookup('storageLocalDisk', id=1)['driveSerialNumber'], 'S000100')
+
+    def testStreaming(self):
+        inventories = fleet(3)
+        buffer = io.BytesIO()
+        writer = SnapshotWriter(buffer)
+        for host, inventory in inventories.items():
+            writer.write(host, inventory)
+        buffer.seek(0)
+        hosts = [snapshot.host for snapshot in SnapshotReader(buffer)]
+        self.assertEqual(hosts, list(inventories))
+        with self.assertRaises(ValueError):
+            SnapshotReader(io.BytesIO(b'{"not": "a snapshot"}'))
+
+    def testDelta(self):
+        inventories = fleet(4)
+        with tempfile.TemporaryDirectory() as directory:
+            base_path = os.path.join(directory, 'base.snap')
+            delta_path = os.path.join(directory, 'delta.snap')
+            save(base_path, inventories)
+            base = load(base_path)
+            changed = copy.deepcopy(inventories)
+            disks = changed['10.0.0.1']['drives']['storageLocalDisk']
+            disks[3]['pdStatus'] = 'Failed'
+            disks.insert(0, disks.pop())
+            del changed['10.0.0.2']['bios']['ASPM-Support']
+            changed['10.0.0.3']['cimc']['hostname'] = 'rack-42'
+            changed['10.0.0.9'] = changed['10.0.0.0']
+            # an unchanged fleet is a few bytes per host
+            save(delta_path, inventories, base=base)
+            self.assertLess(os.path.getsize(delta_path), 100 * len(inventories))
+            save(delta_path, changed, base=base)
+            loaded = load(delta_path, base=base)
+            self.assertEqual(load(delta_path, base=base_path), changed)
+            with self.assertRaises(ValueError):
+                load(delta_path)
+            with self.assertRaises(ValueError):
+                save(base_path, fleet(4))
+                load(delta_path, base=base_path)
+        self.assertEqual(loaded, changed)
+        self.assertEqual(loaded.base_id, base.id)
+        # unchanged objects are copies, not the base's
+        self.assertIsNot(loaded['10.0.0.0']['chassis'], base['10.0.0.0']['chassis'])
+
+    def testCompiledAndWalkedBuildsAgree(self):
+        inventory = fleet(1)['10.0.0.0']
+        writer = SnapshotWriter(io.BytesIO())
+        codes = []
+        node = json.loads(json.dumps(writer._walk(inventory, codes)))
+        shapes = [tuple(writer._new[cimc_snapshot.VALUES][code] for code in shape) for shape in writer._new[cimc_snapshot.SHAPES]]
+        values = [writer._new[cimc_snapshot.VALUES][code] for code in codes]
+        self.assertEqual(cimc_snapshot.build(node, shapes, iter(values)), inventory)
+        self.assertEqual(cimc_snapshot.compiled(node, shapes)(values, cimc_snapshot.MISSING), inventory)
+
+    def testHostileStructuresAreRejected(self):
+        def snapshot_file(structure):
+            # {'k': structure}
+            records = [(VALUES, ['k']), (SHAPES, [[0]]), (STRUCTURES, [['d', 0, [structure]]])]
+            records += [(SNAPSHOT, {'host': host, 'taken': 0, 'delta': True, 'structure': 0}) for host in ('a', 'b')]
+            data = FILE_HEADER.pack(MAGIC, bytes(16), NO_BASE)
+            for kind, content in records:
+                payload = json.dumps(content).encode()
+                if kind == SNAPSHOT:
+                    payload = LENGTH.pack(len(payload)) + payload
+                data += RECORD_HEADER.pack(kind, len(payload)) + payload
+            return io.BytesIO(data)
+
+        base = {'a': {'k': [['x']]}, 'b': {'k': [['x']]}}
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            for structure in (['b', "print('INJECTED') or 0", ['s']], ['b', True, ['s']], ['b', -1, ['s']],
+                              ['r', 0, 1], ['r', 0, '1'], ['f', '0'], ['d', 0, []], ['l', 's'], ['s', 0], 0.0, 'l'):
+                with self.assertRaises(ValueError):
+                    load(snapshot_file(structure), base=base)
+                with self.assertRaises(ValueError):
+                    cimc_snapshot.build(structure, [], iter([]), base['a']['k'])
+        self.assertEqual(output.getvalue(), '')
+        # the same two hosts with a well-formed structure
+        self.assertEqual(load(snapshot_file(['l', [['b', 0, ['s']]]]), base=base), base)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import json
+import time
+import tempfile
+import unittest
+from cimc_store import FleetStore
+
+SAMPLE_INVENTORY = os.path.join(os.path.dirname(__file__), '..', 'sample_inventory.json')
+
+def fleet(count):
+    with open(SAMPLE_INVENTORY) as inventory_file:
+        inventory = json.load(inventory_file)
+    store = FleetStore()
+    hyperthreading = inventory['bios']['Intel-HyperThreading-Tech']
+    for index in range(count):
+        drives = inventory['drives']['storageLocalDisk']
+        # every tenth host has a failed first drive and hyperthreading off
+        if index % 10 == 0:
+            inventory['drives']['storageLocalDisk'] = [dict(drives[0], pdStatus='Failed')] + drives[1:]
+            inventory['bios']['Intel-HyperThreading-Tech'] = {'vpIntelHyperThreadingTech': 'disabled'}
+        store.add_inventory(f'10.0.{index // 256}.{index % 256}', inventory)
+        inventory['drives']['storageLocalDisk'] = drives
+        inventory['bios']['Intel-HyperThreading-Tech'] = hyperthreading
+    return store
+
+class storeTest(unittest.TestCase):
+
+    def testQueries(self):
+        store = fleet(20)
+        disks = store['storageLocalDisk']
+        self.assertEqual(len(disks), 20 * 24)
+        failed = disks.where('pdStatus', 'Online', op='!=')
+        self.assertEqual(failed.hosts(), ['10.0.0.0', '10.0.0.10'])
+        self.assertEqual(failed.rows(['host', 'pdStatus']),
+                         [{'host': '10.0.0.0', 'pdStatus': 'Failed'}, {'host': '10.0.0.10', 'pdStatus': 'Failed'}])
+        self.assertEqual(disks.where('host', '10.0.0.10').where('pdStatus', 'Failed').count(), 1)
+        self.assertEqual(disks.group_by('pdStatus'), {'Failed': 2, 'Online': 20 * 24 - 2})
+        self.assertEqual(store['biosSettings'].where('vpIntelHyperThreadingTech', 'disabled').values('host'),
+                         ['10.0.0.0', '10.0.0.10'])
+        versions = store['firmwareRunning'].group_by('dn', 'version')
+        self.assertEqual(versions[('sys/rack-unit-1/mgmt/fw-system', '1.5(4)')], 20)
+        self.assertEqual(len(store['adaptorHostEthIf'].where('name', lambda name: name and name.startswith('eth'))), 20 * 4)
+        self.assertEqual(len(store['noSuchClass']), 0)
+        self.assertEqual(disks.where('noSuchAttribute', None).count(), len(disks))
+
+    def testSaveAndLoad(self):
+        store = fleet(30)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'fleet.store')
+            store.save(path)
+            with FleetStore.load(path) as loaded:
+                for name, table in store.tables.items():
+                    self.assertEqual(loaded[name].rows(), table.rows())
+                self.assertIsInstance(loaded['storageLocalDisk'].columns['pdStatus'].codes, memoryview)
+                loaded.add('10.0.9.9', 'storageLocalDisk', {'dn': 'pd-1', 'pdStatus': 'Failed'})
+                self.assertEqual(loaded['storageLocalDisk'].where('pdStatus', 'Failed').hosts(),
+                                 ['10.0.0.0', '10.0.0.10', '10.0.0.20', '10.0.9.9'])
+
+    def testFleetQueriesAreFast(self):
+        store = fleet(5000)
+        start = time.perf_counter()
+        failed = store['storageLocalDisk'].where('pdStatus', 'Online', op='!=').hosts()
+        disabled = store['biosSettings'].where('vpIntelHyperThreadingTech', 'disabled').values('host')
+        versions = store['firmwareRunning'].group_by('dn', 'version')
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(failed), 500)
+        self.assertEqual(len(disabled), 500)
+        self.assertEqual(sum(versions.values()), 5000 * 4)
+        self.assertLess(elapsed, 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import socket
+import unittest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pycimc
+import exception_mapper
+from cimc_transport import CimcTransport
+
+class FakeCimcHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    peers = set()
+
+    def do_POST(self):
+        self.peers.add(self.client_address)
+        self.rfile.read(int(self.headers['Content-Length']))
+        body = b'<configResolveClass cookie="c" response="yes" classId="pciEquipSlot"><outConfigs>' \
+               b'<pciEquipSlot id="2" dn="sys/rack-unit-1/equipped-slot-2" model="VIC"/>' \
+               b'</outConfigs></configResolveClass>'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class transportTest(unittest.TestCase):
+
+    def setUp(self):
+        FakeCimcHandler.peers = set()
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), FakeCimcHandler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.host = '127.0.0.1:%d' % self.httpd.server_address[1]
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def testRequestsReuseOneConnection(self):
+        myServer = pycimc.UcsServer(self.host, 'admin', 'password', transport=CimcTransport(self.host, scheme='http'))
+        for _ in range(5):
+            myResp = myServer._post('<configResolveClass cookie="c" inHierarchical="false" classId="pciEquipSlot"/>')
+            self.assertEqual(myResp.find('outConfigs')[0].attrib['id'], '2')
+        myServer.close()
+        self.assertEqual(len(FakeCimcHandler.peers), 1)
+
+    def testTimeoutIsConfigurable(self):
+        myTransport = CimcTransport(self.host, scheme='http', connect_timeout=1.0, read_timeout=2.0)
+        self.assertEqual(myTransport.timeout(), (1.0, 2.0))
+        self.assertEqual(myTransport.timeout(7.0), (1.0, 7.0))
+        myTransport.close()
+
+class hungCimcTest(unittest.TestCase):
+
+    def setUp(self):
+        # accepts connections and reads the requests, but never answers
+        self.listener = socket.socket()
+        self.listener.bind(('127.0.0.1', 0))
+        self.listener.listen(8)
+        self.host = '127.0.0.1:%d' % self.listener.getsockname()[1]
+        self.connections = []
+        threading.Thread(target=self.accept, daemon=True).start()
+
+    def accept(self):
+        while True:
+            try:
+                connection, _ = self.listener.accept()
+            except OSError:
+                return
+            self.connections.append(connection)
+
+    def tearDown(self):
+        self.listener.close()
+        for connection in self.connections:
+            connection.close()
+
+    def testReadTimeoutIsTimeoutError(self):
+        myTransport = CimcTransport(self.host, scheme='http', read_timeout=0.3)
+        command_string = '<configResolveClass cookie="c" inHierarchical="false" classId="pciEquipSlot"/>'
+        with self.assertRaises(exception_mapper.TimeoutError):
+            pycimc.post_request(self.host, command_string, transport=myTransport)
+        with self.assertRaises(exception_mapper.TimeoutError):
+            list(pycimc.stream_request(self.host, command_string, transport=myTransport))
+        myTransport.close()
+
+if __name__ == "__main__":
+    unittest.main()
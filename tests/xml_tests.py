@@ -0,0 +1,41 @@
+import os
+import unittest
+import xml.etree.ElementTree as ET
+import pycimc
+import cimc_xml
+from cimc_simulator import CimcSimulator
+from cimc_transport import CimcTransport
+from cveLogger import redact, request_fields
+
+SAMPLE_INVENTORY = os.path.join(os.path.dirname(__file__), '..', 'sample_inventory.json')
+PASSWORD = 'p"<&>\'\tw€rd'
+
+class xmlTest(unittest.TestCase):
+
+    def testRequests(self):
+        self.assertEqual(cimc_xml.resolve_class('1234/abcd', 'pciEquipSlot'),
+                         '<configResolveClass classId="pciEquipSlot" inHierarchical="false" cookie="1234/abcd"/>')
+        self.assertEqual(cimc_xml.resolve_children('c', 'sys/rack-unit-1', hierarchical=True),
+                         '<configResolveChildren inDn="sys/rack-unit-1" inHierarchical="true" cookie="c"/>')
+        self.assertEqual(cimc_xml.logout('c'), '<aaaLogout inCookie="c" cookie="c"/>')
+        login = ET.fromstring(cimc_xml.encode(cimc_xml.login('admin', PASSWORD)))
+        self.assertEqual(login.attrib, {'inName': 'admin', 'inPassword': PASSWORD})
+        self.assertNotIn('cookie', login.attrib)
+        command = cimc_xml.conf_mo('c', 'sys/user-ext/user-3', [cimc_xml.mo('aaaUser', {'id': 3, 'pwd': PASSWORD})])
+        self.assertNotIn(' >', command)
+        self.assertTrue(command.endswith('cookie="c"><inConfig><aaaUser id="3" pwd="p&quot;&lt;&amp;&gt;\'&#9;w€rd"/>'
+                                         '</inConfig></configConfMo>'))
+        self.assertEqual(ET.fromstring(command).find('inConfig/aaaUser').get('pwd'), PASSWORD)
+        self.assertEqual(request_fields(command), ('configConfMo', ''))
+        self.assertEqual(redact(cimc_xml.refresh('c', 'admin', PASSWORD)),
+                         '<aaaRefresh inName="admin" inPassword="***" inCookie="***" cookie="***"/>')
+
+    def testSpecialCharactersReachTheCimc(self):
+        with CimcSimulator(SAMPLE_INVENTORY, tls=False, credentials={'admin': PASSWORD}) as simulator:
+            host = simulator.addresses[0]
+            with pycimc.UcsServer(host, 'admin', PASSWORD, transport=CimcTransport(host, scheme='http')) as myServer:
+                myServer.get_chassis_info()
+        self.assertEqual(myServer.serial_no, 'FCH1749V0AU')
+
+if __name__ == '__main__':
+    unittest.main()